@@ -0,0 +1,50 @@
+"""Mount point for the SQLAdmin UI that defers building it until the first admin request."""
+
+from starlette.applications import Starlette
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.db.session import async_engine
+
+
+class LazyAdminApp:
+    """ASGI app for ``/admin`` that imports sqladmin and registers the views on first use.
+
+    sqladmin and its Jinja templates are only needed by operators, so API and
+    worker processes that never serve an admin page skip the import entirely.
+    ``routes`` is exposed so ``url_for("admin:...")`` resolves through the mount.
+    """
+
+    def __init__(self, base_url: str = "/admin") -> None:
+        self.base_url = base_url
+        self._app: Starlette | None = None
+
+    def _build(self) -> Starlette:
+        from sqladmin import Admin
+
+        from app.admin.auth import AdminAuth
+        from app.admin.views import ADMIN_VIEWS
+
+        # Admin mounts itself on the app it is given; a throwaway host keeps it off the real router.
+        admin = Admin(
+            Starlette(),
+            async_engine,
+            base_url=self.base_url,
+            authentication_backend=AdminAuth(secret_key=settings.SECRET_KEY),
+        )
+        for view in ADMIN_VIEWS:
+            admin.add_view(view)
+        return admin.admin
+
+    @property
+    def app(self) -> ASGIApp:
+        if self._app is None:
+            self._app = self._build()
+        return self._app
+
+    @property
+    def routes(self) -> list:
+        return self.app.routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
@@ -453,3 +453,28 @@ class NotificationAdmin(ModelView, model=Notification):
     can_create = False
     can_edit = True
     can_delete = True
+
+
+# Registration order is the sidebar order.
+ADMIN_VIEWS: list[type[ModelView]] = [
+    UserAdmin,
+    UserProfileAdmin,
+    VaultAdmin,
+    StorageAdmin,
+    RoomAdmin,
+    DwellerAdmin,
+    RelationshipAdmin,
+    PregnancyAdmin,
+    TrainingAdmin,
+    IncidentAdmin,
+    ExplorationAdmin,
+    ChatMessageAdmin,
+    NotificationAdmin,
+    OutfitAdmin,
+    WeaponAdmin,
+    JunkAdmin,
+    QuestAdmin,
+    ObjectiveAdmin,
+    PromptAdmin,
+    LLInteractionAdmin,
+]
@@ -0,0 +1,27 @@
+"""add_dweller_image_variants
+
+Revision ID: 7f3e9a1c5b20
+Revises: 1c57603aa0f6
+Create Date: 2026-10-18 00:01:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3e9a1c5b20"
+down_revision: str | None = "1c57603aa0f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("dweller", sa.Column("image_variants", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("dweller", "image_variants")
@@ -0,0 +1,130 @@
+"""add_exploration_event_journal
+
+Move exploration journey logs from the ``exploration.events`` JSONB array into
+an append-only ``exploration_event`` table, back-filling every existing event.
+
+Revision ID: 3d8b6f0e2a71
+Revises: 7f3e9a1c5b20
+Create Date: 2026-10-19 00:01:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3d8b6f0e2a71"
+down_revision: str | None = "7f3e9a1c5b20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Keys promoted to columns are stripped from the payload; malformed location ids
+# (never written by the app, but the column was free-form JSON) are dropped.
+BACKFILL_EVENTS_SQL = """
+INSERT INTO exploration_event (id, exploration_id, vault_id, seq, type, ts, location_id, coord_x, coord_y, payload)
+SELECT
+    gen_random_uuid(),
+    e.id,
+    e.vault_id,
+    ev.ordinality - 1,
+    LEFT(COALESCE(ev.value->>'type', 'unknown'), 32),
+    COALESCE((ev.value->>'timestamp')::timestamp, e.start_time),
+    CASE
+        WHEN ev.value->>'location_id' ~* '^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$'
+        THEN (ev.value->>'location_id')::uuid
+    END,
+    (ev.value->>'coord_x')::double precision,
+    (ev.value->>'coord_y')::double precision,
+    ev.value - 'type' - 'timestamp' - 'location_id' - 'coord_x' - 'coord_y'
+FROM exploration e
+CROSS JOIN LATERAL jsonb_array_elements(e.events) WITH ORDINALITY AS ev(value, ordinality)
+WHERE jsonb_typeof(e.events) = 'array'
+"""
+
+BACKFILL_SUMMARY_SQL = """
+UPDATE exploration e
+SET event_count = journal.event_count, last_event_at = journal.last_event_at
+FROM (
+    SELECT exploration_id, COUNT(*) AS event_count, MAX(ts) AS last_event_at
+    FROM exploration_event
+    GROUP BY exploration_id
+) AS journal
+WHERE journal.exploration_id = e.id
+"""
+
+RESTORE_EVENTS_SQL = """
+UPDATE exploration e
+SET events = journal.events
+FROM (
+    SELECT
+        exploration_id,
+        jsonb_agg(
+            payload || jsonb_strip_nulls(
+                jsonb_build_object(
+                    'type', type,
+                    'timestamp', to_jsonb(ts),
+                    'location_id', location_id::text,
+                    'coord_x', coord_x,
+                    'coord_y', coord_y
+                )
+            )
+            ORDER BY seq
+        ) AS events
+    FROM exploration_event
+    GROUP BY exploration_id
+) AS journal
+WHERE journal.exploration_id = e.id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exploration_event",
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("type", sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+        sa.Column("ts", sa.DateTime(), nullable=False),
+        sa.Column("location_id", sa.Uuid(), nullable=True),
+        sa.Column("coord_x", sa.Float(), nullable=True),
+        sa.Column("coord_y", sa.Float(), nullable=True),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("exploration_id", sa.Uuid(), nullable=False),
+        sa.Column("vault_id", sa.Uuid(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("exploration_id", "seq", name="uq_exploration_event_exploration_seq"),
+        sa.ForeignKeyConstraint(["exploration_id"], ["exploration.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["vault_id"], ["vault.id"], ondelete="CASCADE"),
+    )
+    op.create_index(op.f("ix_exploration_event_id"), "exploration_event", ["id"], unique=False)
+    op.create_index("ix_exploration_event_vault_type", "exploration_event", ["vault_id", "type"], unique=False)
+
+    op.add_column("exploration", sa.Column("event_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("exploration", sa.Column("last_event_at", sa.DateTime(), nullable=True))
+
+    op.execute(BACKFILL_EVENTS_SQL)
+    op.execute(BACKFILL_SUMMARY_SQL)
+    op.drop_column("exploration", "events")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "exploration",
+        sa.Column(
+            "events",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=True,
+        ),
+    )
+    op.execute(RESTORE_EVENTS_SQL)
+    op.alter_column("exploration", "events", server_default=None)
+
+    op.drop_column("exploration", "last_event_at")
+    op.drop_column("exploration", "event_count")
+    op.drop_index("ix_exploration_event_vault_type", table_name="exploration_event")
+    op.drop_index(op.f("ix_exploration_event_id"), table_name="exploration_event")
+    op.drop_table("exploration_event")
@@ -0,0 +1,26 @@
+"""add_vault_map_version
+
+Revision ID: 9b41d7c2e5f8
+Revises: 3d8b6f0e2a71
+Create Date: 2026-10-20 00:01:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b41d7c2e5f8"
+down_revision: str | None = "3d8b6f0e2a71"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("vault", sa.Column("map_version", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("vault", "map_version")
@@ -0,0 +1,44 @@
+"""partition_append_only_tables
+
+Revision ID: 3e7b9a1c5d20
+Revises: 5c2a8e7d1f46
+Create Date: 2026-10-22 00:01:00.000000
+
+``llminteraction.created_at`` becomes NOT NULL (it is the partition key and has
+always been filled by the model default). When ``DB_PARTITIONING_ENABLED`` is set
+on PostgreSQL, notification, chatmessage and llminteraction are then rebuilt as
+monthly range-partitioned tables; otherwise they can be converted later with
+``fo-cli partitions enable``.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.config import settings
+from app.db.partitioning import PARTITIONED_TABLES, convert_to_partitioned, convert_to_plain
+
+# revision identifiers, used by Alembic.
+revision: str = "3e7b9a1c5d20"
+down_revision: str | None = "5c2a8e7d1f46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE llminteraction SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    op.alter_column("llminteraction", "created_at", existing_type=sa.DateTime(), nullable=False)
+
+    if settings.DB_PARTITIONING_ENABLED:
+        connection = op.get_bind()
+        for table in PARTITIONED_TABLES:
+            convert_to_partitioned(connection, table, settings.DB_PARTITION_MONTHS_AHEAD)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        convert_to_plain(connection, table)
+
+    op.alter_column("llminteraction", "created_at", existing_type=sa.DateTime(), nullable=True)
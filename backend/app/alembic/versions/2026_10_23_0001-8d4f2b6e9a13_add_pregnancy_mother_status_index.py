@@ -0,0 +1,30 @@
+"""add_pregnancy_mother_status_index
+
+Revision ID: 8d4f2b6e9a13
+Revises: 3e7b9a1c5d20
+Create Date: 2026-10-23 00:01:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4f2b6e9a13"
+down_revision: str | None = "3e7b9a1c5d20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_pregnancy_mother_status_updated_at",
+        "pregnancy",
+        ["mother_id", "status", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pregnancy_mother_status_updated_at", table_name="pregnancy")
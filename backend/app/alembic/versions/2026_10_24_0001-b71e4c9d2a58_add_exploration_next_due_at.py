@@ -0,0 +1,42 @@
+"""add_exploration_next_due_at
+
+Revision ID: b71e4c9d2a58
+Revises: 8d4f2b6e9a13
+Create Date: 2026-10-24 00:01:00.000000
+
+Existing explorations keep ``next_due_at`` NULL, which the game loop treats as
+due, so each is scheduled on its first tick after the upgrade.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e4c9d2a58"
+down_revision: str | None = "8d4f2b6e9a13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("exploration", sa.Column("next_due_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_exploration_vault_status_next_due_at",
+        "exploration",
+        ["vault_id", "status", "next_due_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_training_vault_status_estimated_completion_at",
+        "training",
+        ["vault_id", "status", "estimated_completion_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_training_vault_status_estimated_completion_at", table_name="training")
+    op.drop_index("ix_exploration_vault_status_next_due_at", table_name="exploration")
+    op.drop_column("exploration", "next_due_at")
@@ -363,6 +363,47 @@ def cleanup_old_records():
         return result
 
 
+@dramatiq.actor(actor_name="maintain_partitions", max_retries=3, min_backoff=3600000)
+def maintain_partitions():
+    """Create the upcoming monthly partitions of the partitioned append-only tables.
+
+    A no-op unless the tables were converted (see ``app.db.partitioning``).
+
+    Returns:
+        dict: Names of the partitions created.
+    """
+    try:
+
+        async def run_maintenance():
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            from app.core.config import settings
+            from app.db.partitioning import ensure_partitions
+
+            engine = create_async_engine(
+                str(settings.ASYNC_DATABASE_URI),
+                echo=False,
+                future=True,
+                pool_pre_ping=True,
+                connect_args={"server_settings": {"timezone": "UTC"}},
+            )
+
+            try:
+                async with engine.begin() as conn:
+                    created = await conn.run_sync(ensure_partitions, settings.DB_PARTITION_MONTHS_AHEAD)
+                    return {"partitions_created": created}
+            finally:
+                await engine.dispose()
+
+        result = asyncio.run(run_maintenance())
+    except Exception:
+        logger.exception("Partition maintenance failed")
+        raise
+    else:
+        logger.info(f"Partition maintenance completed: {result}")
+        return result
+
+
 # Periodiq schedule configuration
 # These actors are scheduled to run periodically via Periodiq scheduler
 # Command: periodiq app.core.dramatiq app.api.tasks
@@ -374,6 +415,7 @@ game_tick.options["periodic"] = periodiq.cron("* * * * *")
 check_permanent_deaths.options["periodic"] = periodiq.cron("0 0 * * *")
 refresh_daily_objectives.options["periodic"] = periodiq.cron("0 0 * * *")
 cleanup_old_records.options["periodic"] = periodiq.cron("0 0 * * *")
+maintain_partitions.options["periodic"] = periodiq.cron("0 0 * * *")
 
 # Weekly on Monday at midnight
 refresh_weekly_objectives.options["periodic"] = periodiq.cron("0 0 * * 1")
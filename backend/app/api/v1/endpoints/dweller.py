@@ -24,6 +24,7 @@ from app.schemas.dweller import (
     DwellerReviveResponse,
     DwellerUpdate,
     DwellerVisualAttributes,
+    FamilyTreeResponse,
     LineageResponse,
     RevivalCostResponse,
 )
@@ -187,6 +188,21 @@ async def read_dwellers_by_vault(
     )
 
 
+@router.get("/vault/{vault_id}/family-tree", response_model=FamilyTreeResponse)
+async def get_vault_family_tree(
+    vault_id: UUID4,
+    user: CurrentActiveUser,
+    db_session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> FamilyTreeResponse:
+    """Get the whole family graph of a vault.
+
+    Returns:
+        FamilyTreeResponse: Every living-record dweller with generation and parent/partner links.
+    """
+    await get_user_vault_or_403(vault_id, user, db_session)
+    return await lineage_service.get_family_tree(db_session, vault_id)
+
+
 @router.post("/{dweller_id}/move_to/{room_id}", response_model=DwellerReadWithRoomID)
 async def move_dweller_to_room(
     dweller_id: UUID4,
@@ -11,6 +11,7 @@ from app.crud import exploration as crud_exploration
 from app.db.session import get_async_session
 from app.schemas.exploration import (
     ExplorationCompleteResponse,
+    ExplorationJournalPage,
     ExplorationProgress,
     ExplorationRead,
     ExplorationReadShort,
@@ -39,7 +40,7 @@ async def send_dweller_to_wasteland(
     """
     await get_user_vault_or_403(vault_id, user, db_session)
     try:
-        return await exploration_service.send_dweller(
+        exploration = await exploration_service.send_dweller(
             db_session,
             vault_id=vault_id,
             dweller_id=request.dweller_id,
@@ -49,6 +50,7 @@ async def send_dweller_to_wasteland(
         )
     except ValueError as e:
         raise ValidationException(str(e)) from e
+    return await exploration_service.to_read(db_session, exploration)
 
 
 @router.get("/vault/{vault_id}", response_model=list[ExplorationReadShort])
@@ -83,7 +85,25 @@ async def get_exploration(
         ExplorationRead: Exploration details.
     """
     await verify_exploration_access(exploration_id, user, db_session)
-    return await crud_exploration.get(db_session, exploration_id)
+    exploration = await crud_exploration.get(db_session, exploration_id)
+    return await exploration_service.to_read(db_session, exploration)
+
+
+@router.get("/{exploration_id}/events", response_model=ExplorationJournalPage)
+async def get_exploration_events(
+    exploration_id: UUID4,
+    user: CurrentActiveUser,
+    db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    after_seq: Annotated[int | None, Query(ge=0, description="Cursor returned by the previous page")] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> ExplorationJournalPage:
+    """Page through an exploration's event journal, oldest first.
+
+    Returns:
+        ExplorationJournalPage: Events and the cursor for the next page.
+    """
+    await verify_exploration_access(exploration_id, user, db_session)
+    return await exploration_service.get_journal(db_session, exploration_id, after_seq=after_seq, limit=limit)
 
 
 @router.get("/{exploration_id}/progress", response_model=ExplorationProgress)
@@ -118,12 +138,12 @@ async def recall_dweller(
     await verify_exploration_access(exploration_id, user, db_session)
     try:
         exploration, rewards = await exploration_service.recall_exploration_with_data(db_session, exploration_id)
-        return ExplorationCompleteResponse(
-            exploration=exploration,
-            rewards_summary=rewards.model_dump(),
-        )
     except ValueError as e:
         raise ValidationException(str(e)) from e
+    return ExplorationCompleteResponse(
+        exploration=await exploration_service.to_read(db_session, exploration),
+        rewards_summary=rewards.model_dump(),
+    )
 
 
 @router.post("/{exploration_id}/complete", response_model=ExplorationCompleteResponse)
@@ -143,12 +163,12 @@ async def complete_exploration(
     await verify_exploration_access(exploration_id, user, db_session)
     try:
         exploration, rewards = await exploration_service.complete_exploration_with_data(db_session, exploration_id)
-        return ExplorationCompleteResponse(
-            exploration=exploration,
-            rewards_summary=rewards.model_dump(),
-        )
     except ValueError as e:
         raise ValidationException(str(e)) from e
+    return ExplorationCompleteResponse(
+        exploration=await exploration_service.to_read(db_session, exploration),
+        rewards_summary=rewards.model_dump(),
+    )
 
 
 @router.post("/{exploration_id}/generate_event", response_model=ExplorationRead)
@@ -167,6 +187,7 @@ async def generate_event(
     """
     await verify_exploration_access(exploration_id, user, db_session)
     try:
-        return await exploration_service.process_event_for_exploration(db_session, exploration_id)
+        exploration = await exploration_service.process_event_for_exploration(db_session, exploration_id)
     except ValueError as e:
         raise ValidationException(str(e)) from e
+    return await exploration_service.to_read(db_session, exploration)
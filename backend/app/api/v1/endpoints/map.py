@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from pydantic import UUID4
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -15,18 +15,31 @@ from app.services.map_service import map_service
 router = APIRouter(prefix="/map", tags=["Map"])
 
 
-@router.get("/vault/{vault_id}", response_model=VaultMapResponse)
+@router.get(
+    "/vault/{vault_id}",
+    response_model=VaultMapResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Map unchanged since the given ETag"}},
+)
 async def get_vault_map(
     vault: Annotated[Vault, Depends(get_user_vault_or_403)],
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    response: Response,
     unlocked_only: Annotated[bool, Query()] = False,
-) -> VaultMapResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> VaultMapResponse | Response:
     """Return the full world-map for a vault.
 
     Pass *unlocked_only=True* to hide non-VAULT locations that have no unlocked
     dweller links.  The default (False) returns every location regardless of
     unlock state so the frontend can style locked markers.
+
+    The response carries an ``ETag``; sending it back as ``If-None-Match``
+    yields ``304 Not Modified`` until the map changes.
     """
+    etag = map_service.map_etag(vault, unlocked_only=unlocked_only)
+    if if_none_match is not None and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return await map_service.get_vault_map(db_session, vault, unlocked_only=unlocked_only)
 
 
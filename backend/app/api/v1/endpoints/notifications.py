@@ -4,13 +4,15 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import UUID4
+from redis.asyncio import Redis
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import CurrentActiveUser
+from app.api.deps import CurrentActiveUser, get_redis_client
 from app.crud.notification import notification as notification_crud
 from app.db.session import get_async_session
 from app.models.notification import NotificationCreate, NotificationRead
 from app.schemas.responses import CountResponse, MarkReadResponse
+from app.services.notification_counter import unread_counter
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -41,13 +43,16 @@ async def get_notifications(
 async def get_unread_count(
     user: CurrentActiveUser,
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
 ) -> CountResponse:
     """Get count of unread notifications.
 
+    Served from a Redis counter; the database is only counted on a cache miss.
+
     Returns:
         Count of unread notifications.
     """
-    count = await notification_crud.get_unread_count(db_session, user_id=user.id)
+    count = await unread_counter.get(db_session, redis_client, user.id)
     return CountResponse(count=count)
 
 
@@ -56,13 +61,16 @@ async def create_notification(
     notification_data: NotificationCreate,
     user: CurrentActiveUser,  # ruff: ignore[unused-function-argument]
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
 ) -> NotificationRead:
     """Create a new notification (admin/system use).
 
     Returns:
         The created notification.
     """
-    return await notification_crud.create(db_session, obj_in=notification_data)
+    notification = await notification_crud.create(db_session, obj_in=notification_data)
+    await unread_counter.adjust(redis_client, {notification.user_id: 1})
+    return notification
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationRead)
@@ -70,6 +78,7 @@ async def mark_notification_as_read(
     notification_id: UUID4,
     user: CurrentActiveUser,
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
 ) -> NotificationRead:
     """Mark a notification as read.
 
@@ -82,6 +91,8 @@ async def mark_notification_as_read(
     notification = await notification_crud.mark_as_read(db_session, notification_id=notification_id, user_id=user.id)
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
+    # Whether it was unread before is unknown here, so let the next badge read recount
+    await unread_counter.invalidate(redis_client, user.id)
     return notification
 
 
@@ -89,6 +100,7 @@ async def mark_notification_as_read(
 async def mark_all_notifications_as_read(
     user: CurrentActiveUser,
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
 ) -> MarkReadResponse:
     """Mark all notifications as read for the current user.
 
@@ -96,6 +108,7 @@ async def mark_all_notifications_as_read(
         Response with count of notifications marked as read.
     """
     count = await notification_crud.mark_all_as_read(db_session, user_id=user.id)
+    await unread_counter.reset(redis_client, user.id)
     return MarkReadResponse(marked_read=count)
 
 
@@ -104,6 +117,7 @@ async def dismiss_notification(
     notification_id: UUID4,
     user: CurrentActiveUser,
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[Redis, Depends(get_redis_client)],
 ) -> NotificationRead:
     """Dismiss (soft delete) a notification.
 
@@ -116,4 +130,6 @@ async def dismiss_notification(
     notification = await notification_crud.dismiss(db_session, notification_id=notification_id, user_id=user.id)
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
+    # Whether it was unread before is unknown here, so let the next badge read recount
+    await unread_counter.invalidate(redis_client, user.id)
     return notification
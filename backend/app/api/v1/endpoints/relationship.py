@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import UUID4
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -35,6 +35,26 @@ async def get_vault_relationships(
     return await relationship_crud.get_by_vault(db_session, vault_id)
 
 
+@router.get("/vault/{vault_id}/matches/{dweller_id}", response_model=list[CompatibilityScore])
+async def get_top_matches(
+    vault_id: UUID4,
+    dweller_id: UUID4,
+    user: CurrentActiveUser,
+    db_session: Annotated[AsyncSession, Depends(get_async_session)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 5,
+    opposite_gender: Annotated[bool, Query(description="Only return matches who could have children")] = False,
+) -> list[CompatibilityScore]:
+    """Get the most compatible living adults in a vault for a dweller.
+
+    Returns:
+        Compatibility scores, best match first.
+    """
+    await get_user_vault_or_403(vault_id, user, db_session)
+    return await relationship_service.top_matches(
+        db_session, vault_id, dweller_id, limit, opposite_gender=opposite_gender
+    )
+
+
 @router.get("/{relationship_id}", response_model=RelationshipRead)
 async def get_relationship(
     relationship_id: UUID4,
@@ -104,8 +104,8 @@ async def get_training(
     # Verify training belongs to user's vault
     await get_user_vault_or_403(training.vault_id, user, db_session)
 
-    # Update progress before returning
-    training = await training_service.update_training_progress(db_session, training)
+    # Complete it first if the duration has elapsed
+    training = await training_service.complete_if_due(db_session, training)
 
     return TrainingProgress(
         **training.model_dump(),
@@ -0,0 +1,106 @@
+"""CLI command group: partitions — monthly partitions of the append-only tables.
+
+Thin wrapper over :mod:`app.db.partitioning`; see its docstring for the layout.
+
+Usage (from backend/):
+    uv run fo-cli partitions status
+    uv run fo-cli partitions enable
+    uv run fo-cli partitions maintain
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Annotated, Any
+
+import typer
+from sqlalchemy import Connection
+
+from app.core.config import settings
+from app.db.partitioning import (
+    PARTITIONED_TABLES,
+    convert_to_partitioned,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+)
+
+app = typer.Typer(
+    name="partitions",
+    help="Inspect and maintain monthly partitions of notification, chat and LLM tables (PostgreSQL).",
+    no_args_is_help=True,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _run_sync(fn: Callable[[Connection], Any]) -> Any:
+    """Run ``fn`` on a synchronous connection in one committed transaction."""
+
+    async def _run() -> Any:
+        from app.cli.main import _make_async_session
+
+        session_factory = _make_async_session()
+        async with session_factory() as session:
+            connection = await session.connection()
+            result = await connection.run_sync(fn)
+            await session.commit()
+            return result
+
+    return asyncio.run(_run())
+
+
+def _status(connection: Connection) -> dict[str, list[str] | None]:
+    return {
+        table: list_partitions(connection, table) if is_partitioned(connection, table) else None
+        for table in PARTITIONED_TABLES
+    }
+
+
+@app.command("status")
+def status() -> None:
+    """Show which tables are partitioned and their partitions."""
+    for table, partitions in _run_sync(_status).items():
+        if partitions is None:
+            typer.echo(f"{table}: not partitioned")
+        else:
+            typer.echo(f"{table}: {len(partitions)} partition(s)")
+            for name in partitions:
+                typer.echo(f"  {name}")
+
+
+@app.command("enable")
+def enable(
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip the confirmation prompt")] = False,
+) -> None:
+    """Convert the tables to monthly partitions, copying their rows (locks each table while it runs)."""
+    if not yes:
+        typer.confirm("Rebuild notification, chatmessage and llminteraction as partitioned tables?", abort=True)
+
+    def _convert(connection: Connection) -> list[str]:
+        return [
+            table
+            for table in PARTITIONED_TABLES
+            if convert_to_partitioned(connection, table, settings.DB_PARTITION_MONTHS_AHEAD)
+        ]
+
+    try:
+        converted = _run_sync(_convert)
+    except Exception as exc:
+        logger.exception("partitions enable failed")
+        typer.echo("Error: partition conversion failed — see logs for details.", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if converted:
+        typer.echo(f"✓ Partitioned {', '.join(converted)}.")
+    else:
+        typer.echo("Nothing to do: tables already partitioned or database is not PostgreSQL.")
+
+
+@app.command("maintain")
+def maintain() -> None:
+    """Create the upcoming monthly partitions now (normally done by the daily worker job)."""
+    created = _run_sync(lambda connection: ensure_partitions(connection, settings.DB_PARTITION_MONTHS_AHEAD))
+    typer.echo(f"✓ Created {len(created)} partition(s).")
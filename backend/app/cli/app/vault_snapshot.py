@@ -0,0 +1,97 @@
+"""CLI command group: vault-snapshot — move or back up a whole vault.
+
+Thin wrapper over :class:`app.services.vault_snapshot.VaultSnapshotService`;
+all business logic lives in the service layer per AGENTS.md.
+
+Usage (from backend/):
+    uv run fo-cli vault-snapshot export --vault-id <UUID> --output vault.ndjson.gz
+    uv run fo-cli vault-snapshot import --input vault.ndjson.gz --user-id <UUID>
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Annotated
+from uuid import UUID
+
+import typer
+
+from app.services.vault_snapshot import SnapshotResult, vault_snapshot_service
+from app.utils.exceptions import ResourceNotFoundException
+
+app = typer.Typer(
+    name="vault-snapshot",
+    help="Export a vault to a compressed archive or import one as a new vault.",
+    no_args_is_help=True,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _echo_counts(result: SnapshotResult) -> None:
+    for table, count in result.row_counts.items():
+        typer.echo(f"  {table:<28} {count:>8,}")
+
+
+@app.command("export")
+def export_vault(
+    vault_id: Annotated[UUID, typer.Option("--vault-id", help="Vault to export")],
+    output: Annotated[Path, typer.Option("--output", "-o", dir_okay=False, help="Archive path (.ndjson.gz)")],
+) -> None:
+    """Stream every row of a vault into a gzip-compressed NDJSON archive."""
+
+    async def _run() -> SnapshotResult:
+        from app.cli.main import _make_async_session
+
+        session_factory = _make_async_session()
+        async with session_factory() as session:
+            with output.open("wb") as destination:
+                return await vault_snapshot_service.export_vault(session, vault_id, destination)
+
+    try:
+        result = asyncio.run(_run())
+    except ResourceNotFoundException as exc:
+        output.unlink(missing_ok=True)
+        typer.echo(f"Error: {exc.detail}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as exc:
+        output.unlink(missing_ok=True)
+        logger.exception("vault-snapshot export failed")
+        typer.echo("Error: vault-snapshot export failed — see logs for details.", err=True)
+        raise typer.Exit(code=1) from exc
+
+    _echo_counts(result)
+    typer.echo(f"✓ Exported {result.total_rows:,} rows to {output}.")
+
+
+@app.command("import")
+def import_vault(
+    input_path: Annotated[
+        Path, typer.Option("--input", "-i", exists=True, dir_okay=False, help="Archive written by 'export'")
+    ],
+    user_id: Annotated[UUID, typer.Option("--user-id", help="Owner of the imported vault")],
+) -> None:
+    """Load an archive as a new vault with fresh ids; the source vault is untouched."""
+
+    async def _run() -> SnapshotResult:
+        from app.cli.main import _make_async_session
+
+        session_factory = _make_async_session()
+        async with session_factory() as session:
+            with input_path.open("rb") as source:
+                return await vault_snapshot_service.import_vault(session, source, user_id=user_id)
+
+    try:
+        result = asyncio.run(_run())
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as exc:
+        logger.exception("vault-snapshot import failed")
+        typer.echo("Error: vault-snapshot import failed — see logs for details.", err=True)
+        raise typer.Exit(code=1) from exc
+
+    _echo_counts(result)
+    typer.echo(f"✓ Imported {result.total_rows:,} rows as vault {result.vault_id}.")
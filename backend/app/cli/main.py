@@ -5,6 +5,7 @@ Usage:
     uv run fo-cli createsuperuser
     uv run fo-cli migrations upgrade head
     uv run fo-cli startapp dweller
+    uv run fo-cli vault-snapshot export --vault-id <UUID> -o vault.ndjson.gz
 """
 
 import asyncio
@@ -19,7 +20,9 @@ from app import crud
 from app.cli.app.dweller_bios import dweller_bios as _dweller_bios
 from app.cli.app.family_scenario import app as family_scenario
 from app.cli.app.manage import startapp as _startapp
+from app.cli.app.partitions import app as partitions
 from app.cli.app.pregen_dwellers import pregen_dwellers as _pregen_dwellers
+from app.cli.app.vault_snapshot import app as vault_snapshot
 from app.cli.migrations.cli import migrations
 from app.core.config import settings
 from app.db.session import async_engine
@@ -34,6 +37,8 @@ cli = typer.Typer(
 # Register sub-command groups
 cli.add_typer(migrations, name="migrations", help="Alembic database migrations")
 cli.add_typer(family_scenario, name="family-scenario", help="Dev/QA: build family/breeding test scenarios")
+cli.add_typer(vault_snapshot, name="vault-snapshot", help="Export or import a whole vault as a compressed archive")
+cli.add_typer(partitions, name="partitions", help="Monthly partitions of notification, chat and LLM tables")
 
 # Re-register startapp as a flat command
 cli.command(name="startapp", help="Scaffold a new app module (model, schema, CRUD, API, service)")(_startapp)
@@ -135,17 +140,15 @@ def createsuperuser(
 
 @cli.command()
 def seed() -> None:
-    """Re-seed quests and objectives from JSON files into the database."""
-    from app.utils.seed_objectives import seed_objectives_from_json
-    from app.utils.seed_quests import seed_quests_from_json
+    """Re-seed quests and objectives from JSON files into the database, even if the data files are unchanged."""
+    from app.utils.seed_runner import seed_static_content
 
     async def _seed() -> None:
         async_session = _make_async_session()
         async with async_session() as session:
-            quest_count = await seed_quests_from_json(session)
-            objective_count = await seed_objectives_from_json(session)
-            typer.echo(f"  Quests seeded: {quest_count}")
-            typer.echo(f"  Objectives seeded: {objective_count}")
+            seeded = await seed_static_content(session, force=True)
+            typer.echo(f"  Quests seeded: {seeded['quests']}")
+            typer.echo(f"  Objectives seeded: {seeded['objectives']}")
 
     asyncio.run(_seed())
     typer.echo("✅ Seeding complete.")
@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     ALGORITHM: str = "HS256"
     SECRET_KEY: str
+    # bcrypt cost for new hashes; older hashes at a different cost are re-hashed on the next successful login
+    PASSWORD_BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    PASSWORD_HASH_WORKERS: int = Field(default=4, ge=1, le=64)  # Threads reserved for bcrypt work
 
     EMAIL_TEST_USER: EmailStr
     FIRST_SUPERUSER_USERNAME: str
@@ -60,6 +63,17 @@ class Settings(BaseSettings):
         "weapon-images",
         "room-images",
     ]
+    RUSTFS_MAX_POOL_CONNECTIONS: int = Field(default=32, ge=1, le=256)
+    RUSTFS_MULTIPART_THRESHOLD: int = Field(default=8 * 1024 * 1024, ge=5 * 1024 * 1024)
+    RUSTFS_MULTIPART_CHUNK_SIZE: int = Field(default=8 * 1024 * 1024, ge=5 * 1024 * 1024)
+    RUSTFS_MULTIPART_CONCURRENCY: int = Field(default=4, ge=1, le=32)
+    RUSTFS_DOWNLOAD_CHUNK_SIZE: int = Field(default=64 * 1024, ge=1024)
+
+    # Media pipeline (content-addressed blobs + derived image variants)
+    MEDIA_VARIANT_WIDTHS: list[int] = [64, 128, 256, 512]
+    MEDIA_VARIANT_FORMATS: list[str] = ["webp", "avif"]
+    MEDIA_THUMBNAIL_WIDTH: int = 256
+    MEDIA_PROCESS_WORKERS: int = Field(default=2, ge=0, le=16)  # 0 renders variants on a thread instead
 
     # AI Configuration
     PYDANTIC_AI_GATEWAY_API_KEY: str | None = None
@@ -108,10 +122,20 @@ class Settings(BaseSettings):
     LOG_JSON_FORMAT: bool = False  # True for production (JSON), False for development (human-readable)
     LOG_FILE_PATH: str | None = None  # Optional: "/var/log/fallout_shelter/app.log"
     LOG_FILE_RETENTION_DAYS: int = 14  # Number of days to retain log files
+    # Per-tick log thinning, keyed by logger name (children included); WARNING and above are never dropped.
+    # Env values are JSON, e.g. LOG_SAMPLE_RATES='{"app.services.game_loop": 0.1}'
+    LOG_SAMPLE_RATES: dict[str, float] = {}  # Fraction of records kept
+    LOG_RATE_LIMITS: dict[str, int] = {}  # Records kept per message template per window
+    LOG_RATE_LIMIT_WINDOW_SECONDS: float = Field(default=60.0, gt=0)
 
     INCIDENT_RETENTION_DAYS: int = Field(default=7, ge=1)
     NOTIFICATION_RETENTION_DAYS: int = Field(default=30, ge=1)
     CLEANUP_BATCH_SIZE: int = Field(default=500, ge=1, le=10_000)
+    CLEANUP_THROTTLE_SECONDS: float = Field(default=0.0, ge=0)  # Pause between cleanup batches to spare live traffic
+    # Monthly range partitions for notification/chatmessage/llminteraction (PostgreSQL only).
+    # Applied by the migration or `fo-cli partitions enable`; retention then drops whole months.
+    DB_PARTITIONING_ENABLED: bool = False
+    DB_PARTITION_MONTHS_AHEAD: int = Field(default=3, ge=1, le=24)  # Future monthly partitions kept ready
 
     # Logfire Observability (optional)
     LOGFIRE_TOKEN: str | None = None  # Get token from https://logfire.pydantic.dev
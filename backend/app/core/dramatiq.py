@@ -13,6 +13,9 @@ if os.getenv("FALLOUT_WORKER") == "1":
         json_format=settings.LOG_JSON_FORMAT,
         log_file=settings.log_file_path,
         retention_days=settings.LOG_FILE_RETENTION_DAYS,
+        sample_rates=settings.LOG_SAMPLE_RATES,
+        rate_limits=settings.LOG_RATE_LIMITS,
+        rate_limit_window_seconds=settings.LOG_RATE_LIMIT_WINDOW_SECONDS,
     )
 
 broker = RedisBroker(url=settings.redis_url)
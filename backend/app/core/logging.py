@@ -1,8 +1,16 @@
 """Centralized logging configuration for the application."""
 
+import copy
 import logging
+import queue
+import random
 import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from pythonjsonlogger import jsonlogger
@@ -10,6 +18,9 @@ from pythonjsonlogger import jsonlogger
 # Context var for request ID tracking across async operations
 request_id_ctx_var: ContextVar[str | None] = ContextVar("request_id", default=None)
 
+# Upper bound on rate-limit windows tracked at once; the least recently used go first
+_MAX_RATE_WINDOWS = 4096
+
 
 class RequestIdFilter(logging.Filter):
     """Add request ID to log records from context variable."""
@@ -19,6 +30,111 @@ class RequestIdFilter(logging.Filter):
         return True
 
 
+class SamplingFilter(logging.Filter):
+    """Thin out sub-WARNING records from chatty loggers (per-tick messages).
+
+    Rules are keyed by logger name and also cover its children; the most
+    specific configured name wins. Warnings and errors always pass.
+
+    - ``sample_rates``: fraction of records kept, e.g. ``{"app.services.game_loop": 0.1}``
+    - ``rate_limits``: records kept per message template per ``window_seconds``
+
+    A template is the ``%``-style format string; an f-string message has none,
+    so its call site stands in for it.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Mapping[str, float] | None = None,
+        rate_limits: Mapping[str, int] | None = None,
+        window_seconds: float = 60.0,
+    ) -> None:
+        super().__init__()
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.window_seconds = window_seconds
+        self._rules: dict[str, tuple[float | None, int | None]] = {}
+        self._windows: OrderedDict[tuple[str, str, int, str | None], tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _lookup(rules: Mapping[str, Any], name: str) -> Any:
+        while name:
+            if name in rules:
+                return rules[name]
+            name = name.rpartition(".")[0]
+        return None
+
+    def _rule(self, name: str) -> tuple[float | None, int | None]:
+        rule = self._rules.get(name)
+        if rule is None:
+            rule = self._rules[name] = (self._lookup(self.sample_rates, name), self._lookup(self.rate_limits, name))
+        return rule
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        sample_rate, rate_limit = self._rule(record.name)
+        if sample_rate is not None and random.random() >= sample_rate:
+            return False
+        if rate_limit is None:
+            return True
+
+        template = str(record.msg) if record.args else None
+        key = (record.name, record.pathname, record.lineno, template)
+        now = time.monotonic()
+        with self._lock:
+            started, count = self._windows.pop(key, (now, 0))
+            if now - started >= self.window_seconds:
+                started, count = now, 0
+            self._windows[key] = (started, count + 1)
+            # Least recently used first: drop windows that have run out and anything past the cap
+            while self._windows:
+                oldest_started, _ = next(iter(self._windows.values()))
+                if now - oldest_started < self.window_seconds and len(self._windows) <= _MAX_RATE_WINDOWS:
+                    break
+                self._windows.popitem(last=False)
+        return count < rate_limit
+
+
+class _LogQueueHandler(QueueHandler):
+    """Hand records to the background listener; the caller only pays for merging the message args."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._listening = False
+
+    def start_listener(self, *handlers: logging.Handler) -> None:
+        """Start a ``QueueListener`` writing queued records to ``handlers``."""
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self._listening = True
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve args now (they may be mutated after the call returns) but leave layout, exc_info
+        # and the final formatter to the listener thread.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def flush(self) -> None:
+        # Block until the listener has written everything queued so far (nothing drains a stopped one)
+        if self._listening:
+            self.queue.join()
+            for handler in self.listener.handlers:
+                handler.flush()
+
+    def close(self) -> None:
+        # logging.shutdown() closes handlers at exit; stopping the listener drains what is left
+        if self.listener is not None:
+            self._listening = False
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional fields."""
 
@@ -52,30 +168,37 @@ def setup_logging(
     json_format: bool = False,
     log_file: str | None = None,
     retention_days: int = 14,
+    *,
+    use_queue: bool = True,
+    sample_rates: Mapping[str, float] | None = None,
+    rate_limits: Mapping[str, int] | None = None,
+    rate_limit_window_seconds: float = 60.0,
 ) -> None:
     """
     Configure application-wide logging.
 
+    Console and file output run on a background ``QueueListener`` thread, so a
+    log call on the event loop only enqueues the record.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: If True, use JSON formatter for structured logs
         log_file: Optional file path for log output
+        retention_days: Days of rotated log files to keep
+        use_queue: If False, write from the calling thread (no listener)
+        sample_rates: Logger name -> fraction of sub-WARNING records kept
+        rate_limits: Logger name -> sub-WARNING records kept per message template per window
+        rate_limit_window_seconds: Window for ``rate_limits``
     """
+    level = getattr(logging, log_level.upper())
+
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
 
     # Remove existing handlers
     root_logger.handlers.clear()
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-
-    # Add request ID filter
-    request_id_filter = RequestIdFilter()
-    console_handler.addFilter(request_id_filter)
-
     # Configure formatter
     if json_format:
         # Production: JSON structured logs
@@ -86,8 +209,11 @@ def setup_logging(
             fmt="%(asctime)s [%(levelname)s] [%(name)s] [req:%(request_id)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
 
+    # Create console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    output_handlers: list[logging.Handler] = [console_handler]
 
     # Add file handler if specified
     if log_file:
@@ -100,10 +226,25 @@ def setup_logging(
 
         # Use rotating file handler with daily rotation and retention
         file_handler = TimedRotatingFileHandler(log_file, when="midnight", backupCount=retention_days, encoding="utf-8")
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.addFilter(request_id_filter)
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+
+    # Filters run on the calling side: the request ID lives in the caller's context,
+    # and dropped samples should never reach the queue.
+    request_id_filter = RequestIdFilter()
+    sampling_filter = SamplingFilter(sample_rates, rate_limits, rate_limit_window_seconds)
+    if use_queue:
+        queue_handler = _LogQueueHandler(queue.Queue(-1))
+        queue_handler.addFilter(request_id_filter)
+        queue_handler.addFilter(sampling_filter)
+        queue_handler.start_listener(*output_handlers)
+        root_logger.addHandler(queue_handler)
+    else:
+        for handler in output_handlers:
+            handler.addFilter(request_id_filter)
+            handler.addFilter(sampling_filter)
+            root_logger.addHandler(handler)
 
     # Suppress noisy third-party loggers
     logging.getLogger("asyncio").setLevel(logging.WARNING)
@@ -5,6 +5,7 @@ from app.models.weapon import Weapon
 from . import storage
 from .dweller import dweller
 from .exploration import exploration
+from .exploration_event import exploration_event
 from .game_state import game_state_crud
 from .incident import incident_crud
 from .item_base import CRUDItem
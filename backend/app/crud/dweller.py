@@ -11,6 +11,7 @@ from app.core.game_config import game_config
 from app.crud.base import CRUDBase
 from app.crud.room import room as room_crud
 from app.crud.vault import vault as vault_crud
+from app.crud.wasteland_location import wasteland_location as wl_crud
 from app.models.dweller import Dweller
 from app.schemas.common import AgeGroupEnum, DwellerStatusEnum, RarityEnum, RoomTypeEnum
 from app.schemas.dweller import (
@@ -69,6 +70,21 @@ class CRUDDweller(CRUDBase[Dweller, DwellerCreate, DwellerUpdate]):
             raise ResourceNotFoundException(self.model, identifier=id)
         return db_obj
 
+    async def delete(self, db_session: AsyncSession, id: UUID4, soft: bool = True) -> Dweller:
+        """Delete a dweller, invalidating the vault's cached world map if it links them."""
+        await wl_crud.bump_map_version_for_dweller(db_session, id)
+        return await super().delete(db_session, id, soft=soft)
+
+    async def soft_delete(self, db_session: AsyncSession, id: UUID4) -> Dweller:
+        """Soft delete a dweller, invalidating the vault's cached world map if it links them."""
+        await wl_crud.bump_map_version_for_dweller(db_session, id)
+        return await super().soft_delete(db_session, id)
+
+    async def restore(self, db_session: AsyncSession, id: UUID4) -> Dweller:
+        """Restore a soft-deleted dweller, putting them back on the vault's world map."""
+        await wl_crud.bump_map_version_for_dweller(db_session, id)
+        return await super().restore(db_session, id)
+
     async def get_multi_by_vault(
         self,
         db_session: AsyncSession,
@@ -142,6 +158,28 @@ class CRUDDweller(CRUDBase[Dweller, DwellerCreate, DwellerUpdate]):
         response = await db_session.execute(query)
         return response.scalars().all()
 
+    @staticmethod
+    def build_random(
+        vault_id: UUID4,
+        obj_in: DwellerCreateCommonOverride | None = None,
+        seed: int | None = None,
+        rarity: RarityEnum = RarityEnum.COMMON,
+    ) -> tuple[Dweller, tuple[str, list[str]] | None]:
+        """Build an unsaved random dweller and the bio places it should be linked to.
+
+        Bulk provisioning adds the returned rows itself; ``create_random`` is
+        the one-at-a-time wrapper that commits and registers the places.
+        """
+        dweller_data = create_random_common_dweller(seed=seed, rarity=rarity)
+        bio_places = dweller_data.pop("_bio_places", None)
+        if obj_in:
+            new_dweller_data = obj_in.model_dump(exclude_unset=True)
+            if stat := new_dweller_data.get("special_boost"):
+                dweller_data[stat.value.lower()] = game_config.dweller.boosted_stat_value
+                new_dweller_data.pop("special_boost")
+            dweller_data.update(new_dweller_data)
+        return Dweller(**dweller_data, vault_id=vault_id), bio_places
+
     @staticmethod
     async def create_random(
         db_session: AsyncSession,
@@ -162,16 +200,7 @@ class CRUDDweller(CRUDBase[Dweller, DwellerCreate, DwellerUpdate]):
         register their own places (e.g. pregen_service) pass False to avoid
         double registration.
         """
-        dweller_data = create_random_common_dweller(seed=seed, rarity=rarity)
-        bio_places = dweller_data.pop("_bio_places", None)
-        if obj_in:
-            new_dweller_data = obj_in.model_dump(exclude_unset=True)
-            if stat := new_dweller_data.get("special_boost"):
-                dweller_data[stat.value.lower()] = game_config.dweller.boosted_stat_value
-                new_dweller_data.pop("special_boost")
-            dweller_data.update(new_dweller_data)
-
-        db_obj = Dweller(**dweller_data, vault_id=vault_id)
+        db_obj, bio_places = CRUDDweller.build_random(vault_id, obj_in, seed=seed, rarity=rarity)
         db_session.add(db_obj)
         await db_session.commit()
         await db_session.refresh(db_obj)
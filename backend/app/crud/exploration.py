@@ -94,6 +94,19 @@ class CRUDExploration(CRUDBase[Exploration, ExplorationCreate, ExplorationUpdate
         result = await db_session.execute(query)
         return list(result.scalars().all())
 
+    async def get_due_by_vault(
+        self,
+        db_session: AsyncSession,
+        *,
+        vault_id: UUID4,
+        now: datetime,
+    ) -> list[Exploration]:
+        """Get the active explorations in a vault with an event or completion due by ``now``."""
+        result = await db_session.execute(
+            select(Exploration).where(Exploration.vault_id == vault_id, Exploration.due_by(now))
+        )
+        return list(result.scalars().all())
+
     async def get_by_dweller(
         self,
         db_session: AsyncSession,
@@ -0,0 +1,72 @@
+"""CRUD operations for the exploration event journal."""
+
+from collections.abc import Sequence
+
+from pydantic import UUID4
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.exploration_event import ExplorationEvent
+
+
+class CRUDExplorationEvent:
+    """Read access to the append-only journal.
+
+    Rows are written through ``Exploration.add_event`` (the write-only
+    ``journal`` relationship), so there is deliberately no update or delete here.
+    """
+
+    async def get_page(
+        self,
+        db_session: AsyncSession,
+        exploration_id: UUID4,
+        *,
+        after_seq: int | None = None,
+        limit: int | None = None,
+    ) -> Sequence[ExplorationEvent]:
+        """
+        Return journal entries in order, keyset-paginated on ``seq``.
+
+        :param db_session: Database session
+        :param exploration_id: Exploration whose journal to read
+        :param after_seq: Only return entries after this sequence number
+        :param limit: Maximum number of entries (all when None)
+        :returns: Entries ordered by ``seq``
+        """
+        query = select(ExplorationEvent).where(ExplorationEvent.exploration_id == exploration_id)
+        if after_seq is not None:
+            query = query.where(ExplorationEvent.seq > after_seq)
+        query = query.order_by(ExplorationEvent.seq)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await db_session.execute(query)
+        return result.scalars().all()
+
+    async def get_records(self, db_session: AsyncSession, exploration_id: UUID4) -> list[dict]:
+        """Return the whole journal as event dicts, oldest first."""
+        return [event.to_record() for event in await self.get_page(db_session, exploration_id)]
+
+    async def get_by_vault_and_type(
+        self,
+        db_session: AsyncSession,
+        vault_id: UUID4,
+        event_type: str,
+    ) -> Sequence[ExplorationEvent]:
+        """
+        Return every event of one type across a vault's explorations.
+
+        :param db_session: Database session
+        :param vault_id: Vault ID
+        :param event_type: Event type, e.g. ``"discovery"``
+        :returns: Entries ordered by exploration and ``seq``
+        """
+        query = (
+            select(ExplorationEvent)
+            .where(ExplorationEvent.vault_id == vault_id, ExplorationEvent.type == event_type)
+            .order_by(ExplorationEvent.exploration_id, ExplorationEvent.seq)
+        )
+        result = await db_session.execute(query)
+        return result.scalars().all()
+
+
+exploration_event = CRUDExplorationEvent()
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import select
+from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.base import CRUDBase
@@ -33,13 +33,13 @@ class CRUDNotification(CRUDBase[Notification, NotificationCreate, NotificationUp
     async def get_unread_count(self, db: AsyncSession, user_id: UUID) -> int:
         """Count unread notifications"""
         query = (
-            select(Notification)
+            select(func.count())
+            .select_from(Notification)
             .where(Notification.user_id == user_id)
             .where(~Notification.is_read)
             .where(~Notification.is_dismissed)
         )
-        result = await db.execute(query)
-        return len(list(result.scalars().all()))
+        return (await db.execute(query)).scalar_one()
 
     async def mark_as_read(self, db: AsyncSession, notification_id: UUID, user_id: UUID) -> Notification | None:
         """Mark notification as read"""
@@ -4,7 +4,6 @@ from pydantic import UUID4
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import get_user_vault_or_403
 from app.crud.base import CRUDBase
 from app.models.dweller import Dweller
 from app.models.pregnancy import Pregnancy
@@ -47,7 +46,9 @@ class CRUDPregnancy(CRUDBase[Pregnancy, PregnancyCreate, PregnancyUpdate]):
         if not mother:
             raise ResourceNotFoundException(Dweller, identifier=preg.mother_id)
 
-        # Verify user has access to the vault (raises 403 if not)
+        # Verify user has access to the vault (raises 403 if not); app.api.deps imports app.crud
+        from app.api.deps import get_user_vault_or_403
+
         await get_user_vault_or_403(mother.vault_id, user, db_session)
 
         return preg, mother
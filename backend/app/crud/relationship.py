@@ -5,6 +5,8 @@ from datetime import UTC, datetime
 from pydantic import UUID4
 from sqlalchemy import and_
 from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -226,6 +228,30 @@ class CRUDRelationship(CRUDBase[Relationship, RelationshipCreate, RelationshipUp
         await db.refresh(relationship)
         return relationship
 
+    async def bulk_upsert(self, db: AsyncSession, rows: list[dict]) -> None:
+        """
+        Insert or update many relationships in a single statement (does not commit).
+
+        Each row carries the full column set; rows whose ``id`` already exists only
+        have their affinity, stage and ``updated_at`` overwritten.
+
+        :param db: Database session
+        :param rows: Column dicts, one per relationship
+        """
+        if not rows:
+            return
+        insert = sqlite_insert if db.bind and db.bind.dialect.name == "sqlite" else pg_insert
+        statement = insert(Relationship).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[Relationship.id],
+            set_={
+                "affinity": statement.excluded.affinity,
+                "relationship_type": statement.excluded.relationship_type,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        await db.execute(statement)
+
 
 # Create singleton instance
 relationship_crud = CRUDRelationship(Relationship)
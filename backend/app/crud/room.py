@@ -1,6 +1,8 @@
 import ast
 import logging
 import operator
+from collections.abc import Callable
+from functools import lru_cache
 
 from pydantic import UUID4
 from sqlalchemy import func
@@ -37,24 +39,49 @@ _ROOM_FORMULA_OPERATORS = {
 _ROOM_FORMULA_UNARY_OPERATORS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
 
 
-def _evaluate_room_formula(formula: str, level: int, size: int) -> int:
-    """Evaluate a backend-owned room formula containing only arithmetic over L and S."""
+type _CompiledFormula = Callable[[int, int], int | float]
+
+
+def _compile_room_formula_node(node: ast.AST, formula: str) -> _CompiledFormula:
+    if isinstance(node, ast.Constant) and isinstance(node.value, int | float):
+        value = node.value
+        return lambda _level, _size: value
+    if isinstance(node, ast.Name) and node.id == "L":
+        return lambda level, _size: level
+    if isinstance(node, ast.Name) and node.id == "S":
+        return lambda _level, size: size
+    if isinstance(node, ast.BinOp) and type(node.op) in _ROOM_FORMULA_OPERATORS:
+        binary_op = _ROOM_FORMULA_OPERATORS[type(node.op)]
+        left = _compile_room_formula_node(node.left, formula)
+        right = _compile_room_formula_node(node.right, formula)
+        return lambda level, size: binary_op(left(level, size), right(level, size))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _ROOM_FORMULA_UNARY_OPERATORS:
+        unary_op = _ROOM_FORMULA_UNARY_OPERATORS[type(node.op)]
+        operand = _compile_room_formula_node(node.operand, formula)
+        return lambda level, size: unary_op(operand(level, size))
+    raise ValueError(f"Unsupported room formula: {formula!r}")
+
+
+@lru_cache(maxsize=512)
+def _compile_room_formula(formula: str) -> _CompiledFormula:
+    """Parse and validate a room formula once, returning a closure over its arithmetic tree.
+
+    Formulas come from the static room catalogue, so the set of distinct strings
+    is small and every build, upgrade and simulation step hits the cache.
+    """
+    try:
+        expression = ast.parse(formula, mode="eval")
+        return _compile_room_formula_node(expression.body, formula)
+    except (SyntaxError, ValueError) as exc:
+        raise ValueError(f"Invalid room formula: {formula!r}") from exc
 
-    def evaluate(node: ast.AST) -> int | float:
-        if isinstance(node, ast.Constant) and isinstance(node.value, int | float):
-            return node.value
-        if isinstance(node, ast.Name) and node.id in {"L", "S"}:
-            return {"L": level, "S": size}[node.id]
-        if isinstance(node, ast.BinOp) and type(node.op) in _ROOM_FORMULA_OPERATORS:
-            return _ROOM_FORMULA_OPERATORS[type(node.op)](evaluate(node.left), evaluate(node.right))
-        if isinstance(node, ast.UnaryOp) and type(node.op) in _ROOM_FORMULA_UNARY_OPERATORS:
-            return _ROOM_FORMULA_UNARY_OPERATORS[type(node.op)](evaluate(node.operand))
-        raise ValueError(f"Unsupported room formula: {formula!r}")
 
+def _evaluate_room_formula(formula: str, level: int, size: int) -> int:
+    """Evaluate a backend-owned room formula containing only arithmetic over L and S."""
+    compiled = _compile_room_formula(formula)
     try:
-        expression = ast.parse(formula, mode="eval")
-        return int(evaluate(expression.body))
-    except (ArithmeticError, SyntaxError, ValueError) as exc:
+        return int(compiled(level, size))
+    except ArithmeticError as exc:
         raise ValueError(f"Invalid room formula: {formula!r}") from exc
 
 
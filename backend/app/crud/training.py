@@ -1,5 +1,7 @@
 """CRUD operations for training."""
 
+from datetime import datetime
+
 from pydantic import UUID4
 from sqlalchemy import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +37,16 @@ class CRUDTraining(CRUDBase[Training, TrainingCreate, TrainingUpdate]):
         )
         return list(result.scalars().all())
 
+    async def get_due_by_vault(
+        self,
+        db_session: AsyncSession,
+        vault_id: UUID4,
+        now: datetime,
+    ) -> list[Training]:
+        """Get the active training sessions in a vault whose duration has elapsed by ``now``."""
+        result = await db_session.execute(select(Training).where(Training.vault_id == vault_id, Training.due_by(now)))
+        return list(result.scalars().all())
+
     async def get_active_by_room(
         self,
         db_session: AsyncSession,
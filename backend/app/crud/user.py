@@ -6,7 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import password_hasher
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.models.user_profile import UserProfile
@@ -34,7 +34,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db_obj = User(
             username=obj_in.username,
             email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=await password_hasher.hash(obj_in.password),
             is_superuser=obj_in.is_superuser,
         )
         try:
@@ -62,7 +62,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     ) -> User:
         update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
         if update_data.get("password"):
-            hashed_password = get_password_hash(update_data["password"])
+            hashed_password = await password_hasher.hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
         return await super().update(db_session, id=id, obj_in=update_data)
@@ -71,8 +71,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = await self.get_by_email(db_session, email=email, include_deleted=False)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            # Stored hash predates the current bcrypt cost; upgrade it while we have the plaintext
+            user.hashed_password = new_hash
+            db_session.add(user)
+            await db_session.commit()
         return user
 
     @staticmethod
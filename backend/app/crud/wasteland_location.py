@@ -10,6 +10,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from app.models.dweller import Dweller
+from app.models.vault import Vault
 from app.models.wasteland_location import DwellerLocation, DwellerLocationRelationEnum, WastelandLocation
 from app.utils.places import collision_nudge, normalize_place_name, schematic_coords
 
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from uuid import UUID
 
     from pydantic import UUID4
+    from sqlalchemy import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,30 @@ logger = logging.getLogger(__name__)
 class CRUDWastelandLocation:
     """Race-safe CRUD for wasteland locations and dweller-location links."""
 
+    # -- map versioning -------------------------------------------------------------
+
+    async def bump_map_version(self, db_session: AsyncSession, vault_id: UUID4 | ColumnElement) -> None:
+        """Mark the vault's cached world map stale, inside the caller's transaction.
+
+        ``vault_id`` may be a scalar subquery so callers that only know a
+        location or dweller id do not need an extra round trip.
+        """
+        await db_session.execute(sa_update(Vault).where(Vault.id == vault_id).values(map_version=Vault.map_version + 1))
+
+    @staticmethod
+    def _vault_of_location(location_id: UUID4) -> ColumnElement:
+        return select(WastelandLocation.vault_id).where(WastelandLocation.id == location_id).scalar_subquery()
+
+    async def bump_map_version_for_dweller(self, db_session: AsyncSession, dweller_id: UUID4) -> None:
+        """Mark stale the map of the vault whose places link ``dweller_id`` (before the dweller is removed)."""
+        vault_id = (
+            select(Dweller.vault_id)
+            .where(Dweller.id == dweller_id)
+            .where(select(DwellerLocation.dweller_id).where(DwellerLocation.dweller_id == dweller_id).exists())
+            .scalar_subquery()
+        )
+        await self.bump_map_version(db_session, vault_id)
+
     # -- WastelandLocation queries -------------------------------------------------
 
     async def get_by_id(self, db_session: AsyncSession, location_id: UUID4) -> WastelandLocation | None:
@@ -107,10 +133,13 @@ class CRUDWastelandLocation:
             if not commit:
                 db_session.add(obj)
                 await db_session.flush()
+                await self.bump_map_version(db_session, vault_id)
                 return obj
 
             try:
                 db_session.add(obj)
+                await db_session.flush()
+                await self.bump_map_version(db_session, vault_id)
                 await db_session.commit()
             except IntegrityError:
                 # Race: another request already inserted this name
@@ -169,6 +198,7 @@ class CRUDWastelandLocation:
             if is_unlocked and not existing.is_unlocked:
                 existing.is_unlocked = True
                 db_session.add(existing)
+                await self.bump_map_version(db_session, self._vault_of_location(location_id))
                 if commit:
                     await db_session.commit()
                     await db_session.refresh(existing)
@@ -183,8 +213,11 @@ class CRUDWastelandLocation:
         db_session.add(link)
         if not commit:
             await db_session.flush()
+            await self.bump_map_version(db_session, self._vault_of_location(location_id))
             return link
         try:
+            await db_session.flush()
+            await self.bump_map_version(db_session, self._vault_of_location(location_id))
             await db_session.commit()
         except IntegrityError:
             await db_session.rollback()
@@ -194,6 +227,7 @@ class CRUDWastelandLocation:
                 if is_unlocked and not existing.is_unlocked:
                     existing.is_unlocked = True
                     db_session.add(existing)
+                    await self.bump_map_version(db_session, self._vault_of_location(location_id))
                     await db_session.commit()
                     await db_session.refresh(existing)
                 return existing
@@ -222,6 +256,7 @@ class CRUDWastelandLocation:
             )
             .join(Dweller, Dweller.id == DwellerLocation.dweller_id)
             .where(DwellerLocation.location_id.in_(location_ids))
+            .where(~Dweller.is_deleted)
         )
         result = await db_session.execute(stmt)
         rows = result.all()
@@ -250,6 +285,9 @@ class CRUDWastelandLocation:
             .values(is_unlocked=True)
         )
         result = await db_session.execute(stmt)
+        if result.rowcount:
+            vault_id = select(Dweller.vault_id).where(Dweller.id == dweller_id).scalar_subquery()
+            await self.bump_map_version(db_session, vault_id)
         await db_session.commit()
         return result.rowcount
 
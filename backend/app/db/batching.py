@@ -0,0 +1,166 @@
+"""Constant-memory building blocks for maintenance and backfill jobs.
+
+Three shapes cover the batch jobs in this codebase:
+
+* :func:`stream_batches` — read-only scans inside one transaction, fetched
+  through a server-side cursor (``yield_per``) one partition at a time.
+* :func:`iter_keyset` — scans whose consumer commits between batches. Each batch
+  is its own ``WHERE key > :last ORDER BY key LIMIT n`` query, so no cursor is
+  held across commits and the last key can be checkpointed so a rerun resumes.
+* :func:`delete_in_batches` — set-based ``DELETE ... WHERE key IN (SELECT key
+  ... LIMIT n) RETURNING key`` with one commit per batch, so no rows are loaded
+  into the session and each transaction holds its locks only briefly.
+
+All three accept ``throttle_seconds`` to leave headroom for live traffic and log
+progress under the job ``label``.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Checkpoint(Protocol):
+    """Where a keyset scan records the last key whose batch was fully processed."""
+
+    def load(self) -> str | None: ...
+
+    def save(self, key: Any) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class FileCheckpoint:
+    """Checkpoint kept in a small JSON file, for CLI jobs that may be interrupted and rerun."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    def load(self) -> str | None:
+        try:
+            return json.loads(self.path.read_text())["last_key"]
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: Any) -> None:
+        # Write-then-rename so a crash mid-write never leaves a truncated checkpoint
+        tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp.write_text(json.dumps({"last_key": str(key)}))
+        tmp.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+async def stream_batches(
+    db_session: AsyncSession,
+    statement: Select,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Any]]:
+    """Yield the results of ``statement`` in partitions read from a server-side cursor.
+
+    Single-entity or single-column statements yield scalars, anything else yields
+    rows. The cursor lives as long as the transaction, so the consumer must not
+    commit or roll back until the iteration is finished; use :func:`iter_keyset`
+    for jobs that do.
+    """
+    result = await db_session.stream(statement.execution_options(yield_per=batch_size))
+    partitions = result.scalars().partitions() if len(statement.column_descriptions) == 1 else result.partitions()
+    async for partition in partitions:
+        yield partition
+
+
+async def iter_keyset(
+    db_session: AsyncSession,
+    statement: Select,
+    key: InstrumentedAttribute,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    checkpoint: Checkpoint | None = None,
+    throttle_seconds: float = 0.0,
+    label: str = "keyset scan",
+) -> AsyncIterator[Sequence[Any]]:
+    """Yield ``statement``'s results in batches ordered by the unique column ``key``.
+
+    The consumer may commit between batches. When a ``checkpoint`` is given, the
+    scan resumes after its saved key, and a batch's last key is saved only once
+    the consumer asks for the next batch, so an interrupted batch is redone
+    rather than skipped. A scan that runs to the end clears the checkpoint.
+    """
+    last_key: Any = None
+    if checkpoint is not None and (saved := checkpoint.load()) is not None:
+        last_key = key.type.python_type(saved)
+        logger.info("%s: resuming after %s", label, last_key)
+
+    single = len(statement.column_descriptions) == 1
+    keyed = statement.add_columns(key).order_by(None).order_by(key).limit(batch_size)
+    processed = 0
+    while True:
+        page = keyed if last_key is None else keyed.where(key > last_key)
+        rows = (await db_session.execute(page)).all()
+        if not rows:
+            break
+
+        yield [row[0] for row in rows] if single else [row[:-1] for row in rows]
+
+        last_key = rows[-1][-1]
+        processed += len(rows)
+        if checkpoint is not None:
+            checkpoint.save(last_key)
+        logger.info("%s: %d row(s) processed", label, processed)
+        if len(rows) < batch_size:
+            break
+        if throttle_seconds:
+            await asyncio.sleep(throttle_seconds)
+
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+async def delete_in_batches(
+    db_session: AsyncSession,
+    key: InstrumentedAttribute,
+    *criteria: Any,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    throttle_seconds: float = 0.0,
+    label: str = "batched delete",
+) -> int:
+    """Delete every row matching ``criteria``, ``batch_size`` rows per transaction.
+
+    Rows are never loaded into the session: each round is a single
+    ``DELETE ... WHERE key IN (SELECT key ... LIMIT n) RETURNING key``, committed
+    before the next one starts. ORM-level cascades do not run, so use this only
+    for tables whose dependents are removed by ``ON DELETE`` in the database.
+
+    Returns:
+        Number of rows deleted
+    """
+    victims = select(key).where(*criteria).limit(batch_size)
+    statement = delete(key.class_).where(key.in_(victims)).returning(key).execution_options(synchronize_session=False)
+    deleted = 0
+    while True:
+        try:
+            removed = len((await db_session.execute(statement)).all())
+            await db_session.commit()
+        except Exception:
+            await db_session.rollback()
+            raise
+        deleted += removed
+        if removed:
+            logger.info("%s: %d row(s) deleted", label, deleted)
+        if removed < batch_size:
+            return deleted
+        if throttle_seconds:
+            await asyncio.sleep(throttle_seconds)
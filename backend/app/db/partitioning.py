@@ -0,0 +1,278 @@
+"""Opt-in monthly range partitioning for the append-only tables.
+
+``notification``, ``chatmessage`` and ``llminteraction`` only ever grow, and every
+hot query against them is bounded by ``created_at``. On PostgreSQL they can be
+converted to tables partitioned by calendar month of ``created_at``:
+
+* queries with a ``created_at >= :month_start`` predicate (monthly quota and
+  usage) are pruned to the partitions they cover;
+* retention drops whole expired partitions instead of deleting row by row;
+* a ``DEFAULT`` partition catches rows outside the created months, so a missed
+  maintenance run never fails an insert; when the month's partition is created
+  later, those rows are moved into it.
+
+Conversion is switched on by ``DB_PARTITIONING_ENABLED`` when the Alembic
+migration runs, or later with ``fo-cli partitions enable``. Future partitions
+are created ahead of time by the daily ``maintain_partitions`` actor. On other
+dialects (SQLite in tests) or unconverted tables every function is a no-op, so
+callers never need to check.
+
+The primary key of a partitioned table must include the partition key, so it
+becomes ``(id, created_at)``; ``id`` stays unique in practice (UUID4) and the ORM
+keeps addressing rows by ``id``. PostgreSQL cannot reference a partitioned table
+by ``id`` alone, so foreign keys pointing *at* a converted table (only
+``chatmessage.llm_interaction_id``) are dropped.
+
+The functions take a synchronous ``Connection`` so Alembic can call them
+directly; async callers go through ``AsyncConnection.run_sync``.
+"""
+
+import logging
+import re
+from datetime import date, datetime
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.schema import AddConstraint
+from sqlmodel import SQLModel
+
+logger = logging.getLogger(__name__)
+
+# Table name -> partition key column. Identifiers interpolated into DDL below only ever
+# come from this mapping or from the catalog, never from user input.
+PARTITIONED_TABLES: dict[str, str] = {
+    "notification": "created_at",
+    "chatmessage": "created_at",
+    "llminteraction": "created_at",
+}
+
+_PARTITION_NAME = re.compile(r"^(?P<table>\w+)_y(?P<year>\d{4})m(?P<month>\d{2})$")
+
+
+def month_start(moment: date | datetime) -> date:
+    """First day of the month containing ``moment``."""
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month ``count`` months after ``month`` (which must be a month start)."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(table: str, name: str) -> date | None:
+    """Month covered by partition ``name`` of ``table``, or ``None`` for the default/foreign names."""
+    match = _PARTITION_NAME.match(name)
+    if match is None or match["table"] != table:
+        return None
+    return date(int(match["year"]), int(match["month"]), 1)
+
+
+def expired_partitions(table: str, names: list[str], cutoff: datetime) -> list[str]:
+    """Monthly partitions of ``table`` whose every row is older than ``cutoff``."""
+    expired = []
+    for name in names:
+        month = partition_month(table, name)
+        if month is not None and datetime.combine(add_months(month, 1), datetime.min.time()) <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.scalar(
+            text(
+                "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE c.relname = :table AND c.relnamespace = 'public'::regnamespace"
+            ),
+            {"table": table},
+        )
+    )
+
+
+def list_partitions(connection: Connection, table: str) -> list[str]:
+    """Names of the partitions currently attached to ``table``."""
+    if not is_partitioned(connection, table):
+        return []
+    return list(
+        connection.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = :table AND parent.relnamespace = 'public'::regnamespace "
+                "ORDER BY child.relname"
+            ),
+            {"table": table},
+        )
+    )
+
+
+def _create_month_partition(connection: Connection, table: str, month: date) -> None:
+    """Create ``table``'s partition for ``month``, moving any of its rows out of the DEFAULT partition.
+
+    PostgreSQL refuses ``CREATE TABLE ... PARTITION OF`` while the DEFAULT
+    partition holds rows in the new range (after a missed maintenance run, or
+    rows with future timestamps), so the partition is built standalone, filled
+    from DEFAULT and then attached.
+    """
+    key = PARTITIONED_TABLES[table]
+    name = partition_name(table, month)
+    bounds = f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    connection.execute(text(f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    moved = connection.execute(
+        text(
+            f'WITH moved AS (DELETE FROM "{table}_default" '  # ruff: ignore[hardcoded-sql-expression]
+            f'WHERE "{key}" >= :start AND "{key}" < :end RETURNING *) '
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        {"start": month, "end": add_months(month, 1)},
+    ).rowcount
+    connection.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" FOR VALUES {bounds}'))
+    if moved:
+        logger.warning("Moved %d row(s) from %s_default into new partition %s", moved, table, name)
+
+
+def ensure_partitions(connection: Connection, months_ahead: int, today: date | None = None) -> list[str]:
+    """Create the partitions from the current month through ``months_ahead`` months ahead.
+
+    Each table is maintained in its own savepoint, so a failure is logged and
+    the remaining tables are still maintained.
+
+    Returns:
+        Names of the partitions that did not exist yet
+    """
+    current = month_start(today or datetime.utcnow())
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = set(list_partitions(connection, table))
+        if not existing:
+            continue
+        missing = [
+            month
+            for month in (add_months(current, offset) for offset in range(months_ahead + 1))
+            if partition_name(table, month) not in existing
+        ]
+        if not missing:
+            continue
+        try:
+            with connection.begin_nested():
+                for month in missing:
+                    _create_month_partition(connection, table, month)
+        except SQLAlchemyError:
+            logger.exception("Partition maintenance failed for %s", table)
+            continue
+        created.extend(partition_name(table, month) for month in missing)
+    if created:
+        logger.info("Created partitions: %s", ", ".join(created))
+    return created
+
+
+def drop_expired_partitions(connection: Connection, table: str, cutoff: datetime) -> int:
+    """Drop the monthly partitions of ``table`` that lie entirely before ``cutoff``.
+
+    Rows of the month straddling ``cutoff`` stay; the caller deletes those.
+
+    Returns:
+        Number of rows removed with the dropped partitions
+    """
+    removed = 0
+    for name in expired_partitions(table, list_partitions(connection, table), cutoff):
+        removed += connection.scalar(text(f'SELECT count(*) FROM "{name}"'))  # ruff: ignore[hardcoded-sql-expression]
+        connection.execute(text(f'DROP TABLE "{name}"'))
+        logger.info("Dropped partition %s", name)
+    return removed
+
+
+def convert_to_partitioned(connection: Connection, table: str, months_ahead: int) -> bool:
+    """Rebuild ``table`` as a monthly range-partitioned table, keeping its rows.
+
+    Runs in the caller's transaction and holds an exclusive lock on the table
+    while rows are copied, so run it in a maintenance window on large tables.
+
+    Returns:
+        ``False`` if there was nothing to do (not PostgreSQL, or already partitioned)
+    """
+    if connection.dialect.name != "postgresql" or is_partitioned(connection, table):
+        return False
+
+    key = PARTITIONED_TABLES[table]
+    staging = f"{table}_partitioned"
+    model_table = SQLModel.metadata.tables[table]
+
+    connection.execute(text(f'LOCK TABLE "{table}" IN ACCESS EXCLUSIVE MODE'))
+    connection.execute(
+        text(
+            f'CREATE TABLE "{staging}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ("{key}")'
+        )
+    )
+    connection.execute(text(f'ALTER TABLE "{staging}" ADD PRIMARY KEY (id, "{key}")'))
+    connection.execute(text(f'CREATE TABLE "{staging}_default" PARTITION OF "{staging}" DEFAULT'))
+
+    oldest = connection.scalar(text(f'SELECT min("{key}") FROM "{table}"'))  # ruff: ignore[hardcoded-sql-expression]
+    current = month_start(datetime.utcnow())
+    month = month_start(oldest) if oldest is not None else current
+    while month <= add_months(current, months_ahead):
+        connection.execute(
+            text(
+                f'CREATE TABLE "{partition_name(table, month)}" PARTITION OF "{staging}" '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        )
+        month = add_months(month, 1)
+
+    connection.execute(text(f'INSERT INTO "{staging}" SELECT * FROM "{table}"'))  # ruff: ignore[hardcoded-sql-expression]
+    # CASCADE drops foreign keys that point at the old table (see module docstring)
+    connection.execute(text(f'DROP TABLE "{table}" CASCADE'))
+    connection.execute(text(f'ALTER TABLE "{staging}" RENAME TO "{table}"'))
+    connection.execute(text(f'ALTER TABLE "{staging}_default" RENAME TO "{table}_default"'))
+
+    # Indexes and outgoing foreign keys were not copied by LIKE; recreate them from the models
+    for index in model_table.indexes:
+        index.create(connection)
+    for constraint in model_table.foreign_key_constraints:
+        if constraint.referred_table.name not in PARTITIONED_TABLES:
+            connection.execute(AddConstraint(constraint))
+
+    logger.info("Partitioned table %s by month of %s", table, key)
+    return True
+
+
+def convert_to_plain(connection: Connection, table: str) -> bool:
+    """Undo :func:`convert_to_partitioned`, keeping the rows.
+
+    Returns:
+        ``False`` if ``table`` was not partitioned
+    """
+    if not is_partitioned(connection, table):
+        return False
+
+    model_table = SQLModel.metadata.tables[table]
+    staging = f"{table}_plain"
+    connection.execute(text(f'CREATE TABLE "{staging}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    connection.execute(text(f'INSERT INTO "{staging}" SELECT * FROM "{table}"'))  # ruff: ignore[hardcoded-sql-expression]
+    connection.execute(text(f'DROP TABLE "{table}" CASCADE'))
+    connection.execute(text(f'ALTER TABLE "{staging}" RENAME TO "{table}"'))
+    connection.execute(text(f'ALTER TABLE "{table}" ADD PRIMARY KEY (id)'))
+    for index in model_table.indexes:
+        index.create(connection)
+    for constraint in model_table.foreign_key_constraints:
+        if not is_partitioned(connection, constraint.referred_table.name):
+            connection.execute(AddConstraint(constraint))
+    # Restore foreign keys into this table that conversion dropped
+    for other in PARTITIONED_TABLES:
+        if other == table or is_partitioned(connection, other):
+            continue
+        for constraint in SQLModel.metadata.tables[other].foreign_key_constraints:
+            if constraint.referred_table.name == table:
+                connection.execute(AddConstraint(constraint))
+
+    logger.info("Converted table %s back to an unpartitioned table", table)
+    return True
@@ -1,6 +1,7 @@
 from .chat_message import ChatMessage, ChatMessageCreate, ChatMessageRead
 from .dweller import Dweller
 from .exploration import Exploration
+from .exploration_event import ExplorationEvent
 from .game_state import GameState
 from .incident import Incident, IncidentStatus, IncidentType
 from .item import Item
@@ -17,6 +18,7 @@ from .quest_requirement import QuestRequirement, RequirementType
 from .quest_reward import QuestReward, RewardType
 from .relationship import Relationship
 from .room import Room
+from .seed_state import SeedState
 from .storage import Storage
 from .training import Training
 from .user import User
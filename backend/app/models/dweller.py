@@ -34,6 +34,7 @@ class DwellerBaseWithoutStats(SQLModel):
     visual_attributes: dict | None = Field(default=None, sa_column=sa.Column(JSONB))
     image_url: str | None = Field(default=None, max_length=255)
     thumbnail_url: str | None = Field(default=None, max_length=255)
+    image_variants: list[dict] | None = Field(default=None, sa_column=sa.Column(JSONB))
 
     # Stats
     level: int = Field(default=1, ge=1, le=50)
@@ -1,15 +1,17 @@
 """Exploration models for wasteland expeditions."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import StrEnum
 
 import sqlalchemy as sa
 from pydantic import UUID4
 from sqlalchemy import orm
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Relationship, SQLModel
 
+from app.core.game_config import game_config
 from app.models.base import BaseUUIDModel, TimeStampMixin
+from app.models.exploration_event import ExplorationEvent
 
 
 def get_utc_now() -> datetime:
@@ -33,8 +35,12 @@ class ExplorationBase(SQLModel):
     end_time: datetime | None = Field(default=None)
     status: ExplorationStatus = Field(default=ExplorationStatus.ACTIVE, index=True)
 
-    # Journey log and events
-    events: list[dict] = Field(default_factory=list, sa_column=sa.Column(JSONB))
+    # Journey log lives in the exploration_event table; these summarise it
+    event_count: int = Field(default=0, ge=0, sa_column_kwargs={"server_default": "0"})
+    last_event_at: datetime | None = Field(default=None)
+    # When the game loop next has work here (next event or the end of the trip);
+    # None until the first tick schedules it
+    next_due_at: datetime | None = Field(default=None)
     loot_collected: list[dict] = Field(default_factory=list, sa_column=sa.Column(JSONB))
 
     # Stats at start (for calculations)
@@ -59,9 +65,29 @@ class ExplorationBase(SQLModel):
 class Exploration(BaseUUIDModel, ExplorationBase, TimeStampMixin, table=True):
     """Exploration model with relationships."""
 
+    __table_args__ = (sa.Index("ix_exploration_vault_status_next_due_at", "vault_id", "status", "next_due_at"),)
+
     vault_id: UUID4 = Field(foreign_key="vault.id", index=True, ondelete="CASCADE")
     dweller_id: UUID4 = Field(foreign_key="dweller.id", index=True, ondelete="CASCADE")
 
+    # Write-only (a WriteOnlyCollection at runtime): appending queues an INSERT
+    # without ever loading the journal
+    journal: list[ExplorationEvent] = Relationship(
+        sa_relationship_kwargs={
+            "lazy": "write_only",
+            "passive_deletes": True,
+            "order_by": "ExplorationEvent.seq",
+        }
+    )
+
+    @classmethod
+    def due_by(cls, now: datetime) -> sa.ColumnElement[bool]:
+        """SQL filter for active explorations the game loop has work for at ``now``."""
+        return sa.and_(
+            cls.status == ExplorationStatus.ACTIVE,
+            sa.or_(cls.next_due_at.is_(None), cls.next_due_at <= now),
+        )
+
     def is_active(self) -> bool:
         """Check if exploration is still active."""
         return self.status == ExplorationStatus.ACTIVE
@@ -104,6 +130,15 @@ class Exploration(BaseUUIDModel, ExplorationBase, TimeStampMixin, table=True):
         time_since_last_event = (now - last_event_time).total_seconds()
         return time_since_last_event >= 600  # 10 minutes
 
+    def schedule_next_check(self) -> None:
+        """Set ``next_due_at`` to the next event or the end of the trip, whichever comes first."""
+        cfg = game_config.exploration
+        if self.last_event_at is None:
+            next_event_at = self.start_time + timedelta(seconds=cfg.first_event_delay_seconds)
+        else:
+            next_event_at = self.last_event_at + timedelta(seconds=cfg.event_interval_seconds)
+        self.next_due_at = min(next_event_at, self.start_time + timedelta(hours=self.duration))
+
     def complete(self) -> None:
         """Mark exploration as completed."""
         self.status = ExplorationStatus.COMPLETED
@@ -126,9 +161,11 @@ class Exploration(BaseUUIDModel, ExplorationBase, TimeStampMixin, table=True):
         health_loss: int | None = None,
         health_restored: int | None = None,
     ) -> dict:
-        """Add an event to the journey log.
+        """Append an event to the journey log.
 
-        Returns the created event record so callers can publish it (e.g. via SSE).
+        The row is queued on the session and inserted with the next flush,
+        batched with any other events added before it. Returns the created event
+        record so callers can publish it (e.g. via SSE).
         """
         event = {
             "type": event_type,
@@ -150,9 +187,12 @@ class Exploration(BaseUUIDModel, ExplorationBase, TimeStampMixin, table=True):
             event["health_loss"] = health_loss
         if health_restored is not None:
             event["health_restored"] = health_restored
-        self.events.append(event)
-        # Flag the field as modified so SQLAlchemy tracks the change
-        orm.attributes.flag_modified(self, "events")
+        self.journal.add(
+            ExplorationEvent.from_record(event, exploration_id=self.id, vault_id=self.vault_id, seq=self.event_count)
+        )
+        self.event_count += 1
+        self.last_event_at = datetime.fromisoformat(event["timestamp"])
+        self.schedule_next_check()
         return event
 
     def add_loot(self, item_name: str, quantity: int = 1, rarity: str = "common", item_type: str = "junk") -> None:
@@ -0,0 +1,68 @@
+"""Append-only journal of exploration events."""
+
+from datetime import datetime
+from uuid import UUID
+
+import sqlalchemy as sa
+from pydantic import UUID4
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from app.models.base import BaseUUIDModel
+
+# Record keys stored in dedicated columns; everything else lives in ``payload``.
+_COLUMN_KEYS = frozenset({"type", "timestamp", "location_id", "coord_x", "coord_y"})
+
+
+class ExplorationEventBase(SQLModel):
+    """Shared fields for ExplorationEvent."""
+
+    seq: int = Field(ge=0, description="0-based position in the exploration's journal")
+    type: str = Field(max_length=32)
+    ts: datetime
+    location_id: UUID4 | None = Field(default=None)
+    coord_x: float | None = Field(default=None)
+    coord_y: float | None = Field(default=None)
+    payload: dict = Field(default_factory=dict, sa_column=sa.Column(JSONB, nullable=False))
+
+
+class ExplorationEvent(BaseUUIDModel, ExplorationEventBase, table=True):
+    """One journal entry; rows are inserted once and never updated."""
+
+    __tablename__ = "exploration_event"
+
+    exploration_id: UUID4 = Field(foreign_key="exploration.id", ondelete="CASCADE")
+    vault_id: UUID4 = Field(foreign_key="vault.id", ondelete="CASCADE")
+
+    __table_args__ = (
+        sa.UniqueConstraint("exploration_id", "seq", name="uq_exploration_event_exploration_seq"),
+        sa.Index("ix_exploration_event_vault_type", "vault_id", "type"),
+    )
+
+    @classmethod
+    def from_record(cls, record: dict, *, exploration_id: UUID4, vault_id: UUID4, seq: int) -> "ExplorationEvent":
+        """Build a row from the event dict produced by ``Exploration.add_event``."""
+        location_id = record.get("location_id")
+        return cls(
+            exploration_id=exploration_id,
+            vault_id=vault_id,
+            seq=seq,
+            type=record["type"],
+            ts=datetime.fromisoformat(record["timestamp"]),
+            # Table models skip validation, so the string form add_event stores must be coerced here
+            location_id=UUID(str(location_id)) if location_id else None,
+            coord_x=record.get("coord_x"),
+            coord_y=record.get("coord_y"),
+            payload={key: value for key, value in record.items() if key not in _COLUMN_KEYS},
+        )
+
+    def to_record(self) -> dict:
+        """Rebuild the event dict in the shape the API has always returned."""
+        record = {"type": self.type, "timestamp": self.ts.isoformat(), **self.payload}
+        if self.location_id is not None:
+            record["location_id"] = str(self.location_id)
+        if self.coord_x is not None:
+            record["coord_x"] = self.coord_x
+        if self.coord_y is not None:
+            record["coord_y"] = self.coord_y
+        return record
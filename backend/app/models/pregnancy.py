@@ -23,6 +23,9 @@ class PregnancyBase(SQLModel):
 class Pregnancy(BaseUUIDModel, PregnancyBase, TimeStampMixin, table=True):
     """Tracks active pregnancies in the vault."""
 
+    # Serves the per-mother pregnant / postpartum-cooldown check of the breeding phase
+    __table_args__ = (sa.Index("ix_pregnancy_mother_status_updated_at", "mother_id", "status", "updated_at"),)
+
     mother: "Dweller" = Relationship(
         sa_relationship_kwargs={
             "foreign_keys": "[Pregnancy.mother_id]",
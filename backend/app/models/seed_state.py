@@ -0,0 +1,15 @@
+"""Record of the static game data last seeded into the database."""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class SeedState(SQLModel, table=True):
+    """Content digest of one seeder's source files at the time it was last applied."""
+
+    __tablename__ = "seed_state"
+
+    name: str = Field(primary_key=True, max_length=32)
+    digest: str = Field(max_length=64)
+    applied_at: datetime = Field(default_factory=datetime.utcnow)
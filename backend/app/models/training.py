@@ -1,9 +1,10 @@
 """Training model for dweller SPECIAL stat training."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+import sqlalchemy as sa
 from pydantic import UUID4
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -24,6 +25,16 @@ class TrainingStatus(StrEnum):
     CANCELLED = "cancelled"
 
 
+def elapsed_fraction(started_at: datetime, estimated_completion_at: datetime, now: datetime | None = None) -> float:
+    """Fraction (0.0 to 1.0) of the span from ``started_at`` to ``estimated_completion_at`` elapsed at ``now``."""
+    if now is None:
+        now = datetime.now(UTC) if started_at.tzinfo else datetime.utcnow()
+    total = (estimated_completion_at - started_at).total_seconds()
+    if total <= 0:
+        return 1.0
+    return min(1.0, max(0.0, (now - started_at).total_seconds() / total))
+
+
 class TrainingBase(SQLModel):
     """Base model for training sessions."""
 
@@ -35,7 +46,8 @@ class TrainingBase(SQLModel):
     current_stat_value: int = Field(ge=1, le=10)  # Snapshot at start
     target_stat_value: int = Field(ge=2, le=10)  # Always current + 1
 
-    progress: float = Field(default=0.0, ge=0.0, le=1.0)  # 0.0 to 1.0
+    # 0.0 to 1.0; stored once the session ends, derived from the timestamps while active
+    progress: float = Field(default=0.0, ge=0.0, le=1.0)
 
     started_at: datetime
     estimated_completion_at: datetime
@@ -47,11 +59,20 @@ class TrainingBase(SQLModel):
 class Training(BaseUUIDModel, TrainingBase, TimeStampMixin, table=True):
     """Training session for a dweller in a training room."""
 
+    __table_args__ = (
+        sa.Index("ix_training_vault_status_estimated_completion_at", "vault_id", "status", "estimated_completion_at"),
+    )
+
     # Relationships
     dweller: "Dweller" = Relationship(back_populates="trainings")
     room: "Room" = Relationship()
     vault: "Vault" = Relationship()
 
+    @classmethod
+    def due_by(cls, now: datetime) -> sa.ColumnElement[bool]:
+        """SQL filter for active trainings whose duration has elapsed at ``now``."""
+        return sa.and_(cls.status == TrainingStatus.ACTIVE, cls.estimated_completion_at <= now)
+
     def is_active(self) -> bool:
         """Check if training is currently active."""
         return self.status == TrainingStatus.ACTIVE
@@ -64,9 +85,15 @@ class Training(BaseUUIDModel, TrainingBase, TimeStampMixin, table=True):
         """Check if training was cancelled."""
         return self.status == TrainingStatus.CANCELLED
 
+    def current_progress(self) -> float:
+        """Get progress (0.0 to 1.0), computed from the timestamps while the session is active."""
+        if not self.is_active():
+            return self.progress
+        return elapsed_fraction(self.started_at, self.estimated_completion_at)
+
     def progress_percentage(self) -> float:
         """Get progress as percentage (0-100)."""
-        return self.progress * 100
+        return self.current_progress() * 100
 
     def time_remaining_seconds(self) -> int:
         """
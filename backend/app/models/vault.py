@@ -52,6 +52,9 @@ class Vault(BaseUUIDModel, VaultBase, TimeStampMixin, SoftDeleteMixin, table=Tru
     user_id: UUID4 = Field(default=None, foreign_key="user.id", index=True)
     user: "User" = Relationship(back_populates="vaults")
 
+    # Bumped whenever the world-map payload changes; drives the map cache and its ETag
+    map_version: int = Field(default=0, ge=0, sa_column_kwargs={"server_default": "0"})
+
     dwellers: list["Dweller"] = Relationship(back_populates="vault", cascade_delete=True)
     rooms: list["Room"] = Relationship(back_populates="vault", cascade_delete=True)
     storage: "Storage" = Relationship(back_populates="vault", cascade_delete=True)
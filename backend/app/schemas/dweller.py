@@ -256,3 +256,24 @@ class LineageResponse(SQLModel):
     children: list[LineageMember]
     siblings: list[LineageMember]
     partners: list[LineageMember]
+
+
+class FamilyTreeMember(SQLModel):
+    """A dweller node in a vault family tree; links point at other members or are ``None``."""
+
+    id: UUID4
+    first_name: str
+    last_name: str | None
+    generation: int
+    is_dead: bool = False
+    age_group: AgeGroupEnum = AgeGroupEnum.ADULT
+    parent_1_id: UUID4 | None = None
+    parent_2_id: UUID4 | None = None
+    partner_id: UUID4 | None = None
+
+
+class FamilyTreeResponse(SQLModel):
+    """Response schema for the whole family graph of a vault."""
+
+    vault_id: UUID4
+    members: list[FamilyTreeMember]
@@ -94,6 +94,15 @@ class ExplorationProgress(SQLModel):
     radaways: int
 
 
+class ExplorationJournalPage(SQLModel):
+    """One page of an exploration's event journal."""
+
+    events: list[dict]
+    next_after_seq: int | None = Field(
+        default=None, description="Pass as after_seq to fetch the next page; null on the last page"
+    )
+
+
 class ExplorationEvent(SQLModel):
     """Schema for exploration events."""
 
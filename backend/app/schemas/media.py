@@ -0,0 +1,29 @@
+"""Pydantic schemas for content-addressed media assets."""
+
+from sqlmodel import SQLModel
+
+
+class ImageVariant(SQLModel):
+    """One derived rendition of a stored image."""
+
+    format: str
+    width: int
+    height: int
+    url: str
+    size_bytes: int
+
+
+class StoredImage(SQLModel):
+    """A content-addressed image and its derived variants (smallest first)."""
+
+    digest: str
+    url: str
+    variants: list[ImageVariant]
+
+    def variant_for(self, width: int, fmt: str = "webp") -> ImageVariant | None:
+        """Return the smallest ``fmt`` variant at least ``width`` pixels wide, else the largest one."""
+        candidates = [variant for variant in self.variants if variant.format == fmt]
+        for variant in candidates:
+            if variant.width >= width:
+                return variant
+        return candidates[-1] if candidates else None
@@ -37,6 +37,7 @@ class QuestRead(QuestBase):
     duration_minutes: int | None = None
     quest_requirements: list[QuestRequirementRead] | None = None
     quest_rewards: list[QuestRewardRead] | None = None
+    missing_requirements: list[str] | None = None
 
 
 class QuestCompleteResponse(SQLModel):
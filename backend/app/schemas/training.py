@@ -1,10 +1,11 @@
 """Training schemas for API requests and responses."""
 
 from datetime import datetime
+from typing import Self
 
-from pydantic import UUID4, field_serializer
+from pydantic import UUID4, field_serializer, model_validator
 
-from app.models.training import TrainingBase
+from app.models.training import TrainingBase, TrainingStatus, elapsed_fraction
 from app.schemas.common import serialize_optional_utc_datetime, serialize_utc_datetime
 
 
@@ -26,6 +27,13 @@ class TrainingRead(TrainingBase):
     class Config:
         from_attributes = True
 
+    @model_validator(mode="after")
+    def derive_active_progress(self) -> Self:
+        # Progress is only stored once a session ends; report the live value while it runs
+        if self.status == TrainingStatus.ACTIVE:
+            self.progress = elapsed_fraction(self.started_at, self.estimated_completion_at)
+        return self
+
     @field_serializer(
         "started_at",
         "estimated_completion_at",
@@ -59,6 +67,12 @@ class TrainingProgress(TrainingBase):
     class Config:
         from_attributes = True
 
+    @model_validator(mode="after")
+    def derive_active_progress(self) -> Self:
+        if self.status == TrainingStatus.ACTIVE:
+            self.progress = elapsed_fraction(self.started_at, self.estimated_completion_at)
+        return self
+
     @field_serializer(
         "started_at",
         "estimated_completion_at",
@@ -13,6 +13,7 @@ Architecture Notes:
     - Image (DALL-E): Uses direct OpenAI client (Gateway ImageGenerationTool requires Agent pattern)
     - Audio (TTS/Whisper): Uses direct OpenAI client (Gateway does not support OpenAI native audio APIs)
     - For image/audio: Set both PYDANTIC_AI_GATEWAY_API_KEY AND OPENAI_API_KEY for full functionality
+    - The openai and pydantic_ai SDKs are imported when a provider is initialised, not at module import
 """
 
 import asyncio
@@ -20,14 +21,12 @@ import base64
 import logging
 import warnings
 from dataclasses import dataclass
-from typing import Any, Optional, Self
-
-import openai
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.gateway import gateway_provider
+from typing import TYPE_CHECKING, Any, Optional, Self
 
 from app.core.config import settings
-from app.utils.image_processing import image_url_to_bytes
+
+if TYPE_CHECKING:
+    import openai
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +89,10 @@ class AIService:
         if not settings.PYDANTIC_AI_GATEWAY_API_KEY:
             return
         try:
+            import openai
+            from pydantic_ai.models.openai import OpenAIChatModel
+            from pydantic_ai.providers.gateway import gateway_provider
+
             gateway_options = {"api_key": settings.PYDANTIC_AI_GATEWAY_API_KEY}
             if settings.PYDANTIC_AI_GATEWAY_ROUTE:
                 gateway_options["route"] = settings.PYDANTIC_AI_GATEWAY_ROUTE
@@ -121,9 +124,12 @@ class AIService:
         match settings.AI_PROVIDER:
             case "openai":
                 if settings.OPENAI_API_KEY:
-                    self._client = openai.Client(api_key=settings.OPENAI_API_KEY)
+                    import openai
+                    from pydantic_ai.models.openai import OpenAIChatModel
                     from pydantic_ai.providers.openai import OpenAIProvider
 
+                    self._client = openai.Client(api_key=settings.OPENAI_API_KEY)
+
                     provider = OpenAIProvider(api_key=settings.OPENAI_API_KEY)
                     self._model = OpenAIChatModel(model_name=settings.AI_MODEL, provider=provider)
                     logger.warning("AI initialized with direct OpenAI API (deprecated)")
@@ -149,6 +155,7 @@ class AIService:
     def _initialize_ollama(self) -> None:
         """Initialize using local Ollama instance."""
         if settings.OLLAMA_BASE_URL:
+            from pydantic_ai.models.openai import OpenAIChatModel
             from pydantic_ai.providers.ollama import OllamaProvider
 
             provider = OllamaProvider(base_url=settings.OLLAMA_BASE_URL)
@@ -166,7 +173,7 @@ class AIService:
         return cls().model
 
     @property
-    def client(self) -> openai.Client | None:
+    def client(self) -> "openai.Client | None":
         """Get the OpenAI client, or None if not configured."""
         return self._client
 
@@ -219,6 +226,8 @@ class AIService:
             if data.b64_json:
                 return base64.b64decode(data.b64_json)
             if data.url:
+                from app.utils.image_processing import image_url_to_bytes
+
                 result = await image_url_to_bytes(data.url)
                 if result is None:
                     raise RuntimeError("Failed to fetch image from URL")
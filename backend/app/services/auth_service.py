@@ -208,7 +208,7 @@ class AuthService:
                 raise ValidationException(detail="Token has expired")
 
         # Update password
-        user.hashed_password = security.get_password_hash(new_password)
+        user.hashed_password = await security.password_hasher.hash(new_password)
 
         # Clear reset token
         user.password_reset_token = None
@@ -251,11 +251,11 @@ class AuthService:
             ValidationException: If current password is incorrect
         """
         # Verify current password
-        if not security.verify_password(current_password, user.hashed_password):
+        if not await security.password_hasher.verify(current_password, user.hashed_password):
             raise ValidationException(detail="Incorrect password")
 
         # Update password
-        user.hashed_password = security.get_password_hash(new_password)
+        user.hashed_password = await security.password_hasher.hash(new_password)
         await db_session.commit()
 
         # Invalidate all refresh tokens for security
@@ -13,17 +13,19 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import exists, select
 
+from app.db.batching import DEFAULT_BATCH_SIZE, iter_keyset
 from app.models.dweller import Dweller
 from app.models.vault import Vault
 from app.models.wasteland_location import DwellerLocation
 from app.services.map_service import map_service
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
     from pydantic import UUID4
+    from sqlalchemy import Select
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from app.db.batching import Checkpoint
+
 logger = logging.getLogger(__name__)
 
 # Known place lists mirror the template-based bio filler. They are used to
@@ -140,13 +142,20 @@ def extract_places_from_bio(bio: str | None) -> tuple[str | None, list[str]]:
 
 
 class BioPlaceBackfillService:
-    """Backfill bio-origin/visited places for existing vaults."""
+    """Backfill bio-origin/visited places for existing vaults.
+
+    Candidates are read in keyset-ordered batches (see :mod:`app.db.batching`),
+    so memory stays flat however many vaults and dwellers there are, and the
+    per-dweller commits never invalidate an open cursor.
+    """
 
     async def backfill_bio_places_for_vault(
         self,
         db_session: AsyncSession,
         vault_id: UUID4,
         max_dwellers: int | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> int:
         """Register bio places for dwellers in *vault_id* that have no map links yet.
 
@@ -155,39 +164,20 @@ class BioPlaceBackfillService:
         single registration failure (after the internal retry) cannot roll back
         earlier successful registrations in the same vault.
         """
-        candidates = await self._get_dwellers_missing_locations(db_session, vault_id, max_dwellers)
         processed = 0
-        for dweller in candidates:
-            origin, visited = extract_places_from_bio(dweller.bio)
-            if not origin and not visited:
-                continue
-
-            registered = await map_service.register_bio_places(
-                db_session,
-                dweller,
-                origin_place=origin or "",
-                visited_places=visited,
-            )
-            if not registered:
-                continue
-
-            try:
-                await db_session.commit()
-                processed += 1
-                logger.info(
-                    "Backfilled bio places for dweller %s in vault %s: origin=%s visited=%s",
-                    dweller.id,
-                    vault_id,
-                    origin,
-                    visited,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to commit bio place backfill for dweller %s in vault %s",
-                    dweller.id,
-                    vault_id,
-                )
-                await db_session.rollback()
+        seen = 0
+        async for dwellers in iter_keyset(
+            db_session,
+            self._dwellers_missing_locations(vault_id),
+            Dweller.id,
+            batch_size=batch_size if max_dwellers is None else min(batch_size, max_dwellers),
+            label=f"bio place backfill for vault {vault_id}",
+        ):
+            for dweller in dwellers:
+                if max_dwellers is not None and seen >= max_dwellers:
+                    return processed
+                seen += 1
+                processed += await self._backfill_dweller(db_session, dweller, vault_id)
 
         return processed
 
@@ -197,49 +187,79 @@ class BioPlaceBackfillService:
         *,
         max_dwellers_per_vault: int | None = None,
         max_vaults: int | None = None,
+        checkpoint: Checkpoint | None = None,
     ) -> dict[UUID4, int]:
         """Backfill bio places across all active (non-deleted) vaults.
 
         Returns a mapping of ``vault_id`` → number of dwellers processed.
-        Vaults are ordered by creation date for deterministic runs.
+        Vaults are visited in id order; with a *checkpoint* an interrupted run
+        picks up after the last vault it finished.
         """
-        stmt = select(Vault).where(~Vault.is_deleted).order_by(Vault.created_at)
-        if max_vaults is not None:
-            stmt = stmt.limit(max_vaults)
-        result = await db_session.execute(stmt)
-        vaults = result.scalars().all()
-
         counts: dict[UUID4, int] = {}
-        for vault in vaults:
-            processed = await self.backfill_bio_places_for_vault(
-                db_session,
-                vault.id,
-                max_dwellers=max_dwellers_per_vault,
-            )
-            counts[vault.id] = processed
+        async for vault_ids in iter_keyset(
+            db_session,
+            select(Vault.id).where(~Vault.is_deleted),
+            Vault.id,
+            checkpoint=checkpoint,
+            label="bio place backfill",
+        ):
+            for vault_id in vault_ids:
+                if max_vaults is not None and len(counts) >= max_vaults:
+                    return counts
+                counts[vault_id] = await self.backfill_bio_places_for_vault(
+                    db_session,
+                    vault_id,
+                    max_dwellers=max_dwellers_per_vault,
+                )
 
         return counts
 
-    async def _get_dwellers_missing_locations(
-        self,
-        db_session: AsyncSession,
-        vault_id: UUID4,
-        max_dwellers: int | None,
-    ) -> Sequence[Dweller]:
-        """Return dwellers with a bio but no ``DwellerLocation`` links."""
-        stmt = (
+    async def _backfill_dweller(self, db_session: AsyncSession, dweller: Dweller, vault_id: UUID4) -> int:
+        """Register one dweller's bio places; return 1 if anything was committed."""
+        origin, visited = extract_places_from_bio(dweller.bio)
+        if not origin and not visited:
+            return 0
+
+        registered = await map_service.register_bio_places(
+            db_session,
+            dweller,
+            origin_place=origin or "",
+            visited_places=visited,
+        )
+        if not registered:
+            return 0
+
+        try:
+            await db_session.commit()
+        except Exception:
+            logger.exception(
+                "Failed to commit bio place backfill for dweller %s in vault %s",
+                dweller.id,
+                vault_id,
+            )
+            await db_session.rollback()
+            return 0
+
+        logger.info(
+            "Backfilled bio places for dweller %s in vault %s: origin=%s visited=%s",
+            dweller.id,
+            vault_id,
+            origin,
+            visited,
+        )
+        return 1
+
+    @staticmethod
+    def _dwellers_missing_locations(vault_id: UUID4) -> Select:
+        """Dwellers with a bio but no ``DwellerLocation`` links."""
+        return (
             select(Dweller)
             .where(Dweller.vault_id == vault_id)
             .where(~Dweller.is_deleted)
             .where(Dweller.bio.is_not(None))
             .where(Dweller.bio != "")
             .where(~exists().where(DwellerLocation.dweller_id == Dweller.id))
-            .order_by(Dweller.created_at)
         )
-        if max_dwellers is not None:
-            stmt = stmt.limit(max_dwellers)
-        response = await db_session.execute(stmt)
-        return response.scalars().all()
 
 
 # Module-level singleton — matches the convention used by other services.
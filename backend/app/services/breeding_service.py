@@ -6,6 +6,8 @@ import random
 from datetime import UTC, datetime, timedelta
 
 from pydantic import UUID4
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import aliased
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -13,6 +15,7 @@ from app.core.game_config import game_config
 from app.crud import vault as vault_crud
 from app.models.dweller import Dweller
 from app.models.pregnancy import Pregnancy
+from app.models.relationship import Relationship
 from app.models.room import Room
 from app.models.vault import Vault
 from app.schemas.common import (
@@ -79,203 +82,102 @@ class BreedingService:
     """Service for managing breeding, pregnancy, and child growth."""
 
     @staticmethod
-    async def _get_living_quarters(
+    async def _get_conception_candidates(
         db_session: AsyncSession,
         vault_id: UUID4,
-    ) -> list[Room]:
-        """Find all living quarters rooms for a vault.
+    ) -> list[tuple[Dweller, Dweller, int | None]]:
+        """Find every couple in a vault that may conceive this tick, in one query.
 
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param vault_id: Vault ID to search
-        :type vault_id: UUID4
-        :returns: List of living quarters rooms
-        :rtype: list[Room]
-        """
-        query = select(Room).where(Room.vault_id == vault_id).where(Room.category == RoomTypeEnum.CAPACITY)
-        return list((await db_session.execute(query)).scalars().all())
-
-    @staticmethod
-    async def _get_eligible_dwellers(
-        db_session: AsyncSession,
-        vault_id: UUID4,
-        living_quarters_ids: list[UUID4],
-    ) -> list[Dweller]:
-        """Find all adult dwellers with partners in living quarters.
+        A candidate is an adult female and an adult male partnered in either
+        direction, both in the vault's living quarters, where the mother is neither
+        pregnant nor within ``birth_cooldown_hours`` of her last delivery. Their
+        relationship affinity is joined in (``None`` when they have no relationship).
 
         :param db_session: Database session
         :type db_session: AsyncSession
         :param vault_id: Vault ID to search
         :type vault_id: UUID4
-        :param living_quarters_ids: List of living quarters room IDs
-        :type living_quarters_ids: list[UUID4]
-        :returns: List of eligible dwellers
-        :rtype: list[Dweller]
+        :returns: (mother, father, affinity) rows ordered by mother
+        :rtype: list[tuple[Dweller, Dweller, int | None]]
         """
-        query = (
-            select(Dweller)
-            .where(Dweller.vault_id == vault_id)
-            .where(Dweller.partner_id.is_not(None))
-            .where(Dweller.room_id.in_(living_quarters_ids))
-            .where(Dweller.age_group == AgeGroupEnum.ADULT)
-        )
-        return list((await db_session.execute(query)).scalars().all())
-
-    @staticmethod
-    async def _get_pregnant_mother_ids(db_session: AsyncSession) -> set[UUID4]:
-        """Get set of currently pregnant mother IDs.
-
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :returns: Set of mother IDs with active pregnancies
-        :rtype: set[UUID4]
-        """
-        query = select(Pregnancy.mother_id).where(Pregnancy.status == PregnancyStatusEnum.PREGNANT)
-        return set((await db_session.execute(query)).scalars().all())
-
-    @staticmethod
-    async def _get_postpartum_mother_ids(
-        db_session: AsyncSession,
-        vault_id: UUID4,
-    ) -> set[UUID4]:
-        """Get set of mother IDs still within the post-birth cooldown window.
-
-        Mothers who delivered within ``birth_cooldown_hours`` are excluded from
-        conceiving again, preventing a high-affinity couple from producing a baby
-        every pregnancy cycle back-to-back.
-
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param vault_id: Vault ID to scope the query
-        :type vault_id: UUID4
-        :returns: Set of mother IDs in the postpartum cooldown window
-        :rtype: set[UUID4]
-        """
-        from app.models.dweller import Dweller
+        mother = aliased(Dweller, name="mother")
+        father = aliased(Dweller, name="father")
 
+        living_quarters = select(Room.id).where(Room.vault_id == vault_id).where(Room.category == RoomTypeEnum.CAPACITY)
         cooldown_start = datetime.now(UTC).replace(tzinfo=None) - timedelta(
             hours=game_config.breeding.birth_cooldown_hours
         )
+        unavailable = (
+            select(Pregnancy.id)
+            .where(Pregnancy.mother_id == mother.id)
+            .where(
+                or_(
+                    Pregnancy.status == PregnancyStatusEnum.PREGNANT,
+                    and_(Pregnancy.status == PregnancyStatusEnum.DELIVERED, Pregnancy.updated_at >= cooldown_start),
+                )
+            )
+        )
+        affinity = (
+            select(Relationship.affinity)
+            .where(
+                or_(
+                    and_(Relationship.dweller_1_id == mother.id, Relationship.dweller_2_id == father.id),
+                    and_(Relationship.dweller_1_id == father.id, Relationship.dweller_2_id == mother.id),
+                )
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
         query = (
-            select(Pregnancy.mother_id)
-            .join(Dweller, Pregnancy.mother_id == Dweller.id)
-            .where(Dweller.vault_id == vault_id)
-            .where(Pregnancy.status == PregnancyStatusEnum.DELIVERED)
-            .where(Pregnancy.updated_at.is_not(None))
-            .where(Pregnancy.updated_at >= cooldown_start)
+            select(mother, father, affinity)
+            .join(father, or_(father.id == mother.partner_id, father.partner_id == mother.id))
+            .where(mother.vault_id == vault_id, father.vault_id == vault_id)
+            .where(mother.gender == GenderEnum.FEMALE, father.gender == GenderEnum.MALE)
+            .where(mother.age_group == AgeGroupEnum.ADULT, father.age_group == AgeGroupEnum.ADULT)
+            .where(mother.room_id.in_(living_quarters), father.room_id.in_(living_quarters))
+            .where(~unavailable.exists())
+            .order_by(mother.id, father.id)
         )
-        return set((await db_session.execute(query)).scalars().all())
-
-    @staticmethod
-    def _is_pair_eligible(
-        dweller: Dweller,
-        pregnant_mother_ids: set[UUID4],
-        checked_pairs: set[tuple[str, str]],
-    ) -> bool:
-        """Check if a dweller-partner pair is eligible for conception check.
-
-        :param dweller: Dweller to check
-        :type dweller: Dweller
-        :param pregnant_mother_ids: Set of currently pregnant mother IDs
-        :type pregnant_mother_ids: set[UUID4]
-        :param checked_pairs: Set of already checked pair keys
-        :type checked_pairs: set[tuple[str, str]]
-        :returns: True if pair is eligible for conception check
-        :rtype: bool
-        """
-        # Skip if dweller is female and already pregnant
-        if dweller.gender == GenderEnum.FEMALE and dweller.id in pregnant_mother_ids:
-            return False
-
-        # Skip if partner is already pregnant
-        if dweller.partner_id in pregnant_mother_ids:
-            return False
-
-        # Avoid checking same pair twice
-        pair_key = tuple(sorted([str(dweller.id), str(dweller.partner_id)]))
-        return pair_key not in checked_pairs
+        return list((await db_session.execute(query)).tuples().all())
 
     @staticmethod
-    async def _get_relationship_affinity(
-        db_session: AsyncSession,
-        dweller: Dweller,
-        partner: Dweller,
-    ) -> float:
-        """Get relationship affinity and calculate conception chance.
-
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param dweller: First dweller in the pair
-        :type dweller: Dweller
-        :param partner: Partner dweller
-        :type partner: Dweller
-        :returns: Conception chance as decimal (0.0 to 1.0)
-        :rtype: float
+    def _new_pregnancy(mother_id: UUID4, father_id: UUID4) -> Pregnancy:
+        """Build an unsaved pregnancy conceived now.
+
+        :param mother_id: Mother dweller ID
+        :type mother_id: UUID4
+        :param father_id: Father dweller ID
+        :type father_id: UUID4
+        :returns: New pregnancy due after ``pregnancy_duration_hours``
+        :rtype: Pregnancy
         """
-        from app.models.relationship import Relationship
-
-        query = select(Relationship).where(
-            ((Relationship.dweller_1_id == dweller.id) & (Relationship.dweller_2_id == partner.id))
-            | ((Relationship.dweller_1_id == partner.id) & (Relationship.dweller_2_id == dweller.id))
+        # NOTE: Using naive datetime to match database TIMESTAMP WITHOUT TIME ZONE
+        conceived_at = datetime.now(UTC).replace(tzinfo=None)
+        return Pregnancy(
+            mother_id=mother_id,
+            father_id=father_id,
+            conceived_at=conceived_at,
+            due_at=conceived_at + timedelta(hours=game_config.breeding.pregnancy_duration_hours),
+            status=PregnancyStatusEnum.PREGNANT,
         )
-        relationship = (await db_session.execute(query)).scalars().first()
-
-        # Calculate conception chance based on affinity (1% per affinity point)
-        # If no relationship found, use base chance
-        if relationship:
-            return relationship.affinity / 100.0  # 90 affinity = 90% chance
-        return game_config.breeding.conception_chance_per_tick  # Fallback to base 2%
-
-    @staticmethod
-    async def _roll_for_conception(
-        db_session: AsyncSession,
-        dweller: Dweller,
-        partner: Dweller,
-        conception_chance: float,
-    ) -> Pregnancy | None:
-        """Roll random chance and create pregnancy if successful.
-
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param dweller: First dweller in the pair
-        :type dweller: Dweller
-        :param partner: Partner dweller
-        :type partner: Dweller
-        :param conception_chance: Probability of conception (0.0 to 1.0)
-        :type conception_chance: float
-        :returns: Created pregnancy if successful, None otherwise
-        :rtype: Pregnancy | None
-        """
-        roll = random.random()
-        if roll >= conception_chance:
-            return None
-
-        # Determine mother and father
-        if dweller.gender == GenderEnum.FEMALE:
-            mother_id = dweller.id
-            father_id = partner.id
-        else:
-            mother_id = partner.id
-            father_id = dweller.id
-
-        # Create pregnancy
-        pregnancy = await BreedingService.create_pregnancy(db_session, mother_id, father_id)
-        logger.info(f"Conception with {conception_chance * 100:.0f}% chance: Mother={mother_id}, Father={father_id}")
-        return pregnancy
 
     @staticmethod
     async def check_for_conception(
         db_session: AsyncSession,
         vault_id: UUID4,
     ) -> list[Pregnancy]:
-        """Check all partner pairs in living quarters and roll for conception.
+        """Roll for conception for every eligible couple in the vault's living quarters.
+
+        Candidates come from a single query, and every successful roll is saved in
+        one commit. The chance per couple is their affinity as a percentage, or the
+        base ``conception_chance_per_tick`` when they have no relationship.
 
         :param db_session: Database session
         :param vault_id: Vault ID to check
         :returns: List of newly created pregnancies
         """
-        living_quarters = await BreedingService._get_living_quarters(db_session, vault_id)
-        if not living_quarters:
+        candidates = await BreedingService._get_conception_candidates(db_session, vault_id)
+        if not candidates:
             return []
 
         # Capacity reservation: a full vault cannot start new conceptions, and
@@ -295,41 +197,32 @@ class BreedingService:
         else:
             available_slots = None
 
-        living_quarters_ids = [room.id for room in living_quarters]
-        dwellers = await BreedingService._get_eligible_dwellers(db_session, vault_id, living_quarters_ids)
-        pregnant_mother_ids = await BreedingService._get_pregnant_mother_ids(db_session)
-        postpartum_mother_ids = await BreedingService._get_postpartum_mother_ids(db_session, vault_id)
-        unavailable_mother_ids = pregnant_mother_ids | postpartum_mother_ids
-
         new_pregnancies: list[Pregnancy] = []
-        checked_pairs: set[tuple[str, str]] = set()
+        conceived_mother_ids: set[UUID4] = set()
 
-        for dweller in dwellers:
-            if available_slots is not None and available_slots <= 0:
+        for mother, father, affinity in candidates:
+            if available_slots is not None and len(new_pregnancies) >= available_slots:
                 break
-
-            if not BreedingService._is_pair_eligible(dweller, unavailable_mother_ids, checked_pairs):
-                continue
-
-            pair_key = tuple(sorted([str(dweller.id), str(dweller.partner_id)]))
-            checked_pairs.add(pair_key)
-
-            partner_query = select(Dweller).where(Dweller.id == dweller.partner_id)
-            partner = (await db_session.execute(partner_query)).scalars().first()
-
-            if not partner or partner.room_id not in living_quarters_ids or partner.age_group != AgeGroupEnum.ADULT:
+            # A mother linked to two partners can still only conceive once
+            if mother.id in conceived_mother_ids:
                 continue
 
-            if partner.gender == dweller.gender:
+            # 1% per affinity point (90 affinity = 90% chance); base 2% without a relationship
+            conception_chance = (
+                affinity / 100.0 if affinity is not None else game_config.breeding.conception_chance_per_tick
+            )
+            if random.random() >= conception_chance:
                 continue
 
-            conception_chance = await BreedingService._get_relationship_affinity(db_session, dweller, partner)
-            pregnancy = await BreedingService._roll_for_conception(db_session, dweller, partner, conception_chance)
+            new_pregnancies.append(BreedingService._new_pregnancy(mother.id, father.id))
+            conceived_mother_ids.add(mother.id)
+            logger.info(
+                f"Conception with {conception_chance * 100:.0f}% chance: Mother={mother.id}, Father={father.id}"
+            )
 
-            if pregnancy:
-                new_pregnancies.append(pregnancy)
-                if available_slots is not None:
-                    available_slots -= 1
+        if new_pregnancies:
+            db_session.add_all(new_pregnancies)
+            await db_session.commit()
 
         return new_pregnancies
 
@@ -372,23 +265,13 @@ class BreedingService:
         if father.gender != GenderEnum.MALE:
             raise ValueError("Father must be male")
 
-        # NOTE: Using naive datetime to match database TIMESTAMP WITHOUT TIME ZONE
-        conceived_at = datetime.now(UTC).replace(tzinfo=None)
-        due_at = conceived_at + timedelta(hours=game_config.breeding.pregnancy_duration_hours)
-
-        pregnancy = Pregnancy(
-            mother_id=mother_id,
-            father_id=father_id,
-            conceived_at=conceived_at,
-            due_at=due_at,
-            status=PregnancyStatusEnum.PREGNANT,
-        )
+        pregnancy = BreedingService._new_pregnancy(mother_id, father_id)
 
         db_session.add(pregnancy)
         await db_session.commit()
         await db_session.refresh(pregnancy)
 
-        logger.info(f"Created pregnancy: Mother={mother_id}, Father={father_id}, Due at {due_at.isoformat()}")
+        logger.info(f"Created pregnancy: Mother={mother_id}, Father={father_id}, Due at {pregnancy.due_at.isoformat()}")
 
         return pregnancy
 
@@ -3,19 +3,16 @@
 import json
 import logging
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
-from openai import AsyncOpenAI
 from pydantic import UUID4
-from pydantic_ai.agent import AgentRunResult
-from pydantic_ai.exceptions import ModelHTTPError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.agents.dweller_chat_agent import (
+from app.agents.dweller_chat_context import (
     DwellerChatDeps,
     DwellerChatOutput,
     compute_happiness_delta,
     derive_reason_code,
-    dweller_chat_agent,
     parse_action_suggestion,
 )
 from app.core.config import settings
@@ -42,9 +39,17 @@ from app.utils.exceptions import (
     QuotaExceededException,
     ResourceNotFoundException,
 )
+from app.utils.lazy import LazyImport
+
+if TYPE_CHECKING:
+    from pydantic_ai.agent import AgentRunResult
+    from pydantic_ai.exceptions import ModelHTTPError
 
 logger = logging.getLogger(__name__)
 
+# The agent module loads pydantic_ai and the provider SDKs; defer that until the first chat.
+dweller_chat_agent = LazyImport("app.agents.dweller_chat_agent", "dweller_chat_agent")
+
 
 class ChatService:
     """Service for chat-related business logic."""
@@ -95,6 +100,8 @@ class ChatService:
         ]
         """
 
+        from openai import AsyncOpenAI
+
         async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         response = await async_client.chat.completions.create(
             model="gpt-4-turbo",
@@ -359,7 +366,7 @@ class ChatService:
                 yield {"type": "error", "detail": "An unexpected error occurred during chat"}
 
     @staticmethod
-    def _extract_usage(result: AgentRunResult[DwellerChatOutput]) -> tuple[int | None, int | None, int | None]:
+    def _extract_usage(result: "AgentRunResult[DwellerChatOutput]") -> tuple[int | None, int | None, int | None]:
         """Extract token usage from an agent run result.
 
         Returns:
@@ -425,6 +432,8 @@ class ChatService:
             Tuple of (response_message, happiness_impact, action_suggestion,
                      prompt_tokens, completion_tokens, total_tokens)
         """
+        from pydantic_ai.exceptions import ModelHTTPError
+
         # Prepare agent dependencies
         deps = DwellerChatDeps(
             db_session=db_session,
@@ -479,6 +488,8 @@ class ChatService:
         message_text: str,
     ) -> tuple[str, HappinessImpact, ActionSuggestion, int | None, int | None, int | None]:
         """Return a basic chat completion when structured agent processing fails."""
+        from pydantic_ai.exceptions import ModelHTTPError
+
         ai_service = get_ai_service()
         dweller_prompt = conversation_service._build_dweller_prompt(dweller, for_audio=False)
 
@@ -512,7 +523,7 @@ class ChatService:
         )
 
     @staticmethod
-    def _provider_credits_are_exhausted(error: ModelHTTPError) -> bool:
+    def _provider_credits_are_exhausted(error: "ModelHTTPError") -> bool:
         """Return whether a provider error specifically reports an exhausted credit balance."""
         return (
             error.status_code == 429
@@ -1,9 +1,11 @@
 from datetime import UTC, datetime, timedelta
 
-from sqlmodel import col, select
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.db.batching import delete_in_batches
+from app.db.partitioning import drop_expired_partitions
 from app.models.incident import Incident, IncidentStatus
 from app.models.notification import Notification
 
@@ -17,32 +19,18 @@ class CleanupService:
     ) -> int:
         resolved_statuses = [IncidentStatus.RESOLVED, IncidentStatus.FAILED]
         retention = retention_days or settings.INCIDENT_RETENTION_DAYS
-        batch = batch_size or settings.CLEANUP_BATCH_SIZE
         cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=retention)
 
-        deleted_count = 0
-
-        while True:
-            query = (
-                select(Incident)
-                .where(col(Incident.status).in_(resolved_statuses))
-                .where(col(Incident.end_time).is_not(None))
-                .where(col(Incident.end_time) <= cutoff_date)
-                .limit(batch)
-            )
-            result = await db_session.execute(query)
-            incidents_to_delete = list(result.scalars().all())
-
-            if not incidents_to_delete:
-                break
-
-            for incident in incidents_to_delete:
-                await db_session.delete(incident)
-                deleted_count += 1
-
-            await db_session.commit()
-
-        return deleted_count
+        return await delete_in_batches(
+            db_session,
+            Incident.id,
+            col(Incident.status).in_(resolved_statuses),
+            col(Incident.end_time).is_not(None),
+            col(Incident.end_time) <= cutoff_date,
+            batch_size=batch_size or settings.CLEANUP_BATCH_SIZE,
+            throttle_seconds=settings.CLEANUP_THROTTLE_SECONDS,
+            label="incident cleanup",
+        )
 
     async def cleanup_old_notifications(
         self,
@@ -51,26 +39,21 @@ class CleanupService:
         batch_size: int | None = None,
     ) -> int:
         retention = retention_days or settings.NOTIFICATION_RETENTION_DAYS
-        batch = batch_size or settings.CLEANUP_BATCH_SIZE
         cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=retention)
 
-        deleted_count = 0
-
-        while True:
-            query = select(Notification).where(col(Notification.created_at) <= cutoff_date).limit(batch)
-            result = await db_session.execute(query)
-            notifications_to_delete = list(result.scalars().all())
-
-            if not notifications_to_delete:
-                break
-
-            for notification in notifications_to_delete:
-                await db_session.delete(notification)
-                deleted_count += 1
-
-            await db_session.commit()
-
-        return deleted_count
+        # Whole months past retention go with their partition; only the boundary month is deleted row by row
+        connection = await db_session.connection()
+        dropped = await connection.run_sync(drop_expired_partitions, Notification.__tablename__, cutoff_date)
+        await db_session.commit()
+
+        return dropped + await delete_in_batches(
+            db_session,
+            Notification.id,
+            col(Notification.created_at) <= cutoff_date,
+            batch_size=batch_size or settings.CLEANUP_BATCH_SIZE,
+            throttle_seconds=settings.CLEANUP_THROTTLE_SECONDS,
+            label="notification cleanup",
+        )
 
 
 cleanup_service = CleanupService()
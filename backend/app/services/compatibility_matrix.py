@@ -0,0 +1,279 @@
+"""Vault-wide pairwise compatibility scores.
+
+``RelationshipService.calculate_compatibility_score`` scores one pair with two
+queries; matchmaking screens and the family scenario tooling need every pair in
+the vault. This module loads the vault's living adults once, packs the scoring
+inputs into flat per-column lists and fills the whole symmetric score matrix in
+one pass (NumPy is not a dependency, so the "broadcast" is a row-wise loop over
+those columns). Matrices are cached per vault and rebuilt only when a cheap
+``count``/``max(updated_at)`` fingerprint shows an adult's stats have changed.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from app.core.game_config import game_config
+from app.models.dweller import Dweller
+from app.schemas.common import AgeGroupEnum, GenderEnum
+from app.schemas.relationship import CompatibilityScore
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterable, Sequence
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SPECIAL_ATTRS = ("strength", "perception", "endurance", "charisma", "intelligence", "agility", "luck")
+_CACHED_VAULTS_MAX = 256
+
+
+def score_components(
+    special_diff: int, happiness_diff: int, level_diff: int, same_room: bool
+) -> tuple[float, float, float, float, float]:
+    """Turn raw pair differences into ``(score, special, happiness, level, proximity)``."""
+    config = game_config.relationship
+    special_score = 1.0 - (special_diff / config.max_special_diff)
+    happiness_score = 1.0 - (happiness_diff / 100.0)
+    level_score = 1.0 - (level_diff / config.max_level_diff)
+    proximity_score = 1.0 if same_room else 0.0
+    compatibility = (
+        special_score * config.compatibility_special_weight
+        + happiness_score * config.compatibility_happiness_weight
+        + level_score * config.compatibility_level_weight
+        + proximity_score * config.compatibility_proximity_weight
+    )
+    return min(1.0, max(0.0, compatibility)), special_score, happiness_score, level_score, proximity_score
+
+
+def pair_score(dweller_1: Dweller, dweller_2: Dweller) -> CompatibilityScore:
+    """Score a single pair of loaded dwellers."""
+    special_diff = sum(abs(getattr(dweller_1, attr, 0) - getattr(dweller_2, attr, 0)) for attr in SPECIAL_ATTRS)
+    score, special, happiness, level, proximity = score_components(
+        special_diff,
+        abs(dweller_1.happiness - dweller_2.happiness),
+        abs(dweller_1.level - dweller_2.level),
+        bool(dweller_1.room_id and dweller_1.room_id == dweller_2.room_id),
+    )
+    return CompatibilityScore(
+        dweller_1_id=dweller_1.id,
+        dweller_2_id=dweller_2.id,
+        score=score,
+        special_score=special,
+        happiness_score=happiness,
+        level_score=level,
+        proximity_score=proximity,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CompatibilityMatrix:
+    """Symmetric score matrix over a fixed, ordered set of dwellers.
+
+    ``scores`` is row-major ``n * n``; the diagonal is 0 so a dweller never
+    matches itself. Per-dweller inputs are kept so a pair's component breakdown
+    can be rebuilt without touching the database.
+    """
+
+    dweller_ids: tuple[UUID, ...]
+    genders: tuple[GenderEnum | None, ...]
+    specials: tuple[tuple[int, ...], ...]
+    happiness: tuple[int, ...]
+    levels: tuple[int, ...]
+    rooms: tuple[UUID | None, ...]
+    scores: array
+    positions: dict[UUID, int]
+
+    @classmethod
+    def build(cls, dwellers: Sequence[Dweller]) -> CompatibilityMatrix:
+        config = game_config.relationship
+        special_weight = config.compatibility_special_weight / config.max_special_diff
+        happiness_weight = config.compatibility_happiness_weight / 100.0
+        level_weight = config.compatibility_level_weight / config.max_level_diff
+        # Every pair shares this constant; only the weighted differences vary
+        base = (
+            config.compatibility_special_weight
+            + config.compatibility_happiness_weight
+            + config.compatibility_level_weight
+        )
+        proximity_weight = config.compatibility_proximity_weight
+
+        specials = tuple(tuple(getattr(d, attr, 0) or 0 for attr in SPECIAL_ATTRS) for d in dwellers)
+        happiness = tuple(d.happiness for d in dwellers)
+        levels = tuple(d.level for d in dwellers)
+        rooms = tuple(d.room_id for d in dwellers)
+        n = len(dwellers)
+        scores = array("d", bytes(8 * n * n))
+
+        for i in range(n):
+            special_i, happiness_i, level_i, room_i = specials[i], happiness[i], levels[i], rooms[i]
+            row = i * n
+            for j in range(i + 1, n):
+                special_j = specials[j]
+                special_diff = sum(abs(a - b) for a, b in zip(special_i, special_j, strict=True))
+                score = (
+                    base
+                    - special_diff * special_weight
+                    - abs(happiness_i - happiness[j]) * happiness_weight
+                    - abs(level_i - levels[j]) * level_weight
+                )
+                if room_i is not None and room_i == rooms[j]:
+                    score += proximity_weight
+                score = min(1.0, max(0.0, score))
+                scores[row + j] = score
+                scores[j * n + i] = score
+
+        return cls(
+            dweller_ids=tuple(d.id for d in dwellers),
+            genders=tuple(d.gender for d in dwellers),
+            specials=specials,
+            happiness=happiness,
+            levels=levels,
+            rooms=rooms,
+            scores=scores,
+            positions={d.id: i for i, d in enumerate(dwellers)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.dweller_ids)
+
+    def index_of(self, dweller_id: UUID) -> int:
+        try:
+            return self.positions[dweller_id]
+        except KeyError:
+            msg = f"Dweller {dweller_id} is not a living adult of this vault"
+            raise KeyError(msg) from None
+
+    def score(self, dweller_1_id: UUID, dweller_2_id: UUID) -> float:
+        return self.scores[self.index_of(dweller_1_id) * len(self) + self.index_of(dweller_2_id)]
+
+    def breakdown(self, i: int, j: int) -> CompatibilityScore:
+        """Full ``CompatibilityScore`` for the pair at matrix positions ``i`` and ``j``."""
+        special_diff = sum(abs(a - b) for a, b in zip(self.specials[i], self.specials[j], strict=True))
+        score, special, happiness, level, proximity = score_components(
+            special_diff,
+            abs(self.happiness[i] - self.happiness[j]),
+            abs(self.levels[i] - self.levels[j]),
+            self.rooms[i] is not None and self.rooms[i] == self.rooms[j],
+        )
+        return CompatibilityScore(
+            dweller_1_id=self.dweller_ids[i],
+            dweller_2_id=self.dweller_ids[j],
+            score=score,
+            special_score=special,
+            happiness_score=happiness,
+            level_score=level,
+            proximity_score=proximity,
+        )
+
+    def top_matches(
+        self, dweller_id: UUID, limit: int = 5, *, opposite_gender: bool = False
+    ) -> list[CompatibilityScore]:
+        """Best ``limit`` partners for one dweller, highest score first."""
+        i = self.index_of(dweller_id)
+        n = len(self)
+        row = self.scores[i * n : (i + 1) * n]
+        candidates = [j for j in range(n) if j != i and (not opposite_gender or self._opposite_genders(i, j))]
+        candidates.sort(key=row.__getitem__, reverse=True)
+        return [self.breakdown(i, j) for j in candidates[:limit]]
+
+    def best_pairs(
+        self,
+        count: int,
+        *,
+        exclude: Iterable[UUID] = (),
+        opposite_gender_first: bool = True,
+        rng: random.Random | None = None,
+    ) -> list[tuple[UUID, UUID]]:
+        """Greedily pick up to ``count`` disjoint pairs, highest score first.
+
+        With ``opposite_gender_first`` (breeding requires it) male/female pairs
+        are exhausted before any same-gender pair is considered. Equal scores
+        keep matrix order unless ``rng`` is given to shuffle them.
+        """
+        n = len(self)
+        used = {self.positions[d] for d in exclude if d in self.positions}
+        pairs = [(i, j) for i in range(n) for j in range(i + 1, n)]
+        if rng is not None:
+            rng.shuffle(pairs)
+        pairs.sort(
+            key=lambda pair: (
+                not opposite_gender_first or self._opposite_genders(*pair),
+                self.scores[pair[0] * n + pair[1]],
+            ),
+            reverse=True,
+        )
+        chosen: list[tuple[UUID, UUID]] = []
+        for i, j in pairs:
+            if len(chosen) >= count:
+                break
+            if i in used or j in used:
+                continue
+            used.update((i, j))
+            chosen.append((self.dweller_ids[i], self.dweller_ids[j]))
+        return chosen
+
+    def _opposite_genders(self, i: int, j: int) -> bool:
+        return {self.genders[i], self.genders[j]} == {GenderEnum.MALE, GenderEnum.FEMALE}
+
+
+def _living_adults_filter(vault_id: UUID) -> tuple:
+    return (
+        Dweller.vault_id == vault_id,
+        Dweller.age_group == AgeGroupEnum.ADULT,
+        ~Dweller.is_dead,
+        ~Dweller.is_deleted,
+    )
+
+
+class CompatibilityMatrixCache:
+    """Per-process LRU of vault matrices, validated against a dweller fingerprint on every read."""
+
+    def __init__(self, max_vaults: int = _CACHED_VAULTS_MAX):
+        self.max_vaults = max_vaults
+        self._entries: OrderedDict[UUID, tuple[tuple[int, datetime | None], CompatibilityMatrix]] = OrderedDict()
+
+    @staticmethod
+    async def _fingerprint(db_session: AsyncSession, vault_id: UUID) -> tuple[int, datetime | None]:
+        query = select(func.count(Dweller.id), func.max(Dweller.updated_at)).where(*_living_adults_filter(vault_id))
+        count, last_updated = (await db_session.execute(query)).one()
+        return count, last_updated
+
+    async def get(self, db_session: AsyncSession, vault_id: UUID) -> CompatibilityMatrix:
+        """Return the vault's matrix, rebuilding it if any living adult changed since it was cached."""
+        fingerprint = await self._fingerprint(db_session, vault_id)
+        cached = self._entries.get(vault_id)
+        if cached is not None and cached[0] == fingerprint:
+            self._entries.move_to_end(vault_id)
+            return cached[1]
+
+        query = select(Dweller).where(*_living_adults_filter(vault_id)).order_by(Dweller.created_at, Dweller.id)
+        dwellers = (await db_session.execute(query)).scalars().all()
+        matrix = CompatibilityMatrix.build(dwellers)
+        logger.debug("Built %dx%d compatibility matrix for vault %s", len(matrix), len(matrix), vault_id)
+
+        self._entries[vault_id] = (fingerprint, matrix)
+        self._entries.move_to_end(vault_id)
+        while len(self._entries) > self.max_vaults:
+            self._entries.popitem(last=False)
+        return matrix
+
+    def invalidate(self, vault_id: UUID | None = None) -> None:
+        if vault_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(vault_id, None)
+
+
+compatibility_matrix_cache = CompatibilityMatrixCache()
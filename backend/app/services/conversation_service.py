@@ -1,21 +1,20 @@
 """Service for handling audio conversations between users and dwellers."""
 
-import asyncio
 import logging
 import random
 from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from pydantic import UUID4
-from pydantic_ai.agent import AgentRunResult
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.agents.dweller_chat_agent import (
+from app.agents.dweller_chat_context import (
     DwellerChatDeps,
     DwellerChatOutput,
     compute_happiness_delta,
     derive_reason_code,
-    dweller_chat_agent,
     parse_action_suggestion,
 )
 from app.crud.chat_message import chat_message as chat_message_crud
@@ -31,11 +30,19 @@ from app.schemas.llm_interaction import LLMInteractionCreate
 from app.services.ai_service import get_ai_service
 from app.services.chat_happiness_service import apply_chat_happiness
 from app.services.quota_service import quota_service
-from app.services.storage import get_storage_client
+from app.services.storage import get_async_storage_client
 from app.utils.exceptions import DwellerNotFoundError, QuotaExceededException
+from app.utils.lazy import LazyImport
+
+if TYPE_CHECKING:
+    from pydantic_ai.agent import AgentRunResult
+
+    from app.services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+dweller_chat_agent = LazyImport("app.agents.dweller_chat_agent", "dweller_chat_agent")
+
 VOICE_MAP = {
     GenderEnum.MALE: ["echo", "fable", "onyx"],
     GenderEnum.FEMALE: ["nova", "shimmer", "alloy"],
@@ -71,9 +78,15 @@ class ChatGenerationResult:
 class ConversationService:
     """Handles audio conversation logic: STT, LLM response, TTS."""
 
-    def __init__(self):
-        self.ai_service = get_ai_service()
-        self.storage_service = get_storage_client()
+    @cached_property
+    def ai_service(self) -> "AIService":
+        """AI client, created on first use so importing this module does not load provider SDKs."""
+        return get_ai_service()
+
+    @cached_property
+    def storage_service(self):
+        """Async storage client (or None when storage is disabled), created on first use."""
+        return get_async_storage_client()
 
     @staticmethod
     def _select_voice_for_gender(gender: GenderEnum | None) -> str:
@@ -120,8 +133,7 @@ class ConversationService:
             user_audio_filename = (
                 f"chat/{user_id}/{dweller_id}/user_{uuid4()}.{audio_filename.rsplit('.', maxsplit=1)[-1]}"
             )
-            user_audio_url = await asyncio.to_thread(
-                self.storage_service.upload_file,
+            user_audio_url = await self.storage_service.upload_file(
                 file_data=audio_bytes,
                 file_name=user_audio_filename,
                 file_type="audio/webm",
@@ -131,7 +143,7 @@ class ConversationService:
         return transcribed_text, user_audio_url, None
 
     @staticmethod
-    def _extract_usage(result: AgentRunResult[DwellerChatOutput]) -> tuple[int | None, int | None, int | None]:
+    def _extract_usage(result: "AgentRunResult[DwellerChatOutput]") -> tuple[int | None, int | None, int | None]:
         """Extract token usage from an agent run result.
 
         Returns:
@@ -207,8 +219,7 @@ class ConversationService:
         audio_url = None
         if self.storage_service is not None:
             audio_filename = f"chat/{user_id}/{dweller_id}/dweller_{uuid4()}.mp3"
-            audio_url = await asyncio.to_thread(
-                self.storage_service.upload_file,
+            audio_url = await self.storage_service.upload_file(
                 file_data=audio_bytes,
                 file_name=audio_filename,
                 file_type="audio/mpeg",
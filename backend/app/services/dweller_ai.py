@@ -1,14 +1,14 @@
-import asyncio
 import logging
+from functools import cached_property
 from math import ceil
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import HTTPException
 from pydantic import UUID4
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.agents.deps import BackstoryDeps, ExtendBioDeps, VisualAttributesDeps
-from app.agents.dweller_agents import backstory_agent, bio_extension_agent, visual_attributes_agent
+from app.core.config import settings
 from app.crud.dweller import dweller as dweller_crud
 from app.crud.llm_interaction import llm_interaction as llm_interaction_crud
 from app.models import User
@@ -18,12 +18,22 @@ from app.schemas.dweller import DwellerReadFull, DwellerUpdate, DwellerVisualAtt
 from app.schemas.llm_interaction import LLMInteractionCreate
 from app.services.ai_service import get_ai_service
 from app.services.map_service import map_service
+from app.services.media_service import media_service
 from app.services.quota_service import quota_service
-from app.services.storage import get_storage_client
+from app.services.storage import get_async_storage_client
 from app.utils.exceptions import ContentNoChangeException, QuotaExceededException
+from app.utils.lazy import LazyImport
+
+if TYPE_CHECKING:
+    from app.services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
+# Agents are built on pydantic_ai; load them when a dweller is first generated, not at import.
+backstory_agent = LazyImport("app.agents.dweller_agents", "backstory_agent")
+bio_extension_agent = LazyImport("app.agents.dweller_agents", "bio_extension_agent")
+visual_attributes_agent = LazyImport("app.agents.dweller_agents", "visual_attributes_agent")
+
 GENDER_PRONOUNS_MAP = {
     GenderEnum.MALE: "his",
     GenderEnum.FEMALE: "her",
@@ -55,9 +65,15 @@ def restrict_equipment_fields(visual_attributes: dict[str, Any], equipped_items:
 
 
 class DwellerAIService:
-    def __init__(self):
-        self.storage_service = get_storage_client()
-        self.ai_service = get_ai_service()
+    @cached_property
+    def storage_service(self):
+        """Async storage client (or None when storage is disabled), created on first use."""
+        return get_async_storage_client()
+
+    @cached_property
+    def ai_service(self) -> "AIService":
+        """AI client, created on first use so importing this module does not load provider SDKs."""
+        return get_ai_service()
 
     async def _register_map_places_best_effort(
         self,
@@ -322,21 +338,24 @@ class DwellerAIService:
             f"Dweller visual attributes: {dweller_obj.visual_attributes}"
         )
         image_bytes = await self.ai_service.generate_image(prompt=prompt, return_bytes=True)
-        image_url = await asyncio.to_thread(
-            self.storage_service.upload_file,
-            file_data=image_bytes,
-            file_name=f"{dweller_obj.id}.png",
+        stored = await media_service.store_image(
+            self.storage_service,
+            image_bytes,
             bucket_name="dweller-images",
+            variants_bucket="dweller-thumbnails",
         )
-        thumbnail_url = await asyncio.to_thread(
-            self.storage_service.upload_thumbnail,
-            file_data=image_bytes,
-            file_name=f"{dweller_obj.id}_thumbnail.png",
-            bucket_name="dweller-thumbnails",
-        )
+        image_url = stored.url
+        thumbnail = stored.variant_for(settings.MEDIA_THUMBNAIL_WIDTH)
+        thumbnail_url = thumbnail.url if thumbnail else image_url
 
         await dweller_crud.update(
-            db_session, dweller_obj.id, DwellerUpdate(image_url=image_url, thumbnail_url=thumbnail_url)
+            db_session,
+            dweller_obj.id,
+            DwellerUpdate(
+                image_url=image_url,
+                thumbnail_url=thumbnail_url,
+                image_variants=[variant.model_dump() for variant in stored.variants],
+            ),
         )
 
         llm_int_create = LLMInteractionCreate(
@@ -393,11 +412,11 @@ class DwellerAIService:
         except (ValueError, RuntimeError) as e:
             raise HTTPException(status_code=500, detail=f"Failed to generate audio via OpenAI: {e}") from e
 
-        audio_url = await asyncio.to_thread(
-            self.storage_service.upload_file,
-            file_data=audio_bytes,
-            file_name=f"{dweller_obj.id}_voice.mp3",
-            file_type="audio/mpeg",
+        audio_url = await media_service.store_blob(
+            self.storage_service,
+            audio_bytes,
+            extension="mp3",
+            content_type="audio/mpeg",
             bucket_name="dweller-audio",
         )
 
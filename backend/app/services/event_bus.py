@@ -50,7 +50,7 @@ class EventBus:
     def subscribe(self, event_type: GameEvent, handler: EventHandler) -> None:
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
-            logger.debug(f"Handler '{handler.__name__}' subscribed to {event_type}")
+            logger.debug("Handler '%s' subscribed to %s", handler.__name__, event_type)
 
     async def emit(self, event_type: GameEvent, vault_id: UUID4, data: dict[str, Any]) -> None:
         """Deliver one vault's event without overlapping the same event delivery.
@@ -64,25 +64,28 @@ class EventBus:
         async with lock:
             handlers = self._handlers.get(event_type, [])
             if not handlers:
-                logger.debug(f"[EVENT] No handlers for {event_type}, skipping (vault: {vault_id})")
+                logger.debug("[EVENT] No handlers for %s, skipping (vault: %s)", event_type, vault_id)
                 return
 
-            logger.info(f"[EVENT] Emitting {event_type} for vault {vault_id} to {len(handlers)} handler(s): {data}")
-            logger.debug(f"[EVENT] Handlers: {[h.__name__ for h in handlers]}")
+            # Once per event per tick; keep the payload out of INFO
+            logger.debug(
+                "[EVENT] Emitting %s for vault %s to %s handler(s): %s", event_type, vault_id, len(handlers), data
+            )
+            logger.debug("[EVENT] Handlers: %s", [h.__name__ for h in handlers])
 
             for handler in handlers:
                 try:
                     await self._safe_call(handler, event_type, vault_id, data)
                 except Exception:
-                    logger.exception(f"Handler '{handler.__name__}' failed for {event_type}")
+                    logger.exception("Handler '%s' failed for %s", handler.__name__, event_type)
 
     def unsubscribe(self, event_type: GameEvent, handler: EventHandler) -> None:
         handlers = self._handlers.get(event_type, [])
         try:
             handlers.remove(handler)
-            logger.debug(f"Handler '{handler.__name__}' unsubscribed from {event_type}")
+            logger.debug("Handler '%s' unsubscribed from %s", handler.__name__, event_type)
         except ValueError:
-            logger.warning(f"Handler '{handler.__name__}' was not subscribed to {event_type}")
+            logger.warning("Handler '%s' was not subscribed to %s", handler.__name__, event_type)
 
     def clear(self) -> None:
         self._handlers.clear()
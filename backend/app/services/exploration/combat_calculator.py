@@ -11,11 +11,12 @@ from app.services.exploration import data_loader
 class CombatCalculator:
     """Handles combat outcome calculations."""
 
-    def select_enemy(self, progress: float) -> EnemySchema:
+    def select_enemy(self, progress: float, rng: random.Random | None = None) -> EnemySchema:
         """Select enemy based on exploration progress.
 
         Args:
             progress: Progress percentage (0-100)
+            rng: Optional per-exploration random stream (defaults to the global one)
 
         Returns:
             EnemySchema with name, difficulty, min_damage, max_damage
@@ -31,14 +32,17 @@ class CombatCalculator:
         if not available_enemies:
             available_enemies = enemies
 
-        return EnemySchema(**random.choice(available_enemies))
+        return EnemySchema(**(rng or random).choice(available_enemies))
 
-    def calculate_combat_outcome(self, exploration: Exploration, enemy: EnemySchema) -> CombatOutcomeSchema:
+    def calculate_combat_outcome(
+        self, exploration: Exploration, enemy: EnemySchema, rng: random.Random | None = None
+    ) -> CombatOutcomeSchema:
         """Calculate combat outcome based on dweller stats.
 
         Args:
             exploration: Active exploration
             enemy: Enemy schema with combat stats
+            rng: Optional per-exploration random stream (defaults to the global one)
 
         Returns:
             CombatOutcomeSchema with victory, health_loss, and description
@@ -53,7 +57,8 @@ class CombatCalculator:
             cfg.combat_success_base + (combat_power * cfg.combat_stat_multiplier),
         )
 
-        success = random.random() < success_chance
+        rng = rng or random
+        success = rng.random() < success_chance
 
         if success:
             # Victory - minimal damage (enemy min damage - endurance bonus)
@@ -62,7 +67,7 @@ class CombatCalculator:
             return CombatOutcomeSchema(victory=True, health_loss=damage, description=description)
 
         # Defeat - significant damage (random in range - endurance bonus)
-        damage = random.randint(enemy.min_damage, enemy.max_damage) - exploration.dweller_endurance
+        damage = rng.randint(enemy.min_damage, enemy.max_damage) - exploration.dweller_endurance
         damage = max(damage // 2, 1)  # At least some damage
         description = f"Barely survived {enemy.name}. Took {damage} damage."
         return CombatOutcomeSchema(victory=False, health_loss=damage, description=description)
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import random
+from collections.abc import Sequence
 from typing import Any, TypedDict
 
 from pydantic import UUID4
@@ -24,10 +25,16 @@ from app.models.junk import Junk
 from app.models.outfit import Outfit
 from app.models.weapon import Weapon
 from app.schemas.common import GenderEnum, JunkTypeEnum, OutfitTypeEnum, RarityEnum, WeaponSubtypeEnum, WeaponTypeEnum
-from app.schemas.exploration_event import ExplorationEventType, OutfitSchema, RewardsSchema, WeaponSchema
+from app.schemas.exploration_event import (
+    ExplorationEvent,
+    ExplorationEventType,
+    OutfitSchema,
+    RewardsSchema,
+    WeaponSchema,
+)
 from app.services.event_bus import GameEvent, event_bus
 from app.services.exploration import data_loader
-from app.services.exploration.event_generator import event_generator
+from app.services.exploration.event_generator import event_generator, exploration_rng
 from app.services.exploration.rewards_calculator import rewards_calculator
 from app.services.notification_service import notification_service
 from app.services.stream_manager import sse_manager
@@ -79,6 +86,116 @@ class ExplorationCoordinator:
         if not event:
             return exploration
 
+        event_records = await self._apply_event(db_session, exploration, event)
+
+        # Commit changes
+        db_session.add(exploration)
+        await db_session.commit()
+        await db_session.refresh(exploration)
+
+        dweller_obj = await dweller_crud.get(db_session, exploration.dweller_id)
+        await self._publish_event_records(exploration, event_records, dweller_obj)
+
+        return exploration
+
+    async def process_events(self, db_session: AsyncSession, explorations: Sequence[Exploration]) -> list[Exploration]:
+        """Advance a batch of active explorations (one vault or shard) by one event each, where due.
+
+        Events are generated in memory from each exploration's own seeded stream
+        (``exploration_rng``), dwellers and currently-equipped gear are loaded
+        with one query per table, and all writes go out in a single commit.
+        SSE updates are published after the commit. Explorations without an
+        event yet get their ``next_due_at`` pushed back to their next event or
+        end, so the game loop does not wake them again before then.
+
+        Returns:
+            The explorations that received an event
+        """
+
+        def _generate() -> tuple[list[tuple[Exploration, random.Random, ExplorationEvent]], list[Exploration]]:
+            generated, waiting = [], []
+            for exploration in explorations:
+                rng = exploration_rng(exploration)
+                try:
+                    event = event_generator.generate_event(exploration, rng=rng)
+                except (ValueError, RuntimeError):
+                    # Left due, so it is retried next tick
+                    logger.exception("Failed to generate event for exploration %s", exploration.id)
+                    continue
+                if event:
+                    generated.append((exploration, rng, event))
+                else:
+                    waiting.append(exploration)
+            return generated, waiting
+
+        due, waiting = await asyncio.to_thread(_generate)
+        for exploration in waiting:
+            exploration.schedule_next_check()
+            db_session.add(exploration)
+        if not due:
+            if waiting:
+                await db_session.commit()
+            return []
+
+        dweller_ids = {exploration.dweller_id for exploration, _, _ in due}
+        dwellers = {
+            dweller.id: dweller
+            for dweller in (await db_session.execute(select(Dweller).where(Dweller.id.in_(dweller_ids)))).scalars()
+        }
+        current_gear = await self._load_current_gear(
+            db_session,
+            [
+                (event.loot.item_type, exploration.dweller_id)
+                for exploration, _, event in due
+                if getattr(event, "loot", None) and event.loot.item_type in {"weapon", "outfit"}
+            ],
+        )
+
+        processed: list[tuple[Exploration, list[dict]]] = []
+        for exploration, rng, event in due:
+            records = await self._apply_event(
+                db_session,
+                exploration,
+                event,
+                rng=rng,
+                dweller_obj=dwellers.get(exploration.dweller_id),
+                current_gear=current_gear,
+            )
+            db_session.add(exploration)
+            processed.append((exploration, records))
+
+        await db_session.commit()
+
+        for exploration, records in processed:
+            await self._publish_event_records(exploration, records, dwellers.get(exploration.dweller_id))
+        return [exploration for exploration, _ in processed]
+
+    @staticmethod
+    async def _load_current_gear(
+        db_session: AsyncSession, wanted: list[tuple[str, UUID4]]
+    ) -> dict[tuple[str, UUID4], Weapon | Outfit | None]:
+        """Load the equipped weapon/outfit for each (item_type, dweller_id) pair in one query per type."""
+        gear: dict[tuple[str, UUID4], Weapon | Outfit | None] = dict.fromkeys(wanted)
+        for item_type, model in (("weapon", Weapon), ("outfit", Outfit)):
+            dweller_ids = {dweller_id for wanted_type, dweller_id in wanted if wanted_type == item_type}
+            if not dweller_ids:
+                continue
+            result = await db_session.execute(select(model).where(model.dweller_id.in_(dweller_ids)))
+            for item in result.scalars():
+                gear[item_type, item.dweller_id] = item
+        return gear
+
+    async def _apply_event(
+        self,
+        db_session: AsyncSession,
+        exploration: Exploration,
+        event: ExplorationEvent,
+        *,
+        rng: random.Random | None = None,
+        dweller_obj: Dweller | None = None,
+        current_gear: dict[tuple[str, UUID4], Weapon | Outfit | None] | None = None,
+    ) -> list[dict]:
+        """Apply a generated event to the exploration and dweller; returns the event records to publish."""
         # Resolve a discovery's world-map location before persisting so the event
         # can carry location_id + coordinates for deep-linking and route drawing.
         location_name = getattr(event, "location_name", None)
@@ -129,31 +246,33 @@ class ExplorationCoordinator:
 
         # Handle event-specific logic
         if hasattr(event, "loot") and event.loot:
-            event_records.extend(await self._handle_loot_event(db_session, exploration, event))
+            event_records.extend(
+                await self._handle_loot_event(db_session, exploration, event, rng=rng, current_gear=current_gear)
+            )
 
         if hasattr(event, "health_loss") and event.health_loss:
-            await self._apply_health_loss(db_session, exploration, event.health_loss)
+            await self._apply_health_loss(db_session, exploration, event.health_loss, dweller_obj=dweller_obj)
 
         if hasattr(event, "health_restored") and event.health_restored:
-            await self._apply_health_restoration(db_session, exploration, event.health_restored)
+            await self._apply_health_restoration(
+                db_session, exploration, event.health_restored, dweller_obj=dweller_obj
+            )
 
         # Trigger auto-heal check (if health low or radiation high)
-        event_records.extend(await self._handle_auto_heal(db_session, exploration))
+        event_records.extend(await self._handle_auto_heal(db_session, exploration, dweller_obj=dweller_obj))
 
         # Update distance traveled for all events
-        exploration.total_distance += random.randint(1, 3)
+        exploration.total_distance += (rng or random).randint(1, 3)
 
         # Track combat encounters
         if event.type == ExplorationEventType.COMBAT:
             exploration.enemies_encountered += 1
 
-        # Commit changes
-        db_session.add(exploration)
-        await db_session.commit()
-        await db_session.refresh(exploration)
-
-        dweller_obj = await dweller_crud.get(db_session, exploration.dweller_id)
+        return event_records
 
+    async def _publish_event_records(
+        self, exploration: Exploration, event_records: list[dict], dweller_obj: Dweller | None
+    ) -> None:
         sse_extra: dict[str, Any] = {}
         if dweller_obj is not None:
             sse_extra = {"health": dweller_obj.health, "radiation": dweller_obj.radiation}
@@ -173,9 +292,15 @@ class ExplorationCoordinator:
                 **sse_extra,
             )
 
-        return exploration
-
-    async def _handle_loot_event(self, db_session: AsyncSession, exploration: Exploration, event) -> list[dict]:
+    async def _handle_loot_event(
+        self,
+        db_session: AsyncSession,
+        exploration: Exploration,
+        event,
+        *,
+        rng: random.Random | None = None,
+        current_gear: dict[tuple[str, UUID4], Weapon | Outfit | None] | None = None,
+    ) -> list[dict]:
         """Handle loot found in event; returns follow-up event records (e.g. auto-equip)."""
         loot_data = event.loot
         item = loot_data.item
@@ -192,7 +317,7 @@ class ExplorationCoordinator:
 
         # Update stats
         exploration.total_caps_found += caps
-        exploration.total_distance += random.randint(1, 5)
+        exploration.total_distance += (rng or random).randint(1, 5)
 
         # Counter only: the find is already logged by the single loot entry above
         if item_type == "stimpak":
@@ -202,17 +327,20 @@ class ExplorationCoordinator:
 
         followups: list[dict] = []
         if item_type in {"weapon", "outfit"}:
-            record = await self._handle_auto_equip(db_session, exploration, item, item_type)
+            record = await self._handle_auto_equip(db_session, exploration, item, item_type, current_gear=current_gear)
             if record is not None:
                 followups.append(record)
         return followups
 
-    async def _apply_health_loss(self, db_session: AsyncSession, exploration: Exploration, damage: int) -> None:
+    async def _apply_health_loss(
+        self, db_session: AsyncSession, exploration: Exploration, damage: int, *, dweller_obj: Dweller | None = None
+    ) -> None:
         """Apply health loss to dweller.
 
         If damage would be fatal (health <= 0), the dweller dies from exploration.
         """
-        dweller_obj = await dweller_crud.get(db_session, exploration.dweller_id)
+        preloaded = dweller_obj is not None
+        dweller_obj = dweller_obj or await dweller_crud.get(db_session, exploration.dweller_id)
 
         # Short-circuit if dweller is already dead - don't apply damage to dead dwellers
         if dweller_obj.is_dead:
@@ -230,18 +358,23 @@ class ExplorationCoordinator:
             # Just apply damage (cap at 1 to give player chance to recall)
             dweller_obj.health = max(1, new_health)
             db_session.add(dweller_obj)
-            # Flush so _handle_auto_heal sees updated health
-            await db_session.flush()
+            # Flush so _handle_auto_heal sees updated health; a preloaded dweller is shared in memory
+            if not preloaded:
+                await db_session.flush()
 
-    async def _apply_health_restoration(self, db_session: AsyncSession, exploration: Exploration, healing: int) -> None:
+    async def _apply_health_restoration(
+        self, db_session: AsyncSession, exploration: Exploration, healing: int, *, dweller_obj: Dweller | None = None
+    ) -> None:
         """Apply health restoration to dweller."""
-        dweller_obj = await dweller_crud.get(db_session, exploration.dweller_id)
+        dweller_obj = dweller_obj or await dweller_crud.get(db_session, exploration.dweller_id)
         dweller_obj.health = min(dweller_obj.max_health, dweller_obj.health + healing)
         db_session.add(dweller_obj)
 
-    async def _handle_auto_heal(self, db_session: AsyncSession, exploration: Exploration) -> list[dict]:
+    async def _handle_auto_heal(
+        self, db_session: AsyncSession, exploration: Exploration, *, dweller_obj: Dweller | None = None
+    ) -> list[dict]:
         """Automatically use stimpaks/radaways if needed; returns the item_use event records."""
-        dweller_obj = await dweller_crud.get(db_session, exploration.dweller_id)
+        dweller_obj = dweller_obj or await dweller_crud.get(db_session, exploration.dweller_id)
 
         # Early return if dweller is already dead
         if dweller_obj.is_dead:
@@ -283,14 +416,32 @@ class ExplorationCoordinator:
 
         return records
 
+    @staticmethod
+    async def _current_gear[T: (Weapon, Outfit)](
+        db_session: AsyncSession,
+        exploration: Exploration,
+        model: type[T],
+        item_type: str,
+        current_gear: dict[tuple[str, UUID4], Weapon | Outfit | None] | None,
+    ) -> T | None:
+        if current_gear is not None and (item_type, exploration.dweller_id) in current_gear:
+            return current_gear[item_type, exploration.dweller_id]
+        item_result = await db_session.execute(select(model).where(model.dweller_id == exploration.dweller_id))
+        return item_result.scalar_one_or_none()
+
     async def _handle_auto_equip(
         self,
         db_session: AsyncSession,
         exploration: Exploration,
         item_schema: WeaponSchema | OutfitSchema,
         item_type: str,
+        *,
+        current_gear: dict[tuple[str, UUID4], Weapon | Outfit | None] | None = None,
     ) -> dict | None:
-        """Flag the strongest found weapon/outfit for auto-equip; returns the equip event record."""
+        """Flag the strongest found weapon/outfit for auto-equip; returns the equip event record.
+
+        ``current_gear`` holds batch-preloaded equipped items keyed by (item_type, dweller_id).
+        """
         flagged = next(
             (
                 entry
@@ -305,10 +456,7 @@ class ExplorationCoordinator:
             if flagged is not None:
                 is_better = new_avg > flagged.get("auto_equip_avg_damage", 0)
             else:
-                item_result = await db_session.execute(
-                    select(Weapon).where(Weapon.dweller_id == exploration.dweller_id)
-                )
-                current_item = item_result.scalar_one_or_none()
+                current_item = await self._current_gear(db_session, exploration, Weapon, item_type, current_gear)
                 current_avg = (current_item.damage_min + current_item.damage_max) / 2 if current_item else 0
                 is_better = new_avg > current_avg
         else:
@@ -320,10 +468,7 @@ class ExplorationCoordinator:
                     flagged.get("auto_equip_value", 0),
                 )
             else:
-                item_result = await db_session.execute(
-                    select(Outfit).where(Outfit.dweller_id == exploration.dweller_id)
-                )
-                current_item = item_result.scalar_one_or_none()
+                current_item = await self._current_gear(db_session, exploration, Outfit, item_type, current_gear)
                 current_priority = self._rarity_priority(current_item.rarity) if current_item else 0
                 current_value = (current_item.value or 0) if current_item else 0
                 is_better = (new_priority, new_value) > (current_priority, current_value)
@@ -561,7 +706,7 @@ class ExplorationCoordinator:
             experience=experience,
             distance=exploration.total_distance,
             enemies_defeated=exploration.enemies_encountered,
-            events_encountered=len(exploration.events),
+            events_encountered=exploration.event_count,
             stimpaks=exploration.stimpaks,
             radaways=exploration.radaways,
         )
@@ -765,8 +910,8 @@ class ExplorationCoordinator:
         items_added = 0
 
         # Load item data for lookups
-        weapons_data = await asyncio.to_thread(data_loader.load_weapons)
-        outfits_data = await asyncio.to_thread(data_loader.load_outfits)
+        weapons_by_name = await asyncio.to_thread(data_loader.weapons_by_name)
+        outfits_by_name = await asyncio.to_thread(data_loader.outfits_by_name)
 
         for loot_item in sorted_loot:
             item_name = loot_item.get("item_name", "Unknown Item")
@@ -796,7 +941,7 @@ class ExplorationCoordinator:
             item_created = False
 
             if item_type == "weapon":
-                weapon_data = next((w for w in weapons_data if w["name"] == item_name), None)
+                weapon_data = weapons_by_name.get(item_name)
                 weapon = self._create_weapon_from_loot(weapon_data, rarity, storage_id)
                 if weapon:
                     db_session.add(weapon)
@@ -807,7 +952,7 @@ class ExplorationCoordinator:
                         auto_equip_ids.append({"item_type": "weapon", "id": weapon.id})
 
             elif item_type == "outfit":
-                outfit_data = next((o for o in outfits_data if o["name"] == item_name), None)
+                outfit_data = outfits_by_name.get(item_name)
                 outfit = self._create_outfit_from_loot(outfit_data, rarity, storage_id)
                 if outfit:
                     db_session.add(outfit)
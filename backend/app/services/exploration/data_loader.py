@@ -1,10 +1,19 @@
-"""Data loader for exploration system."""
+"""Data loader for exploration system.
+
+Item catalogs (weapons, outfits, junk) are read through
+:func:`app.utils.static_data.load_json_records`, so they share one parse with
+``game_data_store``; the returned records are read-only.
+"""
 
 import json
+from collections.abc import Mapping
 from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 
 from app.schemas.exploration_event import EnemySchema
+from app.utils.static_data import load_json_records
 
 # Data directory paths
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
@@ -36,41 +45,48 @@ def load_event_templates() -> dict:
         return json.load(f)
 
 
-@lru_cache(maxsize=1)
-def load_junk_items() -> list[dict]:
+def load_junk_items() -> tuple[dict, ...]:
     """Load junk items from JSON."""
     junk_file = ITEMS_DIR / "junk.json"
     if not junk_file.exists():
-        return []
-
-    with junk_file.open() as f:
-        return json.load(f)
+        return ()
+    return load_json_records(junk_file)
 
 
-@lru_cache(maxsize=1)
-def load_weapons() -> list[dict]:
+def load_weapons() -> tuple[dict, ...]:
     """Load weapons from JSON."""
     weapons_file = ITEMS_DIR / "weapons.json"
     if not weapons_file.exists():
-        return []
-
-    with weapons_file.open() as f:
-        return json.load(f)
+        return ()
+    return load_json_records(weapons_file)
 
 
 @lru_cache(maxsize=1)
-def load_outfits() -> list[dict]:
+def load_outfits() -> tuple[dict, ...]:
     """Load outfits from all outfit JSON files."""
     outfits_dir = ITEMS_DIR / "outfits"
     if not outfits_dir.exists():
-        return []
+        return ()
+    return tuple(chain.from_iterable(load_json_records(path) for path in sorted(outfits_dir.glob("*.json"))))
+
+
+@lru_cache(maxsize=1)
+def weapons_by_name() -> Mapping[str, dict]:
+    """Weapon records keyed by exact name; the first definition wins."""
+    return _index_by_name(load_weapons())
+
+
+@lru_cache(maxsize=1)
+def outfits_by_name() -> Mapping[str, dict]:
+    """Outfit records keyed by exact name; the first definition wins."""
+    return _index_by_name(load_outfits())
 
-    outfits = []
-    for outfit_file in outfits_dir.glob("*.json"):
-        with outfit_file.open() as f:
-            outfits.extend(json.load(f))
 
-    return outfits
+def _index_by_name(records: tuple[dict, ...]) -> Mapping[str, dict]:
+    index: dict[str, dict] = {}
+    for record in records:
+        index.setdefault(record["name"], record)
+    return MappingProxyType(index)
 
 
 @lru_cache(maxsize=1)
@@ -19,6 +19,16 @@ from app.services.exploration.combat_calculator import combat_calculator
 from app.services.exploration.loot_calculator import loot_calculator
 
 
+def exploration_rng(exploration: Exploration) -> random.Random:
+    """Return the random stream for an exploration's next event.
+
+    Seeded from the exploration id and the number of events logged so far, so
+    replaying an exploration from the same state reproduces the same event,
+    independent of how many other explorations were processed in the tick.
+    """
+    return random.Random(f"{exploration.id}:{exploration.event_count or 0}")
+
+
 class EventGenerator:
     """Generates exploration events."""
 
@@ -37,10 +47,7 @@ class EventGenerator:
         cfg = game_config.exploration
 
         # Check if enough time has passed for a new event
-        last_event_time = None
-        if exploration.events:
-            last_event = exploration.events[-1]
-            last_event_time = datetime.fromisoformat(last_event["timestamp"])
+        last_event_time = exploration.last_event_at
 
         if not last_event_time:
             # First event - check if initial delay has passed
@@ -51,11 +58,12 @@ class EventGenerator:
         time_since_last_event = (now - last_event_time).total_seconds()
         return time_since_last_event >= cfg.event_interval_seconds
 
-    def generate_event(self, exploration: Exploration) -> ExplorationEvent | None:
+    def generate_event(self, exploration: Exploration, rng: random.Random | None = None) -> ExplorationEvent | None:
         """Generate a random wasteland event.
 
         Args:
             exploration: Active exploration
+            rng: Optional per-exploration random stream (see ``exploration_rng``); defaults to the global one
 
         Returns:
             Event schema or None if no event should be generated
@@ -64,13 +72,14 @@ class EventGenerator:
             return None
 
         cfg = game_config.exploration
+        rng = rng or random
 
         # Discovery event: independent flat roll before the weighted draw
-        rng_value = random.random()
+        rng_value = rng.random()
         if rng_value < cfg.event_discovery_chance:
             names = data_loader.load_discovery_names()
-            prefix = random.choice(names["prefixes"])
-            suffix = random.choice(names["suffixes"])
+            prefix = rng.choice(names["prefixes"])
+            suffix = rng.choice(names["suffixes"])
             location_name = f"{prefix} {suffix}"
             description = (
                 f"Your dweller has discovered {location_name} in the wasteland. "
@@ -86,7 +95,7 @@ class EventGenerator:
             "rest": cfg.event_weight_rest,
         }
 
-        event_type = random.choices(
+        event_type = rng.choices(
             list(event_weights.keys()),
             weights=list(event_weights.values()),
             k=1,
@@ -94,18 +103,18 @@ class EventGenerator:
 
         # Generate event based on type
         if event_type == "combat":
-            return self._generate_combat_event(exploration)
+            return self._generate_combat_event(exploration, rng)
         if event_type == "loot":
-            return self._generate_loot_event(exploration)
+            return self._generate_loot_event(exploration, rng)
         if event_type == "danger":
-            return self._generate_danger_event(exploration)
-        return self._generate_rest_event(exploration)
+            return self._generate_danger_event(exploration, rng)
+        return self._generate_rest_event(exploration, rng)
 
-    def _generate_combat_event(self, exploration: Exploration) -> CombatEventSchema:
+    def _generate_combat_event(self, exploration: Exploration, rng: random.Random | None = None) -> CombatEventSchema:
         """Generate combat event."""
         progress = exploration.progress_percentage()
-        enemy = combat_calculator.select_enemy(progress)
-        outcome = combat_calculator.calculate_combat_outcome(exploration, enemy)
+        enemy = combat_calculator.select_enemy(progress, rng)
+        outcome = combat_calculator.calculate_combat_outcome(exploration, enemy, rng)
 
         return CombatEventSchema(
             description=outcome.description,
@@ -114,17 +123,17 @@ class EventGenerator:
             victory=outcome.victory,
         )
 
-    def _generate_loot_event(self, exploration: Exploration) -> LootEventSchema:
+    def _generate_loot_event(self, exploration: Exploration, rng: random.Random | None = None) -> LootEventSchema:
         """Generate loot discovery event."""
         luck = exploration.dweller_luck
         perception = exploration.dweller_perception
 
         # Select loot item
-        loot_item, item_type = loot_calculator.select_random_loot(luck)
-        caps_found = loot_calculator.calculate_caps_found(perception, luck)
+        loot_item, item_type = loot_calculator.select_random_loot(luck, rng)
+        caps_found = loot_calculator.calculate_caps_found(perception, luck, rng)
 
         templates = data_loader.load_event_templates()
-        template = random.choice(templates["loot"])
+        template = (rng or random).choice(templates["loot"])
         description = template.format(item=loot_item.name, caps=caps_found)
 
         return LootEventSchema(
@@ -132,28 +141,29 @@ class EventGenerator:
             loot=LootSchema(item=loot_item, item_type=item_type, caps=caps_found),
         )
 
-    def _generate_danger_event(self, exploration: Exploration) -> DangerEventSchema:
+    def _generate_danger_event(self, exploration: Exploration, rng: random.Random | None = None) -> DangerEventSchema:
         """Generate danger/hazard event."""
         endurance = exploration.dweller_endurance
         damage = max(1, 10 - endurance)
 
         templates = data_loader.load_event_templates()
-        template = random.choice(templates["danger"])
+        template = (rng or random).choice(templates["danger"])
         description = template.format(damage=damage)
 
         return DangerEventSchema(description=description, health_loss=damage)
 
-    def _generate_rest_event(self, exploration: Exploration) -> RestEventSchema:
+    def _generate_rest_event(self, exploration: Exploration, rng: random.Random | None = None) -> RestEventSchema:
         """Generate rest/recovery event."""
         cfg = game_config.exploration
-        health_restored = random.randint(cfg.rest_health_min, cfg.rest_health_max)
+        rng = rng or random
+        health_restored = rng.randint(cfg.rest_health_min, cfg.rest_health_max)
 
         # Intelligence provides small bonus
         intelligence_bonus = exploration.dweller_intelligence // 3
         health_restored += intelligence_bonus
 
         templates = data_loader.load_event_templates()
-        template = random.choice(templates["rest"])
+        template = rng.choice(templates["rest"])
         description = template.format(health=health_restored)
 
         return RestEventSchema(description=description, health_restored=health_restored)
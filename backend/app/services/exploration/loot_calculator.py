@@ -1,15 +1,96 @@
-"""Loot selection and rewards calculations."""
+"""Loot selection and rewards calculations.
+
+Item pools are validated into schema instances once and bucketed by rarity
+(:class:`LootTable`), and the luck-adjusted rarity/type weights are kept as
+cumulative vectors per luck value, so a roll is a bisect over at most four
+weights plus a uniform pick from a prebuilt tuple. Rolled items are shared
+instances and must be treated as read-only.
+"""
 
 import random
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+
+from pydantic import BaseModel
 
 from app.core.game_config import game_config
 from app.schemas.exploration_event import ItemSchema, JunkSchema, OutfitSchema, WeaponSchema
 from app.services.exploration import data_loader
 
+RARITIES = ("Common", "Rare", "Legendary")
+_LUCK_MIN = 1
+_LUCK_MAX = 10
+
+_FALLBACK_WEAPON = WeaponSchema(
+    name="Rusty Pipe",
+    rarity="Common",
+    value=10,
+    weapon_type="Melee",
+    weapon_subtype="Blunt",
+    stat="strength",
+    damage_min=1,
+    damage_max=3,
+)
+_FALLBACK_OUTFIT = OutfitSchema(name="Vault Suit", rarity="Common", value=10, outfit_type="Common Outfit")
+_FALLBACK_JUNK = JunkSchema(name="Bottle Cap", value=1, rarity="Common")
+_STIMPAK = ItemSchema(name="Stimpak", value=50, rarity="Common")
+_RADAWAY = ItemSchema(name="RadAway", value=50, rarity="Common")
+
+
+@dataclass(frozen=True, slots=True)
+class LootTable[T: BaseModel]:
+    """Immutable, prevalidated item pool bucketed by rarity."""
+
+    items: tuple[T, ...]
+    by_rarity: Mapping[str, tuple[T, ...]]
+
+    @classmethod
+    def build(cls, raw_items: Sequence[dict], schema: type[T]) -> "LootTable[T]":
+        items = tuple(schema(**raw) for raw in raw_items)
+        buckets: dict[str, list[T]] = {}
+        for item in items:
+            buckets.setdefault(item.rarity, []).append(item)
+        return cls(items=items, by_rarity=MappingProxyType({rarity: tuple(pool) for rarity, pool in buckets.items()}))
+
+    def pick(self, rarity: str, rng: random.Random | None = None) -> T:
+        """Pick uniformly among items of ``rarity``, falling back to the whole pool when none exist."""
+        pool = self.by_rarity.get(rarity) or self.items
+        return (rng or random).choice(pool)
+
+
+@dataclass(frozen=True, slots=True)
+class LootTables:
+    weapons: LootTable[WeaponSchema]
+    outfits: LootTable[OutfitSchema]
+    junk: LootTable[JunkSchema]
+
+
+@lru_cache(maxsize=1)
+def get_loot_tables() -> LootTables:
+    """Build the loot tables from the (cached) item data files on first use."""
+    return LootTables(
+        weapons=LootTable.build(data_loader.load_weapons(), WeaponSchema),
+        outfits=LootTable.build(data_loader.load_outfits(), OutfitSchema),
+        junk=LootTable.build(data_loader.load_junk_items(), JunkSchema),
+    )
+
+
+def _clamp_luck(luck: int) -> int:
+    return min(max(luck, _LUCK_MIN), _LUCK_MAX)
+
 
 class LootCalculator:
     """Handles loot selection and caps rewards."""
 
+    def __init__(self) -> None:
+        # Cumulative weight vectors per luck value, rebuilt if the exploration config changes
+        self._weights_config: tuple[float, ...] | None = None
+        self._rarity_cum_weights: dict[int, tuple[float, ...]] = {}
+        self._type_table: dict[int, tuple[tuple[str, ...], tuple[float, ...]]] = {}
+
     def calculate_luck_multiplier(self, luck: int) -> float:
         """Calculate loot quality multiplier based on luck stat.
 
@@ -47,129 +128,140 @@ class LootCalculator:
             }
         return {"Common": 80.0, "Rare": 18.0, "Legendary": 2.0}
 
-    def select_random_weapon(self, luck: int) -> WeaponSchema:
+    def _weights_for(self, luck: int) -> tuple[tuple[float, ...], tuple[str, ...], tuple[float, ...]]:
+        """Return (rarity cum-weights, loot types, type cum-weights) for a luck value."""
+        cfg = game_config.exploration
+        config_key = (
+            cfg.rarity_common_base,
+            cfg.rarity_rare_base,
+            cfg.rarity_legendary_base,
+            cfg.loot_type_junk,
+            cfg.loot_type_weapon,
+            cfg.loot_type_outfit,
+        )
+        if config_key != self._weights_config:
+            self._rarity_cum_weights = {}
+            self._type_table = {}
+            for value in range(_LUCK_MIN, _LUCK_MAX + 1):
+                rarity_weights = self.get_rarity_weights(value)
+                self._rarity_cum_weights[value] = tuple(accumulate(rarity_weights[rarity] for rarity in RARITIES))
+                type_weights = self.get_loot_type_weights(value)
+                self._type_table[value] = (tuple(type_weights), tuple(accumulate(type_weights.values())))
+            self._weights_config = config_key
+        luck = _clamp_luck(luck)
+        return self._rarity_cum_weights[luck], *self._type_table[luck]
+
+    def _roll_rarities(self, luck: int, k: int, rng: random.Random | None) -> list[str]:
+        rarity_cum_weights, _, _ = self._weights_for(luck)
+        return (rng or random).choices(RARITIES, cum_weights=rarity_cum_weights, k=k)
+
+    def _roll_items[T: BaseModel](
+        self, table: LootTable[T], fallback: T, luck: int, k: int, rng: random.Random | None
+    ) -> list[T]:
+        if not table.items:
+            return [fallback] * k
+        return [table.pick(rarity, rng) for rarity in self._roll_rarities(luck, k, rng)]
+
+    def roll_weapons(self, luck: int, k: int, rng: random.Random | None = None) -> list[WeaponSchema]:
+        """Roll ``k`` luck-adjusted weapons at once."""
+        return self._roll_items(get_loot_tables().weapons, _FALLBACK_WEAPON, luck, k, rng)
+
+    def roll_outfits(self, luck: int, k: int, rng: random.Random | None = None) -> list[OutfitSchema]:
+        """Roll ``k`` luck-adjusted outfits at once."""
+        return self._roll_items(get_loot_tables().outfits, _FALLBACK_OUTFIT, luck, k, rng)
+
+    def roll_junk(self, luck: int, k: int, rng: random.Random | None = None) -> list[JunkSchema]:
+        """Roll ``k`` luck-adjusted junk items at once."""
+        return self._roll_items(get_loot_tables().junk, _FALLBACK_JUNK, luck, k, rng)
+
+    def select_random_weapon(self, luck: int, rng: random.Random | None = None) -> WeaponSchema:
         """Select a random weapon based on luck-adjusted rarity."""
-        weapons = data_loader.load_weapons()
-        if not weapons:
-            return WeaponSchema(
-                name="Rusty Pipe",
-                rarity="Common",
-                value=10,
-                weapon_type="Melee",
-                weapon_subtype="Blunt",
-                stat="strength",
-                damage_min=1,
-                damage_max=3,
-            )
-
-        rarity_weights = self.get_rarity_weights(luck)
-        rarity = random.choices(
-            list(rarity_weights.keys()),
-            weights=list(rarity_weights.values()),
-            k=1,
-        )[0]
-
-        weapons_of_rarity = [w for w in weapons if w.get("rarity") == rarity]
-        if not weapons_of_rarity:
-            weapons_of_rarity = weapons
-
-        return WeaponSchema(**random.choice(weapons_of_rarity))
-
-    def select_random_outfit(self, luck: int) -> OutfitSchema:
-        """Select a random outfit based on luck-adjusted rarity."""
-        outfits = data_loader.load_outfits()
-        if not outfits:
-            return OutfitSchema(name="Vault Suit", rarity="Common", value=10, outfit_type="Common Outfit")
-
-        rarity_weights = self.get_rarity_weights(luck)
-        rarity = random.choices(
-            list(rarity_weights.keys()),
-            weights=list(rarity_weights.values()),
-            k=1,
-        )[0]
+        return self.roll_weapons(luck, 1, rng)[0]
 
-        outfits_of_rarity = [o for o in outfits if o.get("rarity") == rarity]
-        if not outfits_of_rarity:
-            outfits_of_rarity = outfits
-
-        return OutfitSchema(**random.choice(outfits_of_rarity))
+    def select_random_outfit(self, luck: int, rng: random.Random | None = None) -> OutfitSchema:
+        """Select a random outfit based on luck-adjusted rarity."""
+        return self.roll_outfits(luck, 1, rng)[0]
 
-    def select_random_junk(self, luck: int) -> JunkSchema:
+    def select_random_junk(self, luck: int, rng: random.Random | None = None) -> JunkSchema:
         """Select a random junk item based on luck-adjusted rarity."""
-        junk_items = data_loader.load_junk_items()
-        if not junk_items:
-            return JunkSchema(name="Bottle Cap", value=1, rarity="Common")
-
-        rarity_weights = self.get_rarity_weights(luck)
-        rarity = random.choices(
-            list(rarity_weights.keys()),
-            weights=list(rarity_weights.values()),
-            k=1,
-        )[0]
-
-        items_of_rarity = [item for item in junk_items if item.get("rarity") == rarity]
-        if not items_of_rarity:
-            items_of_rarity = junk_items
-
-        return JunkSchema(**random.choice(items_of_rarity))
+        return self.roll_junk(luck, 1, rng)[0]
 
-    def select_medicine(self) -> tuple[ItemSchema, str]:
+    def select_medicine(self, rng: random.Random | None = None) -> tuple[ItemSchema, str]:
         """Select a random medicine item (stimpak or radaway)."""
-        if random.random() > 0.5:
-            return (ItemSchema(name="Stimpak", value=50, rarity="Common"), "stimpak")
-        return (ItemSchema(name="RadAway", value=50, rarity="Common"), "radaway")
+        if (rng or random).random() > 0.5:
+            return (_STIMPAK, "stimpak")
+        return (_RADAWAY, "radaway")
 
-    def select_random_loot(self, luck: int) -> tuple[ItemSchema, str]:
-        """Select a random loot item based on luck.
+    def get_loot_type_weights(self, luck: int) -> dict[str, float]:
+        """Get loot item-type weights adjusted by luck stat.
 
         Args:
             luck: Luck stat (1-10)
 
         Returns:
-            Tuple of (item_schema, item_type) where item_type is 'junk', 'weapon', or 'outfit'
+            Dict of item-type weights {junk, weapon, outfit[, medicine]}
         """
         cfg = game_config.exploration
-
-        # Determine item type with luck-adjusted weights
         if luck >= 8:
-            type_weights = {"junk": 50.0, "weapon": 30.0, "outfit": 20.0}
-        elif luck >= 6:
-            type_weights = {"junk": 55.0, "weapon": 28.0, "outfit": 17.0}
-        else:
-            type_weights = {
-                "junk": cfg.loot_type_junk,
-                "weapon": cfg.loot_type_weapon,
-                "outfit": cfg.loot_type_outfit,
-                "medicine": 5.0,  # 5% base chance for medicine
-            }
-
-        item_type = random.choices(
-            list(type_weights.keys()),
-            weights=list(type_weights.values()),
-            k=1,
-        )[0]
-
-        if item_type == "weapon":
-            return (self.select_random_weapon(luck), "weapon")
-        if item_type == "outfit":
-            return (self.select_random_outfit(luck), "outfit")
-        if item_type == "medicine":
-            return self.select_medicine()
+            return {"junk": 50.0, "weapon": 30.0, "outfit": 20.0}
+        if luck >= 6:
+            return {"junk": 55.0, "weapon": 28.0, "outfit": 17.0}
+        return {
+            "junk": cfg.loot_type_junk,
+            "weapon": cfg.loot_type_weapon,
+            "outfit": cfg.loot_type_outfit,
+            "medicine": 5.0,  # 5% base chance for medicine
+        }
+
+    def select_random_loot(self, luck: int, rng: random.Random | None = None) -> tuple[ItemSchema, str]:
+        """Select a random loot item based on luck.
 
-        return (self.select_random_junk(luck), "junk")
+        Args:
+            luck: Luck stat (1-10)
+            rng: Optional per-exploration random stream (defaults to the global one)
 
-    def calculate_caps_found(self, perception: int, luck: int) -> int:
+        Returns:
+            Tuple of (item_schema, item_type) where item_type is 'junk', 'weapon', or 'outfit'
+        """
+        return self.roll_loot(luck, 1, rng)[0]
+
+    def roll_loot(self, luck: int, k: int, rng: random.Random | None = None) -> list[tuple[ItemSchema, str]]:
+        """Roll ``k`` loot items at once, with the same distribution as ``select_random_loot``."""
+        _, loot_types, type_cum_weights = self._weights_for(luck)
+        rollers: dict[str, Callable[[int, int, random.Random | None], list]] = {
+            "weapon": self.roll_weapons,
+            "outfit": self.roll_outfits,
+            "junk": self.roll_junk,
+        }
+        item_types = (rng or random).choices(loot_types, cum_weights=type_cum_weights, k=k)
+        # Roll each type's items in one batch, then hand them out in roll order
+        batches = {
+            item_type: iter(rollers[item_type](luck, item_types.count(item_type), rng))
+            # sorted: set order varies per process, which would break seeded replays
+            for item_type in sorted(set(item_types))
+            if item_type in rollers
+        }
+        loot: list[tuple[ItemSchema, str]] = []
+        for item_type in item_types:
+            if item_type == "medicine":
+                loot.append(self.select_medicine(rng))
+            else:
+                loot.append((next(batches[item_type]), item_type))
+        return loot
+
+    def calculate_caps_found(self, perception: int, luck: int, rng: random.Random | None = None) -> int:
         """Calculate caps found based on perception and luck.
 
         Args:
             perception: Perception stat (1-10)
             luck: Luck stat (1-10)
+            rng: Optional per-exploration random stream (defaults to the global one)
 
         Returns:
             Number of caps found
         """
         cfg = game_config.exploration
-        base_caps = random.randint(cfg.caps_base_min, cfg.caps_base_max)
+        base_caps = (rng or random).randint(cfg.caps_base_min, cfg.caps_base_max)
         return base_caps + (perception * cfg.caps_perception_multiplier) + (luck * cfg.caps_luck_multiplier)
 
 
@@ -27,7 +27,7 @@ class RewardsCalculator:
         # Base XP sources
         distance_xp = exploration.total_distance * cfg.exploration_xp_per_distance
         combat_xp = exploration.enemies_encountered * cfg.exploration_xp_per_enemy
-        event_xp = len(exploration.events) * cfg.exploration_xp_per_event
+        event_xp = exploration.event_count * cfg.exploration_xp_per_event
 
         base_xp = distance_xp + combat_xp + event_xp
 
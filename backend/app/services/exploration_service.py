@@ -4,16 +4,19 @@ This service provides a clean API for exploration operations and delegates to
 the modular exploration system in services/exploration/ modules.
 """
 
+from collections.abc import Sequence
+
 from pydantic import UUID4
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud import exploration as crud_exploration
+from app.crud import exploration_event as crud_exploration_event
 from app.crud.dweller import dweller as dweller_crud
 from app.models import Storage
 from app.models.exploration import Exploration
 from app.schemas.common import AgeGroupEnum
-from app.schemas.exploration import ExplorationProgress
+from app.schemas.exploration import ExplorationJournalPage, ExplorationProgress, ExplorationRead
 from app.schemas.exploration_event import RewardsSchema
 from app.services.exploration.coordinator import exploration_coordinator
 from app.services.exploration.event_generator import event_generator
@@ -48,6 +51,18 @@ class ExplorationService:
         """
         return await exploration_coordinator.process_event(db_session, exploration)
 
+    async def process_events(self, db_session: AsyncSession, explorations: Sequence[Exploration]) -> list[Exploration]:
+        """Advance a batch of active explorations by one event each, where due.
+
+        :param db_session: Database session
+        :type db_session: AsyncSession
+        :param explorations: Active explorations, e.g. all of a vault's
+        :type explorations: Sequence[Exploration]
+        :return: Explorations that received an event
+        :rtype: list[Exploration]
+        """
+        return await exploration_coordinator.process_events(db_session, explorations)
+
     async def complete_exploration(self, db_session: AsyncSession, exploration_id: UUID4) -> dict:
         """Complete an exploration and return rewards summary.
 
@@ -191,12 +206,54 @@ class ExplorationService:
             progress_percentage=exploration.progress_percentage(),
             time_remaining_seconds=exploration.time_remaining_seconds(),
             elapsed_time_seconds=exploration.elapsed_time_seconds(),
-            events=exploration.events,
+            events=await crud_exploration_event.get_records(db_session, exploration.id),
             loot_collected=exploration.loot_collected,
             stimpaks=exploration.stimpaks,
             radaways=exploration.radaways,
         )
 
+    async def to_read(self, db_session: AsyncSession, exploration: Exploration) -> ExplorationRead:
+        """Build the full read schema, loading the event journal from its table.
+
+        :param db_session: Database session
+        :type db_session: AsyncSession
+        :param exploration: Exploration to serialize
+        :type exploration: Exploration
+        :return: Exploration with its events
+        :rtype: ExplorationRead
+        """
+        events = await crud_exploration_event.get_records(db_session, exploration.id)
+        return ExplorationRead.model_validate(exploration, update={"events": events})
+
+    async def get_journal(
+        self,
+        db_session: AsyncSession,
+        exploration_id: UUID4,
+        *,
+        after_seq: int | None = None,
+        limit: int = 50,
+    ) -> ExplorationJournalPage:
+        """Read one page of an exploration's events, oldest first.
+
+        :param db_session: Database session
+        :type db_session: AsyncSession
+        :param exploration_id: Exploration ID
+        :type exploration_id: UUID4
+        :param after_seq: Cursor from the previous page, or None to start at the beginning
+        :type after_seq: int | None
+        :param limit: Page size
+        :type limit: int
+        :return: Events plus the cursor for the next page
+        :rtype: ExplorationJournalPage
+        """
+        # One extra row tells us whether another page exists without a COUNT
+        rows = await crud_exploration_event.get_page(db_session, exploration_id, after_seq=after_seq, limit=limit + 1)
+        page = rows[:limit]
+        return ExplorationJournalPage(
+            events=[row.to_record() for row in page],
+            next_after_seq=page[-1].seq if len(rows) > limit else None,
+        )
+
     async def complete_exploration_with_data(
         self, db_session: AsyncSession, exploration_id: UUID4
     ) -> tuple[Exploration, RewardsSchema]:
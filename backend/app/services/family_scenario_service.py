@@ -44,6 +44,7 @@ from app.schemas.common import (
     RoomTypeEnum,
 )
 from app.services.breeding_service import breeding_service
+from app.services.relationship_service import relationship_service
 from app.utils.exceptions import ResourceNotFoundException
 
 if TYPE_CHECKING:
@@ -163,41 +164,25 @@ class FamilyScenarioService:
         vault_id: UUID4,
         count: int,
         seed: int | None,
-    ) -> list[tuple[Dweller, Dweller]]:
+    ) -> list[tuple[UUID4, UUID4]]:
         """Auto-pick ``count`` couples from the vault's adults.
 
-        Pairs are built male+female first (breeding requires opposite
-        genders), then leftover dwellers are paired in list order. Throws a
-        clear ValueError if there are not enough adults.
+        Uses the vault's cached compatibility matrix: the highest-scoring
+        male+female pairs are taken first (breeding requires opposite genders),
+        then leftover dwellers are paired by score. ``seed`` breaks ties between
+        equally compatible pairs. Throws a clear ValueError if there are not
+        enough adults.
         """
-        adults = await cls.list_adults(db_session, vault_id)
-        rng = random.Random(seed)
-        rng.shuffle(adults)
+        matrix = await relationship_service.get_compatibility_matrix(db_session, vault_id)
 
-        if len(adults) < count * 2:
+        if len(matrix) < count * 2:
             raise ValueError(
-                f"Vault {vault_id} has {len(adults)} adult dwellers but {count * 2} are needed "
+                f"Vault {vault_id} has {len(matrix)} adult dwellers but {count * 2} are needed "
                 f"for {count} couples. Use --pairs or pregen more dwellers "
                 f"(uv run fo-cli pregen-dwellers --vault-id {vault_id})."
             )
 
-        males = [d for d in adults if d.gender == GenderEnum.MALE]
-        females = [d for d in adults if d.gender == GenderEnum.FEMALE]
-
-        pairs: list[tuple[Dweller, Dweller]] = []
-        used: set[UUID4] = set()
-        for _ in range(count):
-            male = next((m for m in males if m.id not in used), None)
-            female = next((f for f in females if f.id not in used), None)
-            if male and female:
-                pairs.append((male, female))
-                used.update({male.id, female.id})
-                continue
-            remaining = [d for d in adults if d.id not in used]
-            if len(remaining) >= 2:
-                pairs.append((remaining[0], remaining[1]))
-                used.update({remaining[0].id, remaining[1].id})
-        return pairs
+        return matrix.best_pairs(count, rng=random.Random(seed))
 
     @classmethod
     async def pair(
@@ -294,7 +279,7 @@ class FamilyScenarioService:
     ) -> Pregnancy:
         """Create a DELIVERED pregnancy whose ``updated_at`` is ``delivered_hours_ago`` in the past.
 
-        The postpartum-cooldown check (``_get_postpartum_mother_ids``) reads
+        The postpartum-cooldown check (``_get_conception_candidates``) reads
         ``Pregnancy.updated_at`` and excludes mothers whose delivery falls
         within ``birth_cooldown_hours`` (default 6h). Backdating ``updated_at``
         is what makes the cooldown testable without waiting: e.g. 2h ago = still
@@ -2,9 +2,11 @@
 
 import logging
 import random
+from collections import Counter
 from datetime import datetime
 
 from pydantic import UUID4
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -21,8 +23,10 @@ from app.schemas.common import RoomTypeEnum
 from app.services.event_bus import GameEvent, event_bus
 from app.services.exploration_service import exploration_service
 from app.services.happiness_service import happiness_service
+from app.services.notification_service import NotificationOutbox, NotificationService
 from app.services.resource_manager import ResourceManager
 from app.services.stream_manager import sse_manager
+from app.services.vault_activity import VaultActivity, load_vault_activity
 from app.utils.dwellers import group_dwellers_by_room
 from app.utils.exceptions import ResourceNotFoundException, VaultOperationException
 
@@ -47,35 +51,53 @@ class GameLoopService:
             "vaults_skipped": 0,
             "errors": 0,
             "total_time": 0,
+            "phases_skipped": {},
         }
+        phases_skipped: Counter[str] = Counter()
 
         start_time = datetime.utcnow()
 
         # Get all active vaults
         active_vaults = await self._get_active_vaults(db_session)
 
-        self.logger.info(f"Processing game tick for {len(active_vaults)} vaults")
+        self.logger.info("Processing game tick for %s vaults", len(active_vaults))
 
         for vault in active_vaults:
             try:
-                await self.process_vault_tick(db_session, vault.id)
+                result = await self.process_vault_tick(db_session, vault.id)
                 stats["vaults_processed"] += 1
+                phases_skipped.update(result.get("skipped_phases", ()))
             except (SQLAlchemyError, ResourceNotFoundException, VaultOperationException, ValueError, RuntimeError) as e:
-                self.logger.error(f"Error processing vault {vault.id}: {e}", exc_info=True)
+                self.logger.error("Error processing vault %s: %s", vault.id, e, exc_info=True)
                 stats["errors"] += 1
 
         stats["total_time"] = (datetime.utcnow() - start_time).total_seconds()
+        stats["phases_skipped"] = dict(phases_skipped)
 
         self.logger.info(
-            f"Game tick completed: {stats['vaults_processed']} processed, "
-            f"{stats['errors']} errors, {stats['total_time']:.2f}s"
+            "Game tick completed: %s processed, %s errors, %.2fs",
+            stats["vaults_processed"],
+            stats["errors"],
+            stats["total_time"],
         )
+        if stats["vaults_processed"]:
+            self.logger.info(
+                "Phase skip rates: %s",
+                ", ".join(
+                    f"{phase} {count / stats['vaults_processed']:.0%}"
+                    for phase, count in sorted(phases_skipped.items())
+                )
+                or "none skipped",
+            )
 
         return stats
 
     async def process_vault_tick(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
         """Process a single tick for a specific vault.
 
+        Notifications raised by any phase are buffered and inserted with the
+        tick's final commit, then delivered in one batch per user.
+
         Args:
             db_session: Database session
             vault_id: UUID of the vault to process
@@ -83,12 +105,16 @@ class GameLoopService:
         Returns:
             dict: Results of the tick processing
         """
+        async with NotificationService.outbox(db_session) as outbox:
+            return await self._process_vault_tick(db_session, vault_id, outbox)
+
+    async def _process_vault_tick(self, db_session: AsyncSession, vault_id: UUID4, outbox: NotificationOutbox) -> dict:
         # Get or create game state
         game_state = await self._get_or_create_game_state(db_session, vault_id)
 
         # Skip if paused
         if game_state.is_paused:
-            self.logger.debug(f"Vault {vault_id} is paused, skipping tick")
+            self.logger.debug("Vault %s is paused, skipping tick", vault_id)
             return {"status": "paused"}
 
         # Calculate time since last tick
@@ -97,8 +123,10 @@ class GameLoopService:
         # Cap catch-up time to prevent abuse
         if seconds_passed > game_config.game_loop.max_offline_catchup:
             self.logger.warning(
-                f"Vault {vault_id} offline time ({seconds_passed}s) exceeds max catch-up, "
-                f"capping to {game_config.game_loop.max_offline_catchup}s"
+                "Vault %s offline time (%ss) exceeds max catch-up, capping to %ss",
+                vault_id,
+                seconds_passed,
+                game_config.game_loop.max_offline_catchup,
             )
             seconds_passed = game_config.game_loop.max_offline_catchup
 
@@ -131,41 +159,56 @@ class GameLoopService:
             }
 
         except (SQLAlchemyError, ResourceNotFoundException, VaultOperationException) as e:
-            self.logger.error(f"Error updating resources for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Error updating resources for vault %s: %s", vault_id, e, exc_info=True)
             results["updates"]["resources"] = {"error": str(e)}
 
+        # === Tick planning: phases with nothing to work on are skipped ===
+        activity = await load_vault_activity(db_session, vault_id)
+        plan = self._plan_phases(activity, user_online=game_state.is_user_online())
+        results["skipped_phases"] = [phase for phase, run in plan.items() if not run]
+        skipped = {"skipped": True}
+
         # === PHASE 2: Incident Management ===
-        incident_update = await self._process_incidents(db_session, vault_id, seconds_passed, game_state)
-        results["updates"]["incidents"] = incident_update
+        results["updates"]["incidents"] = (
+            await self._process_incidents(db_session, vault_id, seconds_passed, game_state)
+            if plan["incidents"]
+            else skipped
+        )
 
         # === PHASE 3: Wasteland Exploration ===
-        exploration_update = await self._process_explorations(db_session, vault_id)
-        results["updates"]["explorations"] = exploration_update
+        results["updates"]["explorations"] = (
+            await self._process_explorations(db_session, vault_id) if plan["explorations"] else skipped
+        )
 
         # === PHASE 4: Dweller Management ===
         dweller_update = await self._process_dwellers(db_session, vault_id)
         results["updates"]["dwellers"] = dweller_update
 
         # === PHASE 4.5: Training System ===
-        training_update = await self._process_training(db_session, vault_id)
-        results["updates"]["training"] = training_update
+        results["updates"]["training"] = (
+            await self._process_training(db_session, vault_id) if plan["training"] else skipped
+        )
 
         # === PHASE 4.6: Happiness System ===
         happiness_update = await self._process_happiness(db_session, vault_id, seconds_passed)
         results["updates"]["happiness"] = happiness_update
 
         # === PHASE 4.7: Relationships & Breeding System ===
-        breeding_update = await self._process_breeding(db_session, vault_id)
-        results["updates"]["breeding"] = breeding_update
+        results["updates"]["breeding"] = (
+            await self._process_breeding(db_session, vault_id, activity) if plan["breeding"] else skipped
+        )
 
         # === PHASE 5: Event System ===
-        event_update = await self._process_events(db_session, vault_id, seconds_passed, game_state)
-        results["updates"]["events"] = event_update
+        results["updates"]["events"] = (
+            await self._process_events(db_session, vault_id, seconds_passed, game_state) if plan["events"] else skipped
+        )
 
         # Update game state
         game_state.update_tick(seconds_passed)
         db_session.add(game_state)
+        notifications = outbox.stage(db_session)
         await db_session.commit()
+        await NotificationService.deliver(notifications)
 
         try:
             await sse_manager.publish(
@@ -179,10 +222,36 @@ class GameLoopService:
                 },
             )
         except Exception:
-            self.logger.exception(f"Failed to publish SSE tick for vault {vault_id}")
+            self.logger.exception("Failed to publish SSE tick for vault %s", vault_id)
 
         return results
 
+    @staticmethod
+    def _plan_phases(activity: VaultActivity, *, user_online: bool) -> dict[str, bool]:
+        """Decide which optional tick phases have work, from the vault's activity counters.
+
+        Resources, dwellers and happiness always run; the rest only when there is
+        something for them to process (incidents and events can also start while
+        the player is online).
+        """
+        return {
+            "incidents": activity.active_incidents > 0 or user_online,
+            "explorations": activity.due_explorations > 0,
+            "training": activity.due_trainings > 0,
+            "breeding": any(GameLoopService._plan_breeding(activity).values()),
+            "events": user_online and activity.population >= game_config.vault_event.min_vault_population,
+        }
+
+    @staticmethod
+    def _plan_breeding(activity: VaultActivity) -> dict[str, bool]:
+        """Decide which breeding steps have work (see :meth:`_plan_phases`)."""
+        return {
+            "relationships": activity.living_quarters_dwellers >= 2,
+            "conception": activity.cohabiting_partners > 0,
+            "births": activity.pending_pregnancies > 0,
+            "aging": activity.children > 0,
+        }
+
     async def pause_vault(self, db_session: AsyncSession, vault_id: UUID4) -> GameState:
         """Pause game loop for a specific vault."""
         game_state = await self._get_or_create_game_state(db_session, vault_id)
@@ -191,7 +260,7 @@ class GameLoopService:
         await db_session.commit()
         await db_session.refresh(game_state)
 
-        self.logger.info(f"Vault {vault_id} paused")
+        self.logger.info("Vault %s paused", vault_id)
         return game_state
 
     async def resume_vault(self, db_session: AsyncSession, vault_id: UUID4) -> GameState:
@@ -202,7 +271,7 @@ class GameLoopService:
         await db_session.commit()
         await db_session.refresh(game_state)
 
-        self.logger.info(f"Vault {vault_id} resumed")
+        self.logger.info("Vault %s resumed", vault_id)
         return game_state
 
     async def get_vault_status(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
@@ -248,56 +317,61 @@ class GameLoopService:
             db_session.add(game_state)
             await db_session.commit()
             await db_session.refresh(game_state)
-            self.logger.info(f"Created new game state for vault {vault_id}")
+            self.logger.info("Created new game state for vault %s", vault_id)
 
         return game_state
 
     async def _process_explorations(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
-        """Process all active explorations for a vault.
+        """Process the explorations of a vault that have work due.
 
-        - Generate events for explorations that are due
+        Only explorations whose ``next_due_at`` has passed are loaded:
         - Auto-complete explorations that have reached their duration
+        - Generate events for the rest (or schedule their next check)
         """
         stats = {
-            "active_count": 0,
+            "due_count": 0,
             "events_generated": 0,
             "completed": 0,
         }
 
         try:
-            # Get all active explorations for this vault
-            active_explorations = await crud_exploration.get_by_vault(
+            due_explorations = await crud_exploration.get_due_by_vault(
                 db_session,
                 vault_id=vault_id,
-                active_only=True,
+                now=datetime.utcnow(),
             )
 
-            stats["active_count"] = len(active_explorations)
+            stats["due_count"] = len(due_explorations)
 
-            for exploration in active_explorations:
+            in_progress = []
+            for exploration in due_explorations:
+                # Check if exploration should be auto-completed
+                if exploration.time_remaining_seconds() > 0:
+                    in_progress.append(exploration)
+                    continue
                 try:
-                    # Check if exploration should be auto-completed
-                    if exploration.time_remaining_seconds() <= 0:
-                        # Auto-complete the exploration
-                        await exploration_service.complete_exploration(db_session, exploration.id)
-                        stats["completed"] += 1
-                        self.logger.info(
-                            f"Auto-completed exploration {exploration.id} for dweller {exploration.dweller_id}"
-                        )
-                        continue
-
-                    # Try to generate an event
-                    event_generated = exploration_service.generate_event(exploration)
-                    if event_generated:
-                        await exploration_service.process_event(db_session, exploration)
-                        stats["events_generated"] += 1
-
+                    await exploration_service.complete_exploration(db_session, exploration.id)
+                    stats["completed"] += 1
+                    self.logger.info(
+                        "Auto-completed exploration %s for dweller %s", exploration.id, exploration.dweller_id
+                    )
                 except (SQLAlchemyError, ValueError, RuntimeError) as e:
                     # Keep broad exception for individual exploration processing
-                    self.logger.error(f"Error processing exploration {exploration.id}: {e}", exc_info=True)
+                    self.logger.error("Error processing exploration %s: %s", exploration.id, e, exc_info=True)
+
+            # Events for every remaining due exploration are generated and persisted as one batch
+            if in_progress:
+                try:
+                    processed = await exploration_service.process_events(db_session, in_progress)
+                    stats["events_generated"] = len(processed)
+                except (SQLAlchemyError, ValueError, RuntimeError) as e:
+                    self.logger.error(
+                        "Error processing exploration events for vault %s: %s", vault_id, e, exc_info=True
+                    )
+                    await db_session.rollback()
 
         except (SQLAlchemyError, ResourceNotFoundException) as e:
-            self.logger.error(f"Error loading explorations for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Error loading explorations for vault %s: %s", vault_id, e, exc_info=True)
             stats["error"] = str(e)
 
         return stats
@@ -340,7 +414,7 @@ class GameLoopService:
         leveled_up, levels_gained = await leveling_service.check_level_up(db_session, dweller)
         if leveled_up:
             stats["leveled_up"] = levels_gained
-            self.logger.info(f"Dweller {dweller.name} gained {levels_gained} level(s)! Now level {dweller.level}")
+            self.logger.info("Dweller %s gained %s level(s)! Now level %s", dweller.name, levels_gained, dweller.level)
             # Emit DWELLER_LEVEL_UP event for objective tracking
             if dweller.vault_id:
                 await event_bus.emit(
@@ -402,13 +476,15 @@ class GameLoopService:
                     if dweller.health <= 0:
                         await death_service.mark_as_dead(db_session, dweller, DeathCauseEnum.HEALTH)
                         stats["deaths"] += 1
-                        self.logger.info(f"Dweller {dweller.first_name} {dweller.last_name} died from health depletion")
+                        self.logger.info(
+                            "Dweller %s %s died from health depletion", dweller.first_name, dweller.last_name
+                        )
                         continue
 
                     if dweller.radiation >= game_config.death.radiation_death_threshold:
                         await death_service.mark_as_dead(db_session, dweller, DeathCauseEnum.RADIATION)
                         stats["deaths"] += 1
-                        self.logger.info(f"Dweller {dweller.first_name} {dweller.last_name} died from radiation")
+                        self.logger.info("Dweller %s %s died from radiation", dweller.first_name, dweller.last_name)
                         continue
 
                     # Award work XP for dwellers in production rooms
@@ -422,64 +498,53 @@ class GameLoopService:
 
                 except (SQLAlchemyError, ValueError, RuntimeError) as e:
                     # Keep broad exception for individual dweller processing to prevent one failure from stopping all
-                    self.logger.error(f"Error processing dweller {dweller.id}: {e}", exc_info=True)
+                    self.logger.error("Error processing dweller %s: %s", dweller.id, e, exc_info=True)
 
         except SQLAlchemyError as e:
-            self.logger.error(f"Database error processing dwellers for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Database error processing dwellers for vault %s: %s", vault_id, e, exc_info=True)
 
         return stats
 
     async def _process_training(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
-        """Process all active training sessions for a vault.
+        """Complete the training sessions of a vault whose duration has elapsed.
 
-        - Update training progress
-        - Auto-complete trainings that have finished
-        - Track statistics
+        Sessions still running are not loaded or written; their progress is
+        derived from the timestamps when read.
         """
         from app.crud import training as training_crud
         from app.services.training_service import training_service
         from app.utils.exceptions import ResourceConflictException
 
         stats = {
-            "sessions_updated": 0,
+            "due_count": 0,
             "completed": 0,
-            "active_count": 0,
         }
 
         try:
-            # Get all active training sessions in this vault
-            active_trainings = await training_crud.training.get_active_by_vault(db_session, vault_id)
-            stats["active_count"] = len(active_trainings)
+            due_trainings = await training_crud.training.get_due_by_vault(db_session, vault_id, datetime.utcnow())
+            stats["due_count"] = len(due_trainings)
 
             # Batch-fetch all dwellers for these training sessions (N+1 optimization)
-            dwellers_map = await training_crud.training.get_dwellers_for_trainings(db_session, active_trainings)
+            dwellers_map = await training_crud.training.get_dwellers_for_trainings(db_session, due_trainings)
 
-            for training in active_trainings:
+            for training in due_trainings:
                 try:
-                    # Get pre-fetched dweller
-                    dweller = dwellers_map.get(training.dweller_id)
-
-                    # Update progress (this will auto-complete if ready)
-                    updated_training = await training_service.update_training_progress(
-                        db_session, training, dweller=dweller
+                    completed = await training_service.complete_training(
+                        db_session, training.id, dweller=dwellers_map.get(training.dweller_id)
+                    )
+                    stats["completed"] += 1
+                    self.logger.info(
+                        "Training completed: Dweller gained %s (now %s)",
+                        completed.stat_being_trained.value,
+                        completed.target_stat_value,
                     )
 
-                    stats["sessions_updated"] += 1
-
-                    # Check if it was completed
-                    if updated_training.is_completed():
-                        stats["completed"] += 1
-                        self.logger.info(
-                            f"Training completed: Dweller gained {updated_training.stat_being_trained.value} "
-                            f"(now {updated_training.target_stat_value})"
-                        )
-
-                except (SQLAlchemyError, ValueError, RuntimeError) as e:
+                except (SQLAlchemyError, ValueError, RuntimeError, VaultOperationException) as e:
                     # Keep broad exception for individual training processing
-                    self.logger.error(f"Error processing training {training.id}: {e}", exc_info=True)
+                    self.logger.error("Error processing training %s: %s", training.id, e, exc_info=True)
 
         except (SQLAlchemyError, ResourceNotFoundException, ResourceConflictException, VaultOperationException) as e:
-            self.logger.error(f"Error loading training sessions for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Error loading training sessions for vault %s: %s", vault_id, e, exc_info=True)
             stats["error"] = str(e)
 
         return stats
@@ -530,7 +595,7 @@ class GameLoopService:
                 new_incident = await incident_service.spawn_incident(db_session, vault_id)
                 if new_incident:
                     stats["spawned"] = 1
-                    self.logger.info(f"Spawned new incident {new_incident.type} in vault {vault_id}")
+                    self.logger.info("Spawned new incident %s in vault %s", new_incident.type, vault_id)
 
             # Track total caps earned from all incidents
             total_caps_earned = 0
@@ -556,11 +621,11 @@ class GameLoopService:
                     await db_session.refresh(incident)
                     if incident.status.value in ["resolved", "failed"]:
                         stats["resolved"] += 1
-                        self.logger.info(f"Incident {incident.id} auto-resolved with status {incident.status}")
+                        self.logger.info("Incident %s auto-resolved with status %s", incident.id, incident.status)
 
                 except (SQLAlchemyError, ValueError, RuntimeError) as e:
                     # Keep broad exception for individual incident processing
-                    self.logger.error(f"Error processing incident {incident.id}: {e}", exc_info=True)
+                    self.logger.error("Error processing incident %s: %s", incident.id, e, exc_info=True)
 
             # Batch update vault caps and emit event for objectives
             if total_caps_earned > 0:
@@ -568,10 +633,10 @@ class GameLoopService:
                 if vault:
                     await vault_crud.deposit_caps(db_session=db_session, vault_obj=vault, amount=total_caps_earned)
                     stats["caps_earned"] = total_caps_earned
-                    self.logger.info(f"Awarded {total_caps_earned} caps to vault {vault_id} from incidents")
+                    self.logger.info("Awarded %s caps to vault %s from incidents", total_caps_earned, vault_id)
 
         except (SQLAlchemyError, ResourceNotFoundException) as e:
-            self.logger.error(f"Error managing incidents for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Error managing incidents for vault %s: %s", vault_id, e, exc_info=True)
             stats["error"] = str(e)
 
         return stats
@@ -594,8 +659,8 @@ class GameLoopService:
             return stats
 
         # Minimum population gate
-        dwellers_result = await db_session.execute(select(Dweller).where(Dweller.vault_id == vault_id))
-        if len(dwellers_result.scalars().all()) < game_config.vault_event.min_vault_population:
+        population = await db_session.scalar(select(func.count(Dweller.id)).where(Dweller.vault_id == vault_id))
+        if population < game_config.vault_event.min_vault_population:
             return stats
 
         # Time-based spawn chance (capped like incidents)
@@ -645,7 +710,7 @@ class GameLoopService:
         )
         stats["triggered"] = 1
         stats["events"].append({"type": event_type, "caps": caps})
-        self.logger.info(f"Vault event {event_type} triggered in vault {vault_id}")
+        self.logger.info("Vault event %s triggered in vault %s", event_type, vault_id)
         return stats
 
     async def _fetch_existing_relationships(
@@ -683,85 +748,39 @@ class GameLoopService:
         """Give a small bonus when both dwellers are highly charismatic."""
         return game_config.relationship.affinity_increase_per_tick + min(dweller1.charisma, dweller2.charisma) // 10
 
-    async def _update_pair_affinity(
+    def _collect_pair_gains(
         self,
-        db_session: AsyncSession,
-        dweller1: Dweller,
-        dweller2: Dweller,
+        room_dwellers: dict,
         relationships_map: dict[tuple[UUID4, UUID4], Relationship],
-        new_relationships: list[tuple[Relationship, int]],
-    ) -> int:
-        """Update affinity for a pair of dwellers, creating relationship if needed.
+    ) -> list[tuple[Relationship, int]]:
+        """Pair up roommates and compute each pair's affinity gain for this tick.
 
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param dweller1: First dweller in the pair
-        :param dweller2: Second dweller in the pair
+        Pairs without a relationship get a new, not yet persisted ACQUAINTANCE
+        relationship, which is added to ``relationships_map``.
+
+        :param room_dwellers: Dwellers grouped by room ID
         :param relationships_map: Lookup map for existing relationships
-        :param new_relationships: List to append new relationships to
-        :returns: Count of relationships updated (0 or 1)
-        :rtype: int
+        :returns: ``(relationship, affinity_gain)`` pairs, one per roommate pair
+        :rtype: list[tuple[Relationship, int]]
         """
         from app.schemas.common import RelationshipTypeEnum
-        from app.services.relationship_service import relationship_service
-
-        key = (dweller1.id, dweller2.id)
-        relationship = relationships_map.get(key)
-
-        if not relationship:
-            # Create new relationship
-            relationship = Relationship(
-                dweller_1_id=dweller1.id,
-                dweller_2_id=dweller2.id,
-                relationship_type=RelationshipTypeEnum.ACQUAINTANCE,
-                affinity=0,
-            )
-            new_relationships.append((relationship, self._affinity_gain(dweller1, dweller2)))
-            relationships_map[key] = relationship
-            relationships_map[(dweller2.id, dweller1.id)] = relationship
-            return 0  # New relationships updated later after commit
-
-        # Only update affinity for existing (persistent) relationships
-        if not any(new_relationship is relationship for new_relationship, _ in new_relationships):
-            await relationship_service.increase_affinity(
-                db_session,
-                relationship.dweller_1_id,
-                relationship.dweller_2_id,
-                self._affinity_gain(dweller1, dweller2),
-            )
-            return 1
-        return 0
-
-    async def _create_new_relationships(
-        self, db_session: AsyncSession, new_relationships: list[tuple[Relationship, int]]
-    ) -> int:
-        """Bulk create new relationships and update their affinity.
-
-        :param db_session: Database session
-        :type db_session: AsyncSession
-        :param new_relationships: List of new relationships to persist
-        :returns: Count of relationships created and updated
-        :rtype: int
-        """
-        from app.services.relationship_service import relationship_service
-
-        if not new_relationships:
-            return 0
-
-        db_session.add_all([relationship for relationship, _ in new_relationships])
-        await db_session.commit()
 
-        # Update affinity for newly created relationships
-        count = 0
-        for relationship, affinity_gain in new_relationships:
-            await relationship_service.increase_affinity(
-                db_session,
-                relationship.dweller_1_id,
-                relationship.dweller_2_id,
-                affinity_gain,
-            )
-            count += 1
-        return count
+        gains: list[tuple[Relationship, int]] = []
+        for room_dweller_list in room_dwellers.values():
+            for i, dweller1 in enumerate(room_dweller_list):
+                for dweller2 in room_dweller_list[i + 1 :]:
+                    relationship = relationships_map.get((dweller1.id, dweller2.id))
+                    if relationship is None:
+                        relationship = Relationship(
+                            dweller_1_id=dweller1.id,
+                            dweller_2_id=dweller2.id,
+                            relationship_type=RelationshipTypeEnum.ACQUAINTANCE,
+                            affinity=0,
+                        )
+                        relationships_map[(dweller1.id, dweller2.id)] = relationship
+                        relationships_map[(dweller2.id, dweller1.id)] = relationship
+                    gains.append((relationship, self._affinity_gain(dweller1, dweller2)))
+        return gains
 
     async def _update_room_relationships(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
         """Update relationship affinity for dwellers sharing living quarters.
@@ -774,6 +793,7 @@ class GameLoopService:
         :rtype: dict
         """
         from app.models.room import Room
+        from app.services.relationship_service import relationship_service
 
         stats = {"relationships_updated": 0}
 
@@ -801,35 +821,32 @@ class GameLoopService:
             existing_relationships = await self._fetch_existing_relationships(db_session, all_dweller_ids)
 
             relationships_map = self._build_relationships_map(existing_relationships)
+            gains = self._collect_pair_gains(room_dwellers, relationships_map)
+            if not gains:
+                return stats
 
-            new_relationships: list[tuple[Relationship, int]] = []
-            for room_dweller_list in room_dwellers.values():
-                if len(room_dweller_list) < 2:
-                    continue
-
-                for i, dweller1 in enumerate(room_dweller_list):
-                    for dweller2 in room_dweller_list[i + 1 :]:
-                        updated = await self._update_pair_affinity(
-                            db_session, dweller1, dweller2, relationships_map, new_relationships
-                        )
-                        stats["relationships_updated"] += updated
-
-            # Bulk add new relationships and commit
-            stats["relationships_updated"] += await self._create_new_relationships(db_session, new_relationships)
+            # Stages are computed in memory and written back in one upsert
+            stats["relationships_updated"] = await relationship_service.apply_affinity_gains(
+                db_session, gains, {d.id: d for d in dwellers}
+            )
 
         except SQLAlchemyError as e:
-            self.logger.error(f"Database error updating relationships for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Database error updating relationships for vault %s: %s", vault_id, e, exc_info=True)
         except ValueError as e:
-            self.logger.error(f"Validation error updating relationships for vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Validation error updating relationships for vault %s: %s", vault_id, e, exc_info=True)
 
         return stats
 
-    async def _process_pregnancies_and_births(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
+    async def _process_pregnancies_and_births(
+        self, db_session: AsyncSession, vault_id: UUID4, *, conception: bool = True, births: bool = True
+    ) -> dict:
         """Check for conception and process due pregnancies.
 
         Args:
             db_session: Database session
             vault_id: Vault ID to process
+            conception: Whether to roll for new conceptions
+            births: Whether to deliver due pregnancies
 
         Returns:
             dict: Statistics with 'conceptions' and 'births' counts
@@ -839,29 +856,33 @@ class GameLoopService:
         stats = {"conceptions": 0, "births": 0}
 
         # Check for conception
-        try:
-            new_pregnancies = await breeding_service.check_for_conception(db_session, vault_id)
-            stats["conceptions"] = len(new_pregnancies)
-            if new_pregnancies:
-                self.logger.info(f"New pregnancies in vault {vault_id}: {len(new_pregnancies)}")
-        except SQLAlchemyError as e:
-            self.logger.error(f"Database error checking for conception in vault {vault_id}: {e}", exc_info=True)
-        except ValueError as e:
-            self.logger.error(f"Validation error checking for conception in vault {vault_id}: {e}", exc_info=True)
+        if conception:
+            try:
+                new_pregnancies = await breeding_service.check_for_conception(db_session, vault_id)
+                stats["conceptions"] = len(new_pregnancies)
+                if new_pregnancies:
+                    self.logger.info("New pregnancies in vault %s: %s", vault_id, len(new_pregnancies))
+            except SQLAlchemyError as e:
+                self.logger.error("Database error checking for conception in vault %s: %s", vault_id, e, exc_info=True)
+            except ValueError as e:
+                self.logger.error(
+                    "Validation error checking for conception in vault %s: %s", vault_id, e, exc_info=True
+                )
 
         # Check for due pregnancies and deliver babies
-        try:
-            due_pregnancies = await breeding_service.check_due_pregnancies(db_session, vault_id)
-            for pregnancy in due_pregnancies:
-                try:
-                    baby = await breeding_service.deliver_baby(db_session, pregnancy.id)
-                    if baby:
-                        stats["births"] += 1
-                        self.logger.info(f"Baby born in vault {vault_id}: {baby.first_name} {baby.last_name}")
-                except (SQLAlchemyError, ValueError) as e:
-                    self.logger.error(f"Error delivering baby for pregnancy {pregnancy.id}: {e}", exc_info=True)
-        except SQLAlchemyError as e:
-            self.logger.error(f"Database error checking due pregnancies in vault {vault_id}: {e}", exc_info=True)
+        if births:
+            try:
+                due_pregnancies = await breeding_service.check_due_pregnancies(db_session, vault_id)
+                for pregnancy in due_pregnancies:
+                    try:
+                        baby = await breeding_service.deliver_baby(db_session, pregnancy.id)
+                        if baby:
+                            stats["births"] += 1
+                            self.logger.info("Baby born in vault %s: %s %s", vault_id, baby.first_name, baby.last_name)
+                    except (SQLAlchemyError, ValueError) as e:
+                        self.logger.error("Error delivering baby for pregnancy %s: %s", pregnancy.id, e, exc_info=True)
+            except SQLAlchemyError as e:
+                self.logger.error("Database error checking due pregnancies in vault %s: %s", vault_id, e, exc_info=True)
 
         return stats
 
@@ -883,30 +904,50 @@ class GameLoopService:
             aged_children = await breeding_service.age_children(db_session, vault_id)
             stats["children_aged"] = len(aged_children)
             if aged_children:
-                self.logger.info(f"Children aged to adults in vault {vault_id}: {len(aged_children)}")
+                self.logger.info("Children aged to adults in vault %s: %s", vault_id, len(aged_children))
         except SQLAlchemyError as e:
-            self.logger.error(f"Database error aging children in vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Database error aging children in vault %s: %s", vault_id, e, exc_info=True)
         except ValueError as e:
-            self.logger.error(f"Validation error aging children in vault {vault_id}: {e}", exc_info=True)
+            self.logger.error("Validation error aging children in vault %s: %s", vault_id, e, exc_info=True)
 
         return stats
 
-    async def _process_breeding(self, db_session: AsyncSession, vault_id: UUID4) -> dict:
+    async def _process_breeding(
+        self, db_session: AsyncSession, vault_id: UUID4, activity: VaultActivity | None = None
+    ) -> dict:
         """Process relationships and breeding for a vault.
 
         - Update relationship affinity for dwellers in the same room
         - Check for conception in living quarters
         - Process due pregnancies and deliver babies
         - Age children to adults
+
+        With the tick's ``activity`` snapshot, steps with nothing to process are skipped.
         """
+        plan = (
+            self._plan_breeding(activity)
+            if activity
+            else dict.fromkeys(("relationships", "conception", "births", "aging"), True)
+        )
+
         # Update relationship affinity
-        relationship_stats = await self._update_room_relationships(db_session, vault_id)
+        relationship_stats = (
+            await self._update_room_relationships(db_session, vault_id)
+            if plan["relationships"]
+            else {"relationships_updated": 0}
+        )
 
         # Process pregnancies and births
-        pregnancy_stats = await self._process_pregnancies_and_births(db_session, vault_id)
+        pregnancy_stats = (
+            await self._process_pregnancies_and_births(
+                db_session, vault_id, conception=plan["conception"], births=plan["births"]
+            )
+            if plan["conception"] or plan["births"]
+            else {"conceptions": 0, "births": 0}
+        )
 
         # Age children
-        aging_stats = await self._age_children(db_session, vault_id)
+        aging_stats = await self._age_children(db_session, vault_id) if plan["aging"] else {"children_aged": 0}
 
         # Combine stats
         return {
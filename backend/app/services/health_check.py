@@ -7,7 +7,6 @@ from enum import StrEnum
 
 import aiosmtplib
 import httpx
-from botocore.exceptions import BotoCoreError, ClientError
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 from sqlalchemy import text
@@ -102,6 +101,32 @@ class HealthCheckService:
             if redis_client:
                 await redis_client.close()
 
+    @staticmethod
+    def check_password_hasher() -> HealthCheckResult:
+        """Report load on the bcrypt thread pool; a growing queue means logins are waiting on CPU."""
+        from app.core.security import password_hasher
+
+        details = {
+            "workers": password_hasher.max_workers,
+            "in_flight": password_hasher.in_flight,
+            "queue_depth": password_hasher.queue_depth,
+            "peak_queue_depth": password_hasher.peak_queue_depth,
+            "bcrypt_rounds": settings.PASSWORD_BCRYPT_ROUNDS,
+        }
+        if password_hasher.queue_depth > 2 * password_hasher.max_workers:
+            return HealthCheckResult(
+                service="password_hasher",
+                status=ServiceStatus.DEGRADED,
+                message="Password hashing backlog is growing",
+                details=details,
+            )
+        return HealthCheckResult(
+            service="password_hasher",
+            status=ServiceStatus.HEALTHY,
+            message="Password hashing pool keeping up",
+            details=details,
+        )
+
     @staticmethod
     def check_dramatiq() -> HealthCheckResult:
         """Check Dramatiq broker and registered actors."""
@@ -158,45 +183,52 @@ class HealthCheckService:
         scheme = "https" if use_https else "http"
         endpoint_url = f"{scheme}://{hostname}:{port}" if port else f"{scheme}://{hostname}"
 
+        # boto3 is imported here rather than at module level so API startup does not pay for it
         try:
             import boto3
             from botocore.config import Config
+            from botocore.exceptions import BotoCoreError, ClientError
+        except ImportError as e:
+            error: Exception = e
+        else:
+            try:
+                client = boto3.client(
+                    "s3",
+                    endpoint_url=endpoint_url,
+                    aws_access_key_id=settings.RUSTFS_ACCESS_KEY,
+                    aws_secret_access_key=settings.RUSTFS_SECRET_KEY,
+                    region_name="us-east-1",
+                    config=Config(
+                        connect_timeout=2,
+                        read_timeout=3,
+                        retries={"total_max_attempts": 1, "mode": "standard"},
+                        signature_version="s3v4",
+                    ),
+                )
 
-            client = boto3.client(
-                "s3",
-                endpoint_url=endpoint_url,
-                aws_access_key_id=settings.RUSTFS_ACCESS_KEY,
-                aws_secret_access_key=settings.RUSTFS_SECRET_KEY,
-                region_name="us-east-1",
-                config=Config(
-                    connect_timeout=2,
-                    read_timeout=3,
-                    retries={"total_max_attempts": 1, "mode": "standard"},
-                    signature_version="s3v4",
-                ),
-            )
+                # Test connection by listing buckets
+                response = client.list_buckets()
+                bucket_names = [bucket["Name"] for bucket in response.get("Buckets", [])]
 
-            # Test connection by listing buckets
-            response = client.list_buckets()
-            bucket_names = [bucket["Name"] for bucket in response.get("Buckets", [])]
+                return HealthCheckResult(
+                    service="rustfs",
+                    status=ServiceStatus.HEALTHY,
+                    message="RustFS connection successful",
+                    details={
+                        "endpoint": endpoint_url,
+                        "buckets": bucket_names,
+                    },
+                )
+            except (BotoCoreError, ClientError, OSError, ValueError) as e:
+                error = e
 
-            return HealthCheckResult(
-                service="rustfs",
-                status=ServiceStatus.HEALTHY,
-                message="RustFS connection successful",
-                details={
-                    "endpoint": endpoint_url,
-                    "buckets": bucket_names,
-                },
-            )
-        except (BotoCoreError, ClientError, OSError, ValueError, ImportError) as e:
-            logger.warning("RustFS health check failed (non-critical): %s", e)
-            return HealthCheckResult(
-                service="rustfs",
-                status=ServiceStatus.DEGRADED,
-                message=f"RustFS connection failed (optional service): {e!s}",
-                details={"endpoint": endpoint_url, "error": str(e)},
-            )
+        logger.warning("RustFS health check failed (non-critical): %s", error)
+        return HealthCheckResult(
+            service="rustfs",
+            status=ServiceStatus.DEGRADED,
+            message=f"RustFS connection failed (optional service): {error!s}",
+            details={"endpoint": endpoint_url, "error": str(error)},
+        )
 
     @staticmethod
     async def check_ollama() -> HealthCheckResult:
@@ -383,6 +415,8 @@ class HealthCheckService:
             smtp_result = await self.check_smtp()
             results["smtp"] = smtp_result
 
+        results["password_hasher"] = self.check_password_hasher()
+
         # Check Dramatiq (optional)
         if include_dramatiq:
             dramatiq_result = self.check_dramatiq()
@@ -4,18 +4,22 @@ import logging
 from collections.abc import Mapping, Sequence
 
 from pydantic import UUID4
-from sqlalchemy import or_
+from sqlalchemy import ColumnElement, Subquery, func, literal, or_
+from sqlalchemy.orm import aliased
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.crud import dweller as dweller_crud
 from app.models.dweller import Dweller
 from app.models.relationship import Relationship
 from app.schemas.common import PARTNER_LINKED_STAGES, RelationshipTypeEnum
-from app.schemas.dweller import LineageMember, LineageResponse
+from app.schemas.dweller import FamilyTreeMember, FamilyTreeResponse, LineageMember, LineageResponse
+from app.utils.exceptions import ResourceNotFoundException
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on ancestry walks; far beyond any real family, it only stops malformed parent cycles early
+_MAX_DEPTH = 64
+
 
 class LineageService:
     """Computes family relationships (parents, children, siblings, partners) and generation depth."""
@@ -52,147 +56,108 @@ class LineageService:
         ]
 
     @staticmethod
-    async def _find_children(db_session: AsyncSession, dweller_id: UUID4, vault_id: UUID4) -> list[Dweller]:
-        """Find dwellers in the same vault whose parent is this dweller."""
-        query = (
-            select(Dweller)
-            .where(Dweller.vault_id == vault_id)
-            .where(~Dweller.is_deleted)
-            .where(or_(Dweller.parent_1_id == dweller_id, Dweller.parent_2_id == dweller_id))
-        )
-        result = await db_session.execute(query)
-        return list(result.scalars().all())
+    def _ancestor_depths(vault_id: UUID4, *roots: ColumnElement[bool]) -> Subquery:
+        """Build ``(root_id, ancestor_id, depth)`` for every live, same-vault ancestor of the matched dwellers.
 
-    @staticmethod
-    async def _find_siblings(
-        db_session: AsyncSession,
-        dweller: Dweller,
-        parents: list[Dweller],
-        vault_id: UUID4,
-    ) -> list[Dweller]:
-        """Find other children of the same parents in the same vault."""
-        parent_ids = [p.id for p in parents]
-        if not parent_ids:
-            return []
-        query = (
-            select(Dweller)
-            .where(Dweller.vault_id == vault_id)
-            .where(~Dweller.is_deleted)
-            .where(Dweller.id != dweller.id)
-            .where(
-                or_(
-                    Dweller.parent_1_id.in_(parent_ids),
-                    Dweller.parent_2_id.in_(parent_ids),
-                )
-            )
+        One recursive CTE walks ``parent_1_id``/``parent_2_id`` upward; each root is
+        its own ancestor at depth 0. ``depth`` is the shortest distance, so a parent
+        cycle never adds levels, and the walk stops at ``_MAX_DEPTH`` as a backstop.
+        """
+        anchor = select(
+            Dweller.id.label("root_id"),
+            Dweller.id.label("ancestor_id"),
+            Dweller.parent_1_id,
+            Dweller.parent_2_id,
+            literal(0).label("depth"),
+        ).where(*roots)
+        walk = anchor.cte("ancestry", recursive=True)
+        parent = aliased(Dweller)
+        walk = walk.union(
+            select(walk.c.root_id, parent.id, parent.parent_1_id, parent.parent_2_id, walk.c.depth + 1)
+            .join(walk, or_(parent.id == walk.c.parent_1_id, parent.id == walk.c.parent_2_id))
+            .where(parent.vault_id == vault_id)
+            .where(~parent.is_deleted)
+            .where(walk.c.depth < _MAX_DEPTH)
+        )
+        return (
+            select(walk.c.root_id, walk.c.ancestor_id, func.min(walk.c.depth).label("depth"))
+            .group_by(walk.c.root_id, walk.c.ancestor_id)
+            .subquery("ancestor_depths")
         )
-        result = await db_session.execute(query)
-        return list(result.scalars().all())
 
     @staticmethod
-    async def _find_partners(
-        db_session: AsyncSession, dweller_id: UUID4, vault_id: UUID4
-    ) -> tuple[list[Dweller], dict[UUID4, tuple[RelationshipTypeEnum, int]]]:
-        """Find the dweller's partner(s): reciprocal partner_id plus MARRIED/PARTNER relationships.
-
-        Returns:
-            Tuple of partner dwellers and a mapping of partner_id to (relationship_type, affinity).
-        """
-        partner_ids = set()
-        context: dict[UUID4, tuple[RelationshipTypeEnum, int]] = {}
-
-        dweller = await dweller_crud.get(db_session, dweller_id)
-        if dweller and dweller.partner_id:
-            partner_ids.add(dweller.partner_id)
-
+    async def _partner_context(
+        db_session: AsyncSession, dweller_id: UUID4
+    ) -> dict[UUID4, tuple[RelationshipTypeEnum, int]]:
+        """Map the dweller's MARRIED/PARTNER counterparts to (relationship_type, affinity)."""
         query = (
-            select(Dweller)
-            .where(Dweller.vault_id == vault_id)
-            .where(~Dweller.is_deleted)
-            .where(Dweller.partner_id == dweller_id)
-        )
-        result = await db_session.execute(query)
-        partner_ids.update(partner.id for partner in result.scalars().all())
-
-        rel_query = (
             select(Relationship)
             .where(Relationship.relationship_type.in_(PARTNER_LINKED_STAGES))
             .where((Relationship.dweller_1_id == dweller_id) | (Relationship.dweller_2_id == dweller_id))
         )
-        result = await db_session.execute(rel_query)
+        result = await db_session.execute(query)
+        context: dict[UUID4, tuple[RelationshipTypeEnum, int]] = {}
         for relationship in result.scalars().all():
             other_id = (
                 relationship.dweller_2_id if relationship.dweller_1_id == dweller_id else relationship.dweller_1_id
             )
-            partner_ids.add(other_id)
             context[other_id] = (relationship.relationship_type, relationship.affinity)
-
-        partners: list[Dweller] = []
-        for partner_id in partner_ids:
-            partner = await dweller_crud.get(db_session, partner_id)
-            if partner and partner.vault_id == vault_id:
-                partners.append(partner)
-        return partners, context
-
-    @staticmethod
-    async def _compute_generation(db_session: AsyncSession, dweller_id: UUID4, vault_id: UUID4) -> int:
-        """Walk parents upward to compute the generation number (0 for orphans).
-
-        Only live, same-vault parents are followed, and a candidate is validated
-        before being added to the next frontier so cross-vault links, soft-deleted
-        dwellers, and cycles never add phantom generation levels.
-        """
-        generation = 0
-        seen: set[UUID4] = set()
-        frontier = [dweller_id]
-
-        while frontier:
-            next_frontier: list[UUID4] = []
-            for current_id in frontier:
-                if current_id in seen:
-                    continue
-                seen.add(current_id)
-                # include_deleted so a deleted ancestor is filtered here (vault+is_deleted), not raised as not-found
-                parent = await dweller_crud.get(db_session, current_id, include_deleted=True)
-                if not parent or parent.vault_id != vault_id or parent.is_deleted:
-                    continue
-                for candidate_id in (parent.parent_1_id, parent.parent_2_id):
-                    if candidate_id is None or candidate_id in seen:
-                        continue
-                    candidate = await dweller_crud.get(db_session, candidate_id, include_deleted=True)
-                    if candidate and candidate.vault_id == vault_id and not candidate.is_deleted:
-                        next_frontier.append(candidate_id)
-            if next_frontier:
-                generation += 1
-            frontier = next_frontier
-
-        return generation
+        return context
 
     @classmethod
     async def get_lineage(cls, db_session: AsyncSession, dweller_id: UUID4) -> LineageResponse:
         """Compute the full lineage for a dweller.
 
+        Four queries regardless of family depth: the dweller, its ancestry (one
+        recursive CTE), its partner relationships, and every live same-vault
+        relative (parents, children, siblings, partners) in one pass.
+
         Raises:
             ResourceNotFoundException: If the dweller does not exist.
         """
-        dweller = await dweller_crud.get(db_session, dweller_id)
+        dweller = await db_session.scalar(select(Dweller).where(Dweller.id == dweller_id).where(~Dweller.is_deleted))
         if not dweller:
-            from app.utils.exceptions import ResourceNotFoundException
+            raise ResourceNotFoundException(Dweller, identifier=dweller_id)
+        vault_id = dweller.vault_id
 
-            raise ResourceNotFoundException(detail="Dweller not found")
+        depths = cls._ancestor_depths(vault_id, Dweller.id == dweller_id)
+        ancestors = dict((await db_session.execute(select(depths.c.ancestor_id, depths.c.depth))).tuples().all())
+        generation = max(ancestors.values(), default=0)
+        parent_ids = {p for p in (dweller.parent_1_id, dweller.parent_2_id) if p in ancestors and p != dweller_id}
 
-        generation = await cls._compute_generation(db_session, dweller_id, dweller.vault_id)
-
-        parent_ids = [p for p in (dweller.parent_1_id, dweller.parent_2_id) if p is not None]
-        parents: list[Dweller] = []
-        for parent_id in parent_ids:
-            parent = await dweller_crud.get(db_session, parent_id, include_deleted=True)
-            if parent and parent.vault_id == dweller.vault_id and not parent.is_deleted:
-                parents.append(parent)
+        partner_context = await cls._partner_context(db_session, dweller_id)
+        partner_ids = set(partner_context)
+        if dweller.partner_id:
+            partner_ids.add(dweller.partner_id)
 
-        children = await cls._find_children(db_session, dweller_id, dweller.vault_id)
-        siblings = await cls._find_siblings(db_session, dweller, parents, dweller.vault_id)
-        partners, partner_context = await cls._find_partners(db_session, dweller_id, dweller.vault_id)
+        query = (
+            select(Dweller)
+            .where(Dweller.vault_id == vault_id)
+            .where(~Dweller.is_deleted)
+            .where(Dweller.id != dweller_id)
+            .where(
+                or_(
+                    Dweller.id.in_(parent_ids | partner_ids),
+                    Dweller.parent_1_id == dweller_id,
+                    Dweller.parent_2_id == dweller_id,
+                    Dweller.partner_id == dweller_id,
+                    Dweller.parent_1_id.in_(parent_ids),
+                    Dweller.parent_2_id.in_(parent_ids),
+                )
+            )
+        )
+        relatives = (await db_session.execute(query)).scalars().all()
+
+        parents, children, siblings, partners = [], [], [], []
+        for relative in relatives:
+            if relative.id in parent_ids:
+                parents.append(relative)
+            if dweller_id in (relative.parent_1_id, relative.parent_2_id):
+                children.append(relative)
+            if parent_ids.intersection((relative.parent_1_id, relative.parent_2_id)):
+                siblings.append(relative)
+            if relative.id in partner_ids or relative.partner_id == dweller_id:
+                partners.append(relative)
 
         return LineageResponse(
             dweller_id=dweller_id,
@@ -203,5 +168,48 @@ class LineageService:
             partners=cls._to_members(partners, generation, partner_context),
         )
 
+    @classmethod
+    async def get_family_tree(cls, db_session: AsyncSession, vault_id: UUID4) -> FamilyTreeResponse:
+        """Return every live dweller of a vault with its generation and family links, in one query.
+
+        Links to dwellers outside the tree (soft-deleted or from another vault) are
+        reported as ``None``, so every id in the response resolves to a member.
+        """
+        depths = cls._ancestor_depths(vault_id, Dweller.vault_id == vault_id, ~Dweller.is_deleted)
+        generations = (
+            select(depths.c.root_id, func.max(depths.c.depth).label("generation"))
+            .group_by(depths.c.root_id)
+            .subquery("generations")
+        )
+        query = (
+            select(Dweller, generations.c.generation)
+            .join(generations, Dweller.id == generations.c.root_id)
+            .order_by(generations.c.generation, Dweller.first_name, Dweller.id)
+        )
+        rows = (await db_session.execute(query)).tuples().all()
+
+        member_ids = {dweller.id for dweller, _ in rows}
+
+        def _link(target: UUID4 | None) -> UUID4 | None:
+            return target if target in member_ids else None
+
+        return FamilyTreeResponse(
+            vault_id=vault_id,
+            members=[
+                FamilyTreeMember(
+                    id=dweller.id,
+                    first_name=dweller.first_name,
+                    last_name=dweller.last_name,
+                    generation=generation,
+                    is_dead=dweller.is_dead,
+                    age_group=dweller.age_group,
+                    parent_1_id=_link(dweller.parent_1_id),
+                    parent_2_id=_link(dweller.parent_2_id),
+                    partner_id=_link(dweller.partner_id),
+                )
+                for dweller, generation in rows
+            ],
+        )
+
 
 lineage_service = LineageService()
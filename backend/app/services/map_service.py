@@ -3,24 +3,30 @@
 All ``register_*`` methods are best-effort — failures are logged at
 ``logger.exception`` level and NEVER raised to the caller.  This is
 load-bearing because bio generation must not fail on map bookkeeping.
+
+Built maps are cached per vault under ``Vault.map_version``.  Every write that
+changes the payload (new location, new dweller link, unlock, discovery route
+point) bumps that counter in the same transaction, so a repeat open is a dict
+lookup against the vault row the request has already loaded.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol
 
 from pydantic import UUID4  # ruff: ignore[typing-only-third-party-import]
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
 
 from app.core.game_config import game_config
+from app.crud.exploration_event import exploration_event as exploration_event_crud
 from app.crud.wasteland_location import wasteland_location as wl_crud
-from app.models.exploration import Exploration
 from app.models.notification import NotificationPriority, NotificationType
 from app.models.vault import Vault
 from app.models.wasteland_location import (
+    DwellerLocation,
     DwellerLocationRelationEnum,
     LocationTypeEnum,
     WastelandLocation,
@@ -35,9 +41,18 @@ from app.schemas.wasteland_location import (
     WastelandLocationWithDwellers,
 )
 from app.services.notification_service import notification_service
-from app.utils.places import GENERIC_ORIGIN_SKIP, WORLD_SCALE, normalize_place_name, seeded_vault_specs
+from app.utils.places import (
+    GENERIC_ORIGIN_SKIP,
+    WORLD_SCALE,
+    collision_nudge,
+    normalize_place_name,
+    schematic_coords,
+    seeded_vault_specs,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.dweller import Dweller
@@ -62,9 +77,39 @@ class _MapDwellerSnapshot:
     rarity: RarityEnum
 
 
+_CACHED_MAPS_MAX = 512
+
+
+class _VaultMapCache:
+    """Per-process LRU of built maps keyed by ``(vault_id, unlocked_only)``."""
+
+    def __init__(self, max_entries: int = _CACHED_MAPS_MAX):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[UUID4, bool], tuple[int, VaultMapResponse]] = OrderedDict()
+
+    def get(self, vault_id: UUID4, unlocked_only: bool, version: int) -> VaultMapResponse | None:
+        cached = self._entries.get((vault_id, unlocked_only))
+        if cached is None or cached[0] != version:
+            return None
+        self._entries.move_to_end((vault_id, unlocked_only))
+        return cached[1]
+
+    def put(self, vault_id: UUID4, unlocked_only: bool, version: int, response: VaultMapResponse) -> None:
+        self._entries[(vault_id, unlocked_only)] = (version, response)
+        self._entries.move_to_end((vault_id, unlocked_only))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class MapService:
     """Service layer for world-map bookkeeping."""
 
+    def __init__(self) -> None:
+        self._cache = _VaultMapCache()
+
     # ------------------------------------------------------------------
     # best-effort helpers
     # ------------------------------------------------------------------
@@ -231,6 +276,68 @@ class MapService:
             await wl_crud.link_dweller(db_session, dweller.id, loc.id, DwellerLocationRelationEnum.VISITED)
             visited += 1
 
+    def plan_bio_places(
+        self,
+        vault_id: UUID4,
+        entries: Iterable[tuple[_MapDwellerLike, str, list[str]]],
+        existing: Iterable[WastelandLocation] = (),
+    ) -> tuple[list[WastelandLocation], list[DwellerLocation]]:
+        """In-memory ``register_bio_places`` for many dwellers of one vault.
+
+        Each entry is ``(dweller, effective_origin, visited_places)``. The same
+        skip-list, rarity cap, origin de-dupe and coordinate nudging apply, with
+        *existing* standing in for the rows ``get_or_create`` would find. Returns
+        only the locations that still need inserting plus every link, so bulk
+        provisioning can write them with one INSERT per table.
+        """
+        by_name = {location.normalized_name: location for location in existing}
+        occupied = {(location.coord_x, location.coord_y) for location in by_name.values()}
+        new_locations: list[WastelandLocation] = []
+        links: dict[tuple[UUID4, UUID4, DwellerLocationRelationEnum], DwellerLocation] = {}
+
+        def place(name: str, location_type: LocationTypeEnum) -> WastelandLocation:
+            normalized = normalize_place_name(name)
+            location = by_name.get(normalized)
+            if location is None:
+                coord_x, coord_y = collision_nudge(schematic_coords(normalized), occupied)
+                occupied.add((coord_x, coord_y))
+                location = WastelandLocation(
+                    name=name[:64],
+                    normalized_name=normalized,
+                    type=location_type,
+                    coord_x=coord_x,
+                    coord_y=coord_y,
+                    vault_id=vault_id,
+                )
+                by_name[normalized] = location
+                new_locations.append(location)
+            return location
+
+        def link(dweller_id: UUID4, location: WastelandLocation, relation: DwellerLocationRelationEnum) -> None:
+            key = (dweller_id, location.id, relation)
+            if key not in links:
+                links[key] = DwellerLocation(dweller_id=dweller_id, location_id=location.id, relation=relation)
+
+        for dweller, origin_place, visited_places in entries:
+            if not self._should_skip(origin_place):
+                link(dweller.id, place(origin_place[:64], LocationTypeEnum.ORIGIN), DwellerLocationRelationEnum.ORIGIN)
+
+            origin_normalized = normalize_place_name(origin_place)
+            visited = 0
+            max_visited = game_config.bio.max_visited(dweller.rarity.value)
+            for raw_name in visited_places:
+                if visited >= max_visited:
+                    break
+                if not raw_name or self._should_skip(raw_name):
+                    continue
+                name = raw_name[:64]
+                if normalize_place_name(name) == origin_normalized:
+                    continue
+                link(dweller.id, place(name, LocationTypeEnum.VISITED), DwellerLocationRelationEnum.VISITED)
+                visited += 1
+
+        return new_locations, list(links.values())
+
     async def _notify_bio_registration_failure(
         self,
         db_session: AsyncSession,
@@ -272,29 +379,33 @@ class MapService:
         dweller_id: UUID4,
         location_name: str,
     ) -> WastelandLocation | None:
-        """Upsert a DISCOVERY row and unlock it for the exploring dweller (best-effort)."""
+        """Upsert a DISCOVERY row and unlock it for the exploring dweller (best-effort).
+
+        Runs in a savepoint: callers apply a whole batch of events in one
+        transaction, so a failure must drop only this registration, never the
+        events already applied before it.
+        """
         try:
-            location = await wl_crud.get_or_create(
-                db_session,
-                vault_id=vault_id,
-                name=location_name[:64],
-                type=LocationTypeEnum.DISCOVERY,
-                exploration_id=exploration_id,
-                commit=False,
-            )
-            await wl_crud.link_dweller(
-                db_session,
-                dweller_id,
-                location.id,
-                DwellerLocationRelationEnum.VISITED,
-                is_unlocked=True,
-                commit=False,
-            )
+            async with db_session.begin_nested():
+                location = await wl_crud.get_or_create(
+                    db_session,
+                    vault_id=vault_id,
+                    name=location_name[:64],
+                    type=LocationTypeEnum.DISCOVERY,
+                    exploration_id=exploration_id,
+                    commit=False,
+                )
+                await wl_crud.link_dweller(
+                    db_session,
+                    dweller_id,
+                    location.id,
+                    DwellerLocationRelationEnum.VISITED,
+                    is_unlocked=True,
+                    commit=False,
+                )
+                # Even a rediscovery of a known place adds a point to the route
+                await wl_crud.bump_map_version(db_session, vault_id)
         except Exception:
-            # A failed flush leaves SQLAlchemy's transaction unusable. This
-            # registration is best-effort and runs before the event mutation,
-            # so reset it and let the discovery event continue without a link.
-            await db_session.rollback()
             logger.exception(
                 "register_discovery failed: vault=%s exploration=%s name=%r",
                 vault_id,
@@ -313,36 +424,35 @@ class MapService:
         Event records are the journey history and therefore the route authority.
         Older events without the Journal coordinate fields are simply omitted.
         """
-        result = await db_session.execute(select(Exploration).where(Exploration.vault_id == vault_id))
-        routes: list[DiscoveryRouteRead] = []
-        for exploration in result.scalars().all():
-            points: list[DiscoveryRoutePoint] = []
-            for event in exploration.events:
-                if event.get("type") != "discovery":
-                    continue
-                location_id = event.get("location_id")
-                coord_x = event.get("coord_x")
-                coord_y = event.get("coord_y")
-                timestamp = event.get("timestamp")
-                if location_id is None or coord_x is None or coord_y is None or not isinstance(timestamp, str):
-                    continue
-                points.append(
-                    DiscoveryRoutePoint(
-                        location_id=location_id,
-                        coord_x=round(float(coord_x) * WORLD_SCALE, 1),
-                        coord_y=round(float(coord_y) * WORLD_SCALE, 1),
-                        timestamp=timestamp,
-                    )
+        events = await exploration_event_crud.get_by_vault_and_type(db_session, vault_id, "discovery")
+        points_by_exploration: dict[UUID4, list[DiscoveryRoutePoint]] = {}
+        for event in events:
+            if event.location_id is None or event.coord_x is None or event.coord_y is None:
+                continue
+            points_by_exploration.setdefault(event.exploration_id, []).append(
+                DiscoveryRoutePoint(
+                    location_id=event.location_id,
+                    coord_x=round(event.coord_x * WORLD_SCALE, 1),
+                    coord_y=round(event.coord_y * WORLD_SCALE, 1),
+                    timestamp=event.ts.isoformat(),
                 )
+            )
+        routes: list[DiscoveryRouteRead] = []
+        for exploration_id, points in points_by_exploration.items():
             if len(points) >= 2:
                 points.sort(key=lambda point: point.timestamp)
-                routes.append(DiscoveryRouteRead(exploration_id=exploration.id, points=points))
+                routes.append(DiscoveryRouteRead(exploration_id=exploration_id, points=points))
         return routes
 
     # ------------------------------------------------------------------
     # map assembly
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def map_etag(vault: Vault, *, unlocked_only: bool = False) -> str:
+        """Strong ETag for the map payload at the vault's current ``map_version``."""
+        return f'"map-{vault.id}-{vault.map_version}-{int(unlocked_only)}"'
+
     async def get_location_detail(
         self,
         db_session: AsyncSession,
@@ -392,7 +502,23 @@ class MapService:
 
         When *unlocked_only* is True, non-VAULT locations without any unlocked
         DwellerLocation link are excluded.  HOME_VAULT is always retained.
+        The result is served from cache while ``vault.map_version`` is unchanged.
         """
+        version = vault.map_version
+        cached = self._cache.get(vault.id, unlocked_only, version)
+        if cached is not None:
+            return cached
+
+        response = await self._build_vault_map(db_session, vault, unlocked_only=unlocked_only)
+        # Cache under the version read before building: a concurrent bump can only
+        # make the stored payload newer than its key, never older.
+        self._cache.put(vault.id, unlocked_only, version, response)
+        return response
+
+    async def _build_vault_map(
+        self, db_session: AsyncSession, vault: Vault, *, unlocked_only: bool
+    ) -> VaultMapResponse:
+        """Assemble the map payload from the database."""
         await self.ensure_home_marker(db_session, vault)
 
         # --- persisted locations ---
@@ -0,0 +1,180 @@
+"""Content-addressed storage for generated media.
+
+Blobs are keyed by the sha256 of their bytes, so regenerating identical media
+(or retrying after a partial failure) never re-uploads what the bucket already
+holds. Images additionally get a set of resized WebP/AVIF variants rendered in
+a process pool — Pillow encoding is CPU-bound and would otherwise stall the
+event loop — plus a small JSON manifest so a dedupe hit can return the variant
+URLs without re-rendering anything.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+
+from app.core.config import settings
+from app.schemas.media import ImageVariant, StoredImage
+from app.services.storage import AsyncStorageService
+from app.utils.exceptions import FileDownloadError
+from app.utils.image_processing import content_digest, render_image_variants, supported_variant_formats
+
+logger = logging.getLogger(__name__)
+
+VARIANT_CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif", "png": "image/png", "jpeg": "image/jpeg"}
+_KNOWN_IMAGES_MAX = 1024
+
+
+class MediaService:
+    """Upload media once per unique content and derive image variants off the event loop."""
+
+    def __init__(
+        self,
+        *,
+        widths: list[int] | None = None,
+        formats: list[str] | None = None,
+        process_workers: int | None = None,
+    ):
+        self.widths = widths or settings.MEDIA_VARIANT_WIDTHS
+        self._requested_formats = formats or settings.MEDIA_VARIANT_FORMATS
+        self.process_workers = settings.MEDIA_PROCESS_WORKERS if process_workers is None else process_workers
+        self._executor: ProcessPoolExecutor | None = None
+        # digest -> StoredImage for images this process already stored or resolved
+        self._known_images: OrderedDict[str, StoredImage] = OrderedDict()
+
+    @cached_property
+    def formats(self) -> list[str]:
+        """Requested variant formats this Pillow build can encode, probed on first use."""
+        return supported_variant_formats(self._requested_formats)
+
+    @staticmethod
+    def image_key(digest: str) -> str:
+        return f"sha256/{digest[:2]}/{digest}.png"
+
+    @staticmethod
+    def variant_prefix(digest: str) -> str:
+        return f"sha256/{digest[:2]}/{digest}/"
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: the parent runs an event loop and executor threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.process_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _render_variants(self, image_bytes: bytes) -> list[tuple[str, int, int, bytes]]:
+        if not self.process_workers:
+            return await asyncio.to_thread(render_image_variants, image_bytes, self.widths, self.formats)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), render_image_variants, image_bytes, self.widths, self.formats
+        )
+
+    def _remember(self, stored: StoredImage) -> StoredImage:
+        self._known_images[stored.digest] = stored
+        self._known_images.move_to_end(stored.digest)
+        while len(self._known_images) > _KNOWN_IMAGES_MAX:
+            self._known_images.popitem(last=False)
+        return stored
+
+    async def store_blob(
+        self,
+        storage: AsyncStorageService,
+        data: bytes,
+        *,
+        extension: str,
+        content_type: str,
+        bucket_name: str,
+    ) -> str:
+        """Upload ``data`` under its content address unless an identical blob already exists."""
+        digest = content_digest(data)
+        file_name = f"sha256/{digest[:2]}/{digest}.{extension}"
+        if await storage.file_exists(file_name=file_name, bucket_name=bucket_name):
+            logger.debug("Blob %s already stored in %s, skipping upload", digest, bucket_name)
+            return storage.public_url(file_name=file_name, bucket_name=bucket_name)
+        return await storage.upload_file(data, file_name, file_type=content_type, bucket_name=bucket_name)
+
+    async def _load_manifest(
+        self, storage: AsyncStorageService, digest: str, *, bucket_name: str, variants_bucket: str
+    ) -> StoredImage | None:
+        try:
+            raw = await storage.download_file(
+                file_name=f"{self.variant_prefix(digest)}manifest.json", bucket_name=variants_bucket
+            )
+        except FileDownloadError:
+            return None
+        variants = [ImageVariant.model_validate(item) for item in json.loads(raw)]
+        url = storage.public_url(file_name=self.image_key(digest), bucket_name=bucket_name)
+        return StoredImage(digest=digest, url=url, variants=variants)
+
+    async def store_image(
+        self,
+        storage: AsyncStorageService,
+        image_bytes: bytes,
+        *,
+        bucket_name: str = "dweller-images",
+        variants_bucket: str = "dweller-thumbnails",
+    ) -> StoredImage:
+        """Store an image and its variants, reusing everything already stored for the same content."""
+        digest = content_digest(image_bytes)
+        if (known := self._known_images.get(digest)) is not None:
+            self._known_images.move_to_end(digest)
+            return known
+
+        image_key = self.image_key(digest)
+        if await storage.file_exists(file_name=image_key, bucket_name=bucket_name):
+            stored = await self._load_manifest(
+                storage, digest, bucket_name=bucket_name, variants_bucket=variants_bucket
+            )
+            if stored is not None:
+                logger.debug("Image %s already stored, reusing %d variants", digest, len(stored.variants))
+                return self._remember(stored)
+
+        # Render while the original uploads; both are independent of each other
+        upload_task = asyncio.create_task(
+            storage.upload_file(image_bytes, image_key, file_type="image/png", bucket_name=bucket_name)
+        )
+        try:
+            rendered = await self._render_variants(image_bytes)
+            prefix = self.variant_prefix(digest)
+            variant_urls = await asyncio.gather(
+                *(
+                    storage.upload_file(
+                        data,
+                        f"{prefix}{width}.{fmt}",
+                        file_type=VARIANT_CONTENT_TYPES[fmt],
+                        bucket_name=variants_bucket,
+                    )
+                    for fmt, width, _height, data in rendered
+                )
+            )
+            url = await upload_task
+        finally:
+            # On any failure, stop the original's upload and wait for it, so it is neither
+            # orphaned nor left with an unretrieved exception
+            upload_task.cancel()
+            await asyncio.wait([upload_task])
+            if not upload_task.cancelled():
+                upload_task.exception()
+        variants = [
+            ImageVariant(format=fmt, width=width, height=height, url=variant_url, size_bytes=len(data))
+            for (fmt, width, height, data), variant_url in zip(rendered, variant_urls, strict=True)
+        ]
+        # Manifest goes last so its presence implies every variant is in place
+        manifest = json.dumps([variant.model_dump() for variant in variants]).encode()
+        await storage.upload_file(
+            manifest, f"{prefix}manifest.json", file_type="application/json", bucket_name=variants_bucket
+        )
+        return self._remember(StoredImage(digest=digest, url=url, variants=variants))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+media_service = MediaService()
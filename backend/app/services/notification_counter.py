@@ -0,0 +1,164 @@
+"""Per-user unread notification counters cached in Redis.
+
+The database stays the source of truth: a missing key is rebuilt with one
+``COUNT`` on the next read, and every adjustment is applied only after the
+change it mirrors has been committed. Writers never create a key, so a counter
+either reflects every committed change since it was seeded or does not exist.
+
+Every writer also bumps a per-user generation. A reader notes the generation
+before its ``COUNT`` and only seeds if it is unchanged, so a count taken before
+a concurrent commit (whose adjustment found no key to apply to) is never cached.
+"""
+
+import logging
+from collections.abc import Mapping
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud.notification import notification as notification_crud
+
+logger = logging.getLogger(__name__)
+
+UNREAD_COUNT_KEY = "user:{user_id}:notifications_unread"
+UNREAD_GENERATION_KEY = "user:{user_id}:notifications_unread:gen"
+
+# Upper bound on drift if an adjustment is ever lost (e.g. Redis briefly unreachable after a commit)
+UNREAD_COUNT_TTL_SECONDS = 300
+
+# Bump the generation, then INCRBY only when the counter is already seeded; a result
+# below zero means it drifted, so drop it.
+_ADJUST_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('DEL', KEYS[1])
+    return nil
+end
+return value
+"""
+
+# Seed only if no writer has bumped the generation since the reader observed it
+_SEED_SCRIPT = """
+local generation = redis.call('GET', KEYS[2]) or ''
+if generation ~= ARGV[1] then
+    return 0
+end
+if redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3], 'NX') then
+    return 1
+end
+return 0
+"""
+
+_REDIS_ERRORS = (RedisError, OSError)
+
+
+def _key(user_id: UUID) -> str:
+    return UNREAD_COUNT_KEY.format(user_id=user_id)
+
+
+def _generation_key(user_id: UUID) -> str:
+    return UNREAD_GENERATION_KEY.format(user_id=user_id)
+
+
+class UnreadCounter:
+    """Read-through cache of each user's unread, undismissed notification count."""
+
+    async def get(self, db_session: AsyncSession, redis_client: Redis | None, user_id: UUID) -> int:
+        """Return the unread count, seeding the counter from the database on a miss.
+
+        Args:
+            db_session: Database session
+            redis_client: Redis client, or ``None`` to always count in the database
+            user_id: Owner of the notifications
+
+        Returns:
+            Number of unread, undismissed notifications
+        """
+        generation = ""
+        if redis_client is not None:
+            try:
+                cached, observed = await redis_client.mget(_key(user_id), _generation_key(user_id))
+                if cached is not None:
+                    return int(cached)
+                if observed is not None:
+                    generation = observed.decode() if isinstance(observed, bytes) else str(observed)
+            except _REDIS_ERRORS:
+                logger.warning("Unread counter read failed for user %s, counting in the database", user_id)
+                return await notification_crud.get_unread_count(db_session, user_id)
+
+        count = await notification_crud.get_unread_count(db_session, user_id)
+        if redis_client is not None:
+            try:
+                await redis_client.eval(
+                    _SEED_SCRIPT,
+                    2,
+                    _key(user_id),
+                    _generation_key(user_id),
+                    generation,
+                    count,
+                    UNREAD_COUNT_TTL_SECONDS,
+                )
+            except _REDIS_ERRORS:
+                logger.warning("Unread counter seed failed for user %s", user_id)
+        return count
+
+    async def adjust(self, redis_client: Redis | None, deltas: Mapping[UUID, int]) -> None:
+        """Apply committed count changes, one pipelined round trip for all users.
+
+        Args:
+            redis_client: Redis client; no-op when ``None``
+            deltas: Change per user (positive for inserts, negative for reads)
+        """
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+        if redis_client is None or not deltas:
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for user_id, delta in deltas.items():
+                    pipe.eval(
+                        _ADJUST_SCRIPT, 2, _key(user_id), _generation_key(user_id), delta, UNREAD_COUNT_TTL_SECONDS
+                    )
+                await pipe.execute()
+        except _REDIS_ERRORS:
+            logger.warning("Unread counter adjust failed for %d user(s), dropping their counters", len(deltas))
+            await self.invalidate(redis_client, *deltas)
+
+    async def reset(self, redis_client: Redis | None, user_id: UUID) -> None:
+        """Record that every notification for ``user_id`` has been read."""
+        if redis_client is None:
+            return
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(_key(user_id), 0, ex=UNREAD_COUNT_TTL_SECONDS)
+                self._bump_generation(pipe, user_id)
+                await pipe.execute()
+        except _REDIS_ERRORS:
+            logger.warning("Unread counter reset failed for user %s", user_id)
+
+    async def invalidate(self, redis_client: Redis | None, *user_ids: UUID) -> None:
+        """Drop counters so the next read recounts from the database."""
+        if redis_client is None or not user_ids:
+            return
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(*(_key(user_id) for user_id in user_ids))
+                for user_id in user_ids:
+                    self._bump_generation(pipe, user_id)
+                await pipe.execute()
+        except _REDIS_ERRORS:
+            logger.warning("Unread counter invalidation failed for %d user(s)", len(user_ids))
+
+    @staticmethod
+    def _bump_generation(pipe, user_id: UUID) -> None:
+        pipe.incr(_generation_key(user_id))
+        pipe.expire(_generation_key(user_id), UNREAD_COUNT_TTL_SECONDS)
+
+
+unread_counter = UnreadCounter()
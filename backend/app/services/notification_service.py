@@ -1,18 +1,69 @@
 import logging
-from collections.abc import Awaitable, Callable
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.crud.notification import notification as notification_crud
-from app.models.notification import NotificationCreate, NotificationPriority, NotificationType
+from app.models.notification import Notification, NotificationCreate, NotificationPriority, NotificationType
+from app.services.notification_counter import unread_counter
 from app.services.stream_manager import sse_manager
 from app.services.websocket_manager import manager
 
 logger = logging.getLogger(__name__)
 
 
+class NotificationOutbox:
+    """Notifications raised during one unit of work, inserted and delivered together.
+
+    While an outbox is active (see ``NotificationService.outbox``), ``create_and_send``
+    builds rows in memory instead of committing each one. The owner stages them
+    into its final transaction and delivers them once that commit succeeds.
+    """
+
+    def __init__(self) -> None:
+        self.pending: list[Notification] = []
+        self.vault_prefixes: dict[UUID, str] = {}
+
+    def stage(self, db: AsyncSession) -> list[Notification]:
+        """Add every pending row to ``db`` so the caller's next commit inserts them in one batch."""
+        staged, self.pending = self.pending, []
+        db.add_all(staged)
+        return staged
+
+    async def flush(self, db: AsyncSession) -> None:
+        """Stage, commit and deliver whatever is still pending. Logs (never raises) on failure."""
+        if not self.pending:
+            return
+        staged = self.stage(db)
+        try:
+            await db.commit()
+        except Exception:
+            logger.exception("Failed to insert %d buffered notifications", len(staged))
+            await db.rollback()
+            return
+        await NotificationService.deliver(staged)
+
+
+_active_outbox: ContextVar[NotificationOutbox | None] = ContextVar("notification_outbox", default=None)
+
+
+def _notification_payload(notification: Notification) -> dict[str, Any]:
+    return {
+        "id": str(notification.id),
+        "notification_type": notification.notification_type,
+        "priority": notification.priority,
+        "title": notification.title,
+        "message": notification.message,
+        "meta_data": notification.meta_data,
+        "created_at": notification.created_at.isoformat(),
+    }
+
+
 class NotificationService:
     """Service for creating and sending notifications."""
 
@@ -22,12 +73,74 @@ class NotificationService:
         if not vault_id:
             return ""
 
+        outbox = _active_outbox.get()
+        if outbox is not None and vault_id in outbox.vault_prefixes:
+            return outbox.vault_prefixes[vault_id]
+
         from app.crud import vault as crud_vault
 
         vault = await crud_vault.get(db, vault_id)
-        if vault and vault.number:
-            return f"[Vault {vault.number}] "
-        return ""
+        prefix = f"[Vault {vault.number}] " if vault and vault.number else ""
+        if outbox is not None:
+            outbox.vault_prefixes[vault_id] = prefix
+        return prefix
+
+    @staticmethod
+    @asynccontextmanager
+    async def outbox(db: AsyncSession) -> AsyncIterator[NotificationOutbox]:
+        """Buffer notifications created inside the block instead of committing them one by one.
+
+        The caller should ``stage`` the outbox before its final commit and
+        ``deliver`` the staged rows afterwards; anything still pending when the
+        block exits (early return or error) is flushed in its own commit. On an
+        error the session is rolled back first, so that commit never persists
+        the failed unit of work's half-applied changes.
+        """
+        outbox = NotificationOutbox()
+        token = _active_outbox.set(outbox)
+        try:
+            yield outbox
+        except BaseException:
+            _active_outbox.reset(token)
+            if outbox.pending:
+                await db.rollback()
+                await outbox.flush(db)
+            raise
+        _active_outbox.reset(token)
+        await outbox.flush(db)
+
+    @staticmethod
+    async def deliver(notifications: list[Notification]) -> None:
+        """Push committed notifications to their users and bump unread counters.
+
+        WebSocket messages are grouped per user (one cross-instance publish each);
+        SSE events stay one per notification so stream replay ids are unchanged.
+        Delivery is best-effort: persistence has already succeeded.
+        """
+        if not notifications:
+            return
+
+        by_user: dict[UUID, list[Notification]] = defaultdict(list)
+        for notification in notifications:
+            by_user[notification.user_id].append(notification)
+
+        for user_id, user_notifications in by_user.items():
+            messages = [
+                {"type": "notification", "notification": _notification_payload(notification)}
+                for notification in user_notifications
+            ]
+            try:
+                await manager.send_personal_messages(messages, user_id=user_id)
+            except Exception:
+                logger.exception("Failed to send %d notifications to user %s", len(messages), user_id)
+
+            for notification, message in zip(user_notifications, messages, strict=True):
+                try:
+                    await sse_manager.publish(user_id, "notifications", {"event_id": str(notification.id), **message})
+                except Exception:
+                    logger.exception("Failed to send SSE notification %s to user %s", notification.id, user_id)
+
+        await unread_counter.adjust(manager.redis, Counter(notification.user_id for notification in notifications))
 
     @staticmethod
     async def create_and_send(
@@ -42,71 +155,40 @@ class NotificationService:
         priority: NotificationPriority = NotificationPriority.NORMAL,
         meta_data: dict[str, Any] | None = None,
     ):
-        """Create a notification and send it via WebSocket."""
-        vault_prefix = await NotificationService._get_vault_prefix(db, vault_id)
-        prefixed_message = f"{vault_prefix}{message}"
+        """Create a notification and send it via WebSocket.
 
-        notification = await notification_crud.create(
-            db,
-            obj_in=NotificationCreate(
-                user_id=user_id,
-                vault_id=vault_id,
-                from_dweller_id=from_dweller_id,
-                notification_type=notification_type,
-                priority=priority,
-                title=title,
-                message=prefixed_message,
-                meta_data=meta_data,
-            ),
+        Inside ``NotificationService.outbox`` the row is only buffered; it is
+        inserted and delivered together with the rest of the outbox.
+        """
+        vault_prefix = await NotificationService._get_vault_prefix(db, vault_id)
+        obj_in = NotificationCreate(
+            user_id=user_id,
+            vault_id=vault_id,
+            from_dweller_id=from_dweller_id,
+            notification_type=notification_type,
+            priority=priority,
+            title=title,
+            message=f"{vault_prefix}{message}",
+            meta_data=meta_data,
         )
 
+        outbox = _active_outbox.get()
+        if outbox is not None:
+            notification = Notification.model_validate(obj_in)
+            outbox.pending.append(notification)
+            logger.debug("Buffered notification %s: type=%s, user=%s", notification.id, notification_type, user_id)
+            return notification
+
+        notification = await notification_crud.create(db, obj_in=obj_in)
         logger.info(
-            f"Created notification {notification.id}: type={notification_type}, "
-            f"priority={priority}, user={user_id}, vault={vault_id}"
+            "Created notification %s: type=%s, priority=%s, user=%s, vault=%s",
+            notification.id,
+            notification_type,
+            priority,
+            user_id,
+            vault_id,
         )
-
-        try:
-            await manager.send_personal_message(
-                {
-                    "type": "notification",
-                    "notification": {
-                        "id": str(notification.id),
-                        "notification_type": notification.notification_type,
-                        "priority": notification.priority,
-                        "title": notification.title,
-                        "message": notification.message,
-                        "meta_data": notification.meta_data,
-                        "created_at": notification.created_at.isoformat(),
-                    },
-                },
-                user_id=user_id,
-            )
-        except Exception:
-            logger.exception(f"Failed to send notification {notification.id} to user {user_id}")
-            # Best-effort delivery: persistence should succeed even if WS send fails.
-
-        try:
-            await sse_manager.publish(
-                user_id,
-                "notifications",
-                {
-                    "event_id": str(notification.id),
-                    "type": "notification",
-                    "notification": {
-                        "id": str(notification.id),
-                        "notification_type": notification.notification_type,
-                        "priority": notification.priority,
-                        "title": notification.title,
-                        "message": notification.message,
-                        "meta_data": notification.meta_data,
-                        "created_at": notification.created_at.isoformat(),
-                    },
-                },
-            )
-        except Exception:
-            logger.exception(f"Failed to send SSE notification {notification.id} to user {user_id}")
-            # Best-effort delivery: persistence should succeed even if SSE send fails.
-
+        await NotificationService.deliver([notification])
         return notification
 
     @staticmethod
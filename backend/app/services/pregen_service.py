@@ -14,8 +14,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from pydantic import UUID4  # ruff: ignore[typing-only-third-party-import]
+from sqlmodel import or_, select
 
 from app import crud
+from app.db.batching import iter_keyset
+from app.models.dweller import Dweller
 from app.schemas.dweller import DwellerUpdate
 from app.services.exploration.data_loader import load_discovery_names
 from app.services.map_service import map_service
@@ -135,33 +138,26 @@ class PregenService:
 
         When ``seed`` is provided the whole run (names, stats, bio, places) is
         reproducible. Intended for dev/QA seeding — no LLM calls, no quota
-        consumption, cheap.
+        consumption, cheap. Dwellers, locations and links are built in memory
+        and written with one batched INSERT per table in a single transaction.
         """
         await self._ensure_vault_exists(db_session, vault_id)
         rng = std_random.Random(seed)
         prefixes, suffixes = self._load_name_pools()
 
+        dwellers = []
+        bio_entries: list[tuple[Dweller, str, list[str]]] = []
         results: list[PregenResult] = []
         for _ in range(count):
-            dweller = await crud.dweller.create_random(
-                db_session, vault_id=vault_id, seed=seed, register_bio_places=False
-            )
+            dweller, _ = crud.dweller.build_random(vault_id, seed=seed)
 
             origin_place = _clean_name(origin) if origin else _pick_place(rng, prefixes, suffixes)
             visited_count = rng.randint(0, 3)
             visited_places = [_pick_place(rng, prefixes, suffixes) for _ in range(visited_count)]
 
-            bio = _compose_bio(rng, dweller.first_name, origin_place, visited_places)
-
-            await crud.dweller.update(db_session, id=dweller.id, obj_in=DwellerUpdate(bio=bio))
-
-            await map_service.register_bio_places(
-                db_session=db_session,
-                dweller=dweller,
-                origin_place=origin_place,
-                visited_places=visited_places,
-                explicit_origin=origin,
-            )
+            dweller.bio = _compose_bio(rng, dweller.first_name, origin_place, visited_places)
+            dwellers.append(dweller)
+            bio_entries.append((dweller, origin or origin_place, visited_places))
 
             results.append(
                 PregenResult(
@@ -170,11 +166,41 @@ class PregenService:
                     last_name=dweller.last_name,
                     origin_place=origin_place,
                     visited_count=visited_count,
-                    bio_length=len(bio),
+                    bio_length=len(dweller.bio),
                 )
             )
+
+        db_session.add_all(dwellers)
+        await db_session.flush()
+        await self._insert_bio_places(db_session, vault_id, bio_entries)
+        await db_session.commit()
         return results
 
+    @staticmethod
+    async def _insert_bio_places(
+        db_session: AsyncSession,
+        vault_id: UUID4,
+        bio_entries: list[tuple[Dweller, str, list[str]]],
+    ) -> None:
+        """Bulk-insert the map rows for freshly built dwellers — best-effort.
+
+        Runs in a savepoint so a failure (e.g. a concurrent insert of the same
+        place) drops only the markers, never the dwellers themselves.
+        """
+        existing = await crud.wasteland_location.get_by_vault(db_session, vault_id)
+        locations, links = map_service.plan_bio_places(vault_id, bio_entries, existing)
+        if not links:
+            return
+        try:
+            async with db_session.begin_nested():
+                db_session.add_all(locations)
+                await db_session.flush()
+                db_session.add_all(links)
+                await db_session.flush()
+                await crud.wasteland_location.bump_map_version(db_session, vault_id)
+        except Exception:
+            logger.exception("pregen bio places failed: vault=%s dwellers=%d", vault_id, len(bio_entries))
+
     async def fill_missing_bios(
         self,
         db_session: AsyncSession,
@@ -190,46 +216,53 @@ class PregenService:
         rng = std_random.Random(seed)
         prefixes, suffixes = self._load_name_pools()
 
-        # Existing dwellers, newest first (deterministic order)
-        dwellers = await crud.dweller.get_multi_by_vault(
-            db_session,
-            vault_id=vault_id,
-            sort_by="created_at",
-            order="desc",
-        )
-        eligible = [d for d in dwellers if force or not d.bio]
-        if count > 0:
-            eligible = eligible[:count]
+        # Eligible dwellers in id order (deterministic), read in keyset batches so the
+        # per-dweller commits below never hold a cursor open or the whole vault in memory
+        eligible = select(Dweller).where(Dweller.vault_id == vault_id, ~Dweller.is_deleted)
+        if not force:
+            eligible = eligible.where(or_(Dweller.bio.is_(None), Dweller.bio == ""))
 
         results: list[PregenResult] = []
-        for dweller in eligible:
-            origin_place = _clean_name(origin) if origin else _pick_place(rng, prefixes, suffixes)
-            visited_count = rng.randint(0, 3)
-            visited_places = [_pick_place(rng, prefixes, suffixes) for _ in range(visited_count)]
-
-            bio = _compose_bio(rng, dweller.first_name, origin_place, visited_places)
-
-            await crud.dweller.update(db_session, id=dweller.id, obj_in=DwellerUpdate(bio=bio))
+        async for dwellers in iter_keyset(db_session, eligible, Dweller.id, label=f"dweller bios for vault {vault_id}"):
+            for dweller in dwellers:
+                if 0 < count <= len(results):
+                    return results
+                results.append(await self._fill_bio(db_session, dweller, rng, prefixes, suffixes, origin))
+        return results
 
-            await map_service.register_bio_places(
-                db_session=db_session,
-                dweller=dweller,
-                origin_place=origin_place,
-                visited_places=visited_places,
-                explicit_origin=origin,
-            )
+    async def _fill_bio(
+        self,
+        db_session: AsyncSession,
+        dweller: Dweller,
+        rng: std_random.Random,
+        prefixes: list[str],
+        suffixes: list[str],
+        origin: str | None,
+    ) -> PregenResult:
+        origin_place = _clean_name(origin) if origin else _pick_place(rng, prefixes, suffixes)
+        visited_count = rng.randint(0, 3)
+        visited_places = [_pick_place(rng, prefixes, suffixes) for _ in range(visited_count)]
+
+        bio = _compose_bio(rng, dweller.first_name, origin_place, visited_places)
+
+        await crud.dweller.update(db_session, id=dweller.id, obj_in=DwellerUpdate(bio=bio))
+
+        await map_service.register_bio_places(
+            db_session=db_session,
+            dweller=dweller,
+            origin_place=origin_place,
+            visited_places=visited_places,
+            explicit_origin=origin,
+        )
 
-            results.append(
-                PregenResult(
-                    dweller_id=dweller.id,
-                    first_name=dweller.first_name,
-                    last_name=dweller.last_name,
-                    origin_place=origin_place,
-                    visited_count=visited_count,
-                    bio_length=len(bio),
-                )
-            )
-        return results
+        return PregenResult(
+            dweller_id=dweller.id,
+            first_name=dweller.first_name,
+            last_name=dweller.last_name,
+            origin_place=origin_place,
+            visited_count=visited_count,
+            bio_length=len(bio),
+        )
 
 
 pregen_service = PregenService()
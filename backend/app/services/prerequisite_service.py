@@ -1,10 +1,21 @@
-"""Prerequisite service for validating quest requirements before a vault can start a quest."""
+"""Prerequisite service for validating quest requirements before a vault can start a quest.
+
+Requirements are checked against :class:`VaultFacts`, a per-vault aggregate
+loaded with a handful of grouped queries, so checking any number of quests
+costs the same number of round trips as checking one.
+"""
 
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
+from uuid import UUID
 
 from pydantic import UUID4
-from sqlalchemy import func
+from sqlalchemy import func, union_all
 from sqlmodel import and_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -16,168 +27,234 @@ from app.models.room import Room
 from app.models.storage import Storage
 from app.models.vault_quest import VaultQuestCompletionLink
 from app.models.weapon import Weapon
+from app.services.event_bus import GameEvent, event_bus
 
 logger = logging.getLogger(__name__)
 
+# Cached facts only feed the quest board; starting a quest always reloads them.
+FACTS_TTL_SECONDS = 30.0
+# Upper bound on vaults cached per process; the oldest entries go first
+_FACTS_CACHE_MAX = 1024
+
+# Events after which a vault's cached facts are dropped. Writes that emit nothing
+# (or happen in another process) are bounded by FACTS_TTL_SECONDS instead.
+_INVALIDATING_EVENTS = (
+    GameEvent.ROOM_BUILT,
+    GameEvent.ROOM_UPGRADED,
+    GameEvent.DWELLER_LEVEL_UP,
+    GameEvent.ITEM_COLLECTED,
+    GameEvent.QUEST_COMPLETED,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class VaultFacts:
+    """Everything quest requirements are evaluated against, for one vault."""
+
+    level_histogram: Mapping[int, int]
+    item_counts: Mapping[str, int]
+    room_counts: Mapping[str, int]
+    population: int
+    completed_quest_ids: frozenset[UUID]
+
+    def dwellers_at_or_above(self, level: int) -> int:
+        return sum(count for dweller_level, count in self.level_histogram.items() if dweller_level >= level)
+
 
 class PrerequisiteService:
     """Service for checking whether a vault meets all requirements to start a quest."""
 
-    async def validate_level_requirement(
-        self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
-    ) -> bool:
-        required_level = requirement_data.get("level", 1)
-        required_count = requirement_data.get("count", 1)
+    def __init__(self) -> None:
+        # Ordered oldest load first, so expired entries are always at the front
+        self._facts_cache: OrderedDict[UUID4, tuple[float, VaultFacts]] = OrderedDict()
 
-        result = await db_session.execute(
-            select(func.count(Dweller.id)).where(
+    async def load_vault_facts(self, db_session: AsyncSession, vault_id: UUID4) -> VaultFacts:
+        """Aggregate the vault state requirements depend on (four grouped queries)."""
+        levels = await db_session.execute(
+            select(Dweller.level, func.count(Dweller.id))
+            .where(Dweller.vault_id == vault_id, ~Dweller.is_deleted)
+            .group_by(Dweller.level)
+        )
+        level_histogram: dict[int, int] = dict(levels.tuples().all())
+
+        stored_names = union_all(
+            select(func.lower(Weapon.name).label("name"))
+            .join(Storage, Weapon.storage_id == Storage.id)
+            .where(Storage.vault_id == vault_id),
+            select(func.lower(Outfit.name).label("name"))
+            .join(Storage, Outfit.storage_id == Storage.id)
+            .where(Storage.vault_id == vault_id),
+        ).subquery()
+        items = await db_session.execute(select(stored_names.c.name, func.count()).group_by(stored_names.c.name))
+
+        room_name = func.lower(Room.name)
+        rooms = await db_session.execute(
+            select(room_name, func.count(Room.id)).where(Room.vault_id == vault_id).group_by(room_name)
+        )
+
+        completed = await db_session.execute(
+            select(VaultQuestCompletionLink.quest_id).where(
                 and_(
-                    Dweller.vault_id == vault_id,
-                    Dweller.level >= required_level,
-                    ~Dweller.is_deleted,
+                    VaultQuestCompletionLink.vault_id == vault_id,
+                    VaultQuestCompletionLink.is_completed,
                 )
             )
         )
-        matching_count = result.scalar_one()
-        return matching_count >= required_count
 
-    async def validate_item_requirement(
-        self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
-    ) -> bool:
+        return VaultFacts(
+            level_histogram=MappingProxyType(level_histogram),
+            item_counts=MappingProxyType(dict(items.tuples().all())),
+            room_counts=MappingProxyType(dict(rooms.tuples().all())),
+            population=sum(level_histogram.values()),
+            completed_quest_ids=frozenset(completed.scalars().all()),
+        )
+
+    async def get_vault_facts(self, db_session: AsyncSession, vault_id: UUID4) -> VaultFacts:
+        """Return facts cached for up to ``FACTS_TTL_SECONDS`` or until a relevant game event."""
+        now = time.monotonic()
+        cached = self._facts_cache.get(vault_id)
+        if cached is not None:
+            if now - cached[0] < FACTS_TTL_SECONDS:
+                return cached[1]
+            del self._facts_cache[vault_id]
+
+        facts = await self.load_vault_facts(db_session, vault_id)
+        loaded_at = time.monotonic()
+        self._facts_cache[vault_id] = (loaded_at, facts)
+        self._facts_cache.move_to_end(vault_id)
+        # Evict expired entries and anything beyond the size cap, oldest first
+        while self._facts_cache:
+            oldest_at, _ = next(iter(self._facts_cache.values()))
+            if loaded_at - oldest_at < FACTS_TTL_SECONDS and len(self._facts_cache) <= _FACTS_CACHE_MAX:
+                break
+            self._facts_cache.popitem(last=False)
+        return facts
+
+    def invalidate(self, vault_id: UUID4) -> None:
+        self._facts_cache.pop(vault_id, None)
+
+    async def handle_vault_changed(self, event_type: GameEvent, vault_id: UUID4, data: dict[str, Any]) -> None:
+        """Event bus handler that drops the vault's cached facts."""
+        self.invalidate(vault_id)
+
+    @staticmethod
+    def level_requirement_met(facts: VaultFacts, requirement_data: dict[str, Any]) -> bool:
+        required_level = requirement_data.get("level", 1)
+        required_count = requirement_data.get("count", 1)
+        return facts.dwellers_at_or_above(required_level) >= required_count
+
+    @staticmethod
+    def item_requirement_met(facts: VaultFacts, requirement_data: dict[str, Any]) -> bool:
         item_name = requirement_data.get("item_name", "")
         required_count = requirement_data.get("count", 1)
+        return facts.item_counts.get(item_name.lower(), 0) >= required_count
 
-        storage_result = await db_session.execute(select(Storage.id).where(Storage.vault_id == vault_id))
-        storage_id = storage_result.scalar_one_or_none()
-        if not storage_id:
-            return False
+    @staticmethod
+    def room_requirement_met(facts: VaultFacts, requirement_data: dict[str, Any]) -> bool:
+        room_type = requirement_data.get("room_type", "")
+        required_count = requirement_data.get("count", 1)
+        return facts.room_counts.get(room_type.lower().replace("_", " "), 0) >= required_count
 
-        weapon_count_result = await db_session.execute(
-            select(func.count(Weapon.id)).where(
-                and_(
-                    Weapon.storage_id == storage_id,
-                    func.lower(Weapon.name) == item_name.lower(),
-                )
-            )
-        )
-        weapon_count = weapon_count_result.scalar_one()
+    @staticmethod
+    def dweller_count_requirement_met(facts: VaultFacts, requirement_data: dict[str, Any]) -> bool:
+        return facts.population >= requirement_data.get("count", 0)
 
-        outfit_count_result = await db_session.execute(
-            select(func.count(Outfit.id)).where(
-                and_(
-                    Outfit.storage_id == storage_id,
-                    func.lower(Outfit.name) == item_name.lower(),
-                )
-            )
-        )
-        outfit_count = outfit_count_result.scalar_one()
+    @staticmethod
+    def quest_completed_requirement_met(facts: VaultFacts, requirement_data: dict[str, Any]) -> bool:
+        quest_id = requirement_data.get("quest_id")
+        if not quest_id:
+            logger.warning("quest_completed requirement missing quest_id")
+            return False
+        return UUID(str(quest_id)) in facts.completed_quest_ids
 
-        total_count = weapon_count + outfit_count
-        return total_count >= required_count
+    async def validate_level_requirement(
+        self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
+    ) -> bool:
+        return self.level_requirement_met(await self.load_vault_facts(db_session, vault_id), requirement_data)
 
-    async def validate_room_requirement(
+    async def validate_item_requirement(
         self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
     ) -> bool:
-        room_type = requirement_data.get("room_type", "")
-        required_count = requirement_data.get("count", 1)
+        return self.item_requirement_met(await self.load_vault_facts(db_session, vault_id), requirement_data)
 
-        result = await db_session.execute(
-            select(func.count(Room.id)).where(
-                and_(
-                    Room.vault_id == vault_id,
-                    func.lower(Room.name) == room_type.lower().replace("_", " "),
-                )
-            )
-        )
-        matching_count = result.scalar_one()
-        return matching_count >= required_count
+    async def validate_room_requirement(
+        self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
+    ) -> bool:
+        return self.room_requirement_met(await self.load_vault_facts(db_session, vault_id), requirement_data)
 
     async def validate_dweller_count_requirement(
         self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
     ) -> bool:
-        required_count = requirement_data.get("count", 0)
-
-        result = await db_session.execute(
-            select(func.count(Dweller.id)).where(
-                and_(
-                    Dweller.vault_id == vault_id,
-                    ~Dweller.is_deleted,
-                )
-            )
-        )
-        current_count = result.scalar_one()
-        return current_count >= required_count
+        return self.dweller_count_requirement_met(await self.load_vault_facts(db_session, vault_id), requirement_data)
 
     async def validate_quest_completed_requirement(
         self, db_session: AsyncSession, vault_id: UUID4, requirement_data: dict[str, Any]
     ) -> bool:
-        quest_id = requirement_data.get("quest_id")
-        if not quest_id:
-            logger.warning("quest_completed requirement missing quest_id")
-            return False
-
-        result = await db_session.execute(
-            select(VaultQuestCompletionLink).where(
-                and_(
-                    VaultQuestCompletionLink.vault_id == vault_id,
-                    VaultQuestCompletionLink.quest_id == quest_id,
-                    VaultQuestCompletionLink.is_completed,
-                )
-            )
-        )
-        return result.scalar_one_or_none() is not None
+        return self.quest_completed_requirement_met(await self.load_vault_facts(db_session, vault_id), requirement_data)
 
     async def can_start_quest(self, db_session: AsyncSession, vault_id: UUID4, quest: Quest) -> tuple[bool, list[str]]:
         missing = await self.get_missing_requirements(db_session, vault_id, quest)
         return len(missing) == 0, missing
 
-    async def get_missing_requirements(self, db_session: AsyncSession, vault_id: UUID4, quest: Quest) -> list[str]:
+    async def get_missing_requirements(
+        self, db_session: AsyncSession, vault_id: UUID4, quest: Quest, facts: VaultFacts | None = None
+    ) -> list[str]:
+        """Describe the quest's unmet mandatory requirements, loading fresh facts unless given."""
+        if not quest.quest_requirements:
+            return []
+        if facts is None:
+            facts = await self.load_vault_facts(db_session, vault_id)
+
+        missing = self.missing_requirements(quest, facts)
+        if missing:
+            logger.info(f"Vault {vault_id} missing {len(missing)} requirement(s) for quest '{quest.title}': {missing}")
+        return missing
+
+    async def get_missing_requirements_for_quests(
+        self, db_session: AsyncSession, vault_id: UUID4, quests: Iterable[Quest]
+    ) -> dict[UUID4, list[str]]:
+        """Evaluate many quests against one (cached) facts load; requirements must already be loaded."""
+        facts = await self.get_vault_facts(db_session, vault_id)
+        return {quest.id: self.missing_requirements(quest, facts) for quest in quests}
+
+    def missing_requirements(self, quest: Quest, facts: VaultFacts) -> list[str]:
         missing: list[str] = []
         requirements: list[QuestRequirement] = quest.quest_requirements
 
-        if not requirements:
-            return missing
-
         for req in requirements:
-            is_met = await self._check_requirement(db_session, vault_id, req)
+            if self._check_requirement(facts, req):
+                continue
 
-            if not is_met:
-                if not req.is_mandatory:
-                    logger.debug(
-                        f"Optional requirement not met for quest '{quest.title}': "
-                        f"{req.requirement_type} - {req.requirement_data}"
-                    )
-                    continue
+            if not req.is_mandatory:
+                logger.debug(
+                    f"Optional requirement not met for quest '{quest.title}': "
+                    f"{req.requirement_type} - {req.requirement_data}"
+                )
+                continue
 
-                description = self._describe_requirement(req)
-                missing.append(description)
-
-        if missing:
-            logger.info(f"Vault {vault_id} missing {len(missing)} requirement(s) for quest '{quest.title}': {missing}")
+            missing.append(self._describe_requirement(req))
 
         return missing
 
-    async def _check_requirement(
-        self, db_session: AsyncSession, vault_id: UUID4, requirement: QuestRequirement
-    ) -> bool:
-        """Dispatch to the correct validation method based on requirement type."""
-        validators = {
-            RequirementType.LEVEL: self.validate_level_requirement,
-            RequirementType.ITEM: self.validate_item_requirement,
-            RequirementType.ROOM: self.validate_room_requirement,
-            RequirementType.DWELLER_COUNT: self.validate_dweller_count_requirement,
-            RequirementType.QUEST_COMPLETED: self.validate_quest_completed_requirement,
+    def _check_requirement(self, facts: VaultFacts, requirement: QuestRequirement) -> bool:
+        """Dispatch to the correct check based on requirement type."""
+        checks = {
+            RequirementType.LEVEL: self.level_requirement_met,
+            RequirementType.ITEM: self.item_requirement_met,
+            RequirementType.ROOM: self.room_requirement_met,
+            RequirementType.DWELLER_COUNT: self.dweller_count_requirement_met,
+            RequirementType.QUEST_COMPLETED: self.quest_completed_requirement_met,
         }
 
-        validator = validators.get(requirement.requirement_type)
-        if not validator:
+        check = checks.get(requirement.requirement_type)
+        if not check:
             logger.warning(f"Unknown requirement type: {requirement.requirement_type}")
             return False
 
         try:
-            return await validator(db_session, vault_id, requirement.requirement_data)
+            return check(facts, requirement.requirement_data)
         except Exception:
-            logger.exception(f"Error validating {requirement.requirement_type} requirement for vault {vault_id}")
+            logger.exception(f"Error validating {requirement.requirement_type} requirement")
             return False
 
     @staticmethod
@@ -231,3 +308,9 @@ class PrerequisiteService:
 
 
 prerequisite_service = PrerequisiteService()
+
+
+def register_prerequisite_event_handlers() -> None:
+    """Drop cached vault facts when the game reports a relevant change."""
+    for event_type in _INVALIDATING_EVENTS:
+        event_bus.subscribe(event_type, prerequisite_service.handle_vault_changed)
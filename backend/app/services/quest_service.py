@@ -5,7 +5,7 @@ from typing import Any
 from pydantic import UUID4
 from sqlalchemy import func
 from sqlalchemy.orm import selectinload
-from sqlmodel import and_, select
+from sqlmodel import and_, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import crud
@@ -13,6 +13,8 @@ from app.models.dweller import Dweller
 from app.models.quest import Quest
 from app.models.vault_quest import VaultQuestCompletionLink
 from app.schemas.common import AgeGroupEnum, DwellerStatusEnum
+from app.schemas.quest import QuestRead
+from app.services.prerequisite_service import prerequisite_service
 
 logger = logging.getLogger(__name__)
 
@@ -91,17 +93,19 @@ class QuestService:
 
     async def get_available_for_vault(
         self, db_session: AsyncSession, vault_id: UUID4, skip: int = 0, limit: int = 100
-    ) -> list[Quest]:
-        """Get quests available for a vault, respecting quest chain prerequisites."""
-        completed_result = await db_session.execute(
-            select(VaultQuestCompletionLink.quest_id).where(
-                and_(
-                    VaultQuestCompletionLink.vault_id == vault_id,
-                    VaultQuestCompletionLink.is_completed,
-                )
+    ) -> list[QuestRead]:
+        """Get quests available for a vault, respecting quest chain prerequisites.
+
+        Chain unlocks and pagination are applied in SQL. Each returned quest
+        carries ``missing_requirements`` evaluated in memory against the
+        vault's cached facts.
+        """
+        completed_quest_ids = select(VaultQuestCompletionLink.quest_id).where(
+            and_(
+                VaultQuestCompletionLink.vault_id == vault_id,
+                VaultQuestCompletionLink.is_completed,
             )
         )
-        completed_quest_ids = set(completed_result.scalars().all())
 
         result = await db_session.execute(
             select(Quest)
@@ -110,17 +114,18 @@ class QuestService:
                 VaultQuestCompletionLink,
                 and_(Quest.id == VaultQuestCompletionLink.quest_id, VaultQuestCompletionLink.vault_id == vault_id),
             )
-            .where(VaultQuestCompletionLink.is_visible)
+            .where(
+                VaultQuestCompletionLink.is_visible,
+                or_(Quest.previous_quest_id.is_(None), Quest.previous_quest_id.in_(completed_quest_ids)),
+            )
+            .order_by(Quest.chain_id, Quest.chain_order, Quest.title, Quest.id)
+            .offset(skip)
+            .limit(limit)
         )
-        all_quests = result.scalars().all()
-
-        available = [
-            quest
-            for quest in all_quests
-            if quest.previous_quest_id is None or quest.previous_quest_id in completed_quest_ids
-        ]
+        quests = result.scalars().all()
 
-        return available[skip : skip + limit]
+        missing = await prerequisite_service.get_missing_requirements_for_quests(db_session, vault_id, quests)
+        return [QuestRead.model_validate(quest, update={"missing_requirements": missing[quest.id]}) for quest in quests]
 
     async def complete_quest_and_free_party(
         self, db_session: AsyncSession, quest_id: UUID4, vault_id: UUID4
@@ -138,6 +143,7 @@ class QuestService:
             if dweller:
                 dweller.status = "idle"
         await db_session.commit()
+        prerequisite_service.invalidate(vault_id)
 
         return quest, granted_rewards
 
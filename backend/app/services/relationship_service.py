@@ -1,9 +1,11 @@
 """Service for managing dweller relationships and compatibility."""
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 
 from pydantic import UUID4
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.game_config import game_config
@@ -18,11 +20,20 @@ from app.schemas.common import (
     RelationshipTypeEnum,
 )
 from app.schemas.relationship import CompatibilityScore
+from app.services.compatibility_matrix import CompatibilityMatrix, compatibility_matrix_cache, pair_score
 from app.services.notification_service import NotificationService
 from app.utils.exceptions import ResourceNotFoundException, ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Stage reached when affinity crosses the romance threshold; MARRIED is never
+# reached this way (see the conditional PARTNER->MARRIED transition).
+_STAGE_PROGRESSION: dict[RelationshipTypeEnum, RelationshipTypeEnum] = {
+    RelationshipTypeEnum.ACQUAINTANCE: RelationshipTypeEnum.FRIEND,
+    RelationshipTypeEnum.FRIEND: RelationshipTypeEnum.ROMANTIC,
+    RelationshipTypeEnum.ROMANTIC: RelationshipTypeEnum.PARTNER,
+}
+
 
 class RelationshipService:
     """Service for managing relationships between dwellers."""
@@ -102,25 +113,15 @@ class RelationshipService:
         old_type = relationship.relationship_type
 
         # Auto-upgrade relationship based on affinity thresholds
-        if update_data["affinity"] >= game_config.relationship.romance_threshold:
-            # Progress through relationship stages
-            if relationship.relationship_type == RelationshipTypeEnum.ACQUAINTANCE:
-                update_data["relationship_type"] = RelationshipTypeEnum.FRIEND
-            elif relationship.relationship_type == RelationshipTypeEnum.FRIEND:
-                # Upgrade to romantic at 70+ affinity
-                update_data["relationship_type"] = RelationshipTypeEnum.ROMANTIC
-            elif relationship.relationship_type == RelationshipTypeEnum.ROMANTIC:
-                # Upgrade to partner at 70+ affinity
-                update_data["relationship_type"] = RelationshipTypeEnum.PARTNER
+        new_type = RelationshipService.next_stage(old_type, new_affinity)
+        if new_type != old_type:
+            update_data["relationship_type"] = new_type
+            if new_type == RelationshipTypeEnum.PARTNER:
                 await RelationshipService._set_partner_ids(
                     db_session, relationship.dweller_1_id, relationship.dweller_2_id
                 )
 
-        is_marriage_transition = (
-            relationship.relationship_type == RelationshipTypeEnum.PARTNER
-            and new_affinity >= game_config.relationship.marriage_threshold
-        )
-        if is_marriage_transition:
+        if RelationshipService.is_marriage_transition(old_type, new_affinity):
             # Conditional PARTNER->MARRIED update so only one concurrent request
             # wins the transition and applies the one-time bonus/notification.
             if await relationship_crud.transition_partner_to_married(
@@ -146,6 +147,97 @@ class RelationshipService:
         )
         return relationship
 
+    @staticmethod
+    def next_stage(relationship_type: RelationshipTypeEnum, affinity: int) -> RelationshipTypeEnum:
+        """Return the stage a relationship advances to at ``affinity`` (at most one step).
+
+        Args:
+            relationship_type: Current relationship stage
+            affinity: Affinity after the increase
+
+        Returns:
+            The next stage, or ``relationship_type`` when it does not advance
+        """
+        if affinity < game_config.relationship.romance_threshold:
+            return relationship_type
+        return _STAGE_PROGRESSION.get(relationship_type, relationship_type)
+
+    @staticmethod
+    def is_marriage_transition(relationship_type: RelationshipTypeEnum, affinity: int) -> bool:
+        """Whether an affinity increase to ``affinity`` should marry a PARTNER couple."""
+        return (
+            relationship_type == RelationshipTypeEnum.PARTNER
+            and affinity >= game_config.relationship.marriage_threshold
+        )
+
+    @staticmethod
+    async def apply_affinity_gains(
+        db_session: AsyncSession,
+        gains: list[tuple[Relationship, int]],
+        dwellers_by_id: Mapping[UUID4, Dweller],
+    ) -> int:
+        """Apply a batch of affinity gains with one bulk upsert and one commit.
+
+        Stages and affinity are computed in memory with the same rules as
+        ``increase_affinity``. Relationships may be new (not yet persisted) or
+        loaded in ``db_session``. Couples that would marry are left out of the
+        bulk write and go through ``increase_affinity`` afterwards, so the
+        conditional PARTNER->MARRIED update still guards the one-time bonus.
+
+        Args:
+            db_session: Database session
+            gains: ``(relationship, amount)`` pairs, one per relationship
+            dwellers_by_id: Loaded dwellers, used to link new partners without re-fetching
+
+        Returns:
+            Number of relationships updated
+        """
+        now = datetime.utcnow()
+        rows: list[dict] = []
+        synced: list[tuple[Relationship, dict]] = []
+        marriages: list[tuple[Relationship, int]] = []
+
+        for relationship, amount in gains:
+            new_affinity = min(100, relationship.affinity + amount)
+            if RelationshipService.is_marriage_transition(relationship.relationship_type, new_affinity):
+                marriages.append((relationship, amount))
+                continue
+
+            new_type = RelationshipService.next_stage(relationship.relationship_type, new_affinity)
+            if new_type == RelationshipTypeEnum.PARTNER and relationship.relationship_type != new_type:
+                dweller_1 = dwellers_by_id[relationship.dweller_1_id]
+                dweller_2 = dwellers_by_id[relationship.dweller_2_id]
+                dweller_1.partner_id = dweller_2.id
+                dweller_2.partner_id = dweller_1.id
+                db_session.add_all([dweller_1, dweller_2])
+
+            changes = {"affinity": new_affinity, "relationship_type": new_type, "updated_at": now}
+            rows.append(
+                {
+                    "id": relationship.id,
+                    "dweller_1_id": relationship.dweller_1_id,
+                    "dweller_2_id": relationship.dweller_2_id,
+                    "created_at": relationship.created_at or now,
+                    **changes,
+                }
+            )
+            synced.append((relationship, changes))
+
+        if rows:
+            await relationship_crud.bulk_upsert(db_session, rows)
+            await db_session.commit()
+            # The upsert bypassed the unit of work; mirror its values without marking rows dirty
+            for relationship, changes in synced:
+                for key, value in changes.items():
+                    set_committed_value(relationship, key, value)
+
+        for relationship, amount in marriages:
+            await RelationshipService.increase_affinity(
+                db_session, relationship.dweller_1_id, relationship.dweller_2_id, amount
+            )
+
+        return len(rows) + len(marriages)
+
     @staticmethod
     async def initiate_romance(
         db_session: AsyncSession,
@@ -398,42 +490,51 @@ class RelationshipService:
         # Let ResourceNotFoundException propagate directly (HTTP 404)
         dweller_1 = await dweller_crud.get(db_session, dweller_1_id)
         dweller_2 = await dweller_crud.get(db_session, dweller_2_id)
+        return pair_score(dweller_1, dweller_2)
 
-        # SPECIAL similarity score
-        special_attrs = ["strength", "perception", "endurance", "charisma", "intelligence", "agility", "luck"]
-        special_diff = sum(abs(getattr(dweller_1, attr, 0) - getattr(dweller_2, attr, 0)) for attr in special_attrs)
-        max_special_diff = game_config.relationship.max_special_diff
-        special_score = 1.0 - (special_diff / max_special_diff)
-
-        # Happiness similarity
-        happiness_diff = abs(dweller_1.happiness - dweller_2.happiness)
-        happiness_score = 1.0 - (happiness_diff / 100.0)
-
-        # Level similarity
-        level_diff = abs(dweller_1.level - dweller_2.level)
-        max_level_diff = game_config.relationship.max_level_diff
-        level_score = 1.0 - (level_diff / max_level_diff)
-
-        # Proximity (same room bonus)
-        proximity_score = 1.0 if (dweller_1.room_id and dweller_1.room_id == dweller_2.room_id) else 0.0
-
-        # Weighted total
-        compatibility = (
-            special_score * game_config.relationship.compatibility_special_weight
-            + happiness_score * game_config.relationship.compatibility_happiness_weight
-            + level_score * game_config.relationship.compatibility_level_weight
-            + proximity_score * game_config.relationship.compatibility_proximity_weight
-        )
+    @staticmethod
+    async def get_compatibility_matrix(db_session: AsyncSession, vault_id: UUID4) -> CompatibilityMatrix:
+        """Get the pairwise compatibility matrix for a vault's living adults.
 
-        return CompatibilityScore(
-            dweller_1_id=dweller_1_id,
-            dweller_2_id=dweller_2_id,
-            score=min(1.0, max(0.0, compatibility)),
-            special_score=special_score,
-            happiness_score=happiness_score,
-            level_score=level_score,
-            proximity_score=proximity_score,
-        )
+        Args:
+            db_session: Database session
+            vault_id: Vault ID
+
+        Returns:
+            Cached matrix, rebuilt when any living adult's stats changed
+        """
+        return await compatibility_matrix_cache.get(db_session, vault_id)
+
+    @staticmethod
+    async def top_matches(
+        db_session: AsyncSession,
+        vault_id: UUID4,
+        dweller_id: UUID4,
+        limit: int = 5,
+        *,
+        opposite_gender: bool = False,
+    ) -> list[CompatibilityScore]:
+        """Find the most compatible living adults in the vault for one dweller.
+
+        Args:
+            db_session: Database session
+            vault_id: Vault ID
+            dweller_id: Dweller to find matches for
+            limit: Maximum number of matches
+            opposite_gender: Only consider partners who could have children together
+
+        Returns:
+            Compatibility scores, highest first
+
+        Raises:
+            ValidationException: If the dweller is not a living adult of the vault
+        """
+        matrix = await compatibility_matrix_cache.get(db_session, vault_id)
+        try:
+            return matrix.top_matches(dweller_id, limit, opposite_gender=opposite_gender)
+        except KeyError:
+            msg = "Dweller is not a living adult in this vault"
+            raise ValidationException(msg) from None
 
     @staticmethod
     async def calculate_compatibility(
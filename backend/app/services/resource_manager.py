@@ -129,7 +129,11 @@ class ResourceManager:
         for room, dwellers in rooms_with_dwellers:
             if room.category != RoomTypeEnum.PRODUCTION or not room.ability or not room.output:
                 self.logger.debug(
-                    f"Skipping room {room.name}: category={room.category}, ability={room.ability}, output={room.output}"
+                    "Skipping room %s: category=%s, ability=%s, output=%s",
+                    room.name,
+                    room.category,
+                    room.ability,
+                    room.output,
                 )
                 continue
 
@@ -148,9 +152,14 @@ class ResourceManager:
         tier_mult = game_config.resource.get_tier_multiplier(room.tier)
         production = room.output * ability_sum * game_config.resource.base_production_rate * tier_mult * seconds_passed
 
-        self.logger.info(
-            f"Room {room.name} producing: output={room.output}, ability_sum={ability_sum}, "
-            f"production={production:.2f} (tier={room.tier}, dwellers={len(dwellers)})"
+        self.logger.debug(
+            "Room %s producing: output=%s, ability_sum=%s, production=%.2f (tier=%s, dwellers=%s)",
+            room.name,
+            room.output,
+            ability_sum,
+            production,
+            room.tier,
+            len(dwellers),
         )
 
         return production
@@ -191,9 +200,14 @@ class ResourceManager:
     def _log_resource_changes(self, vault: Vault, new_resources: dict[str, float]) -> None:
         """Log resource changes for debugging."""
         self.logger.debug(
-            f"Vault {vault.id}: Power {vault.power:.0f} -> {new_resources['power']:.0f}, "
-            f"Food {vault.food:.0f} -> {new_resources['food']:.0f}, "
-            f"Water {vault.water:.0f} -> {new_resources['water']:.0f}"
+            "Vault %s: Power %.0f -> %.0f, Food %.0f -> %.0f, Water %.0f -> %.0f",
+            vault.id,
+            vault.power,
+            new_resources["power"],
+            vault.food,
+            new_resources["food"],
+            vault.water,
+            new_resources["water"],
         )
 
     @staticmethod
@@ -1,6 +1,13 @@
 """Storage service module with adapter pattern for RustFS."""
 
-from .base import StorageService
-from .factory import create_storage_service, get_storage_client
+from .base import AsyncStorageService, StorageService
+from .factory import create_async_storage_service, create_storage_service, get_async_storage_client, get_storage_client
 
-__all__ = ["StorageService", "create_storage_service", "get_storage_client"]
+__all__ = [
+    "AsyncStorageService",
+    "StorageService",
+    "create_async_storage_service",
+    "create_storage_service",
+    "get_async_storage_client",
+    "get_storage_client",
+]
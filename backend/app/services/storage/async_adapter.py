@@ -0,0 +1,224 @@
+"""Async facade over the RustFS adapter.
+
+boto3 clients are thread-safe but blocking, so every call runs on a dedicated,
+bounded executor sized to the botocore connection pool. That keeps storage I/O
+off the default executor (which ``asyncio.to_thread`` shares with everything
+else) and lets independent uploads — an image and its thumbnail, or the parts of
+a multipart upload — proceed concurrently.
+"""
+
+import asyncio
+import functools
+import logging
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from itertools import starmap
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from app.core.config import settings
+from app.utils.exceptions import FileUploadError
+
+from .rustfs_adapter import RustFSAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRustFSAdapter:
+    """RustFS storage adapter implementing the AsyncStorageService interface."""
+
+    def __init__(self, adapter: RustFSAdapter | None = None, *, max_workers: int | None = None):
+        self._adapter = adapter or RustFSAdapter()
+        self._max_workers = max_workers or settings.RUSTFS_MAX_POOL_CONNECTIONS
+        self._executor: ThreadPoolExecutor | None = None
+        self.multipart_threshold = settings.RUSTFS_MULTIPART_THRESHOLD
+        self.multipart_chunk_size = settings.RUSTFS_MULTIPART_CHUNK_SIZE
+        self.multipart_concurrency = settings.RUSTFS_MULTIPART_CONCURRENCY
+        self.download_chunk_size = settings.RUSTFS_DOWNLOAD_CHUNK_SIZE
+
+    @property
+    def enabled(self) -> bool:
+        return self._adapter.enabled
+
+    @property
+    def sync_adapter(self) -> RustFSAdapter:
+        """The underlying blocking adapter, for scripts and sync call sites."""
+        return self._adapter
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="storage-io")
+        return self._executor
+
+    async def _run[T](self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    async def upload_file(
+        self,
+        file_data: bytes,
+        file_name: str,
+        *,
+        file_type: str = "image/png",
+        bucket_name: str | None = None,
+    ) -> str:
+        if len(file_data) >= self.multipart_threshold:
+            return await self.upload_multipart(file_data, file_name, file_type=file_type, bucket_name=bucket_name)
+        return await self._run(
+            self._adapter.upload_file, file_data, file_name, file_type=file_type, bucket_name=bucket_name
+        )
+
+    async def upload_thumbnail(
+        self,
+        *,
+        file_data: bytes,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> str:
+        return await self._run(
+            self._adapter.upload_thumbnail, file_data=file_data, file_name=file_name, bucket_name=bucket_name
+        )
+
+    async def upload_image_with_thumbnail(
+        self,
+        *,
+        file_data: bytes,
+        file_name: str,
+        thumbnail_name: str,
+        bucket_name: str | None = None,
+        thumbnail_bucket_name: str | None = None,
+    ) -> tuple[str, str]:
+        image_url, thumbnail_url = await asyncio.gather(
+            self.upload_file(file_data, file_name, bucket_name=bucket_name),
+            self.upload_thumbnail(file_data=file_data, file_name=thumbnail_name, bucket_name=thumbnail_bucket_name),
+        )
+        return image_url, thumbnail_url
+
+    async def upload_multipart(
+        self,
+        file_data: bytes,
+        file_name: str,
+        *,
+        file_type: str = "application/octet-stream",
+        bucket_name: str | None = None,
+    ) -> str:
+        """Upload a large object as concurrently-sent parts, aborting the upload on failure."""
+        client = self._adapter.client
+        if not self.enabled or not client:
+            logger.warning(f"RustFS disabled, skipping upload for {file_name}")
+            return ""
+
+        bucket_name = await self._run(self._adapter.ensure_bucket, bucket_name)
+        try:
+            upload = await self._run(
+                client.create_multipart_upload, Bucket=bucket_name, Key=file_name, ContentType=file_type
+            )
+        except ClientError as e:
+            error_msg = f"Error starting multipart upload to RustFS: {e}"
+            raise FileUploadError(error_msg) from e
+        upload_id = upload["UploadId"]
+
+        view = memoryview(file_data)
+        chunk_size = self.multipart_chunk_size
+        semaphore = asyncio.Semaphore(self.multipart_concurrency)
+
+        async def _upload_part(part_number: int, offset: int) -> dict[str, Any]:
+            async with semaphore:
+                response = await self._run(
+                    client.upload_part,
+                    Bucket=bucket_name,
+                    Key=file_name,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=bytes(view[offset : offset + chunk_size]),
+                )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+
+        try:
+            parts = await asyncio.gather(
+                *starmap(_upload_part, enumerate(range(0, len(file_data), chunk_size), start=1))
+            )
+            await self._run(
+                client.complete_multipart_upload,
+                Bucket=bucket_name,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException as e:
+            # Abort on any failure, including timeouts and cancellation, so no upload is left open on
+            # the server; shielded so a repeated cancellation cannot interrupt the abort itself
+            with suppress(ClientError, BotoCoreError):
+                await asyncio.shield(
+                    self._run(client.abort_multipart_upload, Bucket=bucket_name, Key=file_name, UploadId=upload_id)
+                )
+            if isinstance(e, ClientError | BotoCoreError):
+                error_msg = f"Error uploading file to RustFS: {e}"
+                raise FileUploadError(error_msg) from e
+            raise
+
+        logger.info(f"Successfully uploaded {file_name} to {bucket_name} in {len(parts)} parts")
+        return self._adapter.uploaded_file_url(file_name=file_name, bucket_name=bucket_name)
+
+    async def download_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bytes:
+        return await self._run(self._adapter.download_file, file_name=file_name, bucket_name=bucket_name)
+
+    async def iter_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        body = await self._run(self._adapter.open_file_stream, file_name=file_name, bucket_name=bucket_name)
+        chunk_size = chunk_size or self.download_chunk_size
+        try:
+            while chunk := await self._run(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    def public_url(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> str:
+        return self._adapter.public_url(file_name=file_name, bucket_name=bucket_name)
+
+    async def delete_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        return await self._run(self._adapter.delete_file, file_name=file_name, bucket_name=bucket_name)
+
+    async def file_exists(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        return await self._run(self._adapter.file_exists, file_name=file_name, bucket_name=bucket_name)
+
+    async def list_files(
+        self,
+        *,
+        prefix: str = "",
+        bucket_name: str | None = None,
+    ) -> list[str]:
+        return await self._run(self._adapter.list_files, prefix=prefix, bucket_name=bucket_name)
+
+    def close(self) -> None:
+        """Release the executor threads; in-flight calls finish in the background."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,6 +1,7 @@
 """Abstract base class for storage service adapters."""
 
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 
@@ -152,3 +153,154 @@ class StorageService(Protocol):
             List of file names/keys
         """
         ...
+
+
+class AsyncStorageService(Protocol):
+    """Protocol for storage services that can be awaited directly from request handlers.
+
+    Mirrors :class:`StorageService` but never blocks the event loop, and adds the
+    batch/streaming operations that only make sense in async code.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the storage service is enabled and configured."""
+        ...
+
+    @abstractmethod
+    async def upload_file(
+        self,
+        file_data: bytes,
+        file_name: str,
+        *,
+        file_type: str = "image/png",
+        bucket_name: str | None = None,
+    ) -> str:
+        """Upload a file, switching to multipart upload above the configured threshold.
+
+        Args:
+            file_data: Raw bytes of the file
+            file_name: Name/key for the file
+            file_type: MIME type of the file
+            bucket_name: Optional bucket name (uses default if not specified)
+
+        Returns:
+            URL or identifier of the uploaded file
+
+        Raises:
+            FileUploadError: If upload fails
+        """
+        ...
+
+    @abstractmethod
+    async def upload_thumbnail(
+        self,
+        *,
+        file_data: bytes,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> str:
+        """Generate and upload a thumbnail version of an image.
+
+        Args:
+            file_data: Raw bytes of the original image
+            file_name: Name/key for the thumbnail
+            bucket_name: Optional bucket name
+
+        Returns:
+            URL of the uploaded thumbnail
+        """
+        ...
+
+    @abstractmethod
+    async def upload_image_with_thumbnail(
+        self,
+        *,
+        file_data: bytes,
+        file_name: str,
+        thumbnail_name: str,
+        bucket_name: str | None = None,
+        thumbnail_bucket_name: str | None = None,
+    ) -> tuple[str, str]:
+        """Upload an image and its thumbnail concurrently.
+
+        Args:
+            file_data: Raw bytes of the original image
+            file_name: Name/key for the full-size image
+            thumbnail_name: Name/key for the thumbnail
+            bucket_name: Optional bucket for the image
+            thumbnail_bucket_name: Optional bucket for the thumbnail
+
+        Returns:
+            Tuple of (image URL, thumbnail URL)
+        """
+        ...
+
+    @abstractmethod
+    async def download_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bytes:
+        """Download a whole file into memory.
+
+        Raises:
+            FileDownloadError: If download fails
+        """
+        ...
+
+    @abstractmethod
+    def iter_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file in chunks without buffering it entirely.
+
+        Raises:
+            FileDownloadError: If the object cannot be opened
+        """
+        ...
+
+    @abstractmethod
+    def public_url(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> str:
+        """Generate a public URL for accessing a file."""
+        ...
+
+    @abstractmethod
+    async def delete_file(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        """Delete a file from storage."""
+        ...
+
+    @abstractmethod
+    async def file_exists(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        """Check if a file exists in storage."""
+        ...
+
+    @abstractmethod
+    async def list_files(
+        self,
+        *,
+        prefix: str = "",
+        bucket_name: str | None = None,
+    ) -> list[str]:
+        """List files in storage with optional prefix filter."""
+        ...
@@ -1,10 +1,13 @@
-"""Factory for creating storage service instances."""
+"""Factory for creating storage service instances.
+
+The adapters (and boto3 behind them) are imported on first use, so importing the
+storage package costs nothing in processes that never touch object storage.
+"""
 
 import logging
 from functools import lru_cache
 
-from .base import StorageService
-from .rustfs_adapter import RustFSAdapter
+from .base import AsyncStorageService, StorageService
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,8 @@ def create_storage_service() -> StorageService | None:
         Returns None if storage is unavailable or misconfigured.
     """
     try:
+        from .rustfs_adapter import RustFSAdapter
+
         return RustFSAdapter()
     except Exception:
         logger.exception("Failed to initialize RustFS")
@@ -31,3 +36,28 @@ def get_storage_client() -> StorageService | None:
         Singleton storage service instance, or None if storage is unavailable.
     """
     return create_storage_service()
+
+
+def create_async_storage_service() -> AsyncStorageService | None:
+    """Factory function to create the async storage service.
+
+    Returns:
+        Async RustFS storage service sharing the cached sync adapter's client.
+        Returns None if storage is unavailable or misconfigured.
+    """
+    adapter = get_storage_client()
+    if adapter is None:
+        return None
+    from .async_adapter import AsyncRustFSAdapter
+
+    return AsyncRustFSAdapter(adapter)
+
+
+@lru_cache
+def get_async_storage_client() -> AsyncStorageService | None:
+    """Get cached async storage service instance.
+
+    Returns:
+        Singleton async storage service instance, or None if storage is unavailable.
+    """
+    return create_async_storage_service()
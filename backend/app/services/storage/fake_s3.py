@@ -0,0 +1,192 @@
+"""In-memory, MinIO-compatible stand-in for the boto3 S3 client.
+
+Implements the subset of the S3 API the storage adapters use, with the same
+response shapes and ``ClientError`` codes as MinIO/RustFS, so adapters can be
+exercised end-to-end in tests and benchmarks without a running object store.
+An optional per-request ``latency`` emulates network round trips.
+"""
+
+import hashlib
+import io
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from botocore.exceptions import ClientError
+
+
+@dataclass
+class _StoredObject:
+    body: bytes
+    content_type: str
+    etag: str
+
+
+@dataclass
+class _MultipartUpload:
+    bucket: str
+    key: str
+    content_type: str
+    parts: dict[int, bytes] = field(default_factory=dict)
+
+
+class FakeStreamingBody:
+    """Minimal ``botocore.response.StreamingBody`` replacement."""
+
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+        self.closed = False
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._stream.read(amt)
+
+    def iter_chunks(self, chunk_size: int = 1024):
+        while chunk := self.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _client_error(code: str, message: str, operation: str, status: int = 400) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": status}}, operation
+    )
+
+
+class FakeS3Client:
+    """Thread-safe in-memory S3 client."""
+
+    def __init__(self, *, latency: float = 0.0):
+        self.latency = latency
+        self.buckets: dict[str, dict[str, _StoredObject]] = {}
+        self.policies: dict[str, str] = {}
+        self.request_count = 0
+        self._uploads: dict[str, _MultipartUpload] = {}
+        self._lock = threading.Lock()
+
+    def _request(self) -> None:
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _bucket(self, bucket: str, operation: str) -> dict[str, _StoredObject]:
+        objects = self.buckets.get(bucket)
+        if objects is None:
+            raise _client_error("NoSuchBucket", "The specified bucket does not exist", operation, 404)
+        return objects
+
+    def head_bucket(self, *, Bucket: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        if Bucket not in self.buckets:
+            raise _client_error("404", "Not Found", "HeadBucket", 404)
+        return {}
+
+    def create_bucket(self, *, Bucket: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        with self._lock:
+            if Bucket in self.buckets:
+                raise _client_error("BucketAlreadyOwnedByYou", "Bucket already exists", "CreateBucket", 409)
+            self.buckets[Bucket] = {}
+        return {"Location": f"/{Bucket}"}
+
+    def put_bucket_policy(self, *, Bucket: str, Policy: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        self._bucket(Bucket, "PutBucketPolicy")
+        self.policies[Bucket] = Policy
+        return {}
+
+    def put_object(self, *, Bucket: str, Key: str, Body: Any, ContentType: str = "binary/octet-stream") -> dict:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        etag = f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'
+        with self._lock:
+            self._bucket(Bucket, "PutObject")[Key] = _StoredObject(data, ContentType, etag)
+        return {"ETag": etag}
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        stored = self._bucket(Bucket, "GetObject").get(Key)
+        if stored is None:
+            raise _client_error("NoSuchKey", "The specified key does not exist.", "GetObject", 404)
+        return {
+            "Body": FakeStreamingBody(stored.body),
+            "ContentLength": len(stored.body),
+            "ContentType": stored.content_type,
+            "ETag": stored.etag,
+        }
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        stored = self._bucket(Bucket, "HeadObject").get(Key)
+        if stored is None:
+            raise _client_error("404", "Not Found", "HeadObject", 404)
+        return {"ContentLength": len(stored.body), "ContentType": stored.content_type, "ETag": stored.etag}
+
+    def delete_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        with self._lock:
+            self._bucket(Bucket, "DeleteObject").pop(Key, None)
+        return {}
+
+    def list_objects_v2(self, *, Bucket: str, Prefix: str = "") -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        keys = sorted(key for key in self._bucket(Bucket, "ListObjectsV2") if key.startswith(Prefix))
+        contents = [{"Key": key, "Size": len(self.buckets[Bucket][key].body)} for key in keys]
+        return {"Contents": contents, "KeyCount": len(contents)} if contents else {"KeyCount": 0}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str, ContentType: str = "binary/octet-stream") -> dict:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        self._bucket(Bucket, "CreateMultipartUpload")
+        upload_id = uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = _MultipartUpload(Bucket, Key, ContentType)
+        return {"Bucket": Bucket, "Key": Key, "UploadId": upload_id}
+
+    def _upload(self, upload_id: str, operation: str) -> _MultipartUpload:
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise _client_error("NoSuchUpload", "The specified multipart upload does not exist.", operation, 404)
+        return upload
+
+    def upload_part(self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: Any) -> dict:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        with self._lock:
+            self._upload(UploadId, "UploadPart").parts[PartNumber] = data
+        return {"ETag": f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"'}
+
+    def complete_multipart_upload(
+        self,
+        *,
+        Bucket: str,  # ruff: ignore[invalid-argument-name]
+        Key: str,  # ruff: ignore[invalid-argument-name]
+        UploadId: str,  # ruff: ignore[invalid-argument-name]
+        MultipartUpload: dict[str, Any],  # ruff: ignore[invalid-argument-name]
+    ) -> dict[str, Any]:
+        self._request()
+        with self._lock:
+            upload = self._upload(UploadId, "CompleteMultipartUpload")
+            numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+            if numbers != sorted(numbers) or any(number not in upload.parts for number in numbers):
+                raise _client_error(
+                    "InvalidPart", "One or more of the specified parts could not be found.", "CompleteMultipartUpload"
+                )
+            data = b"".join(upload.parts[number] for number in numbers)
+            etag = f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}-{len(numbers)}"'
+            self._bucket(Bucket, "CompleteMultipartUpload")[Key] = _StoredObject(data, upload.content_type, etag)
+            del self._uploads[UploadId]
+        return {"Bucket": Bucket, "Key": Key, "ETag": etag}
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> dict[str, Any]:  # ruff: ignore[invalid-argument-name]
+        self._request()
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {}
+
+    @property
+    def pending_uploads(self) -> int:
+        return len(self._uploads)
@@ -16,10 +16,12 @@ logger = logging.getLogger(__name__)
 class RustFSAdapter:
     """RustFS storage adapter implementing the StorageService interface using boto3."""
 
-    def __init__(self):
-        self._client = None
+    def __init__(self, client=None):
+        """Create the adapter; an explicit ``client`` (e.g. ``FakeS3Client``) bypasses credential checks."""
+        self._client = client
+        self._known_buckets: set[str] = set()
         self.default_bucket_name = getattr(settings, "RUSTFS_DEFAULT_BUCKET", "fallout-shelter")
-        self._enabled = self._check_enabled()
+        self._enabled = client is not None or self._check_enabled()
 
         if not self._enabled:
             logger.info("RustFS not configured. Storage features will be disabled.")
@@ -42,10 +44,20 @@ class RustFSAdapter:
                 aws_access_key_id=getattr(settings, "RUSTFS_ACCESS_KEY", ""),
                 aws_secret_access_key=getattr(settings, "RUSTFS_SECRET_KEY", ""),
                 region_name="us-east-1",
-                config=Config(signature_version="s3v4"),
+                config=self._client_config(),
             )
         return self._client
 
+    @staticmethod
+    def _client_config() -> Config:
+        """Botocore config sized so the async facade's executor never waits on a pooled connection."""
+        return Config(
+            signature_version="s3v4",
+            max_pool_connections=getattr(settings, "RUSTFS_MAX_POOL_CONNECTIONS", 32),
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
+        )
+
     @property
     def enabled(self) -> bool:
         return self._enabled
@@ -68,7 +80,7 @@ class RustFSAdapter:
         return self._get_endpoint_url()
 
     def _ensure_bucket_exists(self, bucket_name: str) -> None:
-        if not self.enabled:
+        if not self.enabled or bucket_name in self._known_buckets:
             return
         client = self._client
         if client is None:
@@ -84,6 +96,11 @@ class RustFSAdapter:
                     logger.info(f"Created bucket: {bucket_name}")
                     bucket_created = True
                 except ClientError as create_error:
+                    create_code = create_error.response.get("Error", {}).get("Code", "Unknown")
+                    if create_code in {"BucketAlreadyOwnedByYou", "BucketAlreadyExists"}:
+                        # A concurrent upload created it between our HEAD and CREATE
+                        self._known_buckets.add(bucket_name)
+                        return
                     error_msg = f"Error creating bucket {bucket_name}: {create_error}"
                     raise BucketNotFoundError(error_msg) from create_error
             else:
@@ -93,6 +110,8 @@ class RustFSAdapter:
         # Set public policy for whitelisted buckets (only after creation or if needed)
         if bucket_created:
             self._ensure_bucket_policy(bucket_name)
+        # Buckets are never deleted at runtime, so skip the HEAD round trip on later uploads
+        self._known_buckets.add(bucket_name)
 
     def _is_public_bucket(self, bucket_name: str) -> bool:
         whitelist = getattr(settings, "RUSTFS_PUBLIC_BUCKET_WHITELIST", [])
@@ -161,9 +180,19 @@ class RustFSAdapter:
             error_msg = f"Error uploading file to RustFS: {e}"
             raise FileUploadError(error_msg) from e
         else:
-            if self._is_public_bucket(bucket_name):
-                return self.public_url(file_name=file_name, bucket_name=bucket_name)
-            return file_name
+            return self.uploaded_file_url(file_name=file_name, bucket_name=bucket_name)
+
+    def uploaded_file_url(self, *, file_name: str, bucket_name: str) -> str:
+        """Return what upload callers store: the public URL for whitelisted buckets, else the key."""
+        if self._is_public_bucket(bucket_name):
+            return self.public_url(file_name=file_name, bucket_name=bucket_name)
+        return file_name
+
+    def ensure_bucket(self, bucket_name: str | None = None) -> str:
+        """Make sure the bucket exists (creating it if needed) and return its resolved name."""
+        bucket_name = bucket_name or self.default_bucket_name
+        self._ensure_bucket_exists(bucket_name)
+        return bucket_name
 
     def upload_thumbnail(
         self,
@@ -186,6 +215,15 @@ class RustFSAdapter:
         file_name: str,
         bucket_name: str | None = None,
     ) -> bytes:
+        return self.open_file_stream(file_name=file_name, bucket_name=bucket_name).read()
+
+    def open_file_stream(
+        self,
+        *,
+        file_name: str,
+        bucket_name: str | None = None,
+    ):
+        """Open an object for reading and return botocore's ``StreamingBody`` without buffering it."""
         if not self.enabled or not self.client:
             logger.warning(f"RustFS disabled, cannot download {file_name}")
             msg = "RustFS is not available"
@@ -194,10 +232,10 @@ class RustFSAdapter:
         bucket_name = bucket_name or self.default_bucket_name
         try:
             response = self.client.get_object(Bucket=bucket_name, Key=file_name)
-            return response["Body"].read()
         except ClientError as e:
             error_msg = f"Error downloading file from RustFS: {e}"
             raise FileDownloadError(error_msg) from e
+        return response["Body"]
 
     def public_url(
         self,
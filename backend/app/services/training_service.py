@@ -190,44 +190,28 @@ class TrainingService:
 
         return training
 
-    async def update_training_progress(
+    async def complete_if_due(
         self,
         db_session: AsyncSession,
         training: Training,
         dweller: Dweller | None = None,
     ) -> Training:
-        """Update training progress based on elapsed time.
-        Auto-completes training if duration has elapsed.
+        """Complete training if its duration has elapsed.
+
+        Progress itself is never written while a session runs: it is derived
+        from the timestamps on read (``Training.current_progress``).
 
         Args:
             db_session: Database session
-            training: Training session to update
+            training: Training session to check
             dweller: Optional pre-fetched dweller to avoid N+1 query
 
         Returns:
-            Updated training session
+            The completed training session, or the unchanged one if not yet due
         """
-        if not training.is_active():
+        if not training.is_ready_to_complete():
             return training
-
-        now = datetime.utcnow()
-
-        # Check if training is complete
-        if now >= training.estimated_completion_at:
-            return await self.complete_training(db_session, training.id, dweller=dweller)
-
-        # Calculate progress
-        total_duration = (training.estimated_completion_at - training.started_at).total_seconds()
-        elapsed = (now - training.started_at).total_seconds()
-        progress = min(1.0, elapsed / total_duration)
-
-        # Update progress
-        training.progress = progress
-        db_session.add(training)
-        await db_session.commit()
-        await db_session.refresh(training)
-
-        return training
+        return await self.complete_training(db_session, training.id, dweller=dweller)
 
     async def complete_training(
         self,
@@ -0,0 +1,76 @@
+"""Per-vault activity snapshot used to skip tick phases that have nothing to do."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from pydantic import UUID4
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.dweller import Dweller
+from app.models.exploration import Exploration
+from app.models.incident import Incident, IncidentStatus
+from app.models.pregnancy import Pregnancy
+from app.models.room import Room
+from app.models.training import Training
+from app.schemas.common import AgeGroupEnum, PregnancyStatusEnum, RoomTypeEnum
+
+
+@dataclass(frozen=True, slots=True)
+class VaultActivity:
+    """Counts of the things each tick phase works on, read once at the start of a tick.
+
+    Counts are deliberately broader than the phases' own filters (e.g. any
+    capacity room counts as living quarters), so a zero always means the phase
+    would have found nothing. Explorations and trainings are counted only when
+    they have an event or completion due, so ticks in between skip them.
+    """
+
+    population: int = 0
+    active_incidents: int = 0
+    due_explorations: int = 0
+    due_trainings: int = 0
+    living_quarters_dwellers: int = 0
+    cohabiting_partners: int = 0
+    pending_pregnancies: int = 0
+    children: int = 0
+
+
+async def load_vault_activity(db_session: AsyncSession, vault_id: UUID4) -> VaultActivity:
+    """Read every :class:`VaultActivity` counter for a vault in a single query."""
+    now = datetime.utcnow()
+    living_quarters = select(Room.id).where(Room.vault_id == vault_id).where(Room.category == RoomTypeEnum.CAPACITY)
+    partner = aliased(Dweller)
+
+    counters = {
+        "population": select(func.count(Dweller.id)).where(Dweller.vault_id == vault_id),
+        "active_incidents": select(func.count(Incident.id))
+        .where(Incident.vault_id == vault_id)
+        .where(Incident.status.in_([IncidentStatus.ACTIVE, IncidentStatus.SPREADING])),
+        "due_explorations": select(func.count(Exploration.id))
+        .where(Exploration.vault_id == vault_id)
+        .where(Exploration.due_by(now)),
+        "due_trainings": select(func.count(Training.id))
+        .where(Training.vault_id == vault_id)
+        .where(Training.due_by(now)),
+        "living_quarters_dwellers": select(func.count(Dweller.id))
+        .where(Dweller.vault_id == vault_id)
+        .where(Dweller.room_id.in_(living_quarters)),
+        "cohabiting_partners": select(func.count(Dweller.id))
+        .join(partner, partner.id == Dweller.partner_id)
+        .where(Dweller.vault_id == vault_id)
+        .where(Dweller.room_id.in_(living_quarters))
+        .where(partner.room_id.in_(living_quarters)),
+        "pending_pregnancies": select(func.count(Pregnancy.id))
+        .join(Dweller, Pregnancy.mother_id == Dweller.id)
+        .where(Dweller.vault_id == vault_id)
+        .where(Pregnancy.status == PregnancyStatusEnum.PREGNANT),
+        "children": select(func.count(Dweller.id))
+        .where(Dweller.vault_id == vault_id)
+        .where(Dweller.age_group == AgeGroupEnum.CHILD),
+    }
+    query = select(*(statement.scalar_subquery().label(name) for name, statement in counters.items()))
+    row = (await db_session.execute(query)).one()
+    return VaultActivity(**row._asdict())
@@ -1,29 +1,162 @@
 """Service for vault initialization and resource management."""
 
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from pydantic import UUID4
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import select
+from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.game_data_deps import get_static_game_data
-from app.core.game_config import compute_medical_capacity
+from app.core.game_config import compute_medical_capacity, game_config
 from app.crud import dweller as dweller_crud
 from app.crud import room as room_crud
 from app.crud.vault import vault as vault_crud
 from app.models import Room, Storage
+from app.models.base import SPECIALModel
+from app.models.dweller import Dweller
+from app.models.objective import Objective
+from app.models.outfit import Outfit
+from app.models.training import Training, TrainingStatus
 from app.models.vault import Vault
 from app.models.vault_objective import VaultObjectiveProgressLink
-from app.schemas.common import DwellerStatusEnum, GenderEnum, RoomTypeEnum, SPECIALEnum
-from app.schemas.dweller import DwellerCreateCommonOverride, DwellerUpdate
+from app.models.wasteland_location import DwellerLocation, WastelandLocation
+from app.models.weapon import Weapon
+from app.schemas.common import (
+    DwellerStatusEnum,
+    GenderEnum,
+    OutfitTypeEnum,
+    RarityEnum,
+    RoomTypeEnum,
+    SPECIALEnum,
+    WeaponSubtypeEnum,
+    WeaponTypeEnum,
+)
+from app.schemas.dweller import DwellerCreateCommonOverride
 from app.schemas.room import RoomCreate
-from app.schemas.vault import MedicalTransferResponse, VaultNumber, VaultUpdate
+from app.schemas.vault import MedicalTransferResponse, VaultCreateWithUserID, VaultNumber
+from app.services.map_service import map_service
 from app.services.resource_manager import ResourceManager
 from app.services.training_service import training_service
-from app.utils.dwellers import group_dwellers_by_room
 from app.utils.exceptions import ResourceConflictException, ResourceNotFoundException
 
+# Boosted stat for the two dwellers staffing each of power, food and water production
+_PRODUCTION_STATS = (SPECIALEnum.STRENGTH, SPECIALEnum.AGILITY, SPECIALEnum.PERCEPTION)
+
+# Training rooms are laid out in this order, one per SPECIAL stat
+_TRAINING_STATS = (
+    SPECIALEnum.STRENGTH,
+    SPECIALEnum.PERCEPTION,
+    SPECIALEnum.ENDURANCE,
+    SPECIALEnum.CHARISMA,
+    SPECIALEnum.INTELLIGENCE,
+    SPECIALEnum.AGILITY,
+    SPECIALEnum.LUCK,
+)
+
+_STARTER_WEAPONS: tuple[dict, ...] = (
+    {
+        "name": "Rusty Pistol",
+        "rarity": RarityEnum.COMMON,
+        "value": 50,
+        "weapon_type": WeaponTypeEnum.GUN,
+        "weapon_subtype": WeaponSubtypeEnum.PISTOL,
+        "stat": "agility",
+        "damage_min": 2,
+        "damage_max": 5,
+    },
+    {
+        "name": "Hunting Rifle",
+        "rarity": RarityEnum.RARE,
+        "value": 150,
+        "weapon_type": WeaponTypeEnum.GUN,
+        "weapon_subtype": WeaponSubtypeEnum.RIFLE,
+        "stat": "perception",
+        "damage_min": 5,
+        "damage_max": 12,
+    },
+    {
+        "name": "Sledgehammer",
+        "rarity": RarityEnum.RARE,
+        "value": 300,
+        "weapon_type": WeaponTypeEnum.MELEE,
+        "weapon_subtype": WeaponSubtypeEnum.BLUNT,
+        "stat": "strength",
+        "damage_min": 8,
+        "damage_max": 15,
+    },
+    {
+        "name": "Laser Pistol",
+        "rarity": RarityEnum.LEGENDARY,
+        "value": 500,
+        "weapon_type": WeaponTypeEnum.ENERGY,
+        "weapon_subtype": WeaponSubtypeEnum.PISTOL,
+        "stat": "intelligence",
+        "damage_min": 10,
+        "damage_max": 20,
+    },
+)
+
+_STARTER_OUTFITS: tuple[dict, ...] = (
+    {"name": "Vault Jumpsuit", "rarity": RarityEnum.COMMON, "value": 20, "outfit_type": OutfitTypeEnum.COMMON},
+    {"name": "Leather Armor", "rarity": RarityEnum.RARE, "value": 100, "outfit_type": OutfitTypeEnum.RARE},
+    {"name": "Metal Armor", "rarity": RarityEnum.RARE, "value": 250, "outfit_type": OutfitTypeEnum.RARE},
+    {
+        "name": "T-51b Power Armor",
+        "rarity": RarityEnum.LEGENDARY,
+        "value": 1000,
+        "outfit_type": OutfitTypeEnum.POWER_ARMOR,
+    },
+)
+
+# Equipped legendary roster for boosted vaults: template name -> (weapon, outfit)
+_LEGENDARY_LOADOUTS = {
+    "Abraham Washington": ("Lever-action rifle", "Abraham's relaxedwear"),
+    "Allistair Tenpenny": ("Hunting rifle", "Eulogy Jones' suit"),
+    "Bittercup": ("10mm pistol", "Bittercup's outfit"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class VaultProvisionSpec:
+    """One vault to provision."""
+
+    obj_in: VaultNumber
+    user_id: UUID4
+    is_boosted: bool = False
+
+
+@dataclass(slots=True)
+class VaultGraph:
+    """Every row of a new vault, built in memory and not yet added to a session."""
+
+    vault: Vault
+    storage: Storage
+    rooms: list[Room] = field(default_factory=list)
+    dwellers: list[Dweller] = field(default_factory=list)
+    trainings: list[Training] = field(default_factory=list)
+    items: list[Weapon | Outfit] = field(default_factory=list)
+    objective_links: list[VaultObjectiveProgressLink] = field(default_factory=list)
+    locations: list[WastelandLocation] = field(default_factory=list)
+    location_links: list[DwellerLocation] = field(default_factory=list)
+
+    @staticmethod
+    def insert_stages(graphs: Sequence["VaultGraph"]) -> list[list[SQLModel]]:
+        """Group the rows of many graphs so each stage only references rows from earlier stages."""
+        return [
+            [graph.vault for graph in graphs],
+            [row for graph in graphs for row in (graph.storage, *graph.rooms, *graph.locations)],
+            [dweller for graph in graphs for dweller in graph.dwellers],
+            [
+                row
+                for graph in graphs
+                for row in (*graph.trainings, *graph.items, *graph.objective_links, *graph.location_links)
+            ],
+        ]
+
 
 class VaultService:
     """Service for vault initialization and management."""
@@ -129,468 +262,268 @@ class VaultService:
 
         return infrastructure_rooms, capacity_rooms, production_rooms, misc_rooms, training_rooms
 
-    async def _create_initial_rooms(
-        self,
-        db_session: AsyncSession,
-        vault: Vault,
-        infrastructure_rooms: list[RoomCreate],
-        capacity_rooms: list[RoomCreate],
-        production_rooms: list[RoomCreate],
-        misc_rooms: list[RoomCreate],
-        training_rooms: list[RoomCreate],
-    ) -> tuple[Vault, list[Room], list[Room], list[Room], list[Room]]:
-        """Create all rooms for a new vault and return production/training rooms."""
-        # Create infrastructure rooms
-        for room_data in infrastructure_rooms:
-            await room_crud.create(db_session, room_data)
-
-        # Create capacity rooms and update vault max capacities
-        created_capacity_rooms = []
-        for room_data in capacity_rooms:
-            created_room = await room_crud.create(db_session, room_data)
-            created_capacity_rooms.append(created_room)
-            # Update vault capacities based on new rooms
-            if created_room.category == RoomTypeEnum.CAPACITY:
-                # Living rooms: ability=Charisma
-                if created_room.ability == SPECIALEnum.CHARISMA:
-                    vault.population_max += created_room.capacity or 0
-                # Storage rooms: ability=Endurance
-                elif created_room.ability == SPECIALEnum.ENDURANCE and created_room.capacity:
-                    # Storage rooms increase Storage.max_space, not individual vault capacities
-                    # Query current storage max_space to avoid lazy load issue
-                    storage_result = await db_session.execute(
-                        select(Storage.max_space).where(Storage.vault_id == vault.id)
-                    )
-                    current_max_space = storage_result.scalar_one_or_none() or 0
-                    await vault_crud.update_storage(db_session, vault.id, current_max_space + created_room.capacity)
-
-        await db_session.commit()
-        await db_session.refresh(vault)
-
-        # Create production rooms and update vault capacities
-        created_production_rooms = []
-        for room_data in production_rooms:
-            created_room = await room_crud.create(db_session, room_data)
-            created_production_rooms.append(created_room)
-
-            # Update vault capacities based on room ability (strength→power, agility→food, perception→water)
-            if created_room.ability and created_room.capacity:
-                ability_lower = created_room.ability.value.lower()
-                if ability_lower == "strength":
-                    vault.power_max += created_room.capacity
-                elif ability_lower == "agility":
-                    vault.food_max += created_room.capacity
-                elif ability_lower == "perception":
-                    vault.water_max += created_room.capacity
-
-        # Create misc rooms
-        created_misc_rooms = []
-        for room_data in misc_rooms:
-            created_room = await room_crud.create(db_session, room_data)
-            created_misc_rooms.append(created_room)
-
-        # Create training rooms
-        created_training_rooms = []
-        for room_data in training_rooms:
-            created_room = await room_crud.create(db_session, room_data)
-            created_training_rooms.append(created_room)
-
-        await db_session.commit()
-
-        # Refresh vault and room objects
-        await db_session.refresh(vault)
-        for room in created_production_rooms + created_training_rooms + created_misc_rooms + created_capacity_rooms:
-            await db_session.refresh(room)
-
-        return vault, created_production_rooms, created_training_rooms, created_misc_rooms, created_capacity_rooms
-
-    async def _create_initial_dwellers(
-        self,
-        db_session: AsyncSession,
-        vault_id: UUID4,
-        created_production_rooms: list[Room],
-        created_training_rooms: list[Room],
-        created_misc_rooms: list[Room],
-        created_capacity_rooms: list[Room],
-        is_boosted: bool,
-    ) -> None:
-        """Create and assign initial dwellers to production and training rooms."""
-        try:
-            assignments = [
-                (room, stat, 2)
-                for room, stat in zip(
-                    created_production_rooms[:3],
-                    (SPECIALEnum.STRENGTH, SPECIALEnum.AGILITY, SPECIALEnum.PERCEPTION),
-                    strict=True,
-                )
-            ]
-            if is_boosted and len(created_production_rooms) >= 5:
-                assignments.extend((room, SPECIALEnum.INTELLIGENCE, 2) for room in created_production_rooms[3:5])
-            for room, boosted_stat, count in assignments:
-                for _ in range(count):
-                    dweller_obj = await dweller_crud.create_random(
-                        db_session, vault_id, DwellerCreateCommonOverride(special_boost=boosted_stat)
-                    )
-                    await dweller_crud.update(
-                        db_session=db_session,
-                        id=dweller_obj.id,
-                        obj_in=DwellerUpdate(room_id=room.id, status=DwellerStatusEnum.WORKING),
-                    )
-                    self.logger.info("Dweller %s assigned to %s", dweller_obj.id, room.name)
-
-            # Training dwellers (boosted only)
-            if is_boosted:
-                training_stats = [
-                    SPECIALEnum.STRENGTH,
-                    SPECIALEnum.PERCEPTION,
-                    SPECIALEnum.ENDURANCE,
-                    SPECIALEnum.CHARISMA,
-                    SPECIALEnum.INTELLIGENCE,
-                    SPECIALEnum.AGILITY,
-                    SPECIALEnum.LUCK,
-                ]
-
-                for i, training_stat in enumerate(training_stats):
-                    if i < len(created_training_rooms):
-                        room = created_training_rooms[i]
-                        dweller_data = DwellerCreateCommonOverride(special_boost=training_stat)
-                        dweller_obj = await dweller_crud.create_random(db_session, vault_id, dweller_data)
-
-                        # Assign to training room with IDLE status (training service will update status)
-
-                        await dweller_crud.update(
-                            db_session=db_session,
-                            id=dweller_obj.id,
-                            obj_in=DwellerUpdate(room_id=room.id, status=DwellerStatusEnum.IDLE),
-                        )
-                        self.logger.info(f"Dweller {dweller_obj.id} assigned to training room {room.id}")
-
-            # Radio studio dweller (Charisma-based, for recruitment)
-            if created_misc_rooms:
-                radio_room = next((r for r in created_misc_rooms if "radio" in r.name.lower()), None)
-                if radio_room:
-                    dweller_data = DwellerCreateCommonOverride(special_boost=SPECIALEnum.CHARISMA)
-                    dweller_obj = await dweller_crud.create_random(db_session, vault_id, dweller_data)
-                    await dweller_crud.update(
-                        db_session=db_session,
-                        id=dweller_obj.id,
-                        obj_in=DwellerUpdate(room_id=radio_room.id, status=DwellerStatusEnum.WORKING),
-                    )
-                    self.logger.info(f"Dweller {dweller_obj.id} assigned to Radio Studio")
-
-            living_rooms = [r for r in created_capacity_rooms if "living" in r.name.lower()]
-            if living_rooms:
-                living_room = living_rooms[0]
-                for gender in (GenderEnum.MALE, GenderEnum.FEMALE):
-                    dweller_data = DwellerCreateCommonOverride(
-                        gender=gender,
-                        special_boost=SPECIALEnum.CHARISMA if is_boosted else None,
-                    )
-                    dweller = await dweller_crud.create_random(db_session, vault_id, dweller_data)
-                    await dweller_crud.update(
-                        db_session=db_session,
-                        id=dweller.id,
-                        obj_in=DwellerUpdate(room_id=living_room.id, status=DwellerStatusEnum.RESTING),
-                    )
-                    self.logger.info("Dweller %s assigned to living quarters for socializing", dweller.id)
+    @staticmethod
+    def _plan_training(dweller: Dweller, room: Room, now: datetime) -> Training | None:
+        """Start a training session in memory, or return None if the dweller cannot train here.
 
-        except Exception:
-            self.logger.exception("Failed to create dwellers")
-            raise
+        Same rules as ``TrainingService.can_start_training``, minus the lookups
+        that are trivially satisfied in an empty vault (no active sessions yet).
+        """
+        if room.category != RoomTypeEnum.TRAINING or not room.ability:
+            return None
+        current_stat_value = SPECIALModel.get_stat(dweller, room.ability)
+        if current_stat_value >= game_config.training.special_stat_max:
+            return None
+        duration_seconds = training_service.calculate_training_duration(current_stat_value, room.tier)
+        return Training(
+            dweller_id=dweller.id,
+            room_id=room.id,
+            vault_id=dweller.vault_id,
+            stat_being_trained=room.ability,
+            current_stat_value=current_stat_value,
+            target_stat_value=current_stat_value + 1,
+            progress=0.0,
+            started_at=now,
+            estimated_completion_at=now + timedelta(seconds=duration_seconds),
+            status=TrainingStatus.ACTIVE,
+        )
 
-    async def _start_training_sessions(
+    def build_vault_graph(
         self,
-        db_session: AsyncSession,
-        vault_id: UUID4,
-        created_training_rooms: list[Room],
-        is_boosted: bool,
-    ) -> None:
-        """Start training sessions for dwellers in training rooms (boosted only)."""
-        if not is_boosted or not created_training_rooms:
-            return
+        spec: VaultProvisionSpec,
+        room_templates: list[RoomCreate],
+        objectives: Sequence[Objective] = (),
+    ) -> VaultGraph:
+        """Lay out a complete starting vault in memory, without touching the database.
 
-        try:
-            # Batch-fetch all dwellers in training rooms via CRUD
-            room_ids = [room.id for room in created_training_rooms]
-            # Get all dwellers in vault via CRUD
-            vault_dwellers = await dweller_crud.get_multi_by_vault(db_session, vault_id)
-            # Filter by room_ids (training rooms)
-            all_dwellers = [d for d in vault_dwellers if d.room_id in room_ids]
-
-            # Group dwellers by room_id for processing
-            dwellers_by_room = group_dwellers_by_room(all_dwellers)
-
-            # Process each training room
-            for room in created_training_rooms:
-                # Re-fetch room to ensure all fields are loaded
-                await db_session.refresh(room)
-                self.logger.info(f"Room {room.id} ({room.name}) - tier: {room.tier}, ability: {room.ability}")
-
-                dwellers = dwellers_by_room.get(room.id, [])
-
-                for dweller in dwellers:
-                    try:
-                        # Refresh dweller to ensure all fields loaded
-                        await db_session.refresh(dweller)
-
-                        # Debug: Check dweller stats
-                        stat_name = room.ability.value.lower() if room.ability else "unknown"
-                        stat_value = getattr(dweller, stat_name, None) if room.ability else None
-                        self.logger.info(
-                            f"Dweller {dweller.id} {stat_name}={stat_value}, "
-                            f"all stats: S={dweller.strength}, P={dweller.perception}, "
-                            f"E={dweller.endurance}, status={dweller.status}"
-                        )
-
-                        await training_service.start_training(db_session, dweller.id, room.id)
-                        self.logger.info(f"Started training for dweller {dweller.id} in room {room.id}")
-                    except (ResourceNotFoundException, ResourceConflictException, ValueError) as e:
-                        # Log error but continue with other dwellers
-                        self.logger.warning(f"Failed to start training for dweller {dweller.id} in room {room.id}: {e}")
-        except Exception:
-            self.logger.exception("Failed to start training sessions")
-            raise
+        Standard vault includes:
+        - Vault door and elevators (infrastructure)
+        - Production rooms (power generator, diner, water treatment) with assigned dwellers
+        - Storage room and 1 living room
+        - Radio studio (for recruitment)
+        - 9 dwellers: 6 in production, 1 in the radio studio, 2 socializing in the living room
+        - Starter weapons and outfits in storage, plus the given objectives
 
-    async def _create_initial_items(self, db_session: AsyncSession, vault_id: UUID4) -> None:
-        """Create initial weapons and outfits for testing."""
-        from sqlmodel import select
-
-        from app.models.outfit import Outfit
-        from app.models.storage import Storage
-        from app.models.weapon import Weapon
-        from app.schemas.common import (
-            OutfitTypeEnum,
-            RarityEnum,
-            WeaponSubtypeEnum,
-            WeaponTypeEnum,
-        )
+        Boosted vault additionally includes:
+        - All 7 training rooms (one for each SPECIAL stat), each with a dweller already training
+        - Medbay, Science Lab and Overseer's Office, with 2 dwellers each in the Medbay and Science Lab
+        - 2 additional living rooms
+        - 3 equipped legendary dwellers (23 dwellers total)
+        """
         from app.utils.outfit_assets import get_outfit_image_url
+        from app.utils.static_data import game_data_store
         from app.utils.weapon_assets import get_weapon_image_url
 
-        result = await db_session.execute(select(Storage).where(Storage.vault_id == vault_id))
-        storage = result.scalar_one_or_none()
-        if not storage:
-            return
+        is_boosted = spec.is_boosted
+        vault = Vault.model_validate(VaultCreateWithUserID(**spec.obj_in.model_dump(), user_id=spec.user_id))
+        storage = Storage(vault_id=vault.id)
+        graph = VaultGraph(vault=vault, storage=storage)
 
-        weapons_data = [
-            {
-                "name": "Rusty Pistol",
-                "rarity": RarityEnum.COMMON,
-                "value": 50,
-                "weapon_type": WeaponTypeEnum.GUN,
-                "weapon_subtype": WeaponSubtypeEnum.PISTOL,
-                "stat": "agility",
-                "damage_min": 2,
-                "damage_max": 5,
-            },
-            {
-                "name": "Hunting Rifle",
-                "rarity": RarityEnum.RARE,
-                "value": 150,
-                "weapon_type": WeaponTypeEnum.GUN,
-                "weapon_subtype": WeaponSubtypeEnum.RIFLE,
-                "stat": "perception",
-                "damage_min": 5,
-                "damage_max": 12,
-            },
-            {
-                "name": "Sledgehammer",
-                "rarity": RarityEnum.RARE,
-                "value": 300,
-                "weapon_type": WeaponTypeEnum.MELEE,
-                "weapon_subtype": WeaponSubtypeEnum.BLUNT,
-                "stat": "strength",
-                "damage_min": 8,
-                "damage_max": 15,
-            },
-            {
-                "name": "Laser Pistol",
-                "rarity": RarityEnum.LEGENDARY,
-                "value": 500,
-                "weapon_type": WeaponTypeEnum.ENERGY,
-                "weapon_subtype": WeaponSubtypeEnum.PISTOL,
-                "stat": "intelligence",
-                "damage_min": 10,
-                "damage_max": 20,
-            },
-        ]
-
-        outfits_data = [
-            {
-                "name": "Vault Jumpsuit",
-                "rarity": RarityEnum.COMMON,
-                "value": 20,
-                "outfit_type": OutfitTypeEnum.COMMON,
-                "gender": None,
-            },
-            {
-                "name": "Leather Armor",
-                "rarity": RarityEnum.RARE,
-                "value": 100,
-                "outfit_type": OutfitTypeEnum.RARE,
-                "gender": None,
-            },
-            {
-                "name": "Metal Armor",
-                "rarity": RarityEnum.RARE,
-                "value": 250,
-                "outfit_type": OutfitTypeEnum.RARE,
-                "gender": None,
-            },
-            {
-                "name": "T-51b Power Armor",
-                "rarity": RarityEnum.LEGENDARY,
-                "value": 1000,
-                "outfit_type": OutfitTypeEnum.POWER_ARMOR,
-                "gender": None,
-            },
+        # --- rooms, and the capacities they grant ---
+        infrastructure, capacity, production, misc, training = self._prepare_initial_rooms(
+            room_templates, vault.id, is_boosted
+        )
+        capacity_rooms = [Room.model_validate(room) for room in capacity]
+        production_rooms = [Room.model_validate(room) for room in production]
+        misc_rooms = [Room.model_validate(room) for room in misc]
+        training_rooms = [Room.model_validate(room) for room in training]
+        graph.rooms = [
+            *(Room.model_validate(room) for room in infrastructure),
+            *capacity_rooms,
+            *production_rooms,
+            *misc_rooms,
+            *training_rooms,
         ]
 
-        for weapon_data in weapons_data:
-            weapon_data["image_url"] = get_weapon_image_url(weapon_data["name"])
-            weapon = Weapon(**weapon_data, storage_id=storage.id)
-            db_session.add(weapon)
-
-        for outfit_data in outfits_data:
-            outfit_data["image_url"] = get_outfit_image_url(outfit_data["name"])
-            outfit = Outfit(**outfit_data, storage_id=storage.id)
-            db_session.add(outfit)
-
-        await db_session.commit()
-        self.logger.info(f"Created initial items for vault {vault_id}")
-
-    async def _create_boosted_legendary_dwellers(self, db_session: AsyncSession, vault_id: UUID4) -> None:
-        """Add a small, equipped legendary roster for boosted-vault testing."""
-        from app.models.dweller import Dweller
-        from app.models.outfit import Outfit
-        from app.models.weapon import Weapon
-        from app.schemas.common import OutfitTypeEnum, RarityEnum, WeaponSubtypeEnum, WeaponTypeEnum
-        from app.utils.outfit_assets import get_outfit_image_url
-        from app.utils.static_data import game_data_store
-        from app.utils.weapon_assets import get_weapon_image_url
+        for room in capacity_rooms:
+            if room.category != RoomTypeEnum.CAPACITY:
+                continue
+            if room.ability == SPECIALEnum.CHARISMA:
+                vault.population_max = (vault.population_max or 0) + (room.capacity or 0)
+            elif room.ability == SPECIALEnum.ENDURANCE and room.capacity:
+                storage.max_space += room.capacity
+
+        for room in production_rooms:
+            if room.ability and room.capacity:
+                if room.ability == SPECIALEnum.STRENGTH:
+                    vault.power_max += room.capacity
+                elif room.ability == SPECIALEnum.AGILITY:
+                    vault.food_max += room.capacity
+                elif room.ability == SPECIALEnum.PERCEPTION:
+                    vault.water_max += room.capacity
+
+        # Start resources at 50% of capacity, and medical supplies from Medbay/Science Lab
+        vault.power = vault.power_max // 2
+        vault.food = vault.food_max // 2
+        vault.water = vault.water_max // 2
+        medical_capacity = compute_medical_capacity(graph.rooms)
+        storage.stimpack = min(5, medical_capacity.get("stimpack", 0))
+        storage.radaway = min(5, medical_capacity.get("radaway", 0))
+
+        # --- dwellers ---
+        bio_entries: list[tuple[Dweller, str, list[str]]] = []
+
+        def recruit(room: Room, status: DwellerStatusEnum, overrides: DwellerCreateCommonOverride) -> Dweller:
+            dweller, bio_places = dweller_crud.build_random(vault.id, overrides)
+            dweller.room_id = room.id
+            dweller.status = status
+            graph.dwellers.append(dweller)
+            if bio_places:
+                bio_entries.append((dweller, *bio_places))
+            return dweller
+
+        staffed = list(zip(production_rooms[:3], _PRODUCTION_STATS, strict=True))
+        if is_boosted and len(production_rooms) >= 5:
+            staffed.extend((room, SPECIALEnum.INTELLIGENCE) for room in production_rooms[3:5])
+        for room, boosted_stat in staffed:
+            for _ in range(2):
+                recruit(room, DwellerStatusEnum.WORKING, DwellerCreateCommonOverride(special_boost=boosted_stat))
 
-        loadouts = {
-            "Abraham Washington": ("Lever-action rifle", "Abraham's relaxedwear"),
-            "Allistair Tenpenny": ("Hunting rifle", "Eulogy Jones' suit"),
-            "Bittercup": ("10mm pistol", "Bittercup's outfit"),
-        }
-        templates = {
-            f"{dweller.first_name} {dweller.last_name or ''}".strip(): dweller
-            for dweller in game_data_store.dwellers
-            if dweller.rarity.lower() == RarityEnum.LEGENDARY.value
-        }
-
-        for name, (weapon_name, outfit_name) in loadouts.items():
-            template = templates[name]
-            dweller = Dweller(**template.model_dump(exclude={"weapon", "outfit"}), vault_id=vault_id)
-            db_session.add(dweller)
-            await db_session.flush()
-            db_session.add(
-                Weapon(
-                    name=weapon_name,
-                    rarity=RarityEnum.LEGENDARY,
-                    weapon_type=WeaponTypeEnum.GUN,
-                    weapon_subtype=WeaponSubtypeEnum.RIFLE if "rifle" in weapon_name else WeaponSubtypeEnum.PISTOL,
-                    stat="perception",
-                    damage_min=12,
-                    damage_max=20,
-                    image_url=get_weapon_image_url(weapon_name),
-                    dweller_id=dweller.id,
+        if is_boosted:
+            now = datetime.utcnow()
+            for room, training_stat in zip(training_rooms, _TRAINING_STATS, strict=False):
+                dweller = recruit(
+                    room, DwellerStatusEnum.IDLE, DwellerCreateCommonOverride(special_boost=training_stat)
                 )
+                if session := self._plan_training(dweller, room, now):
+                    graph.trainings.append(session)
+                    dweller.status = DwellerStatusEnum.TRAINING
+
+        if radio_room := next((room for room in misc_rooms if "radio" in room.name.lower()), None):
+            recruit(
+                radio_room, DwellerStatusEnum.WORKING, DwellerCreateCommonOverride(special_boost=SPECIALEnum.CHARISMA)
             )
-            db_session.add(
-                Outfit(
-                    name=outfit_name,
-                    rarity=RarityEnum.LEGENDARY,
-                    outfit_type=OutfitTypeEnum.LEGENDARY,
-                    image_url=get_outfit_image_url(outfit_name),
-                    dweller_id=dweller.id,
+
+        if living_room := next((room for room in capacity_rooms if "living" in room.name.lower()), None):
+            for gender in (GenderEnum.MALE, GenderEnum.FEMALE):
+                overrides = DwellerCreateCommonOverride(
+                    gender=gender,
+                    special_boost=SPECIALEnum.CHARISMA if is_boosted else None,
+                )
+                recruit(living_room, DwellerStatusEnum.RESTING, overrides)
+
+        if is_boosted:
+            templates = {
+                f"{template.first_name} {template.last_name or ''}".strip(): template
+                for template in game_data_store.dwellers
+                if template.rarity.lower() == RarityEnum.LEGENDARY.value
+            }
+            for name, (weapon_name, outfit_name) in _LEGENDARY_LOADOUTS.items():
+                dweller = Dweller(**templates[name].model_dump(exclude={"weapon", "outfit"}), vault_id=vault.id)
+                graph.dwellers.append(dweller)
+                graph.items.append(
+                    Weapon(
+                        name=weapon_name,
+                        rarity=RarityEnum.LEGENDARY,
+                        weapon_type=WeaponTypeEnum.GUN,
+                        weapon_subtype=WeaponSubtypeEnum.RIFLE if "rifle" in weapon_name else WeaponSubtypeEnum.PISTOL,
+                        stat="perception",
+                        damage_min=12,
+                        damage_max=20,
+                        image_url=get_weapon_image_url(weapon_name),
+                        dweller_id=dweller.id,
+                    )
+                )
+                graph.items.append(
+                    Outfit(
+                        name=outfit_name,
+                        rarity=RarityEnum.LEGENDARY,
+                        outfit_type=OutfitTypeEnum.LEGENDARY,
+                        image_url=get_outfit_image_url(outfit_name),
+                        dweller_id=dweller.id,
+                    )
                 )
-            )
 
-        await db_session.commit()
+        # --- starter kit, objectives and map markers ---
+        graph.items.extend(
+            Weapon(**weapon, image_url=get_weapon_image_url(weapon["name"]), storage_id=storage.id)
+            for weapon in _STARTER_WEAPONS
+        )
+        graph.items.extend(
+            Outfit(**outfit, image_url=get_outfit_image_url(outfit["name"]), storage_id=storage.id)
+            for outfit in _STARTER_OUTFITS
+        )
+        graph.objective_links = [
+            VaultObjectiveProgressLink(
+                vault_id=vault.id,
+                objective_id=objective.id,
+                progress=0,
+                total=objective.target_amount or 1,
+                is_completed=False,
+            )
+            for objective in objectives
+        ]
+        graph.locations, graph.location_links = map_service.plan_bio_places(vault.id, bio_entries)
+        return graph
 
-    async def _assign_initial_objectives(
-        self, db_session: AsyncSession, vault_id: UUID4, is_boosted: bool = False
-    ) -> None:
-        """Assign initial objectives to a new vault.
+    async def _select_initial_objectives(
+        self, db_session: AsyncSession, *, include_achievements: bool
+    ) -> tuple[list[Objective], list[Objective]]:
+        """Pick the objectives every new vault starts with, and the extra achievements for boosted vaults.
 
-        Standard vaults get 1 daily and 1 weekly objective.
-        Boosted vaults get additional achievement objectives (weapons, outfits, stimpaks, etc.)
+        Standard vaults get 1 daily and 1 weekly objective; boosted vaults add up
+        to 8 achievement objectives. A failed lookup only costs the vault its
+        starting objectives, so it is logged rather than raised.
         """
+        base_query = select(Objective).where(Objective.objective_type.isnot(None)).order_by(Objective.id)
         try:
-            from sqlmodel import select
+            starting: list[Objective] = []
+            for category in ("daily", "weekly"):
+                result = await db_session.execute(base_query.where(Objective.category == category).limit(1))
+                if objective := result.scalar_one_or_none():
+                    starting.append(objective)
+            achievements: list[Objective] = []
+            if include_achievements:
+                result = await db_session.execute(
+                    base_query.where(Objective.category != "daily", Objective.category != "weekly").limit(8)
+                )
+                achievements = list(result.scalars().all())
+        except SQLAlchemyError as e:
+            self.logger.warning("Failed to load initial objectives: %s", e)
+            return [], []
+        return starting, achievements
 
-            from app.models.objective import Objective
+    async def provision_vaults(self, db_session: AsyncSession, specs: Sequence[VaultProvisionSpec]) -> list[Vault]:
+        """Create fully initialised vaults in a single transaction.
 
-            assigned_count = 0
-            assigned_types = []
-            objectives_to_assign = []
+        Every vault is laid out by ``build_vault_graph`` first; the rows are then
+        written stage by stage (parents before children), so each table gets one
+        batched INSERT no matter how many vaults are provisioned. Nothing is
+        committed unless every vault succeeds.
+        """
+        if not specs:
+            return []
 
-            # Get 1 daily objective
-            daily_result = await db_session.execute(
-                select(Objective)
-                .where(Objective.category == "daily")
-                .where(Objective.objective_type.isnot(None))
-                .order_by(Objective.id)
-                .limit(1)
+        game_data_store = await get_static_game_data()
+        starting, achievements = await self._select_initial_objectives(
+            db_session, include_achievements=any(spec.is_boosted for spec in specs)
+        )
+        graphs = [
+            self.build_vault_graph(
+                spec, game_data_store.rooms, [*starting, *achievements] if spec.is_boosted else starting
             )
-            daily_objective = daily_result.scalar_one_or_none()
-            if daily_objective:
-                objectives_to_assign.append(daily_objective)
-                assigned_types.append("daily")
-
-            # Get 1 weekly objective
-            weekly_result = await db_session.execute(
-                select(Objective)
-                .where(Objective.category == "weekly")
-                .where(Objective.objective_type.isnot(None))
-                .order_by(Objective.id)
-                .limit(1)
+            for spec in specs
+        ]
+
+        try:
+            for stage in VaultGraph.insert_stages(graphs):
+                db_session.add_all(stage)
+                await db_session.flush()
+            await db_session.commit()
+        except Exception:
+            await db_session.rollback()
+            self.logger.exception("Failed to provision %d vault(s)", len(specs))
+            raise
+
+        for graph in graphs:
+            self.logger.info(
+                "Provisioned vault %s: %d rooms, %d dwellers, %d training sessions",
+                graph.vault.id,
+                len(graph.rooms),
+                len(graph.dwellers),
+                len(graph.trainings),
             )
-            weekly_objective = weekly_result.scalar_one_or_none()
-            if weekly_objective:
-                objectives_to_assign.append(weekly_objective)
-                assigned_types.append("weekly")
-
-            # For boosted vaults, add achievement objectives (collection, build, etc.)
-            if is_boosted:
-                # Get basic objectives (non-daily, non-weekly) with different types
-                basic_result = await db_session.execute(
-                    select(Objective)
-                    .where(Objective.category != "daily")
-                    .where(Objective.category != "weekly")
-                    .where(Objective.objective_type.isnot(None))
-                    .order_by(Objective.id)
-                    .limit(8)
-                )
-                basic_objectives = basic_result.scalars().all()
-                objectives_to_assign.extend(basic_objectives)
-                if basic_objectives:
-                    assigned_types.append(f"{len(basic_objectives)} achievement")
-
-            # Assign all objectives
-            for objective in objectives_to_assign:
-                link = VaultObjectiveProgressLink(
-                    vault_id=vault_id,
-                    objective_id=objective.id,
-                    progress=0,
-                    total=objective.target_amount or 1,
-                    is_completed=False,
-                )
-                db_session.add(link)
-                assigned_count += 1
-
-            if assigned_count > 0:
-                await db_session.commit()
-                types_str = ", ".join(assigned_types) if assigned_types else "objectives"
-                self.logger.info(
-                    "Assigned %d initial objective(s) (%s) to vault %s", assigned_count, types_str, vault_id
-                )
-            else:
-                self.logger.warning("No objectives found for vault %s", vault_id)
-        except SQLAlchemyError as e:
-            self.logger.warning("Failed to assign initial objectives to vault %s: %s", vault_id, e)
+        return [graph.vault for graph in graphs]
 
     async def initiate_vault(
         self,
@@ -601,98 +534,10 @@ class VaultService:
     ) -> Vault:
         """Create a new vault for a user and initialize it with essential rooms and dwellers.
 
-        Standard vault includes:
-        - Vault door and elevators (infrastructure)
-        - Production rooms (power generator, diner, water treatment) with assigned dwellers
-        - Storage room and 1 living room
-        - Radio studio (for recruitment)
-        - Weight room (training room for testing leveling system)
-        - 6 dwellers with boosted SPECIAL stats assigned to production rooms
-
-        Boosted vault additionally includes:
-        - All 7 training rooms (one for each SPECIAL stat)
-        - 2 additional living rooms (3 total for 13+ dwellers)
-        - 7 additional dwellers assigned to training rooms (13 total)
+        See ``build_vault_graph`` for what a standard and a boosted vault contain.
         """
-        # Create vault and storage
-        vault_db_obj = await vault_crud.create_with_user_id(db_session=db_session, obj_in=obj_in, user_id=user_id)
-        await vault_crud.create_storage(db_session=db_session, vault_id=vault_db_obj.id)
-        await db_session.refresh(vault_db_obj)
-
-        # Prepare room data
-        game_data_store = await get_static_game_data()
-        rooms = game_data_store.rooms
-        infrastructure_rooms, capacity_rooms, production_rooms, misc_rooms, training_rooms = (
-            self._prepare_initial_rooms(rooms, vault_db_obj.id, is_boosted)
-        )
-
-        # Create rooms and get created production/training/misc rooms
-        (
-            vault_db_obj,
-            created_production_rooms,
-            created_training_rooms,
-            created_misc_rooms,
-            created_capacity_rooms,
-        ) = await self._create_initial_rooms(
-            db_session, vault_db_obj, infrastructure_rooms, capacity_rooms, production_rooms, misc_rooms, training_rooms
-        )
-
-        # Set initial resources to 50% of max capacity
-        initial_power = vault_db_obj.power_max // 2
-        initial_food = vault_db_obj.food_max // 2
-        initial_water = vault_db_obj.water_max // 2
-
-        vault_db_obj = await vault_crud.update(
-            db_session=db_session,
-            id=vault_db_obj.id,
-            obj_in=VaultUpdate(
-                power=initial_power,
-                food=initial_food,
-                water=initial_water,
-            ),
-        )
-
-        # Set initial medical supplies on Storage (computed from Medbay/Science Lab rooms)
-        all_rooms = created_production_rooms + created_capacity_rooms + created_training_rooms + created_misc_rooms
-        medical_capacity = compute_medical_capacity(all_rooms)
-        initial_stimpack = min(5, medical_capacity.get("stimpack", 0))
-        initial_radaway = min(5, medical_capacity.get("radaway", 0))
-        if initial_stimpack > 0 or initial_radaway > 0:
-            storage_result = await db_session.execute(select(Storage).where(Storage.vault_id == vault_db_obj.id))
-            storage_obj = storage_result.scalar_one_or_none()
-            if storage_obj:
-                storage_obj.stimpack = initial_stimpack
-                storage_obj.radaway = initial_radaway
-                db_session.add(storage_obj)
-                await db_session.commit()
-
-        # Create and assign dwellers
-        await self._create_initial_dwellers(
-            db_session,
-            vault_db_obj.id,
-            created_production_rooms,
-            created_training_rooms,
-            created_misc_rooms,
-            created_capacity_rooms,
-            is_boosted,
-        )
-
-        if is_boosted:
-            await self._create_boosted_legendary_dwellers(db_session, vault_db_obj.id)
-
-        # Commit to ensure all dwellers and rooms are persisted before starting training
-        await db_session.commit()
-
-        # Start training sessions for boosted vaults
-        await self._start_training_sessions(db_session, vault_db_obj.id, created_training_rooms, is_boosted)
-
-        # Assign initial objectives to the vault (boosted vaults get more objectives)
-        await self._assign_initial_objectives(db_session, vault_db_obj.id, is_boosted)
-
-        # Create initial weapons and outfits for testing
-        await self._create_initial_items(db_session, vault_db_obj.id)
-
-        return vault_db_obj
+        (vault,) = await self.provision_vaults(db_session, [VaultProvisionSpec(obj_in, user_id, is_boosted)])
+        return vault
 
     async def update_vault_resources(self, db_session: AsyncSession, vault_id: UUID4) -> Vault:
         """Update vault resources based on resource manager processing."""
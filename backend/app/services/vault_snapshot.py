@@ -0,0 +1,386 @@
+"""Streaming export and import of a whole vault as a gzip-compressed NDJSON archive.
+
+Archive layout, one JSON document per line::
+
+    {"format": "vault-snapshot", "version": 1, "vault_id": "...", "exported_at": "..."}
+    {"table": "vault", "columns": ["id", "name", ...]}
+    ["3f0c...", "Vault 101", ...]
+    {"table": "storage", "columns": [...]}
+    ...
+
+Object lines open a table section; array lines are rows of the current section.
+Tables are written parents first, so the importer can insert them in file order.
+
+Export reads each table through a server-side cursor (``stream_batches``) and writes
+compressed rows as partitions arrive; import reads the archive line by line and
+inserts fixed-size batches with one multi-row ``INSERT`` each. Neither side
+builds ORM objects or holds more than one batch in memory. Imported rows get new
+primary keys derived with ``uuid5`` from a per-import namespace, so every
+reference between snapshot rows is remapped without an id lookup table.
+"""
+
+import gzip
+import json
+import logging
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, BinaryIO
+
+from sqlalchemy import Column, ColumnElement, Table, bindparam, insert, or_, select, update
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.batching import stream_batches
+from app.models.chat_message import ChatMessage
+from app.models.dweller import Dweller
+from app.models.exploration import Exploration
+from app.models.exploration_event import ExplorationEvent
+from app.models.game_state import GameState
+from app.models.incident import Incident
+from app.models.junk import Junk
+from app.models.outfit import Outfit
+from app.models.pregnancy import Pregnancy
+from app.models.quest_party import QuestParty
+from app.models.relationship import Relationship
+from app.models.room import Room
+from app.models.storage import Storage
+from app.models.training import Training
+from app.models.vault import Vault
+from app.models.vault_objective import VaultObjectiveProgressLink
+from app.models.vault_quest import VaultQuestCompletionLink
+from app.models.wasteland_location import DwellerLocation, WastelandLocation
+from app.models.weapon import Weapon
+from app.utils.exceptions import ResourceNotFoundException
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "vault-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Rows per server-side cursor fetch on export and per INSERT on import
+SNAPSHOT_BATCH_SIZE = 1000
+
+# Parents before children: every foreign key between these tables points to an earlier entry
+# (or to the same table, which the importer patches after the rows exist).
+SNAPSHOT_MODELS: tuple[type[SQLModel], ...] = (
+    Vault,
+    GameState,
+    Storage,
+    Room,
+    Dweller,
+    Weapon,
+    Outfit,
+    Junk,
+    Training,
+    Relationship,
+    Pregnancy,
+    Exploration,
+    ExplorationEvent,
+    WastelandLocation,
+    DwellerLocation,
+    Incident,
+    VaultObjectiveProgressLink,
+    VaultQuestCompletionLink,
+    QuestParty,
+    ChatMessage,
+)
+
+_SNAPSHOT_TABLES: dict[str, Table] = {model.__table__.name: model.__table__ for model in SNAPSHOT_MODELS}
+
+
+@dataclass(slots=True)
+class SnapshotResult:
+    """Outcome of an export or import."""
+
+    vault_id: uuid.UUID
+    row_counts: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.row_counts.values())
+
+
+def _vault_filter(table: Table, vault_id: uuid.UUID) -> ColumnElement[bool]:
+    """Select the rows of ``table`` that belong to ``vault_id``."""
+    if table is Vault.__table__:
+        return table.c.id == vault_id
+    if "vault_id" in table.c:
+        return table.c.vault_id == vault_id
+
+    dwellers = select(Dweller.id).where(Dweller.vault_id == vault_id)
+    storages = select(Storage.id).where(Storage.vault_id == vault_id)
+    if table is Weapon.__table__ or table is Outfit.__table__:
+        return or_(table.c.dweller_id.in_(dwellers), table.c.storage_id.in_(storages))
+    if table is Junk.__table__:
+        return table.c.storage_id.in_(storages)
+    if table is Relationship.__table__:
+        return table.c.dweller_1_id.in_(dwellers)
+    if table is Pregnancy.__table__:
+        return table.c.mother_id.in_(dwellers)
+    if table is DwellerLocation.__table__:
+        return table.c.dweller_id.in_(dwellers)
+    msg = f"No vault filter for snapshot table {table.name}"
+    raise NotImplementedError(msg)
+
+
+def _python_type(column: Column) -> type | None:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _encoder(column: Column) -> Callable[[Any], Any] | None:
+    """Return a converter to a JSON-native value, or ``None`` when the value already is one."""
+    python_type = _python_type(column)
+    if python_type is None:
+        return None
+    if issubclass(python_type, Enum):
+        # Enum columns store member names, which is what the importer looks up
+        return lambda value: value.name if isinstance(value, Enum) else value
+    if issubclass(python_type, (datetime, date, time)):
+        return lambda value: value.isoformat()
+    if issubclass(python_type, uuid.UUID):
+        return str
+    return None
+
+
+def _decoder(column: Column) -> Callable[[Any], Any] | None:
+    """Inverse of :func:`_encoder`."""
+    python_type = _python_type(column)
+    if python_type is None:
+        return None
+    if issubclass(python_type, Enum):
+        return lambda value: python_type[value]
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat
+    if issubclass(python_type, date):
+        return date.fromisoformat
+    if issubclass(python_type, time):
+        return time.fromisoformat
+    if issubclass(python_type, uuid.UUID):
+        return uuid.UUID
+    return None
+
+
+def _dump_line(document: Any) -> bytes:
+    return json.dumps(document, separators=(",", ":"), ensure_ascii=False, default=str).encode() + b"\n"
+
+
+class _TableImport:
+    """Decodes and remaps the rows of one archive section."""
+
+    def __init__(self, table: Table, columns: list[str], namespace: uuid.UUID, owner_id: uuid.UUID):
+        unknown = [name for name in columns if name not in table.c]
+        if unknown:
+            msg = f"Snapshot table {table.name} has unknown column(s): {', '.join(unknown)}"
+            raise ValueError(msg)
+
+        self.table = table
+        self.columns = columns
+        self.self_references: list[str] = []
+        self._converters: list[Callable[[Any], Any] | None] = []
+
+        def remap(value: Any) -> uuid.UUID:
+            return uuid.uuid5(namespace, str(value))
+
+        for name in columns:
+            column = table.c[name]
+            decode = _decoder(column)
+            targets = {fk.column.table.name for fk in column.foreign_keys}
+            if (column.primary_key and not column.foreign_keys) or targets & _SNAPSHOT_TABLES.keys():
+                if table.name in targets:
+                    self.self_references.append(name)
+                self._converters.append(remap)
+            elif "user" in targets:
+                self._converters.append(lambda _value: owner_id)
+            elif targets and column.nullable:
+                # Rows outside the snapshot (e.g. LLM interaction logs) may not exist in the target database
+                self._converters.append(lambda _value: None)
+            else:
+                # Shared reference data (objectives, quests) is seeded identically everywhere
+                self._converters.append(decode)
+
+    def convert(self, row: list[Any]) -> dict[str, Any]:
+        return {
+            name: value if value is None or convert is None else convert(value)
+            for name, convert, value in zip(self.columns, self._converters, row, strict=True)
+        }
+
+
+class VaultSnapshotService:
+    """Export a vault's full graph to an archive and load it back as a new vault."""
+
+    def __init__(self, batch_size: int = SNAPSHOT_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    async def export_vault(
+        self, db_session: AsyncSession, vault_id: uuid.UUID, destination: BinaryIO, *, compresslevel: int = 6
+    ) -> SnapshotResult:
+        """Stream every row belonging to ``vault_id`` into ``destination``.
+
+        Args:
+            db_session: Database session
+            vault_id: Vault to export
+            destination: Binary file object the gzip archive is written to
+            compresslevel: gzip level; the default trades a little size for speed
+
+        Returns:
+            Row counts per table
+
+        Raises:
+            ResourceNotFoundException: If the vault does not exist
+        """
+        if await db_session.get(Vault, vault_id) is None:
+            raise ResourceNotFoundException(Vault, identifier=vault_id)
+
+        result = SnapshotResult(vault_id=vault_id)
+        with gzip.GzipFile(fileobj=destination, mode="wb", compresslevel=compresslevel) as archive:
+            archive.write(
+                _dump_line(
+                    {
+                        "format": SNAPSHOT_FORMAT,
+                        "version": SNAPSHOT_VERSION,
+                        "vault_id": str(vault_id),
+                        "exported_at": datetime.utcnow().isoformat(),
+                    }
+                )
+            )
+            for table in _SNAPSHOT_TABLES.values():
+                columns = list(table.c)
+                encoders = [(index, encode) for index, column in enumerate(columns) if (encode := _encoder(column))]
+                archive.write(_dump_line({"table": table.name, "columns": [column.name for column in columns]}))
+
+                rows = select(*columns).where(_vault_filter(table, vault_id))
+                async for partition in stream_batches(db_session, rows, batch_size=self.batch_size):
+                    lines = []
+                    for row in partition:
+                        values = list(row)
+                        for index, encode in encoders:
+                            if values[index] is not None:
+                                values[index] = encode(values[index])
+                        lines.append(_dump_line(values))
+                    archive.write(b"".join(lines))
+                    result.row_counts[table.name] += len(partition)
+
+        logger.info("Exported vault %s: %d rows", vault_id, result.total_rows)
+        return result
+
+    async def import_vault(self, db_session: AsyncSession, source: BinaryIO, *, user_id: uuid.UUID) -> SnapshotResult:
+        """Load an archive written by :meth:`export_vault` as a new vault owned by ``user_id``.
+
+        Every primary key is replaced and every reference between snapshot rows
+        follows it, so the same archive can be imported any number of times,
+        including into the database it came from. Nothing is committed unless the
+        whole archive loads.
+
+        Args:
+            db_session: Database session
+            source: Binary file object holding the gzip archive
+            user_id: Owner of the imported vault (and of its users' chat messages)
+
+        Returns:
+            The new vault id and row counts per table
+
+        Raises:
+            ValueError: If the archive is not a supported vault snapshot
+        """
+        try:
+            result = await self._load(db_session, source, user_id)
+            await db_session.commit()
+        except Exception:
+            await db_session.rollback()
+            raise
+
+        logger.info("Imported vault %s: %d rows", result.vault_id, result.total_rows)
+        return result
+
+    async def _load(self, db_session: AsyncSession, source: BinaryIO, user_id: uuid.UUID) -> SnapshotResult:
+        namespace = uuid.uuid4()
+        result: SnapshotResult | None = None
+        section: _TableImport | None = None
+        batch: list[dict[str, Any]] = []
+        # Rows referencing rows of their own table (dweller partners and parents) are linked once all exist
+        links: list[dict[str, Any]] = []
+
+        with gzip.GzipFile(fileobj=source, mode="rb") as archive:
+            for line in archive:
+                document = json.loads(line)
+                if result is None:
+                    result = self._read_header(document, namespace)
+                elif isinstance(document, list):
+                    if section is None:
+                        msg = "Snapshot row appears before any table header"
+                        raise ValueError(msg)
+                    batch.append(self._stage_row(section, document, links))
+                    if len(batch) >= self.batch_size:
+                        await self._insert(db_session, section, batch, result)
+                        batch = []
+                else:
+                    if section is not None:
+                        await self._insert(db_session, section, batch, result)
+                        batch = []
+                    table = _SNAPSHOT_TABLES.get(document.get("table"))
+                    if table is None:
+                        msg = f"Unknown snapshot table {document.get('table')!r}"
+                        raise ValueError(msg)
+                    section = _TableImport(table, document["columns"], namespace, user_id)
+
+        if result is None:
+            msg = "Snapshot archive is empty"
+            raise ValueError(msg)
+        if section is not None:
+            await self._insert(db_session, section, batch, result)
+        await self._link_self_references(db_session, links)
+        return result
+
+    @staticmethod
+    def _read_header(document: Any, namespace: uuid.UUID) -> SnapshotResult:
+        if not isinstance(document, dict) or document.get("format") != SNAPSHOT_FORMAT:
+            msg = "Not a vault snapshot archive"
+            raise ValueError(msg)
+        if document.get("version") != SNAPSHOT_VERSION:
+            msg = f"Unsupported vault snapshot version {document.get('version')!r}"
+            raise ValueError(msg)
+        return SnapshotResult(vault_id=uuid.uuid5(namespace, document["vault_id"]))
+
+    @staticmethod
+    def _stage_row(section: _TableImport, document: list[Any], links: list[dict[str, Any]]) -> dict[str, Any]:
+        row = section.convert(document)
+        if section.self_references:
+            pending = {name: row[name] for name in section.self_references if row[name] is not None}
+            if pending:
+                links.append({"table": section.table, "id": row["id"], **pending})
+                row.update(dict.fromkeys(pending))
+        return row
+
+    async def _insert(
+        self, db_session: AsyncSession, section: _TableImport, rows: list[dict[str, Any]], result: SnapshotResult
+    ) -> None:
+        if rows:
+            await db_session.execute(insert(section.table), rows)
+            result.row_counts[section.table.name] += len(rows)
+
+    async def _link_self_references(self, db_session: AsyncSession, links: Iterable[dict[str, Any]]) -> None:
+        by_shape: dict[tuple[Table, tuple[str, ...]], list[dict[str, Any]]] = {}
+        for link in links:
+            table = link.pop("table")
+            columns = tuple(sorted(name for name in link if name != "id"))
+            by_shape.setdefault((table, columns), []).append(
+                {"b_id": link["id"], **{f"b_{name}": link[name] for name in columns}}
+            )
+        for (table, columns), params in by_shape.items():
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values({name: bindparam(f"b_{name}") for name in columns})
+            )
+            for start in range(0, len(params), self.batch_size):
+                await db_session.execute(statement, params[start : start + self.batch_size])
+
+
+vault_snapshot_service = VaultSnapshotService()
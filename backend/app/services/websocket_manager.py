@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import json
 import logging
+import time
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -17,12 +18,33 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Sorted set per user: member = instance id, score = last heartbeat (unix time)
+PRESENCE_KEY = "ws:presence:{user_id}"
+# Each instance only subscribes to its own channel
+INSTANCE_CHANNEL = "ws:instance:{instance_id}"
+
+PRESENCE_TTL_SECONDS = 60
+PRESENCE_HEARTBEAT_SECONDS = 20
+# How long a presence lookup is reused; bounds Redis reads during bursts such as streamed chat tokens
+ROUTE_CACHE_SECONDS = 1.0
+# Back-off before retrying a failed Redis connection, so sends do not reconnect per message
+REDIS_RETRY_SECONDS = 30.0
+
+
+def encode_message(message: dict[str, Any]) -> str:
+    """Serialise a payload once; the text is reused for every socket and instance it goes to."""
+    # Compact JSON never contains a raw newline, which is what lets frames be newline-delimited
+    return json.dumps(jsonable_encoder(message), separators=(",", ":"), ensure_ascii=False)
+
 
 class ConnectionManager:
     """Manages WebSocket connections with Redis pub/sub for distributed setup.
 
-    Supports both personal notifications and chat sessions with automatic
-    reconnection handling and cross-instance message broadcasting.
+    Each instance records which users it holds sockets for in a Redis presence
+    registry (refreshed by a heartbeat) and listens on its own channel. A
+    message is delivered to local sockets directly and published only to the
+    other instances that currently hold a connection for its user, so a
+    recipient connected locally or nowhere costs no pub/sub traffic.
     """
 
     def __init__(self):
@@ -31,17 +53,29 @@ class ConnectionManager:
         self.redis: Redis | None = None
         self.instance_id = str(uuid4())
         self.listener_task: asyncio.Task | None = None
-        self.redis_channel = "ws_broadcast"
+        self.heartbeat_task: asyncio.Task | None = None
+        self.redis_channel = INSTANCE_CHANNEL.format(instance_id=self.instance_id)
+        self._departed: set[UUID] = set()
+        self._route_cache: dict[UUID, tuple[float, tuple[str, ...]]] = {}
+        self._redis_retry_at = 0.0
 
-    async def start_redis(self):
-        """Initialize Redis connection and start listener task."""
+    async def start_redis(self, client: Redis | None = None):
+        """Initialize Redis connection and start listener and presence heartbeat tasks.
+
+        :param client: Client to use instead of connecting to ``settings.redis_url``
+        :type client: Redis | None
+        """
         if self.redis:
             return
+        if client is None and time.monotonic() < self._redis_retry_at:
+            return
 
         try:
-            self.redis = Redis.from_url(settings.redis_url, decode_responses=True)
+            self.redis = client or Redis.from_url(settings.redis_url, decode_responses=True)
             await self.redis.ping()
             self.listener_task = asyncio.create_task(self._redis_listener())
+            self.heartbeat_task = asyncio.create_task(self._presence_heartbeat())
+            await self._refresh_presence()
             logger.info(
                 "Distributed WebSocket manager started (ID: %s)",
                 self.instance_id,
@@ -49,40 +83,137 @@ class ConnectionManager:
         except (RedisError, RedisConnectionError, OSError):
             logger.exception("Failed to init Redis for WS manager. Running local-only")
             self.redis = None
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
 
     async def stop_redis(self):
-        """Close Redis connection and cancel listener."""
-        if self.listener_task:
-            self.listener_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.listener_task
+        """Withdraw this instance's presence, close Redis connection and cancel background tasks."""
+        for task in (self.heartbeat_task, self.listener_task):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self.heartbeat_task = None
+        self.listener_task = None
 
         if self.redis:
+            with contextlib.suppress(RedisError, RedisConnectionError, OSError):
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for user_id in self._local_users():
+                        pipe.zrem(PRESENCE_KEY.format(user_id=user_id), self.instance_id)
+                    await pipe.execute()
             await self.redis.close()
             self.redis = None
+        self._route_cache.clear()
+
+    def _local_users(self) -> set[UUID]:
+        """Users with at least one notification or chat socket on this instance."""
+        return set(self.active_connections) | {user_id for user_id, _ in self.chat_connections}
+
+    def _forget_if_gone(self, user_id: UUID):
+        if user_id not in self._local_users():
+            self._departed.add(user_id)
+
+    async def _mark_present(self, user_id: UUID):
+        """Register ``user_id`` on this instance right away instead of waiting for the next heartbeat."""
+        self._departed.discard(user_id)
+        if not self.redis:
+            return
+        key = PRESENCE_KEY.format(user_id=user_id)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, {self.instance_id: time.time()})
+                pipe.expire(key, PRESENCE_TTL_SECONDS)
+                await pipe.execute()
+        except (RedisError, RedisConnectionError):
+            logger.warning("Failed to register WS presence for user %s", user_id)
+
+    async def _refresh_presence(self):
+        """Re-announce every local user and withdraw the ones that disconnected since the last beat."""
+        if not self.redis:
+            return
+        local_users = self._local_users()
+        departed = self._departed - local_users
+        self._departed.clear()
+        now = time.time()
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id in local_users:
+                key = PRESENCE_KEY.format(user_id=user_id)
+                pipe.zadd(key, {self.instance_id: now})
+                pipe.expire(key, PRESENCE_TTL_SECONDS)
+            for user_id in departed:
+                pipe.zrem(PRESENCE_KEY.format(user_id=user_id), self.instance_id)
+            await pipe.execute()
+
+        cutoff = time.monotonic() - ROUTE_CACHE_SECONDS
+        self._route_cache = {user_id: entry for user_id, entry in self._route_cache.items() if entry[0] >= cutoff}
+
+    async def _presence_heartbeat(self):
+        while True:
+            await asyncio.sleep(PRESENCE_HEARTBEAT_SECONDS)
+            try:
+                await self._refresh_presence()
+            except (RedisError, RedisConnectionError):
+                logger.warning("WS presence heartbeat failed; retrying in %ss", PRESENCE_HEARTBEAT_SECONDS)
+
+    async def _remote_instances(self, user_id: UUID) -> tuple[str, ...]:
+        """Other instances holding a live connection for ``user_id`` (briefly cached)."""
+        now = time.monotonic()
+        cached = self._route_cache.get(user_id)
+        if cached and now - cached[0] < ROUTE_CACHE_SECONDS:
+            return cached[1]
+
+        if not self.redis:
+            return ()
+        members = await self.redis.zrangebyscore(
+            PRESENCE_KEY.format(user_id=user_id), time.time() - PRESENCE_TTL_SECONDS, "+inf"
+        )
+        instances = tuple(member for member in members if member != self.instance_id)
+        self._route_cache[user_id] = (now, instances)
+        return instances
+
+    async def _route(self, header: dict[str, str], texts: list[str]):
+        """Publish pre-encoded messages to the other instances connected to ``header["user_id"]``.
+
+        Frames are a JSON routing header followed by the message texts, one per
+        line, so receivers forward the texts without decoding them.
+        """
+        if not self.redis:
+            await self.start_redis()
+        if not self.redis:
+            return
+
+        try:
+            instances = await self._remote_instances(UUID(header["user_id"]))
+            if not instances:
+                return
+            frame = "\n".join([json.dumps(header), *texts])
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for instance_id in instances:
+                    pipe.publish(INSTANCE_CHANNEL.format(instance_id=instance_id), frame)
+                await pipe.execute()
+        except (RedisError, RedisConnectionError):
+            logger.exception("Failed to publish WS message to Redis")
+        except (RuntimeError, AttributeError):
+            # Event loop closed during tests or shutdown - suppress
+            logger.debug("Redis publish skipped (event loop closed)")
 
     async def _process_redis_message(self, message: dict):
         """Process a single Redis message."""
         if message["type"] != "message":
             return
 
-        data = json.loads(message["data"])
-        if data.get("sender_instance") == self.instance_id:
-            return
-
-        msg_type = data.get("msg_type")
-        payload = data.get("payload")
+        header_line, *texts = message["data"].split("\n")
+        header = json.loads(header_line)
+        user_id = UUID(header["user_id"])
 
-        if msg_type == "personal":
-            user_id = UUID(data["user_id"])
-            await self._send_personal_local(payload, user_id)
-        elif msg_type == "chat":
-            user_id = UUID(data["user_id"])
-            dweller_id = UUID(data["dweller_id"])
-            await self._send_chat_local(payload, user_id, dweller_id)
+        if header["kind"] == "personal":
+            await self._send_personal_local(texts, user_id)
+        elif header["kind"] == "chat":
+            await self._send_chat_local(texts, user_id, UUID(header["dweller_id"]))
 
     async def _redis_listener(self):
-        """Listen for broadcast messages from other instances."""
+        """Listen for messages routed to this instance."""
         if not self.redis:
             return
 
@@ -99,23 +230,6 @@ class ConnectionManager:
             await pubsub.unsubscribe(self.redis_channel)
             await pubsub.close()
 
-    async def _publish(self, data: dict[str, Any]):
-        """Publish message to Redis for other instances."""
-        if not self.redis:
-            await self.start_redis()
-
-        if not self.redis:
-            return
-
-        data["sender_instance"] = self.instance_id
-        try:
-            await self.redis.publish(self.redis_channel, json.dumps(jsonable_encoder(data)))
-        except (RedisError, RedisConnectionError):
-            logger.exception("Failed to publish WS message to Redis")
-        except (RuntimeError, AttributeError):
-            # Event loop closed during tests or shutdown - suppress
-            logger.debug("Redis publish skipped (event loop closed)")
-
     async def connect(self, websocket: WebSocket, user_id: UUID):
         """Connect WebSocket for user notifications.
 
@@ -128,6 +242,7 @@ class ConnectionManager:
         await self.start_redis()
 
         self.active_connections.setdefault(user_id, []).append(websocket)
+        await self._mark_present(user_id)
 
     def disconnect(self, websocket: WebSocket, user_id: UUID):
         """Disconnect WebSocket for user notifications.
@@ -145,6 +260,7 @@ class ConnectionManager:
 
         if not self.active_connections[user_id]:
             del self.active_connections[user_id]
+            self._forget_if_gone(user_id)
 
     async def send_personal_message(self, message: dict[str, Any], user_id: UUID):
         """Send message to all user connections across instances.
@@ -154,23 +270,31 @@ class ConnectionManager:
         :param user_id: Target user ID
         :type user_id: UUID
         """
-        await self._send_personal_local(message, user_id)
-        await self._publish(
-            {
-                "msg_type": "personal",
-                "user_id": str(user_id),
-                "payload": message,
-            }
-        )
+        await self.send_personal_messages([message], user_id)
 
-    async def _send_personal_local(self, message: dict[str, Any], user_id: UUID):
-        """Send message to locally connected sockets only."""
+    async def send_personal_messages(self, messages: list[dict[str, Any]], user_id: UUID):
+        """Send several messages to one user with at most one publish per remote instance.
+
+        :param messages: Message payloads, delivered in order
+        :type messages: list[dict[str, Any]]
+        :param user_id: Target user ID
+        :type user_id: UUID
+        """
+        if not messages:
+            return
+        texts = [encode_message(message) for message in messages]
+        await self._send_personal_local(texts, user_id)
+        await self._route({"kind": "personal", "user_id": str(user_id)}, texts)
+
+    async def _send_personal_local(self, texts: list[str], user_id: UUID):
+        """Send encoded messages to locally connected sockets only."""
         connections = self.active_connections.get(user_id, [])
         disconnected = []
 
         for conn in connections:
             try:
-                await conn.send_json(message)
+                for text in texts:
+                    await conn.send_text(text)
             except (RuntimeError, ConnectionError) as e:
                 logger.debug("Connection closed for user %s: %s", user_id, e)
                 disconnected.append(conn)
@@ -193,7 +317,13 @@ class ConnectionManager:
         :param user_ids: List of user IDs to broadcast to
         :type user_ids: list[UUID]
         """
-        await asyncio.gather(*[self.send_personal_message(message, uid) for uid in user_ids])
+        texts = [encode_message(message)]
+
+        async def _deliver(user_id: UUID):
+            await self._send_personal_local(texts, user_id)
+            await self._route({"kind": "personal", "user_id": str(user_id)}, texts)
+
+        await asyncio.gather(*[_deliver(uid) for uid in user_ids])
 
     async def connect_chat(self, websocket: WebSocket, user_id: UUID, dweller_id: UUID):
         """Connect WebSocket for chat session.
@@ -210,6 +340,7 @@ class ConnectionManager:
 
         chat_key = (user_id, dweller_id)
         self.chat_connections.setdefault(chat_key, []).append(websocket)
+        await self._mark_present(user_id)
 
     def disconnect_chat(self, websocket: WebSocket, user_id: UUID, dweller_id: UUID):
         """Disconnect WebSocket for chat session.
@@ -230,6 +361,7 @@ class ConnectionManager:
 
         if not self.chat_connections[chat_key]:
             del self.chat_connections[chat_key]
+            self._forget_if_gone(user_id)
 
     async def send_chat_message(self, message: dict[str, Any], user_id: UUID, dweller_id: UUID):
         """Send message to all chat session connections across instances.
@@ -241,25 +373,20 @@ class ConnectionManager:
         :param dweller_id: Dweller ID
         :type dweller_id: UUID
         """
-        await self._send_chat_local(message, user_id, dweller_id)
-        await self._publish(
-            {
-                "msg_type": "chat",
-                "user_id": str(user_id),
-                "dweller_id": str(dweller_id),
-                "payload": message,
-            }
-        )
+        texts = [encode_message(message)]
+        await self._send_chat_local(texts, user_id, dweller_id)
+        await self._route({"kind": "chat", "user_id": str(user_id), "dweller_id": str(dweller_id)}, texts)
 
-    async def _send_chat_local(self, message: dict[str, Any], user_id: UUID, dweller_id: UUID):
-        """Send message to locally connected chat sockets only."""
+    async def _send_chat_local(self, texts: list[str], user_id: UUID, dweller_id: UUID):
+        """Send encoded messages to locally connected chat sockets only."""
         chat_key = (user_id, dweller_id)
         connections = self.chat_connections.get(chat_key, [])
         disconnected = []
 
         for conn in connections:
             try:
-                await conn.send_json(message)
+                for text in texts:
+                    await conn.send_text(text)
             except (RuntimeError, ConnectionError) as e:
                 logger.debug(
                     "Connection closed for chat %s-%s: %s",
@@ -3,7 +3,7 @@ import sys
 from collections.abc import AsyncGenerator, Generator
 from contextlib import suppress
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
@@ -36,6 +36,12 @@ mock_instance = MagicMock()
 mock_instance.enabled = False  # Disable storage for tests by default
 mock_storage_module.factory.create_storage_service.return_value = mock_instance
 mock_storage_module.get_storage_client.return_value = mock_instance
+mock_async_instance = MagicMock()
+mock_async_instance.enabled = False
+mock_async_instance.upload_file = AsyncMock(return_value="")
+mock_async_instance.upload_image_with_thumbnail = AsyncMock(return_value=("", ""))
+mock_storage_module.factory.create_async_storage_service.return_value = mock_async_instance
+mock_storage_module.get_async_storage_client.return_value = mock_async_instance
 sys.modules["app.services.storage"] = mock_storage_module
 sys.modules["app.services.storage.factory"] = mock_storage_module.factory
 
@@ -87,6 +93,17 @@ async def db_connection() -> AsyncConnection:
         "sqlite+aiosqlite:///:memory:", echo=False, future=True, poolclass=StaticPool
     )
 
+    # pysqlite defers BEGIN until the first write, so a SAVEPOINT issued first would
+    # open (and its RELEASE commit) the outer transaction; emit BEGIN ourselves so
+    # begin_nested() behaves as on PostgreSQL
+    @event.listens_for(_test_async_engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(_test_async_engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     @event.listens_for(SQLModel.metadata, "before_create")
     def _replace_jsonb_with_json(target, connection, **kw):
         for table in target.tables.values():
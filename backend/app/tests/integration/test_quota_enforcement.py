@@ -261,7 +261,7 @@ class TestDwellerAIQuotaEnforcement:
         # Patch the storage_service on the dweller_ai instance directly
         with patch.object(dweller_ai, "storage_service", create=True) as mock_storage:
             mock_storage.enabled = True
-            mock_storage.upload_file = MagicMock(return_value="https://example.com/audio.mp3")
+            mock_storage.upload_file = AsyncMock(return_value="https://example.com/audio.mp3")
 
             with patch("app.services.dweller_ai.get_ai_service") as mock_ai:
                 mock_ai_service = MagicMock()
@@ -401,3 +401,34 @@ async def test_read_dweller_lineage_not_found(
     """GET /dwellers/{id}/lineage returns 404 for a non-existent dweller."""
     response = await async_client.get(f"/dwellers/{uuid4()}/lineage", headers=superuser_token_headers)
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_read_vault_family_tree(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    superuser_token_headers: dict[str, str],
+    dweller: Dweller,
+) -> None:
+    """GET /dwellers/vault/{vault_id}/family-tree returns every dweller with its parent links."""
+    child = DwellerCreate(
+        first_name="Child",
+        last_name="Dweller",
+        gender=GenderEnum.FEMALE,
+        rarity=RarityEnum.COMMON,
+        age_group=AgeGroupEnum.CHILD,
+        vault_id=dweller.vault_id,
+    )
+    child_obj = await crud.dweller.create(async_session, child)
+    child_obj.parent_1_id = dweller.id
+    await async_session.commit()
+
+    response = await async_client.get(
+        f"/dwellers/vault/{dweller.vault_id}/family-tree", headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    members = {m["id"]: m for m in data["members"]}
+    assert members[str(child_obj.id)]["generation"] == 1
+    assert members[str(child_obj.id)]["parent_1_id"] == str(dweller.id)
+    assert members[str(dweller.id)]["generation"] == 0
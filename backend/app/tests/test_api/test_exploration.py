@@ -239,6 +239,47 @@ async def test_get_exploration_progress(
     assert 0 <= data["progress_percentage"] <= 100
 
 
+@pytest.mark.asyncio
+async def test_get_exploration_events_paginates_journal(
+    async_client: AsyncClient,
+    superuser_token_headers: dict[str, str],
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+) -> None:
+    """The journal endpoint pages through events in order using the seq cursor."""
+    exploration = await crud.exploration.create_with_dweller_stats(
+        async_session,
+        vault_id=vault.id,
+        dweller_id=dweller.id,
+        duration=4,
+    )
+    for i in range(5):
+        exploration.add_event("rest", f"Rest stop {i}")
+    async_session.add(exploration)
+    await async_session.commit()
+
+    first = await async_client.get(
+        f"/explorations/{exploration.id}/events?limit=3",
+        headers=superuser_token_headers,
+    )
+    assert first.status_code == 200
+    first_page = first.json()
+    assert [e["description"] for e in first_page["events"]] == ["Rest stop 0", "Rest stop 1", "Rest stop 2"]
+    assert first_page["next_after_seq"] == 2
+
+    second = await async_client.get(
+        f"/explorations/{exploration.id}/events?limit=3&after_seq={first_page['next_after_seq']}",
+        headers=superuser_token_headers,
+    )
+    second_page = second.json()
+    assert [e["description"] for e in second_page["events"]] == ["Rest stop 3", "Rest stop 4"]
+    assert second_page["next_after_seq"] is None
+
+    details = await async_client.get(f"/explorations/{exploration.id}", headers=superuser_token_headers)
+    assert len(details.json()["events"]) == 5
+
+
 @pytest.mark.asyncio
 async def test_recall_dweller_success(
     async_client: AsyncClient,
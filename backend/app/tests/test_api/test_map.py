@@ -247,6 +247,40 @@ async def test_get_location_detail_foreign_vault_location_returns_404(
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_get_vault_map_etag_not_modified_until_map_changes(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    superuser_token_headers: dict[str, str],
+    vault: Vault,
+    dweller: Dweller,
+) -> None:
+    """If-None-Match with the current ETag yields 304; a new location changes the ETag."""
+    first = await async_client.get(f"/map/vault/{vault.id}", headers=superuser_token_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    unchanged = await async_client.get(
+        f"/map/vault/{vault.id}",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+
+    filtered = await async_client.get(f"/map/vault/{vault.id}?unlocked_only=true", headers=superuser_token_headers)
+    assert filtered.headers["etag"] != etag
+
+    await map_service.register_bio_places(async_session, dweller, "Goodneighbor", [])
+
+    changed = await async_client.get(
+        f"/map/vault/{vault.id}",
+        headers={**superuser_token_headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "Goodneighbor" in {loc["name"] for loc in changed.json()["locations"]}
+
+
 # ------------------------------------------------------------------
 # OpenAPI schema assertion
 # ------------------------------------------------------------------
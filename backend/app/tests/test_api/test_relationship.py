@@ -332,6 +332,45 @@ async def test_calculate_compatibility(
     assert 0.0 <= data["score"] <= 1.0
 
 
+@pytest.mark.asyncio
+async def test_get_top_matches(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    superuser_token_headers: dict[str, str],
+):
+    """Test ranking a dweller's best matches across the vault."""
+    user = await crud.user.get_by_email(async_session, email=settings.FIRST_SUPERUSER_EMAIL)
+    vault = await crud.vault.create_with_user_id(
+        db_session=async_session,
+        obj_in={"number": 887},
+        user_id=user.id,
+    )
+    dweller = await crud.dweller.create_random(
+        async_session, vault.id, obj_in=DwellerCreateCommonOverride(gender="male")
+    )
+    others = [
+        await crud.dweller.create_random(async_session, vault.id, obj_in=DwellerCreateCommonOverride(gender=gender))
+        for gender in ("female", "female", "male")
+    ]
+
+    response = await async_client.get(
+        f"/relationships/vault/{vault.id}/matches/{dweller.id}",
+        params={"limit": 2, "opposite_gender": True},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2
+    assert {match["dweller_2_id"] for match in data} == {str(others[0].id), str(others[1].id)}
+    assert data[0]["score"] >= data[1]["score"]
+
+    response = await async_client.get(
+        f"/relationships/vault/{vault.id}/matches/{uuid4()}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Mock-based tests for uncovered endpoint paths
 # ---------------------------------------------------------------------------
@@ -433,7 +433,8 @@ async def test_get_training_success(
     superuser_token_headers: dict[str, str],
 ) -> None:
     """GET /training/{id} returns training with progress details."""
-    mock_training = _make_mock_training(progress=0.75)
+    # The stored value is stale while active; progress is derived from the timestamps
+    mock_training = _make_mock_training(progress=0.0)
 
     with (
         patch(
@@ -445,7 +446,7 @@ async def test_get_training_success(
             AsyncMock(return_value=None),
         ),
         patch(
-            "app.api.v1.endpoints.training.training_service.update_training_progress",
+            "app.api.v1.endpoints.training.training_service.complete_if_due",
             AsyncMock(return_value=mock_training),
         ),
     ):
@@ -456,6 +457,7 @@ async def test_get_training_success(
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == str(mock_training.id)
+    assert data["progress"] == pytest.approx(0.5, abs=0.01)
     assert "progress_percentage" in data
     assert "time_remaining_seconds" in data
     assert "is_ready_to_complete" in data
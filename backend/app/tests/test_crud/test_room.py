@@ -7,7 +7,7 @@ import pytest
 
 from app.constants import GRID_X_MAX, GRID_X_MIN, GRID_Y_MAX, GRID_Y_MIN
 from app.crud.base import CRUDBase
-from app.crud.room import CRUDRoom
+from app.crud.room import CRUDRoom, _compile_room_formula
 from app.models.room import Room
 from app.schemas.common import RoomActionEnum, RoomTypeEnum, SPECIALEnum
 from app.schemas.room import RoomCreate, RoomUpdate
@@ -151,6 +151,25 @@ class TestEvaluateOutputFormula:
         assert result == 0
 
 
+# =============================================================================
+# compiled formulas
+# =============================================================================
+
+
+class TestCompiledRoomFormula:
+    def test_formula_is_parsed_once(self, room_crud):
+        _compile_room_formula.cache_clear()
+        for level in range(1, 4):
+            room_crud.evaluate_capacity_formula("L * 4 + S", level=level, size=3)
+
+        info = _compile_room_formula.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_division_by_zero_returns_zero(self, room_crud):
+        assert room_crud.evaluate_output_formula("L / (S - 3)", level=2, size=3) == 0
+
+
 # =============================================================================
 # requires_recalculation
 # =============================================================================
@@ -98,3 +98,25 @@ async def test_update_user(async_session: AsyncSession) -> None:
     assert user_2
     assert user.email == user_2.email
     assert verify_password(new_password, user_2.hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_password_stored_at_another_cost(async_session: AsyncSession) -> None:
+    from passlib.context import CryptContext
+
+    from app.core.security import pwd_context
+
+    user_data = create_fake_user()
+    user = await crud.user.create(async_session, obj_in=UserCreate(**user_data))
+    user.hashed_password = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash(user_data["password"])
+    async_session.add(user)
+    await async_session.commit()
+    assert pwd_context.needs_update(user.hashed_password)
+
+    authenticated = await crud.user.authenticate(
+        async_session, email=user_data["email"], password=user_data["password"]
+    )
+
+    assert authenticated
+    assert not pwd_context.needs_update(authenticated.hashed_password)
+    assert verify_password(user_data["password"], authenticated.hashed_password)
@@ -0,0 +1,104 @@
+"""Tests for the keyset, streaming and batched-delete helpers."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.batching import FileCheckpoint, delete_in_batches, iter_keyset, stream_batches
+from app.models.notification import Notification, NotificationType
+
+
+async def _seed_notifications(db: AsyncSession, user_id, vault_id, count: int, *, age_days: int = 0) -> None:
+    created_at = datetime.utcnow() - timedelta(days=age_days)
+    await db.execute(
+        insert(Notification),
+        [
+            {
+                "user_id": user_id,
+                "vault_id": vault_id,
+                "notification_type": NotificationType.LEVEL_UP,
+                "title": f"N{n}",
+                "message": "m",
+                "created_at": created_at,
+            }
+            for n in range(count)
+        ],
+    )
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_iter_keyset_survives_commits_and_resumes_from_checkpoint(
+    async_session: AsyncSession, user_with_vault: tuple, tmp_path
+):
+    user, vault = user_with_vault
+    await _seed_notifications(async_session, user.id, vault.id, 7)
+    checkpoint = FileCheckpoint(tmp_path / "scan.ckpt")
+    statement = select(Notification).order_by(Notification.created_at.desc())
+
+    seen = []
+    async for batch in iter_keyset(async_session, statement, Notification.id, batch_size=3, checkpoint=checkpoint):
+        seen.extend(notification.id for notification in batch)
+        await async_session.commit()
+        if len(seen) == 6:
+            break  # interrupted while holding the second batch
+
+    assert seen == sorted(seen)
+    # Only the first batch was acknowledged, so the second is redone on resume
+    assert checkpoint.load() == str(seen[2])
+
+    resumed = [
+        n.id
+        async for batch in iter_keyset(async_session, statement, Notification.id, checkpoint=checkpoint)
+        for n in batch
+    ]
+    assert resumed == seen[3:] + resumed[3:]
+    assert len(resumed) == 4
+    assert checkpoint.load() is None, "a completed scan clears its checkpoint"
+
+
+@pytest.mark.asyncio
+async def test_iter_keyset_yields_rows_for_multi_column_statements(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+    await _seed_notifications(async_session, user.id, vault.id, 2)
+
+    batches = [
+        batch
+        async for batch in iter_keyset(async_session, select(Notification.id, Notification.title), Notification.id)
+    ]
+
+    assert [len(row) for row in batches[0]] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_batches_partitions_results(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+    await _seed_notifications(async_session, user.id, vault.id, 5)
+
+    sizes = [len(p) async for p in stream_batches(async_session, select(Notification), batch_size=2)]
+
+    assert sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_delete_in_batches_removes_only_matching_rows(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+    await _seed_notifications(async_session, user.id, vault.id, 7, age_days=60)
+    await _seed_notifications(async_session, user.id, vault.id, 2)
+    cutoff = datetime.utcnow() - timedelta(days=30)
+
+    with (
+        patch("app.db.batching.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        patch.object(async_session, "commit", wraps=async_session.commit) as commit,
+    ):
+        deleted = await delete_in_batches(
+            async_session, Notification.id, Notification.created_at <= cutoff, batch_size=3, throttle_seconds=0.5
+        )
+
+    assert deleted == 7
+    assert commit.await_count == 3
+    assert sleep.await_count == 2
+    assert await async_session.scalar(select(func.count()).select_from(Notification)) == 2
@@ -0,0 +1,66 @@
+"""Tests for the monthly partitioning helpers."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.partitioning import (
+    add_months,
+    convert_to_partitioned,
+    ensure_partitions,
+    expired_partitions,
+    partition_month,
+    partition_name,
+)
+from app.models.notification import Notification, NotificationType
+from app.services.cleanup_service import cleanup_service
+
+
+def test_month_arithmetic_and_names_round_trip():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    name = partition_name("notification", date(2027, 2, 1))
+
+    assert name == "notification_y2027m02"
+    assert partition_month("notification", name) == date(2027, 2, 1)
+    assert partition_month("chatmessage", name) is None
+    assert partition_month("notification", "notification_default") is None
+
+
+def test_expired_partitions_keeps_the_month_straddling_the_cutoff():
+    names = [
+        "notification_default",
+        "notification_y2026m09",
+        "notification_y2026m07",
+        "notification_y2026m08",
+        "chatmessage_y2020m01",
+    ]
+
+    expired = expired_partitions("notification", names, datetime(2026, 9, 1))
+
+    assert expired == ["notification_y2026m07", "notification_y2026m08"]
+    assert expired_partitions("notification", names, datetime(2026, 8, 31, 23)) == ["notification_y2026m07"]
+
+
+@pytest.mark.asyncio
+async def test_partitioning_is_a_no_op_off_postgresql(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+    async_session.add(
+        Notification(
+            user_id=user.id,
+            vault_id=vault.id,
+            notification_type=NotificationType.LEVEL_UP,
+            title="old",
+            message="m",
+            created_at=datetime.utcnow() - timedelta(days=90),
+        )
+    )
+    await async_session.commit()
+    connection = await async_session.connection()
+
+    assert await connection.run_sync(convert_to_partitioned, "notification", 3) is False
+    assert await connection.run_sync(ensure_partitions, 3) == []
+    # Retention falls back to the batched delete
+    assert await cleanup_service.cleanup_old_notifications(async_session, retention_days=30) == 1
@@ -3,7 +3,7 @@
 import logging
 
 from app.core.config import Settings
-from app.core.logging import setup_logging
+from app.core.logging import SamplingFilter, _LogQueueHandler, setup_logging
 
 
 def test_production_uses_persistent_log_file_when_path_is_unset() -> None:
@@ -39,3 +39,85 @@ def test_setup_logging_creates_nested_log_file(tmp_path) -> None:
         for handler in previous_handlers:
             root_logger.addHandler(handler)
         root_logger.setLevel(previous_level)
+
+
+def test_setup_logging_writes_through_background_listener(tmp_path) -> None:
+    root_logger = logging.getLogger()
+    previous_handlers = root_logger.handlers[:]
+    previous_level = root_logger.level
+    log_path = tmp_path / "queued.log"
+
+    try:
+        setup_logging(log_level="INFO", log_file=str(log_path))
+        assert [type(handler) for handler in root_logger.handlers] == [_LogQueueHandler]
+
+        logging.getLogger("test.queue").info("queued %s of %d", "record", 1)
+        root_logger.handlers[0].flush()
+
+        assert "queued record of 1" in log_path.read_text(encoding="utf-8")
+    finally:
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        for handler in previous_handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(previous_level)
+
+
+def _record(name: str, level: int = logging.INFO, msg: str = "tick %s") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, ("x",), None)
+
+
+def test_sampling_filter_applies_most_specific_rule_to_child_loggers() -> None:
+    sampling = SamplingFilter(sample_rates={"app.services": 1.0, "app.services.game_loop": 0.0})
+
+    assert sampling.filter(_record("app.services.resource_manager"))
+    assert not sampling.filter(_record("app.services.game_loop"))
+    assert not sampling.filter(_record("app.services.game_loop.child"))
+    assert sampling.filter(_record("app.services.game_loop", logging.WARNING))
+    assert sampling.filter(_record("app.api"))
+
+
+def test_sampling_filter_rate_limits_each_message_template(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("app.core.logging.time.monotonic", lambda: now[0])
+    sampling = SamplingFilter(rate_limits={"app.services.resource_manager": 2}, window_seconds=60)
+    name = "app.services.resource_manager"
+
+    kept = [sampling.filter(_record(name)) for _ in range(4)]
+    assert kept == [True, True, False, False]
+    assert sampling.filter(_record(name, msg="other template %s"))
+    assert sampling.filter(_record(name, logging.ERROR))
+
+    now[0] += 60
+    assert sampling.filter(_record(name))
+
+
+def test_sampling_filter_rate_limits_f_string_messages_by_call_site(monkeypatch) -> None:
+    monkeypatch.setattr("app.core.logging.time.monotonic", lambda: 100.0)
+    sampling = SamplingFilter(rate_limits={"app.services": 1}, window_seconds=60)
+
+    def formatted(value: int, lineno: int = 1) -> logging.LogRecord:
+        return logging.LogRecord(
+            "app.services.vault", logging.INFO, __file__, lineno, f"vault {value} ticked", None, None
+        )
+
+    assert sampling.filter(formatted(1))
+    assert not sampling.filter(formatted(2))
+    assert sampling.filter(formatted(3, lineno=2))
+    assert len(sampling._windows) == 2
+
+
+def test_sampling_filter_drops_expired_windows_and_caps_their_number(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("app.core.logging.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("app.core.logging._MAX_RATE_WINDOWS", 3)
+    sampling = SamplingFilter(rate_limits={"app.services": 1}, window_seconds=60)
+
+    for lineno in range(5):
+        sampling.filter(logging.LogRecord("app.services", logging.INFO, __file__, lineno, "tick", None, None))
+    assert [key[2] for key in sampling._windows] == [2, 3, 4]
+
+    now[0] += 60
+    sampling.filter(_record("app.services"))
+    assert len(sampling._windows) == 1
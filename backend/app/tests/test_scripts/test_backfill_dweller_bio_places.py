@@ -76,6 +76,7 @@ async def test_main_all_active_delegates_to_service() -> None:
             mock_session,
             max_dwellers_per_vault=50,
             max_vaults=10,
+            checkpoint=None,
         )
         assert result == expected
 
@@ -176,9 +176,9 @@ class TestInitializationGateway:
 
         svc = _make_fresh_service()
         with (
-            patch("app.services.ai_service.gateway_provider", return_value=mock_provider) as mock_gw_provider,
-            patch("app.services.ai_service.OpenAIChatModel", return_value=mock_model) as mock_chat_model,
-            patch("app.services.ai_service.openai.Client", return_value=mock_client) as mock_openai_client,
+            patch("pydantic_ai.providers.gateway.gateway_provider", return_value=mock_provider) as mock_gw_provider,
+            patch("pydantic_ai.models.openai.OpenAIChatModel", return_value=mock_model) as mock_chat_model,
+            patch("openai.Client", return_value=mock_client) as mock_openai_client,
         ):
             svc._initialize_gateway()
             assert svc._model is mock_model
@@ -206,7 +206,7 @@ class TestInitializationGateway:
         monkeypatch.setattr("app.services.ai_service.settings.AI_PROVIDER", "openai")
         svc = _make_fresh_service()
 
-        with patch("app.services.ai_service.gateway_provider") as mock_gw_provider:
+        with patch("pydantic_ai.providers.gateway.gateway_provider") as mock_gw_provider:
             svc._initialize_gateway()
 
         mock_gw_provider.assert_called_once_with(
@@ -220,7 +220,7 @@ class TestInitializationGateway:
         monkeypatch.setattr("app.services.ai_service.settings.PYDANTIC_AI_GATEWAY_API_KEY", "gw-test-key")
         monkeypatch.setattr("app.services.ai_service.settings.AI_PROVIDER", "openai")
         svc = _make_fresh_service()
-        with patch("app.services.ai_service.gateway_provider", side_effect=Exception("connection error")):
+        with patch("pydantic_ai.providers.gateway.gateway_provider", side_effect=Exception("connection error")):
             svc._initialize_gateway()
             assert svc._model is None
             assert svc._using_gateway is False
@@ -246,9 +246,9 @@ class TestInitializationDirect:
 
         svc = _make_fresh_service()
         with (
-            patch("app.services.ai_service.openai.Client", return_value=mock_client),
+            patch("openai.Client", return_value=mock_client),
             patch("pydantic_ai.providers.openai.OpenAIProvider", return_value=mock_provider),
-            patch("app.services.ai_service.OpenAIChatModel", return_value=mock_model),
+            patch("pydantic_ai.models.openai.OpenAIChatModel", return_value=mock_model),
             patch("app.services.ai_service.warnings.warn") as mock_warn,
         ):
             svc._initialize_direct_provider()
@@ -314,7 +314,7 @@ class TestInitializationOllama:
         svc = _make_fresh_service()
         with (
             patch("pydantic_ai.providers.ollama.OllamaProvider", return_value=mock_provider),
-            patch("app.services.ai_service.OpenAIChatModel", return_value=mock_model),
+            patch("pydantic_ai.models.openai.OpenAIChatModel", return_value=mock_model),
         ):
             svc._initialize_ollama()
             assert svc._model is mock_model
@@ -413,7 +413,7 @@ class TestGenerateImage:
         mock_response.data = [mock_data]
         svc._client.images.generate.return_value = mock_response
 
-        with patch("app.services.ai_service.image_url_to_bytes", return_value=b"fake_bytes"):
+        with patch("app.utils.image_processing.image_url_to_bytes", return_value=b"fake_bytes"):
             result = await svc.generate_image(prompt="test", return_bytes=True)
             assert result == b"fake_bytes"
 
@@ -429,7 +429,7 @@ class TestGenerateImage:
         svc._client.images.generate.return_value = mock_response
 
         with (
-            patch("app.services.ai_service.image_url_to_bytes", return_value=None),
+            patch("app.utils.image_processing.image_url_to_bytes", return_value=None),
             pytest.raises(RuntimeError, match="Failed to fetch image from URL"),
         ):
             await svc.generate_image(prompt="test", return_bytes=True)
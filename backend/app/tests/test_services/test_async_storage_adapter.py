@@ -0,0 +1,181 @@
+"""Tests for the async RustFS storage facade, run against the in-memory S3 fake."""
+
+import asyncio
+import io
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+sys.modules.pop("app.services.storage", None)
+sys.modules.pop("app.services.storage.factory", None)
+
+from botocore.exceptions import ClientError, ReadTimeoutError
+from PIL import Image
+
+from app.services.storage.async_adapter import AsyncRustFSAdapter
+from app.services.storage.fake_s3 import FakeS3Client
+from app.services.storage.rustfs_adapter import RustFSAdapter
+from app.utils.exceptions import FileDownloadError, FileUploadError
+
+
+@pytest.fixture
+def mock_settings():
+    """Patch settings with valid RustFS config."""
+    with patch("app.services.storage.rustfs_adapter.settings") as mock:
+        mock.RUSTFS_ACCESS_KEY = "test-access-key"
+        mock.RUSTFS_SECRET_KEY = "test-secret-key"
+        mock.RUSTFS_DEFAULT_BUCKET = "test-bucket"
+        mock.RUSTFS_PUBLIC_URL = "http://rustfs.local:9000"
+        mock.RUSTFS_PUBLIC_BUCKET_WHITELIST = ["test-bucket", "dweller-images", "dweller-thumbnails"]
+        yield mock
+
+
+@pytest.fixture
+def fake_client() -> FakeS3Client:
+    return FakeS3Client()
+
+
+@pytest.fixture
+def storage(mock_settings, fake_client: FakeS3Client):
+    async_adapter = AsyncRustFSAdapter(RustFSAdapter(client=fake_client), max_workers=4)
+    yield async_adapter
+    async_adapter.close()
+
+
+def _png_bytes(size: tuple[int, int] = (512, 512)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=(40, 120, 200)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestUploads:
+    async def test_upload_file_creates_bucket_and_returns_public_url(self, storage, fake_client):
+        url = await storage.upload_file(b"hello", "greeting.txt", file_type="text/plain")
+
+        assert url == "http://rustfs.local:9000/test-bucket/greeting.txt"
+        assert fake_client.buckets["test-bucket"]["greeting.txt"].body == b"hello"
+
+    async def test_bucket_check_is_cached_between_uploads(self, storage, fake_client):
+        await storage.upload_file(b"one", "one.txt")
+        requests_after_first = fake_client.request_count
+        await storage.upload_file(b"two", "two.txt")
+
+        # Second upload is a single PUT: no HEAD/CREATE bucket round trips
+        assert fake_client.request_count == requests_after_first + 1
+
+    async def test_upload_image_with_thumbnail_writes_both_objects(self, storage, fake_client):
+        image_url, thumbnail_url = await storage.upload_image_with_thumbnail(
+            file_data=_png_bytes(),
+            file_name="dweller.png",
+            thumbnail_name="dweller_thumbnail.png",
+            bucket_name="dweller-images",
+            thumbnail_bucket_name="dweller-thumbnails",
+        )
+
+        assert image_url.endswith("/dweller-images/dweller.png")
+        assert thumbnail_url.endswith("/dweller-thumbnails/dweller_thumbnail.png")
+        thumbnail = Image.open(io.BytesIO(fake_client.buckets["dweller-thumbnails"]["dweller_thumbnail.png"].body))
+        assert max(thumbnail.size) <= 256
+
+    async def test_large_upload_uses_multipart(self, storage, fake_client):
+        storage.multipart_threshold = 1024
+        storage.multipart_chunk_size = 256
+        payload = bytes(range(256)) * 5  # 1280 bytes -> 5 parts
+
+        url = await storage.upload_file(payload, "voice.webm", file_type="audio/webm")
+
+        stored = fake_client.buckets["test-bucket"]["voice.webm"]
+        assert url.endswith("/test-bucket/voice.webm")
+        assert stored.body == payload
+        assert stored.content_type == "audio/webm"
+        assert stored.etag.endswith('-5"')
+        assert fake_client.pending_uploads == 0
+
+    async def test_multipart_failure_aborts_upload(self, storage, fake_client):
+        storage.multipart_threshold = 1024
+        storage.multipart_chunk_size = 256
+
+        def _failing_upload_part(**kwargs):
+            raise ClientError({"Error": {"Code": "InternalError", "Message": "boom"}}, "UploadPart")
+
+        with patch.object(fake_client, "upload_part", side_effect=_failing_upload_part), pytest.raises(FileUploadError):
+            await storage.upload_file(b"x" * 2048, "broken.bin")
+
+        assert fake_client.pending_uploads == 0
+        assert "broken.bin" not in fake_client.buckets["test-bucket"]
+
+    async def test_multipart_timeout_aborts_upload(self, storage, fake_client):
+        storage.multipart_threshold = 1024
+        storage.multipart_chunk_size = 256
+
+        def _timing_out_upload_part(**kwargs):
+            raise ReadTimeoutError(endpoint_url="http://rustfs.local:9000")
+
+        with (
+            patch.object(fake_client, "upload_part", side_effect=_timing_out_upload_part),
+            pytest.raises(FileUploadError),
+        ):
+            await storage.upload_file(b"x" * 2048, "slow.bin")
+
+        assert fake_client.pending_uploads == 0
+
+    async def test_cancelled_multipart_upload_is_aborted(self, storage, fake_client):
+        storage.multipart_threshold = 1024
+        storage.multipart_chunk_size = 256
+        started, release = threading.Event(), threading.Event()
+        upload_part = fake_client.upload_part
+
+        def _blocking_upload_part(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return upload_part(**kwargs)
+
+        with patch.object(fake_client, "upload_part", side_effect=_blocking_upload_part):
+            task = asyncio.create_task(storage.upload_file(b"x" * 2048, "cancelled.bin"))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert fake_client.pending_uploads == 0
+        assert "cancelled.bin" not in fake_client.buckets["test-bucket"]
+
+    async def test_disabled_storage_skips_upload(self):
+        with patch("app.services.storage.rustfs_adapter.settings") as mock:
+            mock.RUSTFS_ACCESS_KEY = None
+            mock.RUSTFS_SECRET_KEY = None
+            mock.RUSTFS_DEFAULT_BUCKET = "test-bucket"
+            storage = AsyncRustFSAdapter(RustFSAdapter())
+
+        assert storage.enabled is False
+        assert await storage.upload_file(b"data", "file.bin") == ""
+        assert await storage.upload_multipart(b"data", "file.bin") == ""
+
+
+class TestDownloads:
+    async def test_iter_file_streams_in_chunks(self, storage, fake_client):
+        payload = b"abcdefghij" * 10
+        await storage.upload_file(payload, "stream.bin")
+
+        chunks = [chunk async for chunk in storage.iter_file(file_name="stream.bin", chunk_size=32)]
+
+        assert b"".join(chunks) == payload
+        assert [len(chunk) for chunk in chunks] == [32, 32, 32, 4]
+
+    async def test_iter_file_missing_key_raises(self, storage, fake_client):
+        await storage.upload_file(b"data", "present.bin")
+
+        with pytest.raises(FileDownloadError):
+            _ = [chunk async for chunk in storage.iter_file(file_name="missing.bin")]
+
+    async def test_download_exists_list_and_delete(self, storage):
+        await storage.upload_file(b"payload", "chat/a.mp3")
+
+        assert await storage.download_file(file_name="chat/a.mp3") == b"payload"
+        assert await storage.file_exists(file_name="chat/a.mp3") is True
+        assert await storage.list_files(prefix="chat/") == ["chat/a.mp3"]
+        assert await storage.delete_file(file_name="chat/a.mp3") is True
+        assert await storage.file_exists(file_name="chat/a.mp3") is False
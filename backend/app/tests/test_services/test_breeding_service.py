@@ -693,6 +693,33 @@ async def test_check_for_conception_single_slot_limits_pairs(
     assert len(pregnancies) == 1
 
 
+@pytest.mark.asyncio
+async def test_check_for_conception_mother_with_two_partner_links_conceives_once(
+    async_session: AsyncSession,
+    vault: Vault,
+    living_quarters: Room,
+    male_dweller: Dweller,
+    male_dweller_2: Dweller,
+    female_dweller: Dweller,
+):
+    """A one-way partner link is enough, but a mother linked to two men conceives only once per tick."""
+    female_dweller.partner_id = male_dweller.id
+    male_dweller_2.partner_id = female_dweller.id
+    for dweller in (male_dweller, male_dweller_2, female_dweller):
+        dweller.room_id = living_quarters.id
+    await async_session.commit()
+
+    with (
+        patch("random.random", return_value=0.0),
+        patch.object(async_session, "commit", wraps=async_session.commit) as commit,
+    ):
+        pregnancies = await BreedingService.check_for_conception(async_session, vault.id)
+
+    assert len(pregnancies) == 1
+    assert pregnancies[0].mother_id == female_dweller.id
+    assert commit.await_count == 1
+
+
 @pytest.mark.asyncio
 async def test_check_due_pregnancies_none_due(
     async_session: AsyncSession,
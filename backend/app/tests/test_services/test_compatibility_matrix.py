@@ -0,0 +1,105 @@
+"""Tests for the vault-wide compatibility matrix and its cache."""
+
+import random
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import crud
+from app.models.vault import Vault
+from app.schemas.common import AgeGroupEnum, GenderEnum, RarityEnum
+from app.schemas.dweller import DwellerCreate
+from app.services.compatibility_matrix import CompatibilityMatrix, CompatibilityMatrixCache, pair_score
+from app.services.family_scenario_service import FamilyScenarioService
+
+
+async def _make_adults(async_session: AsyncSession, vault: Vault, count: int) -> list:
+    rng = random.Random(7)
+    dwellers = []
+    for i in range(count):
+        dweller_in = DwellerCreate(
+            first_name=f"Adult {i}",
+            gender=GenderEnum.MALE if i % 2 else GenderEnum.FEMALE,
+            rarity=RarityEnum.COMMON,
+            age_group=AgeGroupEnum.ADULT,
+            level=rng.randint(1, 30),
+            happiness=rng.randint(10, 100),
+            vault_id=vault.id,
+            **{attr: rng.randint(1, 10) for attr in ("strength", "perception", "endurance", "charisma", "luck")},
+        )
+        dwellers.append(await crud.dweller.create(db_session=async_session, obj_in=dweller_in))
+    return dwellers
+
+
+async def test_matrix_matches_pairwise_scores(async_session: AsyncSession, vault: Vault):
+    dwellers = await _make_adults(async_session, vault, 6)
+
+    matrix = CompatibilityMatrix.build(dwellers)
+
+    for first in dwellers:
+        for second in dwellers:
+            if first is second:
+                assert matrix.score(first.id, second.id) == 0.0
+                continue
+            assert matrix.score(first.id, second.id) == pytest.approx(pair_score(first, second).score)
+
+
+async def test_top_matches_ranked_and_filtered(async_session: AsyncSession, vault: Vault):
+    dwellers = await _make_adults(async_session, vault, 6)
+    matrix = CompatibilityMatrix.build(dwellers)
+
+    matches = matrix.top_matches(dwellers[0].id, limit=10)
+    assert len(matches) == 5
+    assert [m.score for m in matches] == sorted((m.score for m in matches), reverse=True)
+
+    opposite = matrix.top_matches(dwellers[0].id, limit=10, opposite_gender=True)
+    assert {m.dweller_2_id for m in opposite} == {d.id for d in dwellers if d.gender == GenderEnum.MALE}
+    assert opposite[0] == pair_score(dwellers[0], next(d for d in dwellers if d.id == opposite[0].dweller_2_id))
+
+    with pytest.raises(KeyError):
+        matrix.top_matches(vault.id)
+
+
+async def test_best_pairs_are_disjoint_and_opposite_gender_first(async_session: AsyncSession, vault: Vault):
+    dwellers = await _make_adults(async_session, vault, 9)  # 5 female, 4 male
+    matrix = CompatibilityMatrix.build(dwellers)
+    genders = {d.id: d.gender for d in dwellers}
+
+    pairs = matrix.best_pairs(4)
+
+    assert len(pairs) == 4
+    assert len({dweller_id for pair in pairs for dweller_id in pair}) == 8
+    assert all({genders[a], genders[b]} == {GenderEnum.MALE, GenderEnum.FEMALE} for a, b in pairs)
+    assert matrix.best_pairs(4, rng=random.Random(1)) == matrix.best_pairs(4, rng=random.Random(1))
+    assert matrix.best_pairs(1, exclude=[pairs[0][0]])[0] != pairs[0]
+
+
+async def test_cache_reuses_matrix_until_stats_change(async_session: AsyncSession, vault: Vault):
+    dwellers = await _make_adults(async_session, vault, 3)
+    cache = CompatibilityMatrixCache()
+
+    first = await cache.get(async_session, vault.id)
+    assert await cache.get(async_session, vault.id) is first
+    assert len(first) == 3
+
+    dwellers[0].strength = 10 if dwellers[0].strength != 10 else 1
+    async_session.add(dwellers[0])
+    await async_session.commit()
+
+    rebuilt = await cache.get(async_session, vault.id)
+    assert rebuilt is not first
+    assert rebuilt.specials[rebuilt.index_of(dwellers[0].id)][0] == dwellers[0].strength
+
+    await _make_adults(async_session, vault, 1)
+    assert len(await cache.get(async_session, vault.id)) == 4
+
+
+async def test_auto_pair_uses_matrix(async_session: AsyncSession, vault: Vault):
+    dwellers = await _make_adults(async_session, vault, 4)
+
+    pairs = await FamilyScenarioService.auto_pair(async_session, vault.id, 2, seed=3)
+
+    assert len(pairs) == 2
+    assert {dweller_id for pair in pairs for dweller_id in pair} == {d.id for d in dwellers}
+    with pytest.raises(ValueError, match="adult dwellers"):
+        await FamilyScenarioService.auto_pair(async_session, vault.id, 3, seed=3)
@@ -70,7 +70,7 @@ async def test_add_event_persists_location_name(
     vault: Vault,
     dweller: Dweller,
 ):
-    """add_event with location_name persists the key into exploration.events[-1]."""
+    """add_event with location_name persists the key into the exploration's journal."""
     exploration = await crud.exploration.create_with_dweller_stats(
         async_session,
         vault_id=vault.id,
@@ -85,8 +85,13 @@ async def test_add_event_persists_location_name(
         description="Discovered Rusty Depot in the wasteland.",
         location_name="Rusty Depot",
     )
-    assert len(exploration.events) == 1
-    persisted = exploration.events[-1]
+    async_session.add(exploration)
+    await async_session.commit()
+
+    records = await crud.exploration_event.get_records(async_session, exploration.id)
+    assert exploration.event_count == 1
+    assert len(records) == 1
+    persisted = records[-1]
     assert persisted["type"] == "discovery"
     assert persisted["location_name"] == "Rusty Depot"
 
@@ -211,8 +216,12 @@ async def test_event_without_location_name_persists_as_before(
         event_type="combat",
         description="Fought a raider.",
     )
-    assert len(exploration.events) == 1
-    persisted = exploration.events[-1]
+    async_session.add(exploration)
+    await async_session.commit()
+
+    records = await crud.exploration_event.get_records(async_session, exploration.id)
+    assert len(records) == 1
+    persisted = records[-1]
     assert "location_name" not in persisted
     assert persisted["type"] == "combat"
     assert persisted["description"] == "Fought a raider."
@@ -243,10 +252,10 @@ async def test_coordinator_uses_location_name(
     with patch.object(event_generator, "generate_event", return_value=mock_event):
         result = await exploration_service.process_event(async_session, exploration)
 
-    await async_session.refresh(result)
-    assert len(result.events) == 1
-    assert result.events[0]["type"] == "discovery"
-    assert result.events[0]["location_name"] == "Rusty Depot"
+    records = await crud.exploration_event.get_records(async_session, result.id)
+    assert result.event_count == 1
+    assert records[0]["type"] == "discovery"
+    assert records[0]["location_name"] == "Rusty Depot"
 
 
 @pytest.mark.asyncio
@@ -286,7 +295,7 @@ async def test_process_event_registers_discovery_location(
     assert locations[0].exploration_id == exploration.id
     assert locations[0].name == "Rusty Depot"
 
-    event = result.events[0]
+    event = (await crud.exploration_event.get_records(async_session, result.id))[0]
     assert event["location_name"] == "Rusty Depot"
     assert event["location_id"] == str(locations[0].id)
     assert event["coord_x"] == locations[0].coord_x
@@ -361,9 +370,9 @@ async def test_process_event_register_discovery_failure_does_not_break_event(
         result = await exploration_service.process_event(async_session, exploration)
 
     # Event still persisted despite map_service failure
-    await async_session.refresh(result)
-    assert len(result.events) == 1
-    assert result.events[0]["location_name"] == "Glowing Crater"
+    records = await crud.exploration_event.get_records(async_session, result.id)
+    assert len(records) == 1
+    assert records[0]["location_name"] == "Glowing Crater"
 
     # No DISCOVERY WastelandLocation row (register_discovery failed)
     location_stmt = select(WastelandLocation).where(
@@ -377,3 +386,62 @@ async def test_process_event_register_discovery_failure_does_not_break_event(
     llm_count_stmt = select(LLMInteraction)
     llm_rows = (await async_session.execute(llm_count_stmt)).scalars().all()
     assert len(llm_rows) == 0
+
+
+@pytest.mark.asyncio
+async def test_process_events_register_discovery_failure_keeps_earlier_events_in_batch(
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+):
+    """Failure: registration fails for the second of two explorations → only that registration is dropped."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from app.crud.wasteland_location import wasteland_location as wl_crud
+    from app.schemas.dweller import DwellerCreate
+    from app.tests.factory.dwellers import create_fake_dweller
+
+    vault_id, dweller_id = vault.id, dweller.id  # the failed savepoint expires the vault it bumped
+    dweller2 = await crud.dweller.create(async_session, DwellerCreate(**create_fake_dweller(), vault_id=vault.id))
+    explorations = []
+    for explorer in (dweller, dweller2):
+        exploration = await crud.exploration.create_with_dweller_stats(
+            async_session, vault_id=vault.id, dweller_id=explorer.id, duration=4
+        )
+        _make_expired_exploration(exploration)
+        explorations.append(exploration)
+    await async_session.commit()
+
+    original_get_or_create = wl_crud.get_or_create
+    calls = []
+
+    async def get_or_create_failing_second(*args, **kwargs):
+        calls.append(kwargs["name"])
+        location = await original_get_or_create(*args, **kwargs)
+        if len(calls) == 2:
+            raise SQLAlchemyError("forced failure after flush")
+        return location
+
+    def discovery_for(exploration, rng=None):
+        return DiscoveryEventSchema(description="Found a place.", location_name=f"Crater {exploration.dweller_id}")
+
+    with (
+        patch.object(event_generator, "generate_event", side_effect=discovery_for),
+        patch.object(wl_crud, "get_or_create", side_effect=get_or_create_failing_second),
+    ):
+        processed = await exploration_service.process_events(async_session, explorations)
+
+    assert len(processed) == 2
+    first_records = await crud.exploration_event.get_records(async_session, explorations[0].id)
+    second_records = await crud.exploration_event.get_records(async_session, explorations[1].id)
+    assert [record["location_name"] for record in first_records] == [f"Crater {dweller_id}"]
+    assert first_records[0]["location_id"] is not None
+    assert len(second_records) == 1
+    assert "location_id" not in second_records[0]
+
+    # Only the first registration survived; the second's flushed row was rolled back with its savepoint
+    location_stmt = select(WastelandLocation.name).where(
+        WastelandLocation.type == LocationTypeEnum.DISCOVERY,
+        WastelandLocation.vault_id == vault_id,
+    )
+    assert (await async_session.execute(location_stmt)).scalars().all() == [f"Crater {dweller_id}"]
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.schemas.media import ImageVariant, StoredImage
 from app.services.dweller_ai import BIO_MAX_LENGTH, dweller_ai
 
 pytestmark = pytest.mark.asyncio
@@ -53,6 +54,14 @@ def _make_user_mock() -> MagicMock:
     return user
 
 
+def _make_media_mock(url: str = "http://cdn.example.com/photo.png") -> MagicMock:
+    """Return a media_service mock whose store_image yields an image without variants."""
+    media = MagicMock()
+    media.store_image = AsyncMock(return_value=StoredImage(digest="abc", url=url, variants=[]))
+    media.store_blob = AsyncMock(return_value="http://cdn.example.com/voice.mp3")
+    return media
+
+
 def _make_agent_result(output, input_tokens=50, output_tokens=30, total_tokens=80) -> MagicMock:
     """Return a mock agent result with usage info."""
     result = MagicMock()
@@ -445,8 +454,14 @@ async def test_generate_photo_success(mock_crud: MagicMock, mock_llm: MagicMock)
     fake_image_bytes = b"\x89PNG\r\n\x1a\n"  # minimal PNG header
 
     mock_storage = MagicMock()
-    mock_storage.upload_file.return_value = "http://cdn.example.com/dweller.png"
-    mock_storage.upload_thumbnail.return_value = "http://cdn.example.com/dweller_thumb.png"
+    stored = StoredImage(
+        digest="abc",
+        url="http://cdn.example.com/dweller.png",
+        variants=[
+            ImageVariant(format="webp", width=128, height=128, url="http://cdn.example.com/128.webp", size_bytes=10),
+            ImageVariant(format="webp", width=256, height=256, url="http://cdn.example.com/256.webp", size_bytes=20),
+        ],
+    )
 
     mock_openai = MagicMock()
     mock_openai.generate_image = AsyncMock(return_value=fake_image_bytes)
@@ -454,16 +469,23 @@ async def test_generate_photo_success(mock_crud: MagicMock, mock_llm: MagicMock)
     with (
         patch.object(dweller_ai, "storage_service", mock_storage),
         patch.object(dweller_ai, "ai_service", mock_openai),
+        patch("app.services.dweller_ai.media_service") as mock_media,
     ):
+        mock_media.store_image = AsyncMock(return_value=stored)
         result = await dweller_ai.generate_photo(
             user=_make_user_mock(), db_session=MagicMock(), dweller_info=mock_dweller
         )
 
     assert result is mock_dweller
     mock_openai.generate_image.assert_called_once()
-    mock_storage.upload_file.assert_called_once()
-    mock_storage.upload_thumbnail.assert_called_once()
-    mock_crud.update.assert_called_once()
+    mock_media.store_image.assert_awaited_once()
+    store_kwargs = mock_media.store_image.call_args.kwargs
+    assert store_kwargs["bucket_name"] == "dweller-images"
+    assert store_kwargs["variants_bucket"] == "dweller-thumbnails"
+    update_obj = mock_crud.update.call_args.args[2]
+    assert update_obj.image_url == "http://cdn.example.com/dweller.png"
+    assert update_obj.thumbnail_url == "http://cdn.example.com/256.webp"
+    assert len(update_obj.image_variants) == 2
     mock_llm.create.assert_called_once()
 
 
@@ -478,8 +500,6 @@ async def test_generate_photo_force_overwrite(mock_crud: MagicMock, mock_llm: Ma
     fake_image_bytes = b"\x89PNG\r\n\x1a\n"
 
     mock_storage = MagicMock()
-    mock_storage.upload_file.return_value = "http://cdn.example.com/new.png"
-    mock_storage.upload_thumbnail.return_value = "http://cdn.example.com/new_thumb.png"
 
     mock_openai = MagicMock()
     mock_openai.generate_image = AsyncMock(return_value=fake_image_bytes)
@@ -487,7 +507,11 @@ async def test_generate_photo_force_overwrite(mock_crud: MagicMock, mock_llm: Ma
     with (
         patch.object(dweller_ai, "storage_service", mock_storage),
         patch.object(dweller_ai, "ai_service", mock_openai),
+        patch("app.services.dweller_ai.media_service") as mock_media,
     ):
+        mock_media.store_image = AsyncMock(
+            return_value=StoredImage(digest="def", url="http://cdn.example.com/new.png", variants=[])
+        )
         result = await dweller_ai.generate_photo(
             user=_make_user_mock(), db_session=MagicMock(), dweller_info=mock_dweller, force=True
         )
@@ -610,7 +634,8 @@ async def test_generate_audio_success(mock_crud: MagicMock, mock_llm: MagicMock,
 
     mock_storage = MagicMock()
     mock_storage.enabled = True
-    mock_storage.upload_file.return_value = "http://cdn.example.com/voice.mp3"
+    mock_storage.file_exists = AsyncMock(return_value=False)
+    mock_storage.upload_file = AsyncMock(return_value="http://cdn.example.com/voice.mp3")
 
     mock_openai = MagicMock()
     mock_openai.generate_audio = AsyncMock(return_value=fake_audio)
@@ -659,7 +684,8 @@ async def test_generate_audio_empty_bytes_warning(
 
     mock_storage = MagicMock()
     mock_storage.enabled = True
-    mock_storage.upload_file.return_value = "http://cdn.example.com/silent.mp3"
+    mock_storage.file_exists = AsyncMock(return_value=False)
+    mock_storage.upload_file = AsyncMock(return_value="http://cdn.example.com/silent.mp3")
 
     mock_openai = MagicMock()
     mock_openai.generate_audio = AsyncMock(return_value=b"")  # empty bytes
@@ -699,8 +725,6 @@ async def test_generate_avatar_updates_and_generates_photo(
     fake_image_bytes = b"\x89PNG\r\n\x1a\n"
 
     mock_storage = MagicMock()
-    mock_storage.upload_file.return_value = "http://cdn.example.com/photo.png"
-    mock_storage.upload_thumbnail.return_value = "http://cdn.example.com/thumb.png"
 
     mock_openai = MagicMock()
     mock_openai.generate_image = AsyncMock(return_value=fake_image_bytes)
@@ -714,6 +738,7 @@ async def test_generate_avatar_updates_and_generates_photo(
         patch.object(dweller_ai, "storage_service", mock_storage),
         patch.object(dweller_ai, "ai_service", mock_openai),
         patch("app.services.dweller_ai.llm_interaction_crud", mock_llm),
+        patch("app.services.dweller_ai.media_service", _make_media_mock()),
     ):
         result = await dweller_ai.generate_dweller_avatar(
             dweller_id=mock_dweller.id,
@@ -752,11 +777,7 @@ async def test_generate_avatar_with_voice_line(mock_crud: MagicMock) -> None:
 
     mock_storage = MagicMock()
     mock_storage.enabled = True
-    mock_storage.upload_file.side_effect = [
-        "http://cdn.example.com/photo.png",  # image upload
-        "http://cdn.example.com/voice.mp3",  # audio upload
-    ]
-    mock_storage.upload_thumbnail.return_value = "http://cdn.example.com/thumb.png"
+    mock_media = _make_media_mock()
 
     mock_openai = MagicMock()
     mock_openai.generate_image = AsyncMock(return_value=fake_image_bytes)
@@ -777,6 +798,7 @@ async def test_generate_avatar_with_voice_line(mock_crud: MagicMock) -> None:
         patch.object(dweller_ai, "ai_service", mock_openai),
         patch("app.services.dweller_ai.llm_interaction_crud", mock_llm),
         patch("app.services.dweller_ai.quota_service", mock_quota),
+        patch("app.services.dweller_ai.media_service", mock_media),
     ):
         result = await dweller_ai.generate_dweller_avatar(
             dweller_id=mock_dweller.id,
@@ -791,7 +813,8 @@ async def test_generate_avatar_with_voice_line(mock_crud: MagicMock) -> None:
     # Both image and audio generated
     mock_openai.generate_image.assert_called_once()
     mock_openai.generate_audio.assert_called_once()
-    assert mock_storage.upload_file.call_count == 2  # image + audio
+    mock_media.store_image.assert_awaited_once()
+    mock_media.store_blob.assert_awaited_once()  # audio
 
 
 # ── dweller_generate_pipeline ────────────────────────────────────────────
@@ -887,8 +910,6 @@ async def test_pipeline_generates_all_from_scratch(mock_crud: MagicMock) -> None
 
     # Mock storage / OpenAI for photo
     mock_storage = MagicMock()
-    mock_storage.upload_file.return_value = "http://cdn.example.com/photo.png"
-    mock_storage.upload_thumbnail.return_value = "http://cdn.example.com/thumb.png"
 
     mock_openai = MagicMock()
     mock_openai.generate_image = AsyncMock(return_value=b"\x89PNG\r\n\x1a\n")
@@ -907,6 +928,7 @@ async def test_pipeline_generates_all_from_scratch(mock_crud: MagicMock) -> None
         patch("app.services.dweller_ai.llm_interaction_crud", mock_llm),
         patch.object(dweller_ai, "storage_service", mock_storage),
         patch.object(dweller_ai, "ai_service", mock_openai),
+        patch("app.services.dweller_ai.media_service", _make_media_mock()),
     ):
         result = await dweller_ai.dweller_generate_pipeline(
             db_session=MagicMock(),
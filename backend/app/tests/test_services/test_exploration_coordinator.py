@@ -28,6 +28,7 @@ from app.schemas.exploration_event import (
     WeaponSchema,
 )
 from app.services.exploration.coordinator import exploration_coordinator
+from app.services.exploration.event_generator import event_generator, exploration_rng
 
 
 async def _ensure_vault_storage(async_session: AsyncSession, vault_id) -> Storage:
@@ -623,7 +624,8 @@ async def test_auto_equip_equips_better_found_weapon_on_completion(
     )
 
     valid_types = {e.value for e in ExplorationEventType}
-    assert all(e["type"] in valid_types for e in exploration.events)
+    records = await crud.exploration_event.get_records(async_session, exploration.id)
+    assert all(e["type"] in valid_types for e in records)
     assert exploration.loot_collected[-1]["auto_equip"] is True
 
     exploration.start_time = datetime.utcnow() - timedelta(hours=exploration.duration)
@@ -935,8 +937,9 @@ async def test_medicine_loot_adds_single_log_entry(
     await _process_loot_event(async_session, exploration, loot_event)
 
     assert exploration.stimpaks == 1
-    assert len(exploration.events) == 1
-    assert exploration.events[0]["type"] == "loot"
+    records = await crud.exploration_event.get_records(async_session, exploration.id)
+    assert len(records) == 1
+    assert records[0]["type"] == "loot"
     assert exploration.loot_collected[-1]["item_type"] == "stimpak"
 
 
@@ -1102,3 +1105,79 @@ async def test_process_event_publishes_followup_events(
     assert published_types == ["loot", "equip", "item_use"]
     assert exploration.stimpaks == 0
     assert dweller.health == 60
+
+
+@pytest.mark.asyncio
+async def test_exploration_rng_replays_the_same_event(
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+):
+    """The per-exploration stream makes an event reproducible from the exploration's state."""
+    exploration = await crud.exploration.create_with_dweller_stats(
+        async_session,
+        vault_id=vault.id,
+        dweller_id=dweller.id,
+        duration=4,
+    )
+    exploration.start_time = datetime.utcnow() - timedelta(minutes=10)
+
+    first = event_generator.generate_event(exploration, rng=exploration_rng(exploration))
+    replay = event_generator.generate_event(exploration, rng=exploration_rng(exploration))
+
+    assert first is not None
+    assert replay.model_dump() == first.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_process_events_applies_batch_in_one_commit(
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+    make_vault_storage,
+):
+    """A batch applies health and auto-equip from preloaded rows and commits once."""
+    await make_vault_storage()
+    dweller.health = 100
+    dweller.max_health = 100
+    async_session.add(dweller)
+    await _equip_weapon(async_session, dweller, name=".32 pistol", rarity=RarityEnum.COMMON, damage_min=1, damage_max=2)
+    exploration = await crud.exploration.create_with_dweller_stats(
+        async_session,
+        vault_id=vault.id,
+        dweller_id=dweller.id,
+        duration=4,
+    )
+    loot_event = _weapon_loot_event("Fire hydrant bat", "Legendary", 19, 31, 500)
+
+    with (
+        patch("app.services.exploration.coordinator.event_generator.generate_event", return_value=loot_event),
+        patch("app.services.exploration.coordinator.sse_manager.publish", new_callable=AsyncMock) as publish_mock,
+        patch.object(async_session, "commit", wraps=async_session.commit) as commit_spy,
+    ):
+        processed = await exploration_coordinator.process_events(async_session, [exploration])
+
+    assert processed == [exploration]
+    commit_spy.assert_awaited_once()
+    records = await crud.exploration_event.get_records(async_session, exploration.id)
+    assert [event["type"] for event in records] == ["loot", "equip"]
+    assert exploration.loot_collected[-1]["auto_equip"] is True
+    assert publish_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_events_skips_explorations_not_due(
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+):
+    exploration = await crud.exploration.create_with_dweller_stats(
+        async_session,
+        vault_id=vault.id,
+        dweller_id=dweller.id,
+        duration=4,
+    )
+
+    # Freshly started: the first-event delay has not elapsed yet
+    assert await exploration_coordinator.process_events(async_session, [exploration]) == []
+    assert exploration.event_count == 0
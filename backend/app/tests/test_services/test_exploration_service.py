@@ -144,8 +144,7 @@ async def test_generate_event_with_loot(
                 loot=getattr(event, "loot", None),
             )
             # Move time forward to allow next event
-            if exploration.events:
-                exploration.events[-1]["timestamp"] = (datetime.utcnow() - timedelta(minutes=11)).isoformat()
+            exploration.last_event_at = datetime.utcnow() - timedelta(minutes=11)
 
     # Should have generated some events
     assert len(events_generated) > 0
@@ -200,8 +199,9 @@ async def test_process_event_adds_loot(
     # Verify distance was added (loot event adds 1-5 miles + base 1-3 miles)
     assert 2 <= result.total_distance <= 8
     # Verify event was added
-    assert len(result.events) == 1
-    assert result.events[0]["type"] == "loot"
+    records = await crud.exploration_event.get_records(async_session, result.id)
+    assert result.event_count == 1
+    assert records[0]["type"] == "loot"
     # Verify loot was collected
     assert len(result.loot_collected) == 1
     assert result.loot_collected[0]["item_name"] == "Desk Fan"
@@ -243,8 +243,9 @@ async def test_process_event_combat_increases_enemies(
     # Verify distance was added (all events add 1-3 miles)
     assert 1 <= result.total_distance <= 3
     # Verify event was added
-    assert len(result.events) == 1
-    assert result.events[0]["type"] == "combat"
+    records = await crud.exploration_event.get_records(async_session, result.id)
+    assert result.event_count == 1
+    assert records[0]["type"] == "combat"
 
 
 @pytest.mark.asyncio
@@ -25,6 +25,7 @@ from app.models.vault import Vault
 from app.schemas.incident import IncidentRoundResult
 from app.schemas.vault import ResourceTickEvents
 from app.services.game_loop import game_loop_service
+from app.services.vault_activity import VaultActivity, load_vault_activity
 
 # ═════════════════════════════════════════════════════════════════════
 # pause_vault / resume_vault / get_vault_status / _get_or_create
@@ -206,6 +207,80 @@ class TestProcessVaultTick:
         assert result is not None
         assert "updates" in result
 
+    @pytest.mark.asyncio
+    async def test_skips_phases_without_work(self, async_session: AsyncSession, vault: Vault, dweller: Dweller):
+        gs = await game_loop_service._get_or_create_game_state(async_session, vault.id)
+        gs.last_activity_time = datetime.utcnow() - timedelta(hours=1)
+        await async_session.commit()
+
+        activity = await load_vault_activity(async_session, vault.id)
+        result = await self._patched_tick(async_session, vault)
+
+        assert activity == VaultActivity(population=1)
+        assert result["skipped_phases"] == ["incidents", "explorations", "training", "breeding", "events"]
+        assert result["updates"]["explorations"] == {"skipped": True}
+        assert "skipped" not in result["updates"]["dwellers"]
+
+    @pytest.mark.asyncio
+    async def test_failed_tick_keeps_notifications_but_not_its_changes(
+        self, async_session: AsyncSession, user_with_vault: tuple
+    ):
+        from sqlmodel import select
+
+        from app.models.notification import Notification, NotificationType
+        from app.services.notification_service import NotificationService
+
+        user, vault = user_with_vault
+        user_id, vault_id, caps_before = user.id, vault.id, vault.bottle_caps
+
+        async def failing_phase(db_session, vault_id):
+            await NotificationService.create_and_send(
+                db_session,
+                user_id=user_id,
+                vault_id=vault_id,
+                notification_type=NotificationType.LEVEL_UP,
+                title="Level up",
+                message="A dweller levelled up",
+            )
+            tick_vault = await db_session.get(Vault, vault_id)
+            tick_vault.bottle_caps += 500
+            db_session.add(tick_vault)
+            raise RuntimeError("phase failed")
+
+        mock_update = MagicMock(power=100, food=50, water=75)
+        with (
+            patch.object(
+                game_loop_service.resource_manager,
+                "process_vault_resources",
+                new_callable=AsyncMock,
+                return_value=(mock_update, ResourceTickEvents()),
+            ),
+            patch.object(game_loop_service, "_process_incidents", new_callable=AsyncMock, return_value={}),
+            patch.object(game_loop_service, "_process_dwellers", side_effect=failing_phase),
+            patch("app.services.notification_service.manager.send_personal_messages", new_callable=AsyncMock),
+            patch("app.services.notification_service.sse_manager.publish", new_callable=AsyncMock),
+            pytest.raises(RuntimeError, match="phase failed"),
+        ):
+            await game_loop_service.process_vault_tick(async_session, vault_id)
+
+        stored_caps = (await async_session.execute(select(Vault.bottle_caps).where(Vault.id == vault_id))).scalar_one()
+        titles = (await async_session.execute(select(Notification.title).where(Notification.user_id == user_id))).all()
+        assert stored_caps == caps_before
+        assert titles == [("Level up",)]
+
+    def test_plan_runs_only_phases_with_work(self):
+        activity = VaultActivity(population=3, due_trainings=1, pending_pregnancies=1)
+
+        plan = game_loop_service._plan_phases(activity, user_online=False)
+
+        assert [phase for phase, run in plan.items() if run] == ["training", "breeding"]
+        assert game_loop_service._plan_breeding(activity) == {
+            "relationships": False,
+            "conception": False,
+            "births": True,
+            "aging": False,
+        }
+
 
 # ═════════════════════════════════════════════════════════════════════
 # _get_active_vaults
@@ -734,55 +809,38 @@ class TestProcessTraining:
     """Tests for training processing within the game loop."""
 
     @pytest.mark.asyncio
-    async def test_no_active_trainings(self, async_session: AsyncSession, vault: Vault):
-        with patch("app.crud.training.training.get_active_by_vault", new_callable=AsyncMock) as mag:
-            mag.return_value = []
+    async def test_no_due_trainings(self, async_session: AsyncSession, vault: Vault):
+        with patch("app.crud.training.training.get_due_by_vault", new_callable=AsyncMock) as mgd:
+            mgd.return_value = []
             result = await game_loop_service._process_training(async_session, vault.id)
-        assert result["active_count"] == 0
-        assert result["sessions_updated"] == 0
+        assert result["due_count"] == 0
         assert result["completed"] == 0
 
     @pytest.mark.asyncio
-    async def test_with_active_training(self, async_session: AsyncSession, vault: Vault):
+    async def test_completes_due_training(self, async_session: AsyncSession, vault: Vault):
         mt = MagicMock()
         mt.id = "t-1"
         mt.dweller_id = "d-1"
-        mu = MagicMock()
-        mu.is_completed = MagicMock(return_value=False)
-        with patch("app.crud.training.training.get_active_by_vault", new_callable=AsyncMock) as mag:
-            mag.return_value = [mt]
-            with patch("app.crud.training.training.get_dwellers_for_trainings", new_callable=AsyncMock) as md:
-                md.return_value = {mt.dweller_id: MagicMock()}
-                with patch(
-                    "app.services.training_service.training_service.update_training_progress", new_callable=AsyncMock
-                ) as mu_async:
-                    mu_async.return_value = mu
-                    result = await game_loop_service._process_training(async_session, vault.id)
-        assert result["active_count"] == 1
-        assert result["sessions_updated"] == 1
-        assert result["completed"] == 0
-
-    @pytest.mark.asyncio
-    async def test_detects_completion(self, async_session: AsyncSession, vault: Vault):
-        mt = MagicMock()
-        mt.id = "t-1"
-        mt.dweller_id = "d-1"
-        mu = MagicMock()
-        mu.is_completed = MagicMock(return_value=True)
-        mu.stat_being_trained = MagicMock()
-        mu.stat_being_trained.value = "strength"
-        mu.target_stat_value = 7
-        with patch("app.crud.training.training.get_active_by_vault", new_callable=AsyncMock) as mag:
-            mag.return_value = [mt]
-            with patch("app.crud.training.training.get_dwellers_for_trainings", new_callable=AsyncMock) as md:
-                md.return_value = {mt.dweller_id: MagicMock()}
-                with patch(
-                    "app.services.training_service.training_service.update_training_progress", new_callable=AsyncMock
-                ) as mu_async:
-                    mu_async.return_value = mu
-                    result = await game_loop_service._process_training(async_session, vault.id)
-        assert result["sessions_updated"] == 1
+        completed = MagicMock()
+        completed.stat_being_trained.value = "strength"
+        completed.target_stat_value = 7
+        with (
+            patch("app.crud.training.training.get_due_by_vault", new_callable=AsyncMock, return_value=[mt]),
+            patch(
+                "app.crud.training.training.get_dwellers_for_trainings",
+                new_callable=AsyncMock,
+                return_value={mt.dweller_id: MagicMock()},
+            ),
+            patch(
+                "app.services.training_service.training_service.complete_training",
+                new_callable=AsyncMock,
+                return_value=completed,
+            ) as mc,
+        ):
+            result = await game_loop_service._process_training(async_session, vault.id)
+        assert result["due_count"] == 1
         assert result["completed"] == 1
+        mc.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_error_in_one_does_not_stop(self, async_session: AsyncSession, vault: Vault):
@@ -792,38 +850,84 @@ class TestProcessTraining:
         t2 = MagicMock()
         t2.id = "t-2"
         t2.dweller_id = "d-2"
-        t2u = MagicMock()
-        t2u.is_completed = MagicMock(return_value=False)
         call_count = [0]
 
-        async def update_side(db_session, training, dweller=None):
+        async def complete_side(db_session, training_id, dweller=None):
             call_count[0] += 1
             if call_count[0] == 1:
                 raise RuntimeError("Training failed")
-            return t2u
-
-        with patch("app.crud.training.training.get_active_by_vault", new_callable=AsyncMock) as mag:
-            mag.return_value = [t1, t2]
-            with (
-                patch("app.crud.training.training.get_dwellers_for_trainings", new_callable=AsyncMock, return_value={}),
-                patch(
-                    "app.services.training_service.training_service.update_training_progress",
-                    new_callable=AsyncMock,
-                    side_effect=update_side,
-                ),
-            ):
-                result = await game_loop_service._process_training(async_session, vault.id)
-        assert result["active_count"] == 2
+            return MagicMock()
+
+        with (
+            patch("app.crud.training.training.get_due_by_vault", new_callable=AsyncMock, return_value=[t1, t2]),
+            patch("app.crud.training.training.get_dwellers_for_trainings", new_callable=AsyncMock, return_value={}),
+            patch(
+                "app.services.training_service.training_service.complete_training",
+                new_callable=AsyncMock,
+                side_effect=complete_side,
+            ),
+        ):
+            result = await game_loop_service._process_training(async_session, vault.id)
+        assert result["due_count"] == 2
+        assert result["completed"] == 1
 
     @pytest.mark.asyncio
     async def test_outer_exception_set_error(self, async_session: AsyncSession, vault: Vault):
         from sqlalchemy.exc import SQLAlchemyError
 
-        with patch("app.crud.training.training.get_active_by_vault", new_callable=AsyncMock) as mag:
-            mag.side_effect = SQLAlchemyError("Failed to load trainings")
+        with patch("app.crud.training.training.get_due_by_vault", new_callable=AsyncMock) as mgd:
+            mgd.side_effect = SQLAlchemyError("Failed to load trainings")
             result = await game_loop_service._process_training(async_session, vault.id)
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_running_training_is_neither_loaded_nor_written(
+        self, async_session: AsyncSession, vault: Vault, dweller: Dweller
+    ):
+        from app.models.room import Room
+        from app.models.training import Training
+        from app.schemas.common import RoomTypeEnum, SPECIALEnum
+
+        room = Room(
+            name="Weight Room",
+            category=RoomTypeEnum.TRAINING,
+            ability=SPECIALEnum.STRENGTH,
+            tier=1,
+            size=2,
+            size_min=1,
+            size_max=3,
+            capacity=6,
+            base_cost=1000,
+            t2_upgrade_cost=2500,
+            t3_upgrade_cost=5000,
+            vault_id=vault.id,
+        )
+        async_session.add(room)
+        await async_session.flush()
+        now = datetime.utcnow()
+        training = Training(
+            dweller_id=dweller.id,
+            room_id=room.id,
+            vault_id=vault.id,
+            stat_being_trained=SPECIALEnum.STRENGTH,
+            current_stat_value=5,
+            target_stat_value=6,
+            started_at=now - timedelta(hours=1),
+            estimated_completion_at=now + timedelta(hours=1),
+        )
+        async_session.add(training)
+        await async_session.commit()
+        updated_at = training.updated_at
+
+        activity = await load_vault_activity(async_session, vault.id)
+        result = await game_loop_service._process_training(async_session, vault.id)
+
+        assert activity.due_trainings == 0
+        assert result == {"due_count": 0, "completed": 0}
+        assert training.updated_at == updated_at
+        assert training.progress == 0.0
+        assert 49.0 < training.progress_percentage() < 51.0
+
 
 # ═════════════════════════════════════════════════════════════════════
 # _process_happiness
@@ -926,10 +1030,17 @@ class TestUpdateRoomRelationships:
             patch("app.services.game_loop.group_dwellers_by_room", return_value={"r-1": [d1, d2]}),
             patch.object(game_loop_service, "_fetch_existing_relationships", new_callable=AsyncMock, return_value=[]),
             patch.object(game_loop_service, "_build_relationships_map", return_value={}),
-            patch.object(game_loop_service, "_update_pair_affinity", new_callable=AsyncMock, return_value=0),
-            patch.object(game_loop_service, "_create_new_relationships", new_callable=AsyncMock, return_value=1),
+            patch.object(game_loop_service, "_affinity_gain", return_value=2),
+            patch(
+                "app.services.relationship_service.relationship_service.apply_affinity_gains",
+                new_callable=AsyncMock,
+                return_value=1,
+            ) as mock_apply,
         ):
             result = await game_loop_service._update_room_relationships(async_session, vault.id)
+        (gains, dwellers_by_id) = mock_apply.call_args.args[1:]
+        assert [gain for _, gain in gains] == [2]
+        assert dwellers_by_id == {"d-1": d1, "d-2": d2}
         assert result["relationships_updated"] == 1
 
     @pytest.mark.asyncio
@@ -981,8 +1092,7 @@ class TestRelationshipHelpers:
         result = await game_loop_service._fetch_existing_relationships(async_session, set())
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_update_pair_affinity_new_relationship(self, async_session: AsyncSession):
+    def test_collect_pair_gains_creates_missing_relationships(self):
         from app.schemas.common import RelationshipTypeEnum
 
         d1 = MagicMock()
@@ -991,81 +1101,82 @@ class TestRelationshipHelpers:
         d2 = MagicMock()
         d2.id = "d-2"
         d2.charisma = 10
-        new_rels = []
-        result = await game_loop_service._update_pair_affinity(async_session, d1, d2, {}, new_rels)
-        assert result == 0
-        assert len(new_rels) == 1
-        relationship, affinity_gain = new_rels[0]
+        rel_map = {}
+        gains = game_loop_service._collect_pair_gains({"r-1": [d1, d2]}, rel_map)
+        assert len(gains) == 1
+        relationship, affinity_gain = gains[0]
         assert relationship.dweller_1_id == "d-1"
         assert relationship.dweller_2_id == "d-2"
         assert relationship.relationship_type == RelationshipTypeEnum.ACQUAINTANCE
         assert affinity_gain == game_config.relationship.affinity_increase_per_tick + 1
+        assert rel_map[("d-2", "d-1")] is relationship
 
-    @pytest.mark.asyncio
-    async def test_update_pair_affinity_existing(self, async_session: AsyncSession):
+    def test_collect_pair_gains_reuses_existing(self):
         mr = MagicMock()
-        mr.dweller_1_id = "d-1"
-        mr.dweller_2_id = "d-2"
-        d1 = MagicMock()
-        d1.id = "d-1"
-        d1.charisma = 5
-        d2 = MagicMock()
-        d2.id = "d-2"
-        d2.charisma = 5
-        rel_map = {("d-1", "d-2"): mr, ("d-2", "d-1"): mr}
-        with patch(
-            "app.services.relationship_service.relationship_service.increase_affinity", new_callable=AsyncMock
-        ) as mi:
-            result = await game_loop_service._update_pair_affinity(async_session, d1, d2, rel_map, [])
-        mi.assert_called_once()
-        assert result == 1
-
-    @pytest.mark.asyncio
-    async def test_update_pair_affinity_new_in_list_skipped(self, async_session: AsyncSession):
-        mr = MagicMock()
-        mr.dweller_1_id = "d-1"
-        mr.dweller_2_id = "d-2"
-        d1 = MagicMock()
-        d1.id = "d-1"
-        d1.charisma = 5
-        d2 = MagicMock()
-        d2.id = "d-2"
-        d2.charisma = 5
-        new_rels = [(mr, game_config.relationship.affinity_increase_per_tick)]
-        rel_map = {("d-1", "d-2"): mr, ("d-2", "d-1"): mr}
-        with patch(
-            "app.services.relationship_service.relationship_service.increase_affinity", new_callable=AsyncMock
-        ) as mi:
-            result = await game_loop_service._update_pair_affinity(async_session, d1, d2, rel_map, new_rels)
-        mi.assert_not_called()
-        assert result == 0
+        dwellers = []
+        for i in range(3):
+            d = MagicMock()
+            d.id = f"d-{i}"
+            d.charisma = 5
+            dwellers.append(d)
+        rel_map = {("d-0", "d-1"): mr, ("d-1", "d-0"): mr}
+        gains = game_loop_service._collect_pair_gains({"r-1": dwellers, "r-2": []}, rel_map)
+        assert len(gains) == 3
+        assert gains[0][0] is mr
+        assert all(gain == game_config.relationship.affinity_increase_per_tick for _, gain in gains)
+
+    @pytest.mark.asyncio
+    async def test_update_room_relationships_end_to_end(self, async_session: AsyncSession, vault: Vault):
+        from sqlmodel import select
+
+        from app.models.relationship import Relationship
+        from app.models.room import Room
+        from app.schemas.common import GenderEnum, RarityEnum, RelationshipTypeEnum, RoomTypeEnum
+
+        room = Room(
+            name="Living Quarters",
+            category=RoomTypeEnum.CAPACITY,
+            ability=None,
+            base_cost=100,
+            t2_upgrade_cost=500,
+            t3_upgrade_cost=1500,
+            size_min=1,
+            size_max=3,
+            vault_id=vault.id,
+        )
+        async_session.add(room)
+        await async_session.commit()
+        roommates = [
+            Dweller(
+                first_name=f"Roomie {i}",
+                gender=GenderEnum.FEMALE,
+                rarity=RarityEnum.COMMON,
+                vault_id=vault.id,
+                room_id=room.id,
+                charisma=1,
+            )
+            for i in range(3)
+        ]
+        async_session.add_all(roommates)
+        await async_session.commit()
+        existing = Relationship(
+            dweller_1_id=roommates[0].id,
+            dweller_2_id=roommates[1].id,
+            relationship_type=RelationshipTypeEnum.FRIEND,
+            affinity=game_config.relationship.romance_threshold - 1,
+        )
+        async_session.add(existing)
+        await async_session.commit()
 
-    @pytest.mark.asyncio
-    async def test_create_new_relationships_empty(self, async_session: AsyncSession):
-        result = await game_loop_service._create_new_relationships(async_session, [])
-        assert result == 0
+        result = await game_loop_service._update_room_relationships(async_session, vault.id)
 
-    @pytest.mark.asyncio
-    async def test_create_new_relationships_with_rels(self, async_session: AsyncSession):
-        r1 = MagicMock()
-        r1.dweller_1_id = "d1"
-        r1.dweller_2_id = "d2"
-        r2 = MagicMock()
-        r2.dweller_1_id = "d3"
-        r2.dweller_2_id = "d4"
-        with (
-            patch("app.services.relationship_service.relationship_service.increase_affinity", new_callable=AsyncMock),
-            patch.object(async_session, "commit", new_callable=AsyncMock),
-            patch.object(async_session, "add_all"),
-        ):
-            result = await game_loop_service._create_new_relationships(
-                async_session,
-                [
-                    (r1, game_config.relationship.affinity_increase_per_tick),
-                    (r2, game_config.relationship.affinity_increase_per_tick),
-                ],
-            )
-        assert result == 2
+        assert result["relationships_updated"] == 3
+        rows = (await async_session.execute(select(Relationship))).scalars().all()
+        assert len(rows) == 3
+        by_pair = {frozenset((r.dweller_1_id, r.dweller_2_id)): r for r in rows}
+        assert by_pair[frozenset((roommates[0].id, roommates[1].id))].relationship_type == RelationshipTypeEnum.ROMANTIC
+        gain = game_config.relationship.affinity_increase_per_tick
+        assert by_pair[frozenset((roommates[1].id, roommates[2].id))].affinity == gain
 
 
 # ═════════════════════════════════════════════════════════════════════
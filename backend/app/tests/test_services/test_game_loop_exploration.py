@@ -7,6 +7,7 @@ import pytest
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import crud
+from app.core.game_config import game_config
 from app.models.dweller import Dweller
 from app.models.exploration import ExplorationStatus
 from app.models.vault import Vault
@@ -27,7 +28,7 @@ async def test_process_explorations_empty_vault(
     """Test processing explorations when vault has none."""
     result = await game_loop_service._process_explorations(async_session, vault.id)
 
-    assert result["active_count"] == 0
+    assert result["due_count"] == 0
     assert result["events_generated"] == 0
     assert result["completed"] == 0
 
@@ -60,7 +61,7 @@ async def test_process_explorations_active_exploration(
     with patch.object(exploration_service, "generate_event", return_value=mock_event):
         result = await game_loop_service._process_explorations(async_session, vault.id)
 
-    assert result["active_count"] == 1
+    assert result["due_count"] == 1
     assert result["events_generated"] == 1
     assert result["completed"] == 0
     # Note: Event persistence tested separately
@@ -99,7 +100,7 @@ async def test_process_explorations_auto_complete(
     # Process explorations
     result = await game_loop_service._process_explorations(async_session, vault.id)
 
-    assert result["active_count"] == 1  # Was active when retrieved
+    assert result["due_count"] == 1  # Was active when retrieved
     assert result["completed"] == 1
     assert result["events_generated"] == 0  # No events, just completed
 
@@ -197,7 +198,7 @@ async def test_process_explorations_multiple_active(
     # Process explorations
     result = await game_loop_service._process_explorations(async_session, vault.id)
 
-    assert result["active_count"] == 2
+    assert result["due_count"] == 2
     # One should be completed, one might have event generated
     assert result["completed"] == 1
 
@@ -256,7 +257,7 @@ async def test_process_explorations_error_handling(
         result = await game_loop_service._process_explorations(async_session, vault.id)
 
     # Process should continue despite error
-    assert result["active_count"] == 2
+    assert result["due_count"] == 2
 
 
 @pytest.mark.asyncio
@@ -285,8 +286,39 @@ async def test_process_explorations_no_event_when_not_ready(
     # Process immediately after (cooldown not met)
     result = await game_loop_service._process_explorations(async_session, vault.id)
 
-    assert result["active_count"] == 1
-    assert result["events_generated"] == 0  # No new events due to cooldown
+    assert result["due_count"] == 0  # Not woken until the next event is due
+    assert result["events_generated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_process_explorations_wakes_only_when_next_check_is_due(
+    async_session: AsyncSession,
+    vault: Vault,
+    dweller: Dweller,
+):
+    """A fresh exploration is scheduled on its first tick and skipped until its first event."""
+    exploration = await crud.exploration.create_with_dweller_stats(
+        async_session,
+        vault_id=vault.id,
+        dweller_id=dweller.id,
+        duration=1,
+    )
+    assert exploration.next_due_at is None
+
+    first = await game_loop_service._process_explorations(async_session, vault.id)
+    second = await game_loop_service._process_explorations(async_session, vault.id)
+
+    assert first["due_count"] == 1
+    assert first["events_generated"] == 0
+    assert exploration.next_due_at == exploration.start_time + timedelta(
+        seconds=game_config.exploration.first_event_delay_seconds
+    )
+    assert second["due_count"] == 0
+
+    # The next check never lands after the end of the trip
+    exploration.last_event_at = exploration.start_time + timedelta(minutes=55)
+    exploration.schedule_next_check()
+    assert exploration.next_due_at == exploration.start_time + timedelta(hours=1)
 
 
 @pytest.mark.asyncio
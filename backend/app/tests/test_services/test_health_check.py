@@ -197,11 +197,13 @@ def _patch_boto3_in_sys_modules(
     return_buckets: list[str] | None = None,
     side_effect: BaseException | None = None,
 ) -> dict:
-    """Return a dict for patch.dict(sys.modules, ...) with fake boto3 and botocore."""
+    """Return a dict for patch.dict(sys.modules, ...) with fake boto3 and botocore.config.
+
+    ``botocore.exceptions`` stays real: the health check catches its classes.
+    """
     return {
         "boto3": _inject_fake_boto3(return_buckets=return_buckets, side_effect=side_effect),
         "botocore.config": MagicMock(),
-        "botocore.exceptions": MagicMock(),
     }
 
 
@@ -863,3 +865,38 @@ def test_health_check_result_creation() -> None:
     # details default to None
     result_no_details = HealthCheckResult(service="test2", status=ServiceStatus.UNHEALTHY, message="Bad")
     assert result_no_details.details is None
+
+
+# ---------------------------------------------------------------------------
+# check_password_hasher
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_runs_off_loop_and_reports_backlog() -> None:
+    import asyncio
+    import threading
+
+    from app.core.security import PasswordHasher
+
+    hasher = PasswordHasher(max_workers=1)
+    release = threading.Event()
+    try:
+        jobs = [asyncio.ensure_future(hasher._run(release.wait)) for _ in range(4)]
+        await asyncio.sleep(0)
+        # The loop stays responsive while the worker is blocked
+        assert hasher.in_flight == 4
+        assert hasher.queue_depth == 3
+
+        with patch("app.core.security.password_hasher", hasher):
+            result = HealthCheckService.check_password_hasher()
+        assert result.status == ServiceStatus.DEGRADED
+        assert result.details["queue_depth"] == 3
+
+        release.set()
+        await asyncio.gather(*jobs)
+        assert hasher.queue_depth == 0
+        assert hasher.peak_queue_depth == 3
+    finally:
+        release.set()
+        hasher.shutdown()
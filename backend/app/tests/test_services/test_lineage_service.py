@@ -315,3 +315,28 @@ async def test_lineage_generation_ignores_cross_vault_parent(
 
     assert lineage.parents == []
     assert lineage.generation == 0
+
+
+@pytest.mark.asyncio
+async def test_family_tree_reports_generations_and_in_tree_links(
+    async_session: AsyncSession,
+    vault: Vault,
+) -> None:
+    """The vault tree carries every live dweller; links to soft-deleted dwellers are dropped."""
+    grandparent = await _make_dweller(async_session, vault, first_name="Grandparent")
+    ghost = await _make_dweller(async_session, vault, first_name="Ghost")
+    parent = await _make_dweller(async_session, vault, first_name="Parent", parent_1_id=grandparent.id)
+    partner = await _make_dweller(async_session, vault, first_name="Partner", partner_id=parent.id)
+    child = await _make_dweller(async_session, vault, first_name="Child", parent_1_id=parent.id, parent_2_id=ghost.id)
+    ghost.is_deleted = True
+    await async_session.commit()
+
+    tree = await lineage_service.get_family_tree(async_session, vault.id)
+
+    members = {member.id: member for member in tree.members}
+    assert ghost.id not in members
+    assert [members[d.id].generation for d in (grandparent, partner, parent, child)] == [0, 0, 1, 2]
+    assert members[child.id].parent_1_id == parent.id
+    assert members[child.id].parent_2_id is None
+    assert members[partner.id].partner_id == parent.id
+    assert [m.generation for m in tree.members] == sorted(m.generation for m in tree.members)
@@ -0,0 +1,75 @@
+"""Tests for the prebuilt loot tables behind LootCalculator."""
+
+import random
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from app.core.game_config import game_config
+from app.schemas.exploration_event import JunkSchema, WeaponSchema
+from app.services.exploration.loot_calculator import LootCalculator, LootTable, LootTables, get_loot_tables
+
+
+@pytest.fixture
+def calculator() -> LootCalculator:
+    random.seed(1234)
+    return LootCalculator()
+
+
+def test_loot_table_buckets_by_rarity_and_falls_back_to_whole_pool():
+    table = LootTable.build(
+        [{"name": "Tin Can", "rarity": "Common", "value": 1}, {"name": "Gold Watch", "rarity": "Rare", "value": 50}],
+        JunkSchema,
+    )
+
+    assert [item.name for item in table.by_rarity["Rare"]] == ["Gold Watch"]
+    assert table.pick("Legendary").name in {"Tin Can", "Gold Watch"}
+
+
+def test_rolled_items_are_prevalidated_instances(calculator):
+    weapons = calculator.roll_weapons(luck=5, k=50)
+
+    pool = {id(weapon) for weapon in get_loot_tables().weapons.items}
+    assert all(isinstance(weapon, WeaponSchema) for weapon in weapons)
+    assert all(id(weapon) in pool for weapon in weapons)
+
+
+def test_batched_rarity_distribution_follows_luck_weights(calculator):
+    rarities = Counter(item.rarity for item in calculator.roll_junk(luck=9, k=20_000))
+
+    # Luck >= 8: 50/35/15
+    assert rarities["Common"] / 20_000 == pytest.approx(0.50, abs=0.02)
+    assert rarities["Legendary"] / 20_000 == pytest.approx(0.15, abs=0.02)
+
+
+def test_roll_loot_returns_k_items_with_matching_types(calculator):
+    loot = calculator.roll_loot(luck=3, k=500)
+
+    assert len(loot) == 500
+    for item, item_type in loot:
+        if item_type == "weapon":
+            assert isinstance(item, WeaponSchema)
+        elif item_type == "junk":
+            assert isinstance(item, JunkSchema)
+    assert {item_type for _, item_type in loot} >= {"junk", "weapon", "outfit"}
+
+
+def test_weights_follow_config_changes(calculator):
+    calculator.roll_junk(luck=5, k=1)
+
+    with (
+        patch.object(game_config.exploration, "rarity_common_base", 0.0),
+        patch.object(game_config.exploration, "rarity_rare_base", 0.0),
+    ):
+        assert {item.rarity for item in calculator.roll_junk(luck=5, k=200)} == {"Legendary"}
+
+
+def test_empty_pool_uses_fallback_item(calculator):
+    empty = LootTable.build([], WeaponSchema)
+
+    with patch(
+        "app.services.exploration.loot_calculator.get_loot_tables",
+        return_value=LootTables(weapons=empty, outfits=empty, junk=empty),
+    ):
+        assert calculator.select_random_weapon(luck=5).name == "Rusty Pipe"
@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.crud.wasteland_location import wasteland_location as wl_crud
 from app.models.dweller import Dweller
 from app.models.notification import Notification
 from app.models.vault import Vault
@@ -233,6 +234,66 @@ async def test_get_vault_map_seeds_home_marker_once(async_session: AsyncSession,
     assert len(home_rows) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_vault_map_cached_until_map_version_bumps(
+    async_session: AsyncSession, vault: Vault, dweller: Dweller
+) -> None:
+    """Repeat opens reuse the built map; a discovery bumps map_version and forces a rebuild."""
+    first = await map_service.get_vault_map(async_session, vault)
+    assert await map_service.get_vault_map(async_session, vault) is first
+    version = vault.map_version
+
+    location = await map_service.register_discovery(async_session, vault.id, uuid4(), dweller.id, "Rusty Depot")
+    await async_session.commit()
+    await async_session.refresh(vault)
+
+    assert vault.map_version > version
+    rebuilt = await map_service.get_vault_map(async_session, vault)
+    assert rebuilt is not first
+    assert location.id in {loc.id for loc in rebuilt.locations}
+
+
+@pytest.mark.asyncio
+async def test_unlock_places_for_dweller_bumps_map_version(
+    async_session: AsyncSession, vault: Vault, dweller: Dweller
+) -> None:
+    """Unlocking places invalidates the map only when a link actually changed."""
+    await map_service.register_bio_places(async_session, dweller, "Diamond City", [])
+    await async_session.refresh(vault)
+    version = vault.map_version
+
+    assert await wl_crud.unlock_places_for_dweller(async_session, dweller_id=dweller.id) == 1
+    await async_session.refresh(vault)
+    assert vault.map_version == version + 1
+
+    assert await wl_crud.unlock_places_for_dweller(async_session, dweller_id=dweller.id) == 0
+    await async_session.refresh(vault)
+    assert vault.map_version == version + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("soft", [True, False])
+async def test_deleting_a_linked_dweller_invalidates_the_cached_map(
+    async_session: AsyncSession, vault: Vault, dweller: Dweller, soft: bool
+) -> None:
+    """Deleting (or soft-deleting) a dweller drops their links from the map and bumps map_version."""
+    from app import crud
+
+    location = await map_service.register_discovery(async_session, vault.id, uuid4(), dweller.id, "Rusty Depot")
+    await async_session.commit()
+    await async_session.refresh(vault)
+    cached = await map_service.get_vault_map(async_session, vault)
+    version = vault.map_version
+
+    await crud.dweller.delete(async_session, dweller.id, soft=soft)
+    await async_session.refresh(vault)
+
+    assert vault.map_version == version + 1
+    rebuilt = await map_service.get_vault_map(async_session, vault)
+    assert rebuilt is not cached
+    assert all(not loc.dwellers for loc in rebuilt.locations if loc.id == location.id)
+
+
 @pytest.mark.asyncio
 async def test_get_vault_map_returns_vault_markers(async_session: AsyncSession, vault: Vault) -> None:
     """get_vault_map returns the globally consistent computed signal roster."""
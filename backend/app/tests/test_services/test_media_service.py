@@ -0,0 +1,127 @@
+"""Tests for the content-addressed media pipeline, run against the in-memory S3 fake."""
+
+import asyncio
+import io
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.modules.pop("app.services.storage", None)
+sys.modules.pop("app.services.storage.factory", None)
+
+from PIL import Image
+
+from app.services.media_service import MediaService
+from app.services.storage.async_adapter import AsyncRustFSAdapter
+from app.services.storage.fake_s3 import FakeS3Client
+from app.services.storage.rustfs_adapter import RustFSAdapter
+from app.utils.exceptions import FileUploadError
+from app.utils.image_processing import content_digest, render_image_variants
+
+
+@pytest.fixture
+def fake_client() -> FakeS3Client:
+    return FakeS3Client()
+
+
+@pytest.fixture
+def storage(fake_client: FakeS3Client):
+    with patch("app.services.storage.rustfs_adapter.settings") as mock:
+        mock.RUSTFS_DEFAULT_BUCKET = "test-bucket"
+        mock.RUSTFS_PUBLIC_URL = "http://rustfs.local:9000"
+        mock.RUSTFS_PUBLIC_BUCKET_WHITELIST = ["dweller-images", "dweller-thumbnails", "dweller-audio"]
+        async_adapter = AsyncRustFSAdapter(RustFSAdapter(client=fake_client), max_workers=4)
+        yield async_adapter
+        async_adapter.close()
+
+
+@pytest.fixture
+def media() -> MediaService:
+    return MediaService(widths=[64, 128, 256], formats=["webp"], process_workers=0)
+
+
+def _png_bytes(size: tuple[int, int] = (300, 200), color: tuple[int, int, int] = (40, 120, 200)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_render_image_variants_skips_upscaling_and_keeps_aspect_ratio():
+    variants = render_image_variants(_png_bytes((300, 200)), [64, 256, 512], ["webp"])
+
+    assert [(fmt, width, height) for fmt, width, height, _ in variants] == [("webp", 64, 43), ("webp", 256, 171)]
+    assert Image.open(io.BytesIO(variants[-1][3])).format == "WEBP"
+
+
+async def test_store_image_uploads_original_variants_and_manifest(media, storage, fake_client):
+    image = _png_bytes()
+    digest = content_digest(image)
+
+    stored = await media.store_image(storage, image)
+
+    assert stored.digest == digest
+    assert stored.url == f"http://rustfs.local:9000/dweller-images/sha256/{digest[:2]}/{digest}.png"
+    assert [variant.width for variant in stored.variants] == [64, 128, 256]
+    assert stored.variant_for(100).width == 128
+    assert stored.variant_for(1024).width == 256
+    variant_keys = set(fake_client.buckets["dweller-thumbnails"])
+    assert f"sha256/{digest[:2]}/{digest}/manifest.json" in variant_keys
+    assert f"sha256/{digest[:2]}/{digest}/128.webp" in variant_keys
+
+
+async def test_store_image_is_deduplicated_across_service_instances(media, storage, fake_client):
+    image = _png_bytes()
+    first = await media.store_image(storage, image)
+    requests_after_first = fake_client.request_count
+
+    # A fresh service has no in-process memo, so it must resolve the blob from storage
+    second = await MediaService(widths=[64], formats=["webp"], process_workers=0).store_image(storage, image)
+
+    assert second == first
+    # HEAD on the original + GET on the manifest; nothing re-rendered or re-uploaded
+    assert fake_client.request_count == requests_after_first + 2
+
+
+async def test_store_image_memoizes_known_digests(media, storage, fake_client):
+    image = _png_bytes()
+    await media.store_image(storage, image)
+    requests_after_first = fake_client.request_count
+
+    await media.store_image(storage, image)
+
+    assert fake_client.request_count == requests_after_first
+
+
+async def test_store_blob_skips_existing_content(media, storage, fake_client):
+    first = await media.store_blob(
+        storage, b"voice", extension="mp3", content_type="audio/mpeg", bucket_name="dweller-audio"
+    )
+    second = await media.store_blob(
+        storage, b"voice", extension="mp3", content_type="audio/mpeg", bucket_name="dweller-audio"
+    )
+
+    assert first == second
+    assert list(fake_client.buckets["dweller-audio"]) == [
+        f"sha256/{content_digest(b'voice')[:2]}/{content_digest(b'voice')}.mp3"
+    ]
+
+
+async def test_store_image_cancels_original_upload_when_a_variant_upload_fails(media, storage):
+    original_cancelled = asyncio.Event()
+
+    async def upload_file(data, file_name, *, file_type, bucket_name):
+        if bucket_name == "dweller-thumbnails":
+            raise FileUploadError("variant upload failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            original_cancelled.set()
+            raise
+        return "never"
+
+    with patch.object(storage, "upload_file", side_effect=upload_file), pytest.raises(FileUploadError):
+        await media.store_image(storage, _png_bytes())
+
+    # Cancelled and awaited before store_image returned, not left running in the background
+    assert original_cancelled.is_set()
@@ -0,0 +1,123 @@
+"""Tests for the notification outbox and the Redis-backed unread counter."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.crud import vault as crud_vault
+from app.crud.notification import notification as notification_crud
+from app.models.notification import Notification, NotificationType
+from app.services.notification_counter import UNREAD_COUNT_KEY, unread_counter
+from app.services.notification_service import NotificationService
+
+
+async def _notify(db: AsyncSession, user_id, vault_id, title: str) -> Notification:
+    return await NotificationService.create_and_send(
+        db,
+        user_id=user_id,
+        vault_id=vault_id,
+        notification_type=NotificationType.LEVEL_UP,
+        title=title,
+        message="Something happened",
+    )
+
+
+@pytest.mark.asyncio
+async def test_outbox_inserts_and_delivers_once_on_exit(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+
+    with (
+        patch("app.services.notification_service.manager.send_personal_messages", new_callable=AsyncMock) as send,
+        patch("app.services.notification_service.sse_manager.publish", new_callable=AsyncMock) as publish,
+        patch.object(crud_vault, "get", wraps=crud_vault.get) as vault_get,
+    ):
+        async with NotificationService.outbox(async_session):
+            first = await _notify(async_session, user.id, vault.id, "First")
+            second = await _notify(async_session, user.id, vault.id, "Second")
+
+            rows = (await async_session.execute(select(Notification).where(Notification.user_id == user.id))).all()
+            assert rows == []
+            send.assert_not_awaited()
+
+    stored = (await async_session.execute(select(Notification).where(Notification.user_id == user.id))).scalars().all()
+    assert {n.id for n in stored} == {first.id, second.id}
+    assert all(n.message.startswith(f"[Vault {vault.number}] ") for n in stored)
+    assert vault_get.await_count == 1, "vault prefix should be resolved once per outbox"
+
+    send.assert_awaited_once()
+    messages = send.await_args.args[0]
+    assert [m["notification"]["title"] for m in messages] == ["First", "Second"]
+    assert publish.await_count == 2
+    assert publish.await_args.args[2]["event_id"] == str(second.id)
+
+
+@pytest.mark.asyncio
+async def test_create_and_send_without_outbox_commits_immediately(async_session: AsyncSession, user_with_vault: tuple):
+    user, vault = user_with_vault
+
+    with (
+        patch("app.services.notification_service.manager.send_personal_messages", new_callable=AsyncMock) as send,
+        patch("app.services.notification_service.sse_manager.publish", new_callable=AsyncMock),
+    ):
+        notification = await _notify(async_session, user.id, vault.id, "Now")
+
+    assert await notification_crud.get(async_session, notification.id) is not None
+    send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unread_counter_seeds_once_then_tracks_adjustments(
+    async_session: AsyncSession, user_with_vault: tuple, _shared_fake_redis: Any
+):
+    user, vault = user_with_vault
+    key = UNREAD_COUNT_KEY.format(user_id=user.id)
+
+    # Adjusting an unseeded counter must not invent a value
+    await unread_counter.adjust(_shared_fake_redis, {user.id: 3})
+    assert await _shared_fake_redis.get(key) is None
+
+    with (
+        patch("app.services.notification_service.manager.send_personal_messages", new_callable=AsyncMock),
+        patch("app.services.notification_service.sse_manager.publish", new_callable=AsyncMock),
+    ):
+        await _notify(async_session, user.id, vault.id, "One")
+        await _notify(async_session, user.id, vault.id, "Two")
+
+    assert await unread_counter.get(async_session, _shared_fake_redis, user.id) == 2
+    assert await _shared_fake_redis.get(key) == "2"
+
+    with patch.object(notification_crud, "get_unread_count", new_callable=AsyncMock) as count_query:
+        await unread_counter.adjust(_shared_fake_redis, {user.id: 1})
+        assert await unread_counter.get(async_session, _shared_fake_redis, user.id) == 3
+        count_query.assert_not_awaited()
+
+    await unread_counter.adjust(_shared_fake_redis, {user.id: -5})
+    assert await _shared_fake_redis.get(key) is None, "a negative result means drift, so the counter is dropped"
+
+    await unread_counter.reset(_shared_fake_redis, user.id)
+    assert await unread_counter.get(async_session, _shared_fake_redis, user.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_unread_counter_does_not_seed_a_count_raced_by_a_writer(
+    async_session: AsyncSession, user_with_vault: tuple, _shared_fake_redis: Any
+):
+    user, _ = user_with_vault
+    key = UNREAD_COUNT_KEY.format(user_id=user.id)
+
+    async def count_then_concurrent_commit(db_session, user_id):
+        # A notification commits after this COUNT; its adjustment finds no counter to apply to
+        await unread_counter.adjust(_shared_fake_redis, {user_id: 1})
+        return 0
+
+    with patch.object(notification_crud, "get_unread_count", side_effect=count_then_concurrent_commit):
+        assert await unread_counter.get(async_session, _shared_fake_redis, user.id) == 0
+
+    assert await _shared_fake_redis.get(key) is None, "the stale count must not be cached"
+
+    with patch.object(notification_crud, "get_unread_count", new_callable=AsyncMock, return_value=1):
+        assert await unread_counter.get(async_session, _shared_fake_redis, user.id) == 1
+    assert await _shared_fake_redis.get(key) == "1"
@@ -1,5 +1,8 @@
 """Tests for PrerequisiteService."""
 
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -9,10 +12,16 @@ from app import crud
 from app.models.dweller import Dweller
 from app.models.quest import Quest
 from app.models.quest_requirement import QuestRequirement, RequirementType
+from app.models.room import Room
+from app.models.storage import Storage
 from app.models.vault_quest import VaultQuestCompletionLink
+from app.models.weapon import Weapon
+from app.schemas.common import RoomTypeEnum
 from app.schemas.user import UserCreate
 from app.schemas.vault import VaultCreateWithUserID
-from app.services.prerequisite_service import prerequisite_service
+from app.services import prerequisite_service as prerequisite_module
+from app.services.event_bus import GameEvent
+from app.services.prerequisite_service import PrerequisiteService, prerequisite_service
 from app.tests.factory.users import create_fake_user
 from app.tests.factory.vaults import create_fake_vault
 
@@ -442,3 +451,158 @@ async def test_get_available_quests_excludes_locked(async_client: AsyncClient, a
     quest_titles = [q["title"] for q in data]
     assert "Quest A" in quest_titles, "Quest A should be available"
     assert "Quest B" not in quest_titles, "Quest B should be locked (previous not completed)"
+
+
+@pytest.mark.asyncio
+async def test_load_vault_facts_aggregates_vault_state(async_session: AsyncSession) -> None:
+    """Levels, stored items, rooms, population and completed quests come from one aggregate."""
+    user_data = create_fake_user()
+    user = await crud.user.create(async_session, obj_in=UserCreate(**user_data))
+    vault_data = create_fake_vault()
+    vault = await crud.vault.create(async_session, obj_in=VaultCreateWithUserID(**vault_data, user_id=user.id))
+
+    storage = Storage(vault_id=vault.id, max_space=100)
+    quest = Quest(
+        title="Done Quest",
+        short_description="Done",
+        long_description="Already completed",
+        requirements="None",
+        rewards="100 caps",
+        quest_type="side",
+    )
+    async_session.add_all([storage, quest])
+    await async_session.commit()
+
+    async_session.add_all(
+        [
+            Dweller(first_name="A", gender="male", rarity="common", level=3, vault_id=vault.id),
+            Dweller(first_name="B", gender="male", rarity="common", level=3, vault_id=vault.id),
+            Dweller(first_name="C", gender="female", rarity="common", level=7, vault_id=vault.id),
+            *(
+                Weapon(
+                    name=name,
+                    rarity="common",
+                    weapon_type="melee",
+                    weapon_subtype="blunt",
+                    stat="strength",
+                    damage_min=1,
+                    damage_max=3,
+                    storage_id=storage.id,
+                )
+                for name in ("Baseball Bat", "baseball bat", "Lead Pipe")
+            ),
+            Room(
+                name="Living Quarters",
+                category=RoomTypeEnum.CAPACITY,
+                ability=None,
+                base_cost=100,
+                size_min=1,
+                size_max=3,
+                vault_id=vault.id,
+            ),
+            VaultQuestCompletionLink(vault_id=vault.id, quest_id=quest.id, is_completed=True),
+        ]
+    )
+    await async_session.commit()
+
+    facts = await prerequisite_service.load_vault_facts(async_session, vault.id)
+
+    assert dict(facts.level_histogram) == {3: 2, 7: 1}
+    assert facts.population == 3
+    assert facts.dwellers_at_or_above(5) == 1
+    assert dict(facts.item_counts) == {"baseball bat": 2, "lead pipe": 1}
+    assert dict(facts.room_counts) == {"living quarters": 1}
+    assert facts.completed_quest_ids == {quest.id}
+
+    assert prerequisite_service.item_requirement_met(facts, {"item_name": "Baseball Bat", "count": 2})
+    assert not prerequisite_service.item_requirement_met(facts, {"item_name": "Lead Pipe", "count": 2})
+    assert prerequisite_service.room_requirement_met(facts, {"room_type": "living_quarters"})
+    assert prerequisite_service.quest_completed_requirement_met(facts, {"quest_id": str(quest.id)})
+
+
+@pytest.mark.asyncio
+async def test_vault_facts_cache_is_dropped_on_game_event(async_session: AsyncSession) -> None:
+    """Cached facts are reused until an invalidating event arrives for that vault."""
+    user_data = create_fake_user()
+    user = await crud.user.create(async_session, obj_in=UserCreate(**user_data))
+    vault_data = create_fake_vault()
+    vault = await crud.vault.create(async_session, obj_in=VaultCreateWithUserID(**vault_data, user_id=user.id))
+    service = PrerequisiteService()
+
+    first = await service.get_vault_facts(async_session, vault.id)
+    async_session.add(Dweller(first_name="New", gender="male", rarity="common", level=1, vault_id=vault.id))
+    await async_session.commit()
+
+    assert await service.get_vault_facts(async_session, vault.id) is first
+
+    await service.handle_vault_changed(GameEvent.DWELLER_LEVEL_UP, vault.id, {})
+    refreshed = await service.get_vault_facts(async_session, vault.id)
+
+    assert refreshed.population == first.population + 1
+
+
+@pytest.mark.asyncio
+async def test_vault_facts_cache_evicts_expired_and_oldest_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The facts cache drops stale entries and never holds more than its cap."""
+    clock = [1000.0]
+    monkeypatch.setattr(prerequisite_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(prerequisite_module, "_FACTS_CACHE_MAX", 2)
+    service = PrerequisiteService()
+    monkeypatch.setattr(service, "load_vault_facts", AsyncMock(side_effect=lambda _db, vault_id: object()))
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    await service.get_vault_facts(None, first)
+    await service.get_vault_facts(None, second)
+    await service.get_vault_facts(None, third)
+    assert list(service._facts_cache) == [second, third]
+
+    clock[0] += prerequisite_module.FACTS_TTL_SECONDS
+    await service.get_vault_facts(None, first)
+    assert list(service._facts_cache) == [first]
+
+
+@pytest.mark.asyncio
+async def test_get_available_quests_paginates_and_reports_missing_requirements(
+    async_client: AsyncClient, async_session: AsyncSession
+) -> None:
+    """Available quests are paginated in SQL and carry their unmet requirements."""
+    from app.tests.utils.user import user_authentication_headers
+
+    user_data = create_fake_user()
+    user = await crud.user.create(async_session, obj_in=UserCreate(**user_data))
+    vault_data = create_fake_vault()
+    vault = await crud.vault.create(async_session, obj_in=VaultCreateWithUserID(**vault_data, user_id=user.id))
+
+    quests = [
+        Quest(
+            title=f"Board Quest {index}",
+            short_description="Board",
+            long_description="Quest board entry",
+            requirements="Level 20 dweller",
+            rewards="100 caps",
+            quest_type="side",
+        )
+        for index in range(3)
+    ]
+    async_session.add_all(quests)
+    await async_session.commit()
+    async_session.add_all(
+        QuestRequirement(
+            quest_id=quest.id,
+            requirement_type=RequirementType.LEVEL,
+            requirement_data={"level": 20, "count": 1},
+            is_mandatory=True,
+        )
+        for quest in quests
+    )
+    await async_session.commit()
+    for quest in quests:
+        await crud.quest_crud.assign_to_vault(async_session, quest_id=quest.id, vault_id=vault.id)
+
+    headers = await user_authentication_headers(client=async_client, email=user.email, password=user_data["password"])
+    response = await async_client.get(f"/quests/{vault.id}/available?skip=1&limit=1", headers=headers)
+
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [quest["title"] for quest in data] == ["Board Quest 1"]
+    assert data[0]["missing_requirements"] == ["Need a dweller at level 20 or higher"]
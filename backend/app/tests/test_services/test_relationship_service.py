@@ -799,3 +799,86 @@ async def test_marry_applies_bonus_once_under_repeated_attempts(
     assert dweller.happiness == min(100, base_1 + expected)
     assert dweller_2.happiness == min(100, base_2 + expected)
     assert notify_count["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_affinity_gains_persists_new_and_existing(
+    async_session: AsyncSession,
+    dweller: Dweller,
+    dweller_2: Dweller,
+):
+    """New relationships are inserted and existing ones advance a stage, in one upsert."""
+    friend = await RelationshipService.get_or_create_relationship(async_session, dweller.id, dweller_2.id)
+    friend.relationship_type = RelationshipTypeEnum.FRIEND
+    friend.affinity = game_config.relationship.romance_threshold - 1
+    await async_session.commit()
+    third = await crud.dweller.create(
+        db_session=async_session,
+        obj_in=DwellerCreate(
+            first_name="Third", gender=GenderEnum.MALE, rarity=RarityEnum.COMMON, vault_id=dweller.vault_id
+        ),
+    )
+    new_rel = Relationship(dweller_1_id=dweller.id, dweller_2_id=third.id)
+
+    updated = await RelationshipService.apply_affinity_gains(async_session, [(friend, 2), (new_rel, 3)], {})
+
+    assert updated == 2
+    reloaded = await RelationshipService.get_relationship(async_session, dweller.id, dweller_2.id)
+    assert reloaded.relationship_type == RelationshipTypeEnum.ROMANTIC
+    assert reloaded.affinity == game_config.relationship.romance_threshold + 1
+    created = await RelationshipService.get_relationship(async_session, dweller.id, third.id)
+    assert created.relationship_type == RelationshipTypeEnum.ACQUAINTANCE
+    assert created.affinity == 3
+    assert friend not in async_session.dirty
+
+
+@pytest.mark.asyncio
+async def test_apply_affinity_gains_links_partners(
+    async_session: AsyncSession,
+    dweller: Dweller,
+    dweller_2: Dweller,
+):
+    """ROMANTIC -> PARTNER sets reciprocal partner IDs on the preloaded dwellers."""
+    relationship = await RelationshipService.get_or_create_relationship(async_session, dweller.id, dweller_2.id)
+    relationship.relationship_type = RelationshipTypeEnum.ROMANTIC
+    relationship.affinity = game_config.relationship.romance_threshold
+    await async_session.commit()
+
+    await RelationshipService.apply_affinity_gains(
+        async_session, [(relationship, 1)], {dweller.id: dweller, dweller_2.id: dweller_2}
+    )
+
+    await async_session.refresh(dweller)
+    await async_session.refresh(dweller_2)
+    assert relationship.relationship_type == RelationshipTypeEnum.PARTNER
+    assert dweller.partner_id == dweller_2.id
+    assert dweller_2.partner_id == dweller.id
+
+
+@pytest.mark.asyncio
+async def test_apply_affinity_gains_marries_through_conditional_path(
+    async_session: AsyncSession,
+    dweller: Dweller,
+    dweller_2: Dweller,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Partners crossing the marriage threshold skip the upsert and marry exactly once."""
+    partner_rel = await _make_partners(async_session, dweller, dweller_2)
+    partner_rel.affinity = game_config.relationship.marriage_threshold - 1
+    await async_session.commit()
+    upserted: list[list[dict]] = []
+    real_upsert = relationship_crud.bulk_upsert
+
+    async def _recording_upsert(db, rows):
+        upserted.append(rows)
+        await real_upsert(db, rows)
+
+    monkeypatch.setattr(relationship_crud, "bulk_upsert", _recording_upsert)
+
+    updated = await RelationshipService.apply_affinity_gains(async_session, [(partner_rel, 1)], {})
+
+    assert updated == 1
+    assert upserted == []
+    reloaded = await relationship_crud.get(async_session, partner_rel.id)
+    assert reloaded.relationship_type == RelationshipTypeEnum.MARRIED
+    assert reloaded.affinity == game_config.relationship.marriage_threshold
@@ -1,21 +1,19 @@
 """Test vault objective assignment on creation.
 
-This validates that _assign_initial_objectives correctly filters
-objectives by their `category` field (not the `challenge` field).
+This validates that _select_initial_objectives correctly filters
+objectives by their `category` field (not the `challenge` field), and that
+provisioned vaults get a progress link for each selected objective.
 """
 
 import pytest
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app import crud
 from app.models.objective import Objective
 from app.models.user import User
-from app.models.vault import Vault
 from app.models.vault_objective import VaultObjectiveProgressLink
-from app.schemas.vault import VaultCreateWithUserID
+from app.schemas.vault import VaultNumber
 from app.services.vault_service import VaultService
-from app.tests.factory.vaults import create_fake_vault
 
 pytestmark = pytest.mark.asyncio(scope="function")
 
@@ -35,12 +33,6 @@ async def _seed_objective(async_session: AsyncSession, challenge: str, category:
     return obj
 
 
-async def _create_vault(async_session: AsyncSession, user: User) -> Vault:
-    """Helper to create a simple vault for a user."""
-    vault_data = VaultCreateWithUserID(**create_fake_vault(), user_id=user.id)
-    return await crud.vault.create(async_session, vault_data)
-
-
 class TestVaultObjectiveAssignment:
     """Tests for vault objective assignment logic."""
 
@@ -52,10 +44,7 @@ class TestVaultObjectiveAssignment:
         weekly = await _seed_objective(async_session, "Build 5 Rooms", "weekly", "build")
         await async_session.commit()
 
-        vault = await _create_vault(async_session, superuser)
-
-        service = VaultService()
-        await service._assign_initial_objectives(async_session, vault.id, is_boosted=False)
+        vault = await VaultService().initiate_vault(async_session, VaultNumber(number=11), superuser.id)
 
         links = (
             (
@@ -71,71 +60,36 @@ class TestVaultObjectiveAssignment:
         linked_ids = {lnk.objective_id for lnk in links}
         assert daily.id in linked_ids
         assert weekly.id in linked_ids
+        assert {lnk.total for lnk in links} == {5}
 
-    async def test_assigns_achievements_for_boosted_vault(self, async_session: AsyncSession, superuser: User) -> None:
-        """Boosted vault gets extra achievement objectives."""
+    async def test_assigns_achievements_for_boosted_vault(self, async_session: AsyncSession) -> None:
+        """Boosted vaults get extra achievement objectives."""
         await _seed_objective(async_session, "Collect 250 Food", "daily", "collect")
         await _seed_objective(async_session, "Build 5 Rooms", "weekly", "build")
         for i in range(5):
             await _seed_objective(async_session, f"Achievement {i}", "achievement", "build")
         await async_session.commit()
 
-        vault = await _create_vault(async_session, superuser)
-
-        service = VaultService()
-        await service._assign_initial_objectives(async_session, vault.id, is_boosted=True)
-
-        links = (
-            (
-                await async_session.execute(
-                    select(VaultObjectiveProgressLink).where(VaultObjectiveProgressLink.vault_id == vault.id)
-                )
-            )
-            .scalars()
-            .all()
+        starting, achievements = await VaultService()._select_initial_objectives(
+            async_session, include_achievements=True
         )
 
-        assert len(links) == 7  # 1 daily + 1 weekly + 5 achievement
+        assert len(starting) == 2
+        assert len(achievements) == 5
 
-    async def test_skips_when_no_objectives(self, async_session: AsyncSession, superuser: User) -> None:
+    async def test_skips_when_no_objectives(self, async_session: AsyncSession) -> None:
         """No crash when no objectives exist — assigns nothing."""
-        vault = await _create_vault(async_session, superuser)
-
-        service = VaultService()
-        await service._assign_initial_objectives(async_session, vault.id, is_boosted=False)
+        assert await VaultService()._select_initial_objectives(async_session, include_achievements=True) == ([], [])
 
-        links = (
-            (
-                await async_session.execute(
-                    select(VaultObjectiveProgressLink).where(VaultObjectiveProgressLink.vault_id == vault.id)
-                )
-            )
-            .scalars()
-            .all()
-        )
-
-        assert len(links) == 0
-
-    async def test_filters_by_category_not_challenge(self, async_session: AsyncSession, superuser: User) -> None:
+    async def test_filters_by_category_not_challenge(self, async_session: AsyncSession) -> None:
         """Regression: uses category= filter, so objectives whose challenge lacks
         'daily'/'weekly' substring are still found if category is correct."""
         obj = await _seed_objective(async_session, "Collect caps", "daily", "collect")
         await async_session.commit()
 
-        vault = await _create_vault(async_session, superuser)
-
-        service = VaultService()
-        await service._assign_initial_objectives(async_session, vault.id, is_boosted=False)
-
-        links = (
-            (
-                await async_session.execute(
-                    select(VaultObjectiveProgressLink).where(VaultObjectiveProgressLink.vault_id == vault.id)
-                )
-            )
-            .scalars()
-            .all()
+        starting, achievements = await VaultService()._select_initial_objectives(
+            async_session, include_achievements=False
         )
 
-        assert len(links) == 1
-        assert links[0].objective_id == obj.id
+        assert [o.id for o in starting] == [obj.id]
+        assert achievements == []
@@ -249,577 +249,6 @@ class TestPrepareInitialRooms:
         assert len(training) == 7
 
 
-# ---------------------------------------------------------------------------
-# Test _create_initial_rooms
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-class TestCreateInitialRooms:
-    """Tests for the async _create_initial_rooms."""
-
-    async def test_creates_rooms_and_updates_capacities(self) -> None:
-        """Verify rooms created; living room increases population_max, storage increases max_space."""
-        vault_id = VAULT_ID
-        vault = Vault(id=vault_id, number=1, population_max=0, power_max=0, food_max=0, water_max=0)
-
-        # Simulate capacity room creation for a living room
-        living_room = _make_room(
-            name="Living Room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA, capacity=4
-        )
-
-        with patch("app.services.vault_service.room_crud.create", new_callable=AsyncMock) as mock_create:
-            # living room → CHARISMA → increases population_max
-            mock_create.side_effect = [
-                living_room,
-                _make_room(
-                    name="Storage Room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.ENDURANCE, capacity=10
-                ),
-            ]
-
-            infra: list[RoomCreate] = []
-            cap = [
-                RoomCreate(**living_room.model_dump() | {"vault_id": vault_id}),
-                RoomCreate(
-                    name="Storage Room",
-                    category=RoomTypeEnum.CAPACITY,
-                    ability=SPECIALEnum.ENDURANCE,
-                    capacity=10,
-                    size_min=1,
-                    size_max=3,
-                    base_cost=100,
-                    t2_upgrade_cost=500,
-                    t3_upgrade_cost=1500,
-                    vault_id=vault_id,
-                ),
-            ]
-            prod: list[RoomCreate] = []
-            misc: list[RoomCreate] = []
-            training: list[RoomCreate] = []
-
-            db_session = AsyncMock()
-            db_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=0)))
-            db_session.commit = AsyncMock()
-            db_session.refresh = AsyncMock()
-
-            service = VaultService()
-            # Mock vault_crud.update_storage so it doesn't hit real DB
-            with patch("app.services.vault_service.vault_crud.update_storage", new_callable=AsyncMock):
-                await service._create_initial_rooms(db_session, vault, infra, cap, prod, misc, training)
-
-        assert vault.population_max == 4
-
-    async def test_production_rooms_update_maxes(self) -> None:
-        """Production rooms with specific abilities update vault max capacities."""
-        vault_id = VAULT_ID
-        vault = Vault(id=vault_id, number=1, population_max=10, power_max=0, food_max=0, water_max=0)
-
-        power_room = Room(
-            id="rp",
-            name="Power Gen",
-            category=RoomTypeEnum.PRODUCTION,
-            ability=SPECIALEnum.STRENGTH,
-            capacity=20,
-            tier=1,
-            size=1,
-            size_min=1,
-            size_max=3,
-            base_cost=100,
-            t2_upgrade_cost=500,
-            t3_upgrade_cost=1500,
-        )
-        diner_room = Room(
-            id="rd",
-            name="Diner",
-            category=RoomTypeEnum.PRODUCTION,
-            ability=SPECIALEnum.AGILITY,
-            capacity=15,
-            tier=1,
-            size=1,
-            size_min=1,
-            size_max=3,
-            base_cost=100,
-            t2_upgrade_cost=500,
-            t3_upgrade_cost=1500,
-        )
-        water_room = Room(
-            id="rw",
-            name="Water Treatment",
-            category=RoomTypeEnum.PRODUCTION,
-            ability=SPECIALEnum.PERCEPTION,
-            capacity=12,
-            tier=1,
-            size=1,
-            size_min=1,
-            size_max=3,
-            base_cost=100,
-            t2_upgrade_cost=500,
-            t3_upgrade_cost=1500,
-        )
-
-        with patch("app.services.vault_service.room_crud.create", new_callable=AsyncMock) as mock_create:
-            mock_create.side_effect = [power_room, diner_room, water_room]
-
-            db_session = AsyncMock()
-            db_session.execute = AsyncMock()
-            db_session.commit = AsyncMock()
-            db_session.refresh = AsyncMock()
-
-            infra: list[RoomCreate] = []
-            cap: list[RoomCreate] = []
-            prod = [
-                RoomCreate(**power_room.model_dump() | {"vault_id": vault_id}),
-                RoomCreate(**diner_room.model_dump() | {"vault_id": vault_id}),
-                RoomCreate(**water_room.model_dump() | {"vault_id": vault_id}),
-            ]
-            misc: list[RoomCreate] = []
-            training: list[RoomCreate] = []
-
-            service = VaultService()
-            await service._create_initial_rooms(db_session, vault, infra, cap, prod, misc, training)
-
-        assert vault.power_max == 20
-        assert vault.food_max == 15
-        assert vault.water_max == 12
-
-
-# ---------------------------------------------------------------------------
-# Test _create_initial_dwellers
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-class TestCreateInitialDwellers:
-    """Tests for dweler creation during vault init."""
-
-    async def test_standard_dwellers_assigned(self) -> None:
-        """Standard vault: 6 production dwellers + 1 radio + 2 living quarters = ~9 dwellers."""
-        vault_id = VAULT_ID
-
-        prod_rooms = [
-            _make_room(name="Power Gen", ability=SPECIALEnum.STRENGTH),
-            _make_room(name="Diner", ability=SPECIALEnum.AGILITY),
-            _make_room(name="Water Treatment", ability=SPECIALEnum.PERCEPTION),
-        ]
-        cap_rooms = [_make_room(name="Living Room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA)]
-        misc_rooms = [_make_room(name="Radio Studio", category=RoomTypeEnum.MISC, ability=SPECIALEnum.CHARISMA)]
-        training_rooms: list[Room] = []
-
-        call_count = 0
-
-        async def fake_create_random(db_session, vault_id, dweller_data):
-            nonlocal call_count
-            call_count += 1
-            gender = dweller_data.gender if hasattr(dweller_data, "gender") and dweller_data.gender else GenderEnum.MALE
-            return Dweller(
-                id=_dweller_id(call_count),
-                first_name=f"Dweller{call_count}",
-                last_name="Test",
-                gender=gender,
-                rarity=RarityEnum.COMMON,
-                level=1,
-            )
-
-        with (
-            patch(
-                "app.services.vault_service.dweller_crud.create_random",
-                new_callable=AsyncMock,
-                side_effect=fake_create_random,
-            ),
-            patch("app.services.vault_service.dweller_crud.update", new_callable=AsyncMock),
-        ):
-            db_session = AsyncMock()
-            db_session.commit = AsyncMock()
-
-            service = VaultService()
-            await service._create_initial_dwellers(
-                db_session,
-                vault_id,
-                prod_rooms,
-                training_rooms,
-                misc_rooms,
-                cap_rooms,
-                is_boosted=False,
-            )
-
-        # 6 production + 1 radio + 2 living quarters = 9
-        assert call_count == 9
-
-    async def test_boosted_dwellers_assigned(self) -> None:
-        """Boosted vault includes medbay, science lab, and training dwellers."""
-        vault_id = VAULT_ID
-
-        prod_rooms = [
-            _make_room(name="Power Gen", ability=SPECIALEnum.STRENGTH),
-            _make_room(name="Diner", ability=SPECIALEnum.AGILITY),
-            _make_room(name="Water Treatment", ability=SPECIALEnum.PERCEPTION),
-            _make_room(name="Medbay", ability=SPECIALEnum.INTELLIGENCE),
-            _make_room(name="Science Lab", ability=SPECIALEnum.INTELLIGENCE),
-        ]
-        cap_rooms = [_make_room(name="Living Room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA)]
-        misc_rooms = [_make_room(name="Radio Studio", category=RoomTypeEnum.MISC, ability=SPECIALEnum.CHARISMA)]
-        training_rooms = [  # 7 training rooms
-            _make_room(name=name, category=RoomTypeEnum.TRAINING, ability=ability)
-            for i, (name, ability) in enumerate(
-                [
-                    ("Weight Room", SPECIALEnum.STRENGTH),
-                    ("Armory", SPECIALEnum.PERCEPTION),
-                    ("Athletics Room", SPECIALEnum.ENDURANCE),
-                    ("Classroom", SPECIALEnum.CHARISMA),
-                    ("Game Room", SPECIALEnum.INTELLIGENCE),
-                    ("Fitness Room", SPECIALEnum.AGILITY),
-                    ("Lounge", SPECIALEnum.LUCK),
-                ]
-            )
-        ]
-
-        call_count = 0
-
-        async def fake_create_random(db_session, vault_id, dweller_data):
-            nonlocal call_count
-            call_count += 1
-            return Dweller(
-                id=_dweller_id(call_count),
-                first_name=f"Boosted{call_count}",
-                last_name="Test",
-                gender=GenderEnum.MALE,
-                rarity=RarityEnum.COMMON,
-                level=1,
-            )
-
-        with (
-            patch(
-                "app.services.vault_service.dweller_crud.create_random",
-                new_callable=AsyncMock,
-                side_effect=fake_create_random,
-            ),
-            patch("app.services.vault_service.dweller_crud.update", new_callable=AsyncMock),
-        ):
-            db_session = AsyncMock()
-            db_session.commit = AsyncMock()
-
-            service = VaultService()
-            await service._create_initial_dwellers(
-                db_session,
-                vault_id,
-                prod_rooms,
-                training_rooms,
-                misc_rooms,
-                cap_rooms,
-                is_boosted=True,
-            )
-
-        # 6 production + 4 medbay/science + 7 training + 1 radio + 2 living quarters = 20
-        assert call_count == 20
-
-    async def test_dweller_creation_failure_logs_and_raises(self) -> None:
-        """Exception during dweller creation logs and re-raises."""
-        vault_id = VAULT_ID
-        prod_rooms = [
-            _make_room(name="Power Gen", ability=SPECIALEnum.STRENGTH),
-            _make_room(name="Diner", ability=SPECIALEnum.AGILITY),
-            _make_room(name="Water Treatment", ability=SPECIALEnum.PERCEPTION),
-        ]
-        cap_rooms: list[Room] = []
-        misc_rooms: list[Room] = []
-        training_rooms: list[Room] = []
-
-        with patch(
-            "app.services.vault_service.dweller_crud.create_random",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("DB error"),
-        ):
-            db_session = AsyncMock()
-
-            service = VaultService()
-            with pytest.raises(RuntimeError, match="DB error"):
-                await service._create_initial_dwellers(
-                    db_session,
-                    vault_id,
-                    prod_rooms,
-                    training_rooms,
-                    misc_rooms,
-                    cap_rooms,
-                    is_boosted=False,
-                )
-
-
-# ---------------------------------------------------------------------------
-# Test _start_training_sessions
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-class TestStartTrainingSessions:
-    """Tests for training session startup."""
-
-    async def test_noop_when_not_boosted(self) -> None:
-        """When not boosted, method returns immediately."""
-        service = VaultService()
-        db_session = AsyncMock()
-        result = await service._start_training_sessions(db_session, VAULT_ID, [], is_boosted=False)
-        assert result is None
-
-    async def test_noop_when_no_training_rooms(self) -> None:
-        """When boosted but no training rooms, returns immediately."""
-        service = VaultService()
-        db_session = AsyncMock()
-        result = await service._start_training_sessions(db_session, VAULT_ID, [], is_boosted=True)
-        assert result is None
-
-    async def test_starts_training_for_boosted_vault(self) -> None:
-        """Boosted vault with training rooms starts training for assigned dwellers."""
-        vault_id = VAULT_ID
-        train_room = _make_room(
-            name="Weight Room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH, tier=1
-        )
-
-        dweller = Dweller(
-            id=DWELLER_ID,
-            first_name="Train",
-            last_name="Me",
-            gender=GenderEnum.MALE,
-            rarity=RarityEnum.COMMON,
-            strength=5,
-            perception=3,
-            endurance=4,
-            charisma=3,
-            intelligence=3,
-            agility=3,
-            luck=3,
-            level=1,
-            room_id=train_room.id,
-        )
-
-        async def fake_refresh(obj):
-            pass
-
-        db_session = AsyncMock()
-        db_session.refresh = fake_refresh
-        db_session.execute = AsyncMock()
-
-        with (
-            patch(
-                "app.services.vault_service.dweller_crud.get_multi_by_vault",
-                new_callable=AsyncMock,
-                return_value=[dweller],
-            ),
-            patch("app.services.vault_service.training_service.start_training", new_callable=AsyncMock),
-        ):
-            service = VaultService()
-            await service._start_training_sessions(db_session, vault_id, [train_room], is_boosted=True)
-
-        # If we got this far without exception, the call went through
-
-    async def test_training_failure_is_logged_not_raised(self) -> None:
-        """If training fails for one dweller, it is logged and other dwellers proceed."""
-        vault_id = VAULT_ID
-        train_room = _make_room(
-            name="Weight Room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH, tier=1
-        )
-
-        dweller = Dweller(
-            id=OTHER_DWELLER_ID,
-            first_name="Fail",
-            last_name="Dweller",
-            gender=GenderEnum.MALE,
-            rarity=RarityEnum.COMMON,
-            strength=5,
-            perception=3,
-            endurance=4,
-            charisma=3,
-            intelligence=3,
-            agility=3,
-            luck=3,
-            level=1,
-            room_id=train_room.id,
-        )
-
-        async def fake_refresh(obj):
-            pass
-
-        db_session = AsyncMock()
-        db_session.refresh = fake_refresh
-
-        with (
-            patch(
-                "app.services.vault_service.dweller_crud.get_multi_by_vault",
-                new_callable=AsyncMock,
-                return_value=[dweller],
-            ),
-            patch(
-                "app.services.vault_service.training_service.start_training",
-                new_callable=AsyncMock,
-                side_effect=ResourceNotFoundException(Dweller, "test-id"),
-            ),
-        ):
-            service = VaultService()
-            await service._start_training_sessions(db_session, vault_id, [train_room], is_boosted=True)
-
-        # Should not raise; the warning is logged
-
-    async def test_training_sessions_outer_exception_raises(self) -> None:
-        """A non-domain exception during batch fetch raises."""
-        vault_id = VAULT_ID
-        train_room = _make_room(
-            name="Weight Room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH, tier=1
-        )
-
-        db_session = AsyncMock()
-        db_session.refresh = lambda _obj: None
-        db_session.execute = AsyncMock()
-
-        with patch(
-            "app.services.vault_service.dweller_crud.get_multi_by_vault",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("DB down"),
-        ):
-            service = VaultService()
-            with pytest.raises(RuntimeError, match="DB down"):
-                await service._start_training_sessions(db_session, vault_id, [train_room], is_boosted=True)
-
-
-# ---------------------------------------------------------------------------
-# Test _create_initial_items
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-class TestCreateInitialItems:
-    """Tests for initial item creation."""
-
-    async def test_creates_weapons_and_outfits(self) -> None:
-        """When storage exists, 4 weapons and 4 outfits are created."""
-        vault_id = VAULT_ID
-        storage = _make_storage(vault_id=str(vault_id))
-
-        db_session = AsyncMock()
-        db_session.add = MagicMock()
-        db_session.commit = AsyncMock()
-
-        # mock the select(...) call to return storage
-        mock_exec = MagicMock()
-        mock_exec.scalar_one_or_none.return_value = storage
-        db_session.execute = AsyncMock(return_value=mock_exec)
-
-        service = VaultService()
-        await service._create_initial_items(db_session, vault_id)
-
-        # Verify 8 items added (4 weapons + 4 outfits)
-        assert db_session.add.call_count == 8
-        db_session.commit.assert_awaited_once()
-
-    async def test_noop_when_no_storage(self) -> None:
-        """When storage does not exist, method returns without adding items."""
-        vault_id = VAULT_ID
-
-        db_session = AsyncMock()
-        mock_exec = MagicMock()
-        mock_exec.scalar_one_or_none.return_value = None
-        db_session.execute = AsyncMock(return_value=mock_exec)
-
-        service = VaultService()
-        await service._create_initial_items(db_session, vault_id)
-
-        db_session.add.assert_not_called()
-
-
-# ---------------------------------------------------------------------------
-# Test _assign_initial_objectives
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-class TestAssignInitialObjectives:
-    """Tests for initial objective assignment."""
-
-    async def test_standard_assigns_daily_and_weekly(self) -> None:
-        """Standard vault gets 1 daily + 1 weekly objective."""
-        from app.models.objective import Objective
-
-        vault_id = VAULT_ID
-        daily_obj = Objective(
-            id="od", challenge="Daily test", reward="10 caps", category="daily", objective_type="collect"
-        )
-        weekly_obj = Objective(
-            id="ow", challenge="Weekly test", reward="50 caps", category="weekly", objective_type="collect"
-        )
-
-        service = VaultService()
-        db_session = AsyncMock()
-
-        # Simulate two execute calls: first for daily, second for weekly
-        mock_daily = MagicMock()
-        mock_daily.scalar_one_or_none.return_value = daily_obj
-        mock_weekly = MagicMock()
-        mock_weekly.scalar_one_or_none.return_value = weekly_obj
-        db_session.execute = AsyncMock(side_effect=[mock_daily, mock_weekly])
-        db_session.add = MagicMock()
-        db_session.commit = AsyncMock()
-
-        await service._assign_initial_objectives(db_session, vault_id, is_boosted=False)
-
-        assert db_session.add.call_count == 2  # daily + weekly
-        db_session.commit.assert_awaited_once()
-
-    async def test_boosted_assigns_more_objectives(self) -> None:
-        """Boosted vault adds achievement objectives."""
-        from app.models.objective import Objective
-
-        vault_id = VAULT_ID
-        daily_obj = Objective(id="od", challenge="Daily", reward="10 caps", category="daily", objective_type="collect")
-        weekly_obj = Objective(
-            id="ow", challenge="Weekly", reward="50 caps", category="weekly", objective_type="collect"
-        )
-        achievements = [
-            Objective(
-                id=f"oa{i}",
-                challenge=f"Ach{i}",
-                reward=f"{i * 10} caps",
-                category="achievement",
-                objective_type="build",
-            )
-            for i in range(5)
-        ]
-
-        service = VaultService()
-        db_session = AsyncMock()
-
-        mock_daily = MagicMock()
-        mock_daily.scalar_one_or_none.return_value = daily_obj
-        mock_weekly = MagicMock()
-        mock_weekly.scalar_one_or_none.return_value = weekly_obj
-        mock_basic = MagicMock()
-        mock_basic.scalars.return_value.all.return_value = achievements
-        db_session.execute = AsyncMock(side_effect=[mock_daily, mock_weekly, mock_basic])
-        db_session.add = MagicMock()
-        db_session.commit = AsyncMock()
-
-        await service._assign_initial_objectives(db_session, vault_id, is_boosted=True)
-
-        # 2 (daily/weekly) + 5 (achievements) = 7
-        assert db_session.add.call_count == 7
-
-    async def test_sqlalchemy_error_is_handled(self) -> None:
-        """SQLAlchemyError during assignment is caught and logged, not raised."""
-        vault_id = VAULT_ID
-
-        service = VaultService()
-        db_session = AsyncMock()
-        from sqlalchemy.exc import SQLAlchemyError
-
-        db_session.execute = AsyncMock(side_effect=SQLAlchemyError("DB error"))
-
-        # Should not raise
-        await service._assign_initial_objectives(db_session, vault_id, is_boosted=False)
-
-
-# ---------------------------------------------------------------------------
-# Test _create_initial_items noop edge
-# ---------------------------------------------------------------------------
-# (already tested above in TestCreateInitialItems)
-
-
 # ---------------------------------------------------------------------------
 # Test transfer_medical_supplies
 # ---------------------------------------------------------------------------
@@ -1172,228 +601,168 @@ class TestUpdateVaultResources:
 
 
 # ---------------------------------------------------------------------------
-# Test initiate_vault
+# Test build_vault_graph
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-class TestInitiateVault:
-    """Integration-style tests for the full initiate_vault orchestration."""
-
-    async def test_initiate_vault_standard(self) -> None:
-        """Standard vault initialization end-to-end with mocked dependencies."""
-        vault_id = VAULT_ID
-        user_id = UUID4("11111111-1111-1111-1111-111111111111")
-
-        vault = Vault(
-            id=vault_id,
-            number=42,
-            user_id=user_id,
-            population_max=0,
-            power_max=30,
-            food_max=30,
-            water_max=30,
-        )
-        storage_obj = _make_storage(vault_id=str(vault_id), stimpack=0, radaway=0)
+class TestBuildVaultGraph:
+    """Tests for the in-memory vault layout."""
+
+    @staticmethod
+    def _build(*, is_boosted: bool, objectives=()):
+        from app.services.vault_service import VaultProvisionSpec
+        from app.utils.static_data import game_data_store
+
+        spec = VaultProvisionSpec(VaultNumber(number=42), USER_ID, is_boosted=is_boosted)
+        return VaultService().build_vault_graph(spec, game_data_store.rooms, objectives)
+
+    def test_standard_vault_layout(self) -> None:
+        """Standard vault: 9 dwellers, no training, starter kit in storage."""
+        graph = self._build(is_boosted=False)
+        vault = graph.vault
+
+        assert vault.number == 42
+        assert vault.user_id == USER_ID
+        assert len(graph.dwellers) == 9
+        assert all(d.vault_id == vault.id for d in graph.dwellers)
+        assert {d.room_id for d in graph.dwellers} <= {r.id for r in graph.rooms}
+        assert graph.trainings == []
+        assert len(graph.items) == 8
+        assert all(item.storage_id == graph.storage.id for item in graph.items)
+
+        assert vault.population_max > 0
+        assert vault.power == vault.power_max // 2
+        assert vault.food == vault.food_max // 2
+        assert vault.water == vault.water_max // 2
+
+    def test_boosted_vault_layout(self) -> None:
+        """Boosted vault: 23 dwellers, 7 training sessions, equipped legendaries."""
+        graph = self._build(is_boosted=True)
+
+        assert len(graph.dwellers) == 23
+        assert len(graph.trainings) == 7
+        trainee_ids = {t.dweller_id for t in graph.trainings}
+        assert all(d.status == DwellerStatusEnum.TRAINING for d in graph.dwellers if d.id in trainee_ids)
+
+        legendaries = [d for d in graph.dwellers if d.rarity == RarityEnum.LEGENDARY]
+        assert len(legendaries) == 3
+        equipped = [item for item in graph.items if item.dweller_id is not None]
+        assert {item.dweller_id for item in equipped} == {d.id for d in legendaries}
+        assert len(graph.items) == 8 + 6
+
+        standard = self._build(is_boosted=False)
+        assert graph.vault.population_max > standard.vault.population_max
+        assert graph.storage.stimpack > 0
+
+    def test_objective_links(self) -> None:
+        """One progress link is built per objective."""
+        from app.models.objective import Objective
 
-        # Build mock rooms for get_static_game_data
-        room_templates = [
-            _make_room_create("vault door", category=RoomTypeEnum.CAPACITY),
-            _make_room_create("elevator", category=RoomTypeEnum.CAPACITY),
-            _make_room_create(
-                "living room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA, capacity_formula="size * 2"
+        objectives = [
+            Objective(id="od", challenge="Daily", reward="10 caps", category="daily", objective_type="collect"),
+            Objective(
+                id="ow",
+                challenge="Weekly",
+                reward="50 caps",
+                category="weekly",
+                objective_type="collect",
+                target_amount=5,
             ),
-            _make_room_create("storage room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.ENDURANCE),
-            _make_room_create("power generator", ability=SPECIALEnum.STRENGTH),
-            _make_room_create("diner", ability=SPECIALEnum.AGILITY),
-            _make_room_create("water treatment", ability=SPECIALEnum.PERCEPTION),
-            _make_room_create("radio studio", category=RoomTypeEnum.MISC, ability=SPECIALEnum.CHARISMA),
-            _make_room_create("weight room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH),
         ]
 
-        mock_game_data = MagicMock()
-        mock_game_data.rooms = room_templates
+        graph = self._build(is_boosted=False, objectives=objectives)
 
-        # Create actual VaultService with mocked internals
-        service = VaultService()
+        assert [(link.objective_id, link.total) for link in graph.objective_links] == [("od", 1), ("ow", 5)]
+        assert all(link.vault_id == graph.vault.id for link in graph.objective_links)
+
+    def test_insert_stages_order_parents_first(self) -> None:
+        """Every stage only references rows from earlier stages."""
+        from app.services.vault_service import VaultGraph
+
+        graphs = [self._build(is_boosted=True), self._build(is_boosted=False)]
+
+        vaults, parents, dwellers, children = VaultGraph.insert_stages(graphs)
 
-        # Mock all the sub-methods that do heavy lifting
-        service._prepare_initial_rooms = MagicMock(
-            return_value=(
-                [
-                    RoomCreate(
-                        name="Vault Door",
-                        category=RoomTypeEnum.CAPACITY,
-                        ability=None,
-                        size_min=1,
-                        size_max=3,
-                        base_cost=100,
-                        t2_upgrade_cost=500,
-                        t3_upgrade_cost=1500,
-                        vault_id=vault_id,
-                    )
-                ],
-                [],
-                [],
-                [],
-                [],
-            )
+        assert vaults == [g.vault for g in graphs]
+        assert len(dwellers) == 23 + 9
+        assert sum(isinstance(row, Storage) for row in parents) == 2
+        assert sum(isinstance(row, Room) for row in parents) == sum(len(g.rooms) for g in graphs)
+        assert len(children) == sum(
+            len(g.trainings) + len(g.items) + len(g.objective_links) + len(g.location_links) for g in graphs
         )
 
-        prod_rooms = [_make_room(name="Power Gen", ability=SPECIALEnum.STRENGTH, capacity=10)]
-        train_rooms: list[Room] = []
-        misc_rooms: list[Room] = []
-        cap_rooms: list[Room] = []
 
-        service._create_initial_rooms = AsyncMock(return_value=(vault, prod_rooms, train_rooms, misc_rooms, cap_rooms))
-        service._create_initial_dwellers = AsyncMock()
-        service._start_training_sessions = AsyncMock()
-        service._assign_initial_objectives = AsyncMock()
-        service._create_initial_items = AsyncMock()
+# ---------------------------------------------------------------------------
+# Test provision_vaults / initiate_vault
+# ---------------------------------------------------------------------------
 
-        db_session = AsyncMock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-        db_session.add = MagicMock()
-        db_session.execute = AsyncMock()
 
-        with (
-            patch(
-                "app.services.vault_service.vault_crud.create_with_user_id",
-                new_callable=AsyncMock,
-                return_value=vault,
-            ),
-            patch(
-                "app.services.vault_service.vault_crud.create_storage",
-                new_callable=AsyncMock,
-                return_value=storage_obj,
-            ),
-            patch("app.services.vault_service.vault_crud.update", new_callable=AsyncMock, return_value=vault),
-            patch(
-                "app.services.vault_service.get_static_game_data",
-                new_callable=AsyncMock,
-                return_value=mock_game_data,
-            ),
-            patch("app.services.vault_service.room_crud.evaluate_capacity_formula", return_value=4),
-            patch(
-                "app.services.vault_service.compute_medical_capacity",
-                return_value={"stimpack": 0, "radaway": 0},
-            ),
-        ):
-            result = await service.initiate_vault(
-                db_session,
-                VaultNumber(number=42),
-                user_id,
-                is_boosted=False,
-            )
-
-        assert result == vault
-        service._create_initial_rooms.assert_awaited_once()
-        service._create_initial_dwellers.assert_awaited_once()
-
-    async def test_initiate_vault_boosted(self) -> None:
-        """Boosted vault includes training sessions."""
-        vault_id = VAULT_ID
-        user_id = UUID4("11111111-1111-1111-1111-111111111111")
-
-        vault = Vault(
-            id=vault_id,
-            number=99,
-            user_id=user_id,
-            population_max=0,
-            power_max=50,
-            food_max=50,
-            water_max=50,
-        )
-        storage_obj = _make_storage(vault_id=str(vault_id), stimpack=0, radaway=0)
+@pytest.mark.asyncio
+class TestProvisionVaults:
+    """Database-backed tests for bulk vault provisioning."""
 
-        room_templates = [
-            _make_room_create("elevator", category=RoomTypeEnum.CAPACITY),
-            _make_room_create("vault door", category=RoomTypeEnum.CAPACITY),
-            _make_room_create("living room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA),
-            _make_room_create("storage room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.ENDURANCE),
-            _make_room_create("power generator", ability=SPECIALEnum.STRENGTH),
-            _make_room_create("diner", ability=SPECIALEnum.AGILITY),
-            _make_room_create("water treatment", ability=SPECIALEnum.PERCEPTION),
-            _make_room_create("medbay", ability=SPECIALEnum.INTELLIGENCE),
-            _make_room_create("science lab", ability=SPECIALEnum.INTELLIGENCE),
-            _make_room_create("radio studio", category=RoomTypeEnum.MISC, ability=SPECIALEnum.CHARISMA),
-            _make_room_create("overseer's office", category=RoomTypeEnum.MISC),
-            _make_room_create("weight room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH),
-            _make_room_create("armory", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.PERCEPTION),
-            _make_room_create("athletics room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.ENDURANCE),
-            _make_room_create("classroom", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.CHARISMA),
-            _make_room_create("game room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.INTELLIGENCE),
-            _make_room_create("fitness room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.AGILITY),
-            _make_room_create("lounge", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.LUCK),
+    async def test_provisions_many_vaults_in_one_commit(self, async_session, superuser) -> None:
+        """All vaults and their rows are written with a single commit."""
+        from sqlmodel import func, select
+
+        from app.services.vault_service import VaultProvisionSpec
+
+        specs = [
+            VaultProvisionSpec(VaultNumber(number=number), superuser.id, is_boosted=number % 2 == 0)
+            for number in range(100, 104)
         ]
 
-        mock_game_data = MagicMock()
-        mock_game_data.rooms = room_templates
+        with patch.object(async_session, "commit", wraps=async_session.commit) as commit:
+            vaults = await VaultService().provision_vaults(async_session, specs)
 
-        service = VaultService()
+        assert commit.await_count == 1
+        assert [v.number for v in vaults] == [100, 101, 102, 103]
+        for vault in vaults:
+            count = await async_session.scalar(select(func.count()).where(Dweller.vault_id == vault.id))
+            assert count == (23 if vault.number % 2 == 0 else 9)
 
-        prod_rooms = [
-            _make_room(f"p{i}", name, ability=ability)
-            for i, (name, ability) in enumerate(
-                [
-                    ("Power Gen", SPECIALEnum.STRENGTH),
-                    ("Diner", SPECIALEnum.AGILITY),
-                    ("Water Treatment", SPECIALEnum.PERCEPTION),
-                ],
-                1,
-            )
-        ]
-        train_rooms = [
-            _make_room(name="Train Room", category=RoomTypeEnum.TRAINING, ability=SPECIALEnum.STRENGTH)
-            for i in range(7)
-        ]
-        misc_rooms = [_make_room(name="Radio Studio", category=RoomTypeEnum.MISC, ability=SPECIALEnum.CHARISMA)]
-        cap_rooms = [_make_room(name="Living Room", category=RoomTypeEnum.CAPACITY, ability=SPECIALEnum.CHARISMA)]
+    async def test_empty_specs_is_a_noop(self) -> None:
+        """Nothing is loaded or written when there is nothing to provision."""
+        db_session = AsyncMock()
 
-        service._prepare_initial_rooms = MagicMock(return_value=([], [], [], [], []))
-        service._create_initial_rooms = AsyncMock(return_value=(vault, prod_rooms, train_rooms, misc_rooms, cap_rooms))
-        service._create_initial_dwellers = AsyncMock()
-        service._start_training_sessions = AsyncMock()
-        service._assign_initial_objectives = AsyncMock()
-        service._create_initial_items = AsyncMock()
+        assert await VaultService().provision_vaults(db_session, []) == []
+        db_session.commit.assert_not_awaited()
+
+    async def test_failure_rolls_back(self) -> None:
+        """A failed flush rolls back the whole batch and re-raises."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        from app.services.vault_service import VaultProvisionSpec
+        from app.utils.static_data import game_data_store
 
         db_session = AsyncMock()
-        db_session.commit = AsyncMock()
-        db_session.refresh = AsyncMock()
-        db_session.add = MagicMock()
-        db_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=storage_obj)))
+        db_session.add_all = MagicMock()
+        db_session.flush = AsyncMock(side_effect=SQLAlchemyError("boom"))
+        service = VaultService()
 
         with (
-            patch(
-                "app.services.vault_service.vault_crud.create_with_user_id",
-                new_callable=AsyncMock,
-                return_value=vault,
-            ),
-            patch(
-                "app.services.vault_service.vault_crud.create_storage",
-                new_callable=AsyncMock,
-                return_value=storage_obj,
-            ),
-            patch("app.services.vault_service.vault_crud.update", new_callable=AsyncMock, return_value=vault),
             patch(
                 "app.services.vault_service.get_static_game_data",
                 new_callable=AsyncMock,
-                return_value=mock_game_data,
-            ),
-            patch("app.services.vault_service.room_crud.evaluate_capacity_formula", return_value=4),
-            patch(
-                "app.services.vault_service.compute_medical_capacity",
-                return_value={"stimpack": 5, "radaway": 5},
+                return_value=game_data_store,
             ),
+            patch.object(service, "_select_initial_objectives", AsyncMock(return_value=([], []))),
+            pytest.raises(SQLAlchemyError),
         ):
-            result = await service.initiate_vault(
-                db_session,
-                VaultNumber(number=99, boosted=True),
-                user_id,
-                is_boosted=True,
-            )
-
-        assert result == vault
-        service._start_training_sessions.assert_awaited_once()
-        service._assign_initial_objectives.assert_awaited_once()
+            await service.provision_vaults(db_session, [VaultProvisionSpec(VaultNumber(number=7), USER_ID)])
+
+        db_session.rollback.assert_awaited_once()
+        db_session.commit.assert_not_awaited()
+
+    async def test_initiate_vault_delegates(self) -> None:
+        """initiate_vault provisions a single vault through the bulk path."""
+        service = VaultService()
+        vault = MagicMock(spec=Vault)
+        service.provision_vaults = AsyncMock(return_value=[vault])
+        db_session = AsyncMock()
+
+        result = await service.initiate_vault(db_session, VaultNumber(number=5), USER_ID, is_boosted=True)
+
+        assert result is vault
+        ((_, specs), _) = service.provision_vaults.await_args
+        assert [(s.obj_in.number, s.user_id, s.is_boosted) for s in specs] == [(5, USER_ID, True)]
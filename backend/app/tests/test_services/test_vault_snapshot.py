@@ -0,0 +1,110 @@
+"""Tests for streaming vault snapshot export and import."""
+
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.chat_message import ChatMessage
+from app.models.dweller import Dweller
+from app.models.pregnancy import Pregnancy
+from app.models.relationship import Relationship
+from app.models.room import Room
+from app.models.user import User
+from app.models.vault import Vault
+from app.schemas.vault import VaultNumber
+from app.services.vault_service import VaultProvisionSpec, VaultService
+from app.services.vault_snapshot import SNAPSHOT_FORMAT, VaultSnapshotService
+from app.utils.exceptions import ResourceNotFoundException
+
+
+async def _populated_vault(db: AsyncSession, owner: User) -> Vault:
+    (vault,) = await VaultService().provision_vaults(
+        db, [VaultProvisionSpec(VaultNumber(number=42), owner.id, is_boosted=True)]
+    )
+    mother, father, *_ = (await db.execute(select(Dweller).where(Dweller.vault_id == vault.id))).scalars().all()
+    mother.partner_id, father.partner_id = father.id, mother.id
+    db.add_all(
+        [
+            Relationship(dweller_1_id=mother.id, dweller_2_id=father.id, affinity=80),
+            Pregnancy(mother_id=mother.id, father_id=father.id, due_at=datetime.utcnow() + timedelta(hours=3)),
+            ChatMessage(vault_id=vault.id, from_user_id=owner.id, to_dweller_id=mother.id, message_text="Hello"),
+        ]
+    )
+    await db.commit()
+    return vault
+
+
+async def _count(db: AsyncSession, model, *where) -> int:
+    return await db.scalar(select(func.count()).select_from(model).where(*where))
+
+
+@pytest.mark.asyncio
+async def test_round_trip_copies_the_graph_under_new_ids(async_session: AsyncSession, superuser: User):
+    vault = await _populated_vault(async_session, superuser)
+    service = VaultSnapshotService(batch_size=7)  # force several batches per table
+    archive = io.BytesIO()
+
+    exported = await service.export_vault(async_session, vault.id, archive)
+    archive.seek(0)
+    imported = await service.import_vault(async_session, archive, user_id=superuser.id)
+
+    assert imported.vault_id != vault.id
+    assert imported.row_counts == exported.row_counts
+    assert exported.row_counts["dweller"] == await _count(async_session, Dweller, Dweller.vault_id == vault.id)
+    assert imported.row_counts["room"] == await _count(async_session, Room, Room.vault_id == imported.vault_id)
+
+    copy = await async_session.get(Vault, imported.vault_id)
+    assert (copy.number, copy.user_id) == (vault.number, superuser.id)
+
+    dwellers = (
+        (await async_session.execute(select(Dweller).where(Dweller.vault_id == imported.vault_id))).scalars().all()
+    )
+    by_id = {dweller.id: dweller for dweller in dwellers}
+    partnered = [dweller for dweller in dwellers if dweller.partner_id]
+    assert len(partnered) == 2
+    assert all(by_id[dweller.partner_id].partner_id == dweller.id for dweller in partnered)
+
+    pregnancy = (await async_session.execute(select(Pregnancy).where(Pregnancy.mother_id.in_(by_id)))).scalar_one()
+    assert pregnancy.father_id in by_id
+    message = (
+        await async_session.execute(select(ChatMessage).where(ChatMessage.vault_id == imported.vault_id))
+    ).scalar_one()
+    assert message.to_dweller_id in by_id
+    assert message.from_user_id == superuser.id
+
+
+@pytest.mark.asyncio
+async def test_archive_is_gzip_ndjson_with_header(async_session: AsyncSession, superuser: User):
+    vault = await _populated_vault(async_session, superuser)
+    archive = io.BytesIO()
+
+    await VaultSnapshotService().export_vault(async_session, vault.id, archive)
+
+    lines = gzip.decompress(archive.getvalue()).splitlines()
+    header = json.loads(lines[0])
+    assert header["format"] == SNAPSHOT_FORMAT
+    assert header["vault_id"] == str(vault.id)
+    assert json.loads(lines[1])["table"] == "vault"
+
+
+@pytest.mark.asyncio
+async def test_export_unknown_vault_raises(async_session: AsyncSession):
+    with pytest.raises(ResourceNotFoundException):
+        await VaultSnapshotService().export_vault(async_session, uuid4(), io.BytesIO())
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_foreign_archive_and_writes_nothing(async_session: AsyncSession, superuser: User):
+    archive = io.BytesIO(gzip.compress(b'{"format": "something-else"}\n'))
+    before = await _count(async_session, Vault)
+
+    with pytest.raises(ValueError, match="Not a vault snapshot"):
+        await VaultSnapshotService().import_vault(async_session, archive, user_id=superuser.id)
+
+    assert await _count(async_session, Vault) == before
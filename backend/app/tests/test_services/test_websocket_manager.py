@@ -0,0 +1,115 @@
+"""Tests for presence-aware routing between ConnectionManager instances."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from app.services.websocket_manager import PRESENCE_KEY, ConnectionManager
+
+# Listener tasks are started by the fixture, so tests must share its (session) event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _socket() -> MagicMock:
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+async def _until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("condition not reached")
+
+
+@pytest_asyncio.fixture
+async def managers() -> AsyncGenerator[tuple[ConnectionManager, ConnectionManager]]:
+    server = fakeredis.FakeServer()
+    first, second = ConnectionManager(), ConnectionManager()
+    await first.start_redis(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+    await second.start_redis(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True))
+    for manager in (first, second):
+        # The listener subscribes in a background task; publishing before that would be lost
+        for _ in range(100):
+            if (await manager.redis.pubsub_numsub(manager.redis_channel))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+    yield first, second
+    await first.stop_redis()
+    await second.stop_redis()
+
+
+async def test_message_reaches_socket_on_other_instance(managers):
+    first, second = managers
+    user_id = uuid4()
+    websocket = _socket()
+    await second.connect(websocket, user_id)
+
+    await first.send_personal_message({"type": "notification", "id": user_id}, user_id)
+
+    await _until(lambda: websocket.send_text.await_count == 1)
+    assert json.loads(websocket.send_text.await_args.args[0]) == {"type": "notification", "id": str(user_id)}
+
+
+async def test_local_or_absent_recipient_publishes_nothing(managers):
+    first, _second = managers
+    present, absent = uuid4(), uuid4()
+    websocket = _socket()
+    await first.connect(websocket, present)
+
+    with patch.object(first.redis, "publish", new_callable=AsyncMock) as publish:
+        await first.send_personal_message({"type": "ping"}, present)
+        await first.send_personal_message({"type": "ping"}, absent)
+
+    websocket.send_text.assert_awaited_once()
+    publish.assert_not_awaited()
+
+
+async def test_batch_encodes_once_and_keeps_order_across_instances(managers):
+    first, second = managers
+    user_id = uuid4()
+    websocket = _socket()
+    await second.connect(websocket, user_id)
+
+    with patch("app.services.websocket_manager.encode_message", wraps=json.dumps) as encode:
+        await first.send_personal_messages([{"n": 1}, {"n": 2}, {"n": 3}], user_id)
+    assert encode.call_count == 3
+
+    await _until(lambda: websocket.send_text.await_count == 3)
+    assert [json.loads(call.args[0])["n"] for call in websocket.send_text.await_args_list] == [1, 2, 3]
+
+
+async def test_disconnect_withdraws_presence_on_next_heartbeat(managers):
+    first, _second = managers
+    user_id = uuid4()
+    websocket = _socket()
+    await first.connect(websocket, user_id)
+    key = PRESENCE_KEY.format(user_id=user_id)
+    assert await first.redis.zscore(key, first.instance_id) is not None
+
+    first.disconnect(websocket, user_id)
+    await first._refresh_presence()
+
+    assert await first.redis.zscore(key, first.instance_id) is None
+
+
+async def test_chat_message_routes_to_chat_socket(managers):
+    first, second = managers
+    user_id, dweller_id = uuid4(), uuid4()
+    websocket = _socket()
+    await second.connect_chat(websocket, user_id, dweller_id)
+
+    await first.send_typing_indicator(user_id, dweller_id, is_typing=True)
+
+    await _until(lambda: websocket.send_text.await_count == 1)
+    assert json.loads(websocket.send_text.await_args.args[0])["type"] == "typing"
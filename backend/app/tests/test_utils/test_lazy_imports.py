@@ -0,0 +1,60 @@
+"""Tests for deferred imports of heavy SDKs."""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.lazy import LazyImport
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+HEAVY_MODULES = ("openai", "pydantic_ai", "boto3", "botocore", "aioboto3", "PIL", "sqladmin")
+
+
+def test_lazy_import_resolves_on_first_attribute_access(monkeypatch):
+    """The target module is imported once, on first use, and attributes are forwarded."""
+    module = types.ModuleType("lazy_target")
+    module.agent = types.SimpleNamespace(run=lambda: "ran")
+    monkeypatch.setitem(sys.modules, "lazy_target", module)
+
+    proxy = LazyImport("lazy_target", "agent")
+    assert "not loaded" in repr(proxy)
+
+    assert proxy.run() == "ran"
+    assert proxy.resolve() is module.agent
+    assert "(loaded)" in repr(proxy)
+
+
+def test_lazy_import_forwards_attribute_patching(monkeypatch):
+    """patch.object on the proxy patches the real object, as it would with a direct import."""
+    module = types.ModuleType("lazy_target")
+    module.agent = types.SimpleNamespace(run=lambda: "ran")
+    monkeypatch.setitem(sys.modules, "lazy_target", module)
+    proxy = LazyImport("lazy_target", "agent")
+
+    with patch.object(proxy, "run", return_value="patched"):
+        assert module.agent.run() == "patched"
+    assert proxy.run() == "ran"
+
+
+@pytest.mark.parametrize("entry_point", ["main", "app.api.tasks"])
+def test_entry_points_do_not_import_heavy_sdks(entry_point):
+    """API and worker start without loading provider SDKs, boto, Pillow or the admin UI."""
+    probe = f"import sys, {entry_point}; print('HEAVY=' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [sys.executable, "-c", probe],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    # Startup logging may share stdout, so pick out the probe's own line
+    heavy = next(line for line in proc.stdout.splitlines() if line.startswith("HEAVY="))
+    assert heavy == "HEAVY="
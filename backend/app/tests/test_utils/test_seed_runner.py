@@ -0,0 +1,80 @@
+"""Tests for the hash-guarded startup seeding."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.quest import Quest
+from app.models.seed_state import SeedState
+from app.utils.seed_quests import stage_quests
+from app.utils.seed_runner import directory_digest, seed_static_content
+
+
+def _write_quests(quest_dir: Path, *names: str) -> None:
+    quest_dir.mkdir(exist_ok=True)
+    quests = [
+        {
+            "quest_name": name,
+            "long_description": f"{name} long",
+            "short_description": f"{name} short",
+            "requirements": "Level 1",
+            "rewards": "10 caps",
+        }
+        for name in names
+    ]
+    (quest_dir / "quests.json").write_text(json.dumps(quests), encoding="utf-8")
+
+
+def test_directory_digest_tracks_content_and_paths(tmp_path: Path) -> None:
+    _write_quests(tmp_path, "Quest One")
+    first = directory_digest(tmp_path)
+
+    assert directory_digest(tmp_path) == first
+    _write_quests(tmp_path, "Quest Two")
+    assert directory_digest(tmp_path) != first
+    (tmp_path / "quests.json").rename(tmp_path / "renamed.json")
+    assert directory_digest(tmp_path) not in {first, directory_digest(tmp_path / "missing")}
+
+
+@pytest.mark.asyncio
+async def test_seeding_skipped_until_data_changes(async_session: AsyncSession, tmp_path: Path) -> None:
+    quest_dir = tmp_path / "quests"
+    _write_quests(quest_dir, "Quest One", "Quest Two")
+    stage = AsyncMock(wraps=stage_quests)
+    seeders = {"quests": (quest_dir, stage)}
+
+    assert await seed_static_content(async_session, seeders=seeders) == {"quests": 2}
+    state = await async_session.get(SeedState, "quests")
+    assert state.digest == directory_digest(quest_dir)
+
+    assert await seed_static_content(async_session, seeders=seeders) == {"quests": 0}
+    assert stage.await_count == 1
+
+    _write_quests(quest_dir, "Quest One", "Quest Two", "Quest Three")
+    assert await seed_static_content(async_session, seeders=seeders) == {"quests": 1}
+    assert stage.await_count == 2
+
+    assert await seed_static_content(async_session, seeders=seeders, force=True) == {"quests": 0}
+    assert stage.await_count == 3
+    titles = (await async_session.execute(select(Quest.title))).scalars().all()
+    assert sorted(titles) == ["Quest One", "Quest Three", "Quest Two"]
+
+
+@pytest.mark.asyncio
+async def test_failed_seeding_records_no_digest(async_session: AsyncSession, tmp_path: Path) -> None:
+    quest_dir = tmp_path / "quests"
+    _write_quests(quest_dir, "Quest One")
+
+    async def failing_stage(db_session: AsyncSession, directory: Path) -> int:
+        await stage_quests(db_session, directory)
+        raise RuntimeError("boom")
+
+    seeders = {"quests": (quest_dir, failing_stage)}
+
+    assert await seed_static_content(async_session, seeders=seeders) == {"quests": 0}
+    assert await async_session.get(SeedState, "quests") is None
+    assert (await async_session.execute(select(Quest))).scalars().all() == []
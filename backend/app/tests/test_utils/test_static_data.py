@@ -0,0 +1,52 @@
+"""Tests for the shared static game data registry."""
+
+from app.schemas.common import RarityEnum, RoomTypeEnum
+from app.schemas.junk import JunkCreate
+from app.services.exploration import data_loader
+from app.utils.static_data import DATA_DIR, CatalogIndex, StaticGameData, game_data_store, load_json_records
+
+
+def test_get_room_is_case_insensitive_and_returns_catalog_instance():
+    room = game_data_store.rooms[0]
+
+    assert game_data_store.get_room(room.name.upper()) is room
+    assert game_data_store.get_room("Not A Room") is None
+
+
+def test_named_lookups_cover_every_catalog():
+    weapon = game_data_store.weapons[0]
+    outfit = game_data_store.outfits[0]
+    junk = game_data_store.junk_items[0]
+
+    assert game_data_store.get_weapon(weapon.name.lower()) is weapon
+    assert game_data_store.get_outfit(outfit.name) is outfit
+    assert game_data_store.get_junk(junk.name) is junk
+
+
+def test_rarity_and_type_buckets_partition_the_catalog():
+    index = game_data_store.weapon_index
+
+    assert sum(len(group) for group in index.by_rarity.values()) == len(game_data_store.weapons)
+    assert sum(len(group) for group in index.by_type.values()) == len(game_data_store.weapons)
+    assert all(weapon.rarity == RarityEnum.LEGENDARY for weapon in index.by_rarity.get(RarityEnum.LEGENDARY, ()))
+    assert all(room.category == RoomTypeEnum.PRODUCTION for room in game_data_store.room_index.by_type["production"])
+
+
+def test_catalog_index_keeps_first_definition_of_a_name():
+    first, duplicate = game_data_store.junk_items[:2]
+    duplicate = duplicate.model_copy(update={"name": first.name.upper()})
+
+    index = CatalogIndex.build([first, duplicate], "junk_type")
+
+    assert index.by_name[first.name.lower()] is first
+
+
+def test_item_files_are_parsed_once_for_both_consumers():
+    weapons_file = DATA_DIR / "items" / "weapons.json"
+
+    assert data_loader.load_weapons() is load_json_records(weapons_file)
+    assert data_loader.weapons_by_name()[game_data_store.weapons[0].name] is load_json_records(weapons_file)[0]
+
+
+def test_missing_file_loads_as_empty(tmp_path):
+    assert StaticGameData.load_data(tmp_path / "missing.json", JunkCreate) == []
@@ -1,9 +1,13 @@
+import hashlib
 import io
 import logging
+from collections.abc import Iterable, Sequence
 from urllib.parse import urlparse
 
 import httpx
-from PIL import Image
+
+# Pillow is imported inside each function: it is only needed when media is processed,
+# which most API and worker processes never do.
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +30,49 @@ async def image_url_to_bytes(url: str) -> bytes | None:
 
 def generate_thumbnail(image_bytes: bytes, max_size: tuple[int, int] = (256, 256)) -> bytes:
     """Generate a thumbnail from an image."""
+    from PIL import Image
+
     image = Image.open(io.BytesIO(image_bytes))
     image.thumbnail(max_size)
     thumbnail_bytes = io.BytesIO()
     image.save(thumbnail_bytes, format="JPEG")
     return thumbnail_bytes.getvalue()
+
+
+def content_digest(data: bytes) -> str:
+    """Return the hex sha256 digest used as a content address for media blobs."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def supported_variant_formats(formats: Iterable[str]) -> list[str]:
+    """Filter requested encoder formats down to those this Pillow build can write."""
+    from PIL import features
+
+    return [fmt for fmt in formats if features.check(fmt)]
+
+
+def render_image_variants(
+    image_bytes: bytes, widths: Sequence[int], formats: Sequence[str]
+) -> list[tuple[str, int, int, bytes]]:
+    """Decode an image once and encode it at every width/format combination.
+
+    Runs in a worker process, so it only takes and returns picklable primitives:
+    a list of ``(format, width, height, data)`` tuples ordered smallest first.
+    Widths larger than the source are skipped rather than upscaled.
+    """
+    from PIL import Image
+
+    source = Image.open(io.BytesIO(image_bytes))
+    source = source.convert("RGBA" if source.mode in {"RGBA", "LA", "P"} else "RGB")
+    variants: list[tuple[str, int, int, bytes]] = []
+    # Downscale largest-first so each step resamples the previous, smaller image
+    current = source
+    for width in sorted({w for w in widths if w <= source.width}, reverse=True):
+        height = max(1, round(source.height * width / source.width))
+        current = current.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            buffer = io.BytesIO()
+            current.save(buffer, format=fmt.upper(), quality=80)
+            variants.append((fmt, current.width, current.height, buffer.getvalue()))
+    variants.reverse()
+    return variants
@@ -0,0 +1,43 @@
+"""Deferred imports for optional, expensive subsystems."""
+
+import importlib
+from typing import Any
+
+
+class LazyImport:
+    """Module-level stand-in for ``from <module> import <name>`` that imports on first attribute access.
+
+    Lets a service keep a patchable module attribute (``patch("app.services.x.agent")``)
+    for an object whose defining module pulls in a heavy SDK, without paying for
+    that import until the object is actually used.
+    """
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        """Import the module (once) and return the real object."""
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        # Own slots are set directly; anything else (e.g. patch.object in tests) lands on the real object
+        if attr in LazyImport.__slots__:
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self.resolve(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {self._module}.{self._name} ({state})>"
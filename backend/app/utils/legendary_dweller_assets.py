@@ -1,5 +1,6 @@
 """Legendary dweller image URL resolution."""
 
+from functools import cache
 from pathlib import Path
 
 LEGENDARY_DWELLER_IMAGE_FILES = {
@@ -26,8 +27,13 @@ _IMAGE_DIR = Path(__file__).parent.parent / "static" / "legendary_dweller_images
 _FALLBACK_IMAGE_FILE = "FOS_Dw_Legendary_Red.png"
 
 
+@cache
+def _image_exists(filename: str) -> bool:
+    return (_IMAGE_DIR / filename).exists()
+
+
 def get_legendary_dweller_image_url(name: str | None) -> str | None:
     """Return a legendary dweller portrait, with a generic legendary fallback."""
     filename = LEGENDARY_DWELLER_IMAGE_FILES.get(name.strip().casefold()) if name else None
     filename = filename or _FALLBACK_IMAGE_FILE
-    return f"/static/legendary_dweller_images/{filename}" if (_IMAGE_DIR / filename).exists() else None
+    return f"/static/legendary_dweller_images/{filename}" if _image_exists(filename) else None
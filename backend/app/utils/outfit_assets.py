@@ -4,6 +4,7 @@ Centralizes the mapping between in-game outfit names and their static image
 assets. Unmapped outfits fall back to the generic equipment icon in the UI.
 """
 
+from functools import cache
 from pathlib import Path
 
 # Maps canonical lower-cased outfit names to the actual filename in
@@ -44,6 +45,12 @@ OUTFIT_NAME_TO_IMAGE_FILE: dict[str, str] = {
 _APPAREL_IMAGE_DIR = Path(__file__).parent.parent / "static" / "apparel_images"
 
 
+@cache
+def _image_exists(filename: str) -> bool:
+    # Static assets never change at runtime; stat each file once
+    return (_APPAREL_IMAGE_DIR / filename).exists()
+
+
 def get_outfit_image_url(outfit_name: str | None) -> str | None:
     """Return the static image URL for an outfit, if a mapped asset exists.
 
@@ -59,7 +66,7 @@ def get_outfit_image_url(outfit_name: str | None) -> str | None:
     if not filename:
         return None
 
-    if not (_APPAREL_IMAGE_DIR / filename).exists():
+    if not _image_exists(filename):
         return None
 
     return f"/static/apparel_images/{filename}"
@@ -8,7 +8,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.objective import Objective
 from app.schemas.objective import ObjectiveCreate
 from app.utils.objective_constants import validate_target_entity
-from app.utils.seeding import seed_from_json
+from app.utils.seeding import seed_from_json, stage_from_json
 from app.utils.static_data import DATA_DIR
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,23 @@ def _validate_objective(objective_data: ObjectiveCreate) -> list[str]:
     )
 
 
+def _objectives_dir(objectives_dir: Path | None) -> Path:
+    return objectives_dir if objectives_dir is not None else DATA_DIR / "objectives"
+
+
+async def stage_objectives(db_session: AsyncSession, objectives_dir: Path | None = None) -> int:
+    """Add objectives missing from the database to the session without committing; errors propagate."""
+    return await stage_from_json(
+        db_session=db_session,
+        model_class=Objective,
+        schema_class=ObjectiveCreate,
+        directory=_objectives_dir(objectives_dir),
+        unique_field="challenge",
+        transform_fn=_transform_objective_create_to_model,
+        validate_fn=_validate_objective,
+    )
+
+
 async def seed_objectives_from_json(db_session: AsyncSession, objectives_dir: Path | None = None) -> int:
     """
     Seed objectives from JSON files into database if they don't already exist.
@@ -52,14 +69,11 @@ async def seed_objectives_from_json(db_session: AsyncSession, objectives_dir: Pa
     Returns:
         Number of objectives seeded
     """
-    if objectives_dir is None:
-        objectives_dir = DATA_DIR / "objectives"
-
     return await seed_from_json(
         db_session=db_session,
         model_class=Objective,
         schema_class=ObjectiveCreate,
-        directory=objectives_dir,
+        directory=_objectives_dir(objectives_dir),
         unique_field="challenge",
         transform_fn=_transform_objective_create_to_model,
         validate_fn=_validate_objective,
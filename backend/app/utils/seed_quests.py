@@ -4,14 +4,14 @@ import logging
 from pathlib import Path
 from uuid import UUID
 
-from sqlmodel import select
+from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Item
 from app.models.quest import Quest
 from app.models.quest_requirement import QuestRequirement, RequirementType
 from app.models.quest_reward import QuestReward, RewardType
-from app.schemas.quest import QuestJSON, QuestRewardJSON
+from app.schemas.quest import QuestJSON, QuestRequirementJSON, QuestRewardJSON
 from app.utils.load_quests import load_all_quest_chain_files
 
 logger = logging.getLogger(__name__)
@@ -55,6 +55,171 @@ def generate_rewards_string(quest_json: QuestJSON) -> str:
     return ", ".join(format_reward(r) for r in quest_json.quest_rewards)
 
 
+def _requirements_text(quest_json: QuestJSON) -> str:
+    """Flatten the free-form ``Requirements`` field (string or list of strings) into one string."""
+    reqs = quest_json.requirements
+    if isinstance(reqs, str):
+        return reqs
+    if isinstance(reqs, list):
+        return ", ".join(reqs) if all(isinstance(r, str) for r in reqs) else str(reqs[0]) if reqs else ""
+    return ""
+
+
+def _load_quest_jsons(quest_dir: Path | None) -> list[QuestJSON]:
+    """Load every quest from the chain files, warning about quest names defined more than once."""
+    quest_chains = load_all_quest_chain_files(quest_dir)
+    all_quest_jsons = [quest_json for chain in quest_chains for quest_json in chain.quests]
+
+    seen_quest_names: dict[str, list[str]] = {}
+    for quest_json in all_quest_jsons:
+        if quest_json.quest_name:
+            seen_quest_names.setdefault(quest_json.quest_name, []).append(
+                getattr(quest_json, "_source_file", "unknown")
+            )
+    for quest_name, files in seen_quest_names.items():
+        if len(files) > 1:
+            unique_files = list(dict.fromkeys(files))
+            logger.warning(
+                "Duplicate quest_name '%s' found in %d files: %s. Only the first definition is seeded.",
+                quest_name,
+                len(unique_files),
+                unique_files,
+            )
+
+    logger.info("Loaded %d quests from %d quest chains", len(all_quest_jsons), len(quest_chains))
+    return all_quest_jsons
+
+
+def _build_requirement(
+    quest: Quest, req_json: QuestRequirementJSON, quest_ids: dict[str, UUID]
+) -> QuestRequirement | None:
+    """Build one requirement row, resolving ``QUEST_COMPLETED`` quest names against ``quest_ids``."""
+    requirement_data = dict(req_json.requirement_data)
+    is_quest_completed = req_json.requirement_type.upper() == "QUEST_COMPLETED"
+
+    if is_quest_completed and (quest_name := requirement_data.get("quest_name")):
+        if quest_name in quest_ids:
+            requirement_data["quest_id"] = str(quest_ids[quest_name])
+            del requirement_data["quest_name"]
+        else:
+            logger.warning(
+                "Could not resolve quest_name '%s' for QUEST_COMPLETED requirement in quest '%s'",
+                quest_name,
+                quest.title,
+            )
+
+    try:
+        predecessor_id = None
+        if (
+            is_quest_completed
+            and req_json.is_mandatory
+            and quest.previous_quest_id is None
+            and (previous_quest_id := requirement_data.get("quest_id"))
+        ):
+            predecessor_id = UUID(str(previous_quest_id))
+
+        requirement = QuestRequirement(
+            quest_id=quest.id,
+            requirement_type=RequirementType(req_json.requirement_type.lower()),
+            requirement_data=requirement_data,
+            is_mandatory=req_json.is_mandatory,
+        )
+    except ValueError as e:
+        logger.warning("Failed to create requirement for quest '%s': %s", quest.title, e)
+        return None
+
+    if predecessor_id:
+        quest.previous_quest_id = predecessor_id
+    return requirement
+
+
+async def stage_quests(db_session: AsyncSession, quest_dir: Path | None = None) -> int:
+    """Add every quest from the JSON files that is not in the database yet, without committing.
+
+    Existing quest titles and reward item names are read with one query each,
+    quest-name references are resolved in memory (new quests get their UUIDs
+    client-side), and all rows are written in a single flush. Errors propagate
+    so the caller decides whether to roll back.
+
+    Args:
+        db_session: Database session
+        quest_dir: Directory containing quest JSON files (defaults to app/data/quests)
+
+    Returns:
+        Number of quests staged
+    """
+    all_quest_jsons = _load_quest_jsons(quest_dir)
+
+    quest_ids: dict[str, UUID] = {}
+    for title, quest_id in (await db_session.execute(select(Quest.title, Quest.id))).all():
+        quest_ids.setdefault(title, quest_id)
+
+    new_quests: list[tuple[Quest, QuestJSON]] = []
+    for quest_json in all_quest_jsons:
+        if quest_json.quest_name in quest_ids:
+            continue
+        quest = Quest(
+            title=quest_json.quest_name,
+            short_description=quest_json.short_description,
+            long_description=quest_json.long_description,
+            requirements=_requirements_text(quest_json),
+            rewards=generate_rewards_string(quest_json),
+        )
+        quest_ids[quest_json.quest_name] = quest.id
+        new_quests.append((quest, quest_json))
+        logger.debug("Seeding quest: %s", quest_json.quest_name)
+
+    if not new_quests:
+        return 0
+
+    reward_items = {
+        reward_json.item_data["name"]: reward_json.item_data
+        for _, quest_json in new_quests
+        for reward_json in quest_json.quest_rewards
+        if reward_json.reward_type.upper() == "ITEM" and reward_json.item_data and reward_json.item_data.get("name")
+    }
+    existing_items: set[str] = set()
+    if reward_items:
+        result = await db_session.execute(select(Item.name).where(Item.name.in_(reward_items)))
+        existing_items = set(result.scalars().all())
+
+    rows: list[SQLModel] = [quest for quest, _ in new_quests]
+    for quest, quest_json in new_quests:
+        rows.extend(
+            requirement
+            for req_json in quest_json.quest_requirements
+            if (requirement := _build_requirement(quest, req_json, quest_ids)) is not None
+        )
+        for reward_json in quest_json.quest_rewards:
+            try:
+                rows.append(
+                    QuestReward(
+                        quest_id=quest.id,
+                        reward_type=RewardType(reward_json.reward_type.lower()),
+                        reward_data=reward_json.reward_data,
+                        reward_chance=reward_json.reward_chance,
+                    )
+                )
+            except ValueError as e:
+                logger.warning("Failed to create reward for quest '%s': %s", quest.title, e)
+
+    for item_name, item_data in reward_items.items():
+        if item_name not in existing_items:
+            rows.append(
+                Item(
+                    name=item_name,
+                    rarity=item_data.get("rarity", "common"),
+                    value=item_data.get("value"),
+                    image_url=item_data.get("image_url"),
+                )
+            )
+            logger.debug("Created item '%s' from quest reward", item_name)
+
+    db_session.add_all(rows)
+    await db_session.flush()
+    return len(new_quests)
+
+
 async def seed_quests_from_json(db_session: AsyncSession, quest_dir: Path | None = None) -> int:
     """Seed quests from JSON files into database if they don't already exist.
 
@@ -66,167 +231,8 @@ async def seed_quests_from_json(db_session: AsyncSession, quest_dir: Path | None
         Number of quests seeded
     """
     try:
-        # Load quest chains from JSON files
-        quest_chains = load_all_quest_chain_files(quest_dir)
-
-        # Flatten all quests from all chains
-        all_quest_jsons: list[QuestJSON] = []
-        for chain in quest_chains:
-            all_quest_jsons.extend(chain.quests)
-
-        # Detect duplicate quest_names within loaded JSON files (rglob discovery)
-        seen_quest_names: dict[str, list[str]] = {}
-        for quest_json in all_quest_jsons:
-            if quest_json.quest_name:
-                source_file = getattr(quest_json, "_source_file", "unknown")
-                if quest_json.quest_name not in seen_quest_names:
-                    seen_quest_names[quest_json.quest_name] = []
-                seen_quest_names[quest_json.quest_name].append(source_file)
-
-        # Log warnings for duplicates found
-        for quest_name, files in seen_quest_names.items():
-            if len(files) > 1:
-                unique_files = list(dict.fromkeys(files))
-                logger.warning(
-                    f"Duplicate quest_name '{quest_name}' found in %d files: {unique_files}. "
-                    "This may cause non-deterministic seeding behavior.",
-                    len(unique_files),
-                )
-
-        logger.info("Loaded %d quests from %d quest chains", len(all_quest_jsons), len(quest_chains))
-
-        # Check which quests already exist in database
-        existing_titles_result = await db_session.execute(select(Quest.title))
-        existing_titles = set(existing_titles_result.scalars().all())
-
-        # Track seeded quests for requirement resolution
-        quest_name_to_id: dict[str, str] = {}
-        quests_to_commit: list[tuple[Quest, QuestJSON]] = []
-        # Track items created in this seeding run to avoid duplicate SELECTs and inserts
-        created_item_names: set[str] = set()
-
-        # Seed quests that don't exist yet
-        seeded_count = 0
-        for quest_json in all_quest_jsons:
-            # Handle requirements - can be string, list of strings, or list of QuestJSON (from chain format)
-            reqs = quest_json.requirements
-            req_str = ""
-            if isinstance(reqs, str):
-                req_str = reqs
-            elif isinstance(reqs, list):
-                # Check if it's a list of strings or list of QuestJSON
-                req_str = ", ".join(reqs) if all(isinstance(r, str) for r in reqs) else str(reqs[0]) if reqs else ""
-
-            # Use quest_name from JSON as the title
-            if quest_json.quest_name not in existing_titles:
-                # Generate rewards string from structured quest_rewards if available
-                rewards_str = generate_rewards_string(quest_json)
-
-                quest = Quest(
-                    title=quest_json.quest_name,
-                    short_description=quest_json.short_description,
-                    long_description=quest_json.long_description,
-                    requirements=req_str,
-                    rewards=rewards_str,
-                )
-                db_session.add(quest)
-                quests_to_commit.append((quest, quest_json))
-                seeded_count += 1
-                logger.debug("Seeding quest: %s", quest_json.quest_name)
-
-        # Flush to get quest IDs within the current transaction
+        seeded_count = await stage_quests(db_session, quest_dir)
         if seeded_count > 0:
-            await db_session.flush()
-
-            # Build name->id map for requirement resolution
-            for quest, quest_json in quests_to_commit:
-                await db_session.refresh(quest)
-                quest_name_to_id[quest_json.quest_name] = str(quest.id)
-
-            # Create requirements and rewards for each quest
-            for quest, quest_json in quests_to_commit:
-                # Create quest requirements
-                for req_json in quest_json.quest_requirements:
-                    requirement_data = dict(req_json.requirement_data)
-
-                    # For QUEST_COMPLETED type, resolve quest_name to quest_id
-                    if req_json.requirement_type.upper() == "QUEST_COMPLETED":
-                        quest_name = requirement_data.get("quest_name")
-                        if quest_name:
-                            # Check in-memory map first
-                            if quest_name in quest_name_to_id:
-                                requirement_data["quest_id"] = quest_name_to_id[quest_name]
-                                del requirement_data["quest_name"]
-                            else:
-                                # Query database for existing quests by name
-                                result = await db_session.execute(select(Quest).where(Quest.title == quest_name))
-                                existing_quest = result.scalars().first()
-                                if existing_quest:
-                                    requirement_data["quest_id"] = str(existing_quest.id)
-                                    quest_name_to_id[quest_name] = str(existing_quest.id)
-                                    del requirement_data["quest_name"]
-                                else:
-                                    # Emit warning if quest_name cannot be resolved
-                                    logger.warning(
-                                        f"Could not resolve quest_name '{quest_name}' "
-                                        f"for QUEST_COMPLETED requirement in quest '{quest.title}'"
-                                    )
-
-                    try:
-                        predecessor_id = None
-                        if (
-                            req_json.requirement_type.upper() == "QUEST_COMPLETED"
-                            and req_json.is_mandatory
-                            and quest.previous_quest_id is None
-                            and (previous_quest_id := requirement_data.get("quest_id"))
-                        ):
-                            predecessor_id = UUID(str(previous_quest_id))
-
-                        requirement = QuestRequirement(
-                            quest_id=quest.id,
-                            requirement_type=RequirementType(req_json.requirement_type.lower()),
-                            requirement_data=requirement_data,
-                            is_mandatory=req_json.is_mandatory,
-                        )
-                        db_session.add(requirement)
-                        if predecessor_id:
-                            quest.previous_quest_id = predecessor_id
-                    except ValueError as e:
-                        logger.warning(f"Failed to create requirement for quest '{quest.title}': {e}")
-
-                # Create quest rewards
-                for reward_json in quest_json.quest_rewards:
-                    try:
-                        reward = QuestReward(
-                            quest_id=quest.id,
-                            reward_type=RewardType(reward_json.reward_type.lower()),
-                            reward_data=reward_json.reward_data,
-                            reward_chance=reward_json.reward_chance,
-                        )
-                        db_session.add(reward)
-
-                        # Create item from item_data if reward_type is ITEM and item_data is provided
-                        if reward_json.reward_type.upper() == "ITEM" and reward_json.item_data:
-                            item_name = reward_json.item_data.get("name")
-                            if item_name and item_name not in created_item_names:
-                                # Check if item already exists in database
-                                existing_item = await db_session.execute(select(Item).where(Item.name == item_name))
-                                existing = existing_item.scalars().first()
-                                if not existing:
-                                    # Create the item
-                                    item = Item(
-                                        name=item_name,
-                                        rarity=reward_json.item_data.get("rarity", "common"),
-                                        value=reward_json.item_data.get("value"),
-                                        image_url=reward_json.item_data.get("image_url"),
-                                    )
-                                    db_session.add(item)
-                                    created_item_names.add(item_name)
-                                    logger.debug(f"Created item '{item_name}' from quest reward")
-
-                    except ValueError as e:
-                        logger.warning(f"Failed to create reward for quest '{quest.title}': {e}")
-
             await db_session.commit()
             logger.info("Seeded %d new quests with requirements and rewards", seeded_count)
         else:
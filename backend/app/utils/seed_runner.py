@@ -0,0 +1,106 @@
+"""Hash-guarded seeding of quests and objectives, run once per data change rather than per replica boot."""
+
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.seed_state import SeedState
+from app.utils.seed_objectives import stage_objectives
+from app.utils.seed_quests import stage_quests
+from app.utils.static_data import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the seeding logic changes in a way that should re-run against unchanged data files.
+SEED_VERSION = 1
+
+# Key for pg_advisory_xact_lock; any constant works as long as nothing else in the database uses it.
+_SEED_LOCK_KEY = 0x5EED_0001
+
+Seeder = Callable[[AsyncSession, Path], Awaitable[int]]
+
+SEEDERS: dict[str, tuple[Path, Seeder]] = {
+    "quests": (DATA_DIR / "quests", stage_quests),
+    "objectives": (DATA_DIR / "objectives", stage_objectives),
+}
+
+
+def directory_digest(directory: Path) -> str:
+    """SHA-256 over the relative path and contents of every JSON file under ``directory``, plus ``SEED_VERSION``."""
+    digest = hashlib.sha256(f"v{SEED_VERSION}".encode())
+    if directory.exists():
+        for path in sorted(directory.rglob("*.json")):
+            digest.update(path.relative_to(directory).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def _acquire_seed_lock(db_session: AsyncSession) -> None:
+    """Serialise seeding across replicas; released when the transaction ends. No-op outside PostgreSQL."""
+    bind = db_session.bind
+    if bind is not None and bind.dialect.name == "postgresql":
+        await db_session.execute(select(func.pg_advisory_xact_lock(_SEED_LOCK_KEY)))
+
+
+async def seed_static_content(
+    db_session: AsyncSession,
+    *,
+    force: bool = False,
+    seeders: dict[str, tuple[Path, Seeder]] | None = None,
+) -> dict[str, int]:
+    """Seed every registered data directory whose content digest changed since it was last applied.
+
+    All seeders run in one transaction under an advisory lock, so concurrent
+    replicas wait for the first one and then find nothing to do. A digest is
+    only recorded together with the rows it produced; on failure everything is
+    rolled back and the next start retries.
+
+    Args:
+        db_session: Database session
+        force: Run every seeder even if its digest is unchanged
+        seeders: Seeder registry to use instead of ``SEEDERS`` (name -> (directory, stage function))
+
+    Returns:
+        Rows seeded per seeder name; seeders skipped on a digest match report 0
+    """
+    seeders = SEEDERS if seeders is None else seeders
+    digests = {name: directory_digest(directory) for name, (directory, _) in seeders.items()}
+
+    try:
+        await _acquire_seed_lock(db_session)
+        applied = {
+            state.name: state
+            for state in (await db_session.execute(select(SeedState).where(SeedState.name.in_(seeders))))
+            .scalars()
+            .all()
+        }
+
+        counts: dict[str, int] = {}
+        for name, (directory, stage) in seeders.items():
+            state = applied.get(name)
+            if not force and state is not None and state.digest == digests[name]:
+                logger.info("Skipping %s seeding, data unchanged (digest %s)", name, digests[name][:12])
+                counts[name] = 0
+                continue
+
+            counts[name] = await stage(db_session, directory)
+            if state is None:
+                db_session.add(SeedState(name=name, digest=digests[name]))
+            else:
+                state.digest = digests[name]
+                state.applied_at = datetime.utcnow()
+            logger.info("Seeded %d new %s (digest %s)", counts[name], name, digests[name][:12])
+
+        await db_session.commit()
+    except Exception:
+        logger.exception("Failed to seed static content")
+        await db_session.rollback()
+        return dict.fromkeys(seeders, 0)
+    return counts
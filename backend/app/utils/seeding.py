@@ -93,6 +93,36 @@ def _seed_records[T, M](
     return seeded_count
 
 
+async def stage_from_json[T, M](
+    db_session: AsyncSession,
+    model_class: type[M],
+    schema_class: type[T],
+    directory: Path,
+    unique_field: str,
+    transform_fn: Callable[[T], M],
+    validate_fn: Callable[[T], list[str]] | None = None,
+    file_pattern: str = "*.json",
+) -> int:
+    """
+    Add the JSON records missing from the database to the session, without committing.
+
+    Takes the same arguments as ``seed_from_json``; errors propagate to the caller.
+
+    Returns:
+        Number of records staged
+    """
+    all_data = await _load_json_files(directory, file_pattern, schema_class)
+
+    if not all_data:
+        return 0
+
+    existing_values = await _get_existing_values(db_session, model_class, unique_field)
+    seeded_count = _seed_records(db_session, all_data, existing_values, unique_field, transform_fn, validate_fn)
+    if seeded_count > 0:
+        await db_session.flush()
+    return seeded_count
+
+
 async def seed_from_json[T, M](
     db_session: AsyncSession,
     model_class: type[M],
@@ -120,14 +150,9 @@ async def seed_from_json[T, M](
         Number of records seeded
     """
     try:
-        all_data = await _load_json_files(directory, file_pattern, schema_class)
-
-        if not all_data:
-            return 0
-
-        existing_values = await _get_existing_values(db_session, model_class, unique_field)
-
-        seeded_count = _seed_records(db_session, all_data, existing_values, unique_field, transform_fn, validate_fn)
+        seeded_count = await stage_from_json(
+            db_session, model_class, schema_class, directory, unique_field, transform_fn, validate_fn, file_pattern
+        )
 
         if seeded_count > 0:
             await db_session.commit()
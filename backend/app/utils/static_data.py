@@ -1,6 +1,10 @@
 import json
 import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
 from sqlmodel import SQLModel
 
@@ -22,6 +26,56 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 DATA_DIR = ROOT_DIR / "app" / "data"
 
 
+@cache
+def load_json_records(file_path: Path) -> tuple[dict, ...]:
+    """Parse a JSON list file once per process.
+
+    Both :class:`StaticGameData` and the exploration data loader read through
+    here, so each file is parsed a single time and every consumer shares the
+    same records. They must be treated as read-only.
+
+    :param file_path: Path to a JSON file containing a list of objects
+    :returns: The parsed records, or an empty tuple if the file is missing or invalid
+    """
+    try:
+        with file_path.open("r") as file:
+            return tuple(json.load(file))
+    except (json.JSONDecodeError, FileNotFoundError):
+        logger.exception("Failed to load data", extra={"file_path": file_path})
+        return ()
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogIndex[T: SQLModel]:
+    """Read-only lookups over one catalog by lowercase name, rarity and type."""
+
+    by_name: Mapping[str, T]
+    by_rarity: Mapping[str, tuple[T, ...]]
+    by_type: Mapping[str, tuple[T, ...]]
+
+    @classmethod
+    def build(cls, items: Iterable[T], type_field: str) -> "CatalogIndex[T]":
+        """Index ``items``; the first definition wins when two share a name.
+
+        :param items: Catalog entries
+        :param type_field: Attribute holding the entry's type (e.g. ``weapon_type``, ``category``)
+        """
+        by_name: dict[str, T] = {}
+        by_rarity: dict[str, list[T]] = {}
+        by_type: dict[str, list[T]] = {}
+        for item in items:
+            by_name.setdefault(item.name.lower(), item)
+            if (rarity := getattr(item, "rarity", None)) is not None:
+                by_rarity.setdefault(rarity, []).append(item)
+            if (item_type := getattr(item, type_field, None)) is not None:
+                by_type.setdefault(item_type, []).append(item)
+        return cls(
+            by_name=MappingProxyType(by_name),
+            by_rarity=MappingProxyType({key: tuple(group) for key, group in by_rarity.items()}),
+            by_type=MappingProxyType({key: tuple(group) for key, group in by_type.items()}),
+        )
+
+
 class StaticGameData:
     def __init__(self):
         self._dwellers: list[DwellerCreateWithoutVaultID] | None = None
@@ -31,6 +85,7 @@ class StaticGameData:
         self._weapons: list[WeaponCreate] | None = None
         self._quests: list[QuestChainJSON] | None = None
         self._objectives: list[ObjectiveCreate] | None = None
+        self._indexes: dict[str, CatalogIndex] = {}
 
     @property
     def dwellers(self) -> list[DwellerCreateWithoutVaultID]:
@@ -108,9 +163,42 @@ class StaticGameData:
 
         return buildable_rooms
 
+    def _index(self, kind: str, items: list, type_field: str) -> CatalogIndex:
+        if kind not in self._indexes:
+            self._indexes[kind] = CatalogIndex.build(items, type_field)
+        return self._indexes[kind]
+
+    @property
+    def room_index(self) -> CatalogIndex[RoomCreateWithoutVaultID]:
+        return self._index("rooms", self.rooms, "category")
+
+    @property
+    def weapon_index(self) -> CatalogIndex[WeaponCreate]:
+        return self._index("weapons", self.weapons, "weapon_type")
+
+    @property
+    def outfit_index(self) -> CatalogIndex[OutfitCreate]:
+        return self._index("outfits", self.outfits, "outfit_type")
+
+    @property
+    def junk_index(self) -> CatalogIndex[JunkCreate]:
+        return self._index("junk", self.junk_items, "junk_type")
+
     def get_room(self, room_name: str) -> RoomCreateWithoutVaultID | None:
         """Return the canonical template matching a room name."""
-        return next((room for room in self.rooms if room.name.lower() == room_name.lower()), None)
+        return self.room_index.by_name.get(room_name.lower())
+
+    def get_weapon(self, name: str) -> WeaponCreate | None:
+        """Return the catalog weapon with this name (case-insensitive)."""
+        return self.weapon_index.by_name.get(name.lower())
+
+    def get_outfit(self, name: str) -> OutfitCreate | None:
+        """Return the catalog outfit with this name (case-insensitive)."""
+        return self.outfit_index.by_name.get(name.lower())
+
+    def get_junk(self, name: str) -> JunkCreate | None:
+        """Return the catalog junk item with this name (case-insensitive)."""
+        return self.junk_index.by_name.get(name.lower())
 
     @property
     def quests(self) -> list[QuestChainJSON]:
@@ -144,13 +232,7 @@ class StaticGameData:
 
     @staticmethod
     def load_data[SchemaType: SQLModel](file_path: Path, model: type[SchemaType]) -> list[SchemaType]:
-        try:
-            with file_path.open("r") as file:
-                data_list = json.load(file)
-                return [model.model_validate(item) for item in data_list]
-        except (json.JSONDecodeError, FileNotFoundError):
-            logger.exception("Failed to load data", extra={"file_path": file_path})
-            return []
+        return [model.model_validate(item) for item in load_json_records(file_path)]
 
 
 game_data_store = StaticGameData()
@@ -1,5 +1,6 @@
 """Weapon image URL resolution for backend static assets."""
 
+from functools import cache
 from pathlib import Path
 
 WEAPON_NAME_TO_IMAGE_FILE = {
@@ -25,8 +26,13 @@ _WEAPON_IMAGE_DIR = Path(__file__).parent.parent / "static" / "weapon_images"
 _FALLBACK_IMAGE_FILE = "10mm pistol FOS.png"
 
 
+@cache
+def _image_exists(filename: str) -> bool:
+    return (_WEAPON_IMAGE_DIR / filename).exists()
+
+
 def get_weapon_image_url(weapon_name: str | None) -> str | None:
     """Return an exact weapon image when available, otherwise a generic weapon image."""
     filename = WEAPON_NAME_TO_IMAGE_FILE.get(weapon_name.strip().casefold()) if weapon_name else _FALLBACK_IMAGE_FILE
     filename = filename or _FALLBACK_IMAGE_FILE
-    return f"/static/weapon_images/{filename}" if (_WEAPON_IMAGE_DIR / filename).exists() else None
+    return f"/static/weapon_images/{filename}" if _image_exists(filename) else None
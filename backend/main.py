@@ -7,45 +7,24 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from sqladmin import Admin
 from starlette import status
 from starlette.middleware.sessions import SessionMiddleware
 
-from app.admin.auth import AdminAuth
-from app.admin.views import (
-    ChatMessageAdmin,
-    DwellerAdmin,
-    ExplorationAdmin,
-    IncidentAdmin,
-    JunkAdmin,
-    LLInteractionAdmin,
-    NotificationAdmin,
-    ObjectiveAdmin,
-    OutfitAdmin,
-    PregnancyAdmin,
-    PromptAdmin,
-    QuestAdmin,
-    RelationshipAdmin,
-    RoomAdmin,
-    StorageAdmin,
-    TrainingAdmin,
-    UserAdmin,
-    UserProfileAdmin,
-    VaultAdmin,
-    WeaponAdmin,
-)
+from app.admin.site import LazyAdminApp
 from app.api.v1.api import api_router as api_router_v1
 from app.core.config import settings
 from app.core.logfire_config import configure_logfire
 from app.core.logging import setup_logging
+from app.core.security import password_hasher
 from app.db.session import async_engine, get_async_session
 from app.middleware.request_id import RequestIdMiddleware
 from app.services.health_check import HealthCheckService
+from app.services.media_service import media_service
 from app.services.objective_evaluators import evaluator_manager
 from app.services.objective_notifications import register_objective_event_handlers
+from app.services.prerequisite_service import register_prerequisite_event_handlers
 from app.services.websocket_manager import manager
-from app.utils.seed_objectives import seed_objectives_from_json
-from app.utils.seed_quests import seed_quests_from_json
+from app.utils.seed_runner import seed_static_content
 
 # Import security middleware (conditional on settings)
 if settings.ENABLE_RATE_LIMITING:
@@ -60,6 +39,9 @@ setup_logging(
     json_format=settings.LOG_JSON_FORMAT,
     log_file=settings.log_file_path,
     retention_days=settings.LOG_FILE_RETENTION_DAYS,
+    sample_rates=settings.LOG_SAMPLE_RATES,
+    rate_limits=settings.LOG_RATE_LIMITS,
+    rate_limit_window_seconds=settings.LOG_RATE_LIMIT_WINDOW_SECONDS,
 )
 
 logger = logging.getLogger(__name__)
@@ -87,15 +69,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     results = await health_check_service.check_all_services(async_engine, include_rustfs=False)
     health_check_service.log_health_check_results(results)
 
-    # Seed quests and objectives from JSON files
+    # Seed quests and objectives from JSON files (skipped when the data files are unchanged)
     async for session in get_async_session():
-        quest_count = await seed_quests_from_json(session)
-        objective_count = await seed_objectives_from_json(session)
+        seeded = await seed_static_content(session)
 
-        if quest_count > 0:
-            logger.info("Quest seeding complete: %d quests added", quest_count)
-        if objective_count > 0:
-            logger.info("Objective seeding complete: %d objectives added", objective_count)
+        if seeded["quests"] > 0:
+            logger.info("Quest seeding complete: %d quests added", seeded["quests"])
+        if seeded["objectives"] > 0:
+            logger.info("Objective seeding complete: %d objectives added", seeded["objectives"])
         break
 
     logger.info("Fallout Shelter API startup complete")
@@ -106,6 +87,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # Initialize objective evaluators
     evaluator_manager.initialize()
     register_objective_event_handlers()
+    register_prerequisite_event_handlers()
 
     yield
 
@@ -115,6 +97,8 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # Shutdown
     logger.info("Shutting down Fallout Shelter API...")
     await manager.stop_redis()
+    media_service.close()
+    password_hasher.shutdown()
 
 
 app = FastAPI(
@@ -139,11 +123,8 @@ if settings.ENABLE_RATE_LIMITING:
 # Add session middleware for admin authentication
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
-# Create authentication backend
-authentication_backend = AdminAuth(secret_key=settings.SECRET_KEY)
-
-# Create admin with authentication
-admin = Admin(app, async_engine, authentication_backend=authentication_backend)
+# Admin UI (with its own authentication backend) is built on the first /admin request
+app.mount("/admin", app=LazyAdminApp("/admin"), name="admin")
 
 app.add_middleware(
     CORSMiddleware,
@@ -189,23 +170,3 @@ async def perform_healthcheck(*, detailed: bool = False):
 
 
 app.include_router(api_router_v1, prefix=settings.API_V1_STR)
-admin.add_view(UserAdmin)
-admin.add_view(UserProfileAdmin)
-admin.add_view(VaultAdmin)
-admin.add_view(StorageAdmin)
-admin.add_view(RoomAdmin)
-admin.add_view(DwellerAdmin)
-admin.add_view(RelationshipAdmin)
-admin.add_view(PregnancyAdmin)
-admin.add_view(TrainingAdmin)
-admin.add_view(IncidentAdmin)
-admin.add_view(ExplorationAdmin)
-admin.add_view(ChatMessageAdmin)
-admin.add_view(NotificationAdmin)
-admin.add_view(OutfitAdmin)
-admin.add_view(WeaponAdmin)
-admin.add_view(JunkAdmin)
-admin.add_view(QuestAdmin)
-admin.add_view(ObjectiveAdmin)
-admin.add_view(PromptAdmin)
-admin.add_view(LLInteractionAdmin)
@@ -7,6 +7,7 @@ Usage:
     uv run python scripts/backfill_dweller_bio_places.py --vault <uuid>
     uv run python scripts/backfill_dweller_bio_places.py --vault <uuid> --max-dwellers <n>
     uv run python scripts/backfill_dweller_bio_places.py --all-active --max-dwellers <n> --max-vaults <m>
+    uv run python scripts/backfill_dweller_bio_places.py --all-active --checkpoint bio.ckpt  # resumable
 
 Requires ASYNC_DATABASE_URI in backend/.env.
 """
@@ -16,12 +17,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
 import typer
 
 from app import crud
+from app.db.batching import FileCheckpoint
 from app.db.session import async_session_maker
 from app.services.bio_place_backfill_service import bio_place_backfill_service
 from app.utils.exceptions import ResourceNotFoundException
@@ -42,6 +45,7 @@ async def main(
     max_dwellers: int = MAX_DWELLERS,
     all_active: bool = False,
     max_vaults: int = MAX_VAULTS,
+    checkpoint: Path | None = None,
 ) -> int | dict[UUID, int]:
     """Run the backfill for one vault or all active vaults.
 
@@ -50,6 +54,9 @@ async def main(
 
     When *all_active* is False, *vault_uuid* must be provided and a single integer
     count is returned.
+
+    With *checkpoint*, an interrupted *all_active* run resumes after the last
+    vault it finished.
     """
     if not vault_uuid and not all_active:
         raise ValueError("Either --vault or --all-active must be provided")
@@ -60,6 +67,7 @@ async def main(
                 session,
                 max_dwellers_per_vault=max_dwellers,
                 max_vaults=max_vaults,
+                checkpoint=FileCheckpoint(checkpoint) if checkpoint else None,
             )
 
         try:
@@ -91,6 +99,9 @@ def backfill(
     max_dwellers: Annotated[int, typer.Option(help="Maximum dwellers to process per vault")] = MAX_DWELLERS,
     all_active: Annotated[bool, typer.Option(help="Process all active (non-deleted) vaults")] = False,
     max_vaults: Annotated[int, typer.Option(help="Maximum active vaults to process")] = MAX_VAULTS,
+    checkpoint: Annotated[
+        Path | None, typer.Option(help="File recording progress so an interrupted --all-active run resumes")
+    ] = None,
 ) -> None:
     """Extract origin/visited places from dweller bios and register them on the world map."""
     if vault and not all_active:
@@ -101,7 +112,13 @@ def backfill(
 
     try:
         result = asyncio.run(
-            main(vault_uuid=vault, max_dwellers=max_dwellers, all_active=all_active, max_vaults=max_vaults)
+            main(
+                vault_uuid=vault,
+                max_dwellers=max_dwellers,
+                all_active=all_active,
+                max_vaults=max_vaults,
+                checkpoint=checkpoint,
+            )
         )
     except ValueError as exc:
         print(f"Backfill failed: {exc}", file=sys.stderr)
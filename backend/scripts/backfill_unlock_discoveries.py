@@ -9,6 +9,7 @@ Usage:
     cd backend
     uv run python scripts/backfill_unlock_discoveries.py --vault <uuid>
     uv run python scripts/backfill_unlock_discoveries.py --all-active
+    uv run python scripts/backfill_unlock_discoveries.py --all-active --checkpoint unlock.ckpt  # resumable
 
 Requires ASYNC_DATABASE_URI in backend/.env.
 """
@@ -18,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
@@ -25,6 +27,7 @@ import typer
 from sqlmodel import select
 
 from app.crud.wasteland_location import wasteland_location as wl_crud
+from app.db.batching import FileCheckpoint, iter_keyset
 from app.db.session import async_session_maker
 from app.models.wasteland_location import (
     DwellerLocation,
@@ -40,47 +43,55 @@ async def _unlock_discoveries_for_vault(session, vault_id: UUID) -> int:
     """Link every locked DISCOVERY location in a vault to its finding dweller."""
     from app.models.exploration import Exploration
 
-    result = await session.execute(
-        select(WastelandLocation).where(
+    discoveries = (
+        select(WastelandLocation, Exploration.dweller_id)
+        .join(Exploration, Exploration.id == WastelandLocation.exploration_id)
+        .where(
             WastelandLocation.vault_id == vault_id,
             WastelandLocation.type == LocationTypeEnum.DISCOVERY,
-            WastelandLocation.exploration_id.is_not(None),
         )
     )
     fixed = 0
-    for location in result.scalars().all():
-        exploration = await session.get(Exploration, location.exploration_id)
-        if exploration is None:
-            logger.warning("No exploration %s for location %s", location.exploration_id, location.name)
-            continue
-        existing = (
-            (
-                await session.execute(
-                    select(DwellerLocation).where(
-                        DwellerLocation.dweller_id == exploration.dweller_id,
-                        DwellerLocation.location_id == location.id,
-                        DwellerLocation.relation == DwellerLocationRelationEnum.VISITED,
+    async for batch in iter_keyset(
+        session, discoveries, WastelandLocation.id, label=f"discovery unlock for {vault_id}"
+    ):
+        for location, dweller_id in batch:
+            existing = (
+                (
+                    await session.execute(
+                        select(DwellerLocation).where(
+                            DwellerLocation.dweller_id == dweller_id,
+                            DwellerLocation.location_id == location.id,
+                            DwellerLocation.relation == DwellerLocationRelationEnum.VISITED,
+                        )
                     )
                 )
+                .scalars()
+                .first()
             )
-            .scalars()
-            .first()
-        )
-        was_locked = existing is None or not existing.is_unlocked
-        await wl_crud.link_dweller(
-            session,
-            exploration.dweller_id,
-            location.id,
-            DwellerLocationRelationEnum.VISITED,
-            is_unlocked=True,
-        )
-        if was_locked:
-            fixed += 1
+            was_locked = existing is None or not existing.is_unlocked
+            await wl_crud.link_dweller(
+                session,
+                dweller_id,
+                location.id,
+                DwellerLocationRelationEnum.VISITED,
+                is_unlocked=True,
+            )
+            if was_locked:
+                fixed += 1
     return fixed
 
 
-async def main(vault_uuid: str | None = None, all_active: bool = False) -> int | dict[UUID, int]:
-    """Unlock discovery locations for one vault or all vaults."""
+async def main(
+    vault_uuid: str | None = None,
+    all_active: bool = False,
+    checkpoint: Path | None = None,
+) -> int | dict[UUID, int]:
+    """Unlock discovery locations for one vault or all vaults.
+
+    With *checkpoint*, an interrupted ``--all-active`` run resumes after the last
+    vault it finished.
+    """
     from app.models.vault import Vault
 
     if not vault_uuid and not all_active:
@@ -88,10 +99,16 @@ async def main(vault_uuid: str | None = None, all_active: bool = False) -> int |
 
     async with async_session_maker() as session:
         if all_active:
-            vault_result = await session.execute(select(Vault.id).where(Vault.is_deleted.is_(False)))
             counts: dict[UUID, int] = {}
-            for (vault_id,) in vault_result.all():
-                counts[vault_id] = await _unlock_discoveries_for_vault(session, vault_id)
+            async for vault_ids in iter_keyset(
+                session,
+                select(Vault.id).where(Vault.is_deleted.is_(False)),
+                Vault.id,
+                checkpoint=FileCheckpoint(checkpoint) if checkpoint else None,
+                label="discovery unlock",
+            ):
+                for vault_id in vault_ids:
+                    counts[vault_id] = await _unlock_discoveries_for_vault(session, vault_id)
             return counts
 
         try:
@@ -112,10 +129,13 @@ def backfill(
         str | None, typer.Option(help="Vault UUID to limit scope; ignored when --all-active is set")
     ] = None,
     all_active: Annotated[bool, typer.Option(help="Process all non-deleted vaults")] = False,
+    checkpoint: Annotated[
+        Path | None, typer.Option(help="File recording progress so an interrupted --all-active run resumes")
+    ] = None,
 ) -> None:
     """Link each DISCOVERY location to its finding dweller and mark it unlocked."""
     try:
-        result = asyncio.run(main(vault_uuid=vault, all_active=all_active))
+        result = asyncio.run(main(vault_uuid=vault, all_active=all_active, checkpoint=checkpoint))
     except ValueError as exc:
         print(f"Backfill failed: {exc}", file=sys.stderr)
         raise typer.Exit(code=1) from exc
@@ -0,0 +1,102 @@
+"""Measure cold-start import time of the API (``main``) and worker (``app.api.tasks``) entry points.
+
+Each target is imported in a fresh interpreter with ``-X importtime`` and the
+cumulative time of the top-level module is reported, together with any heavy
+optional SDKs that were loaded. Those SDKs are meant to be imported on first
+use only, so a non-empty "Heavy modules" column is a regression. The script
+exits non-zero on either regression or when a median exceeds the budget
+(``DEFAULT_BUDGET_MS`` unless ``--budget-ms`` is given; ``0`` disables it).
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_import_time.py
+    uv run python scripts/benchmark_import_time.py --runs 5 --budget-ms 2500
+"""
+
+from __future__ import annotations
+
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+app = typer.Typer(help="Benchmark cold-start import time of the API and worker entry points.")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    "api": "main",
+    "worker": "app.api.tasks",
+}
+
+# Generous for a CI runner; the entry points import in roughly 2.5-3.5 s on a slow machine
+DEFAULT_BUDGET_MS = 5000.0
+
+# Loaded lazily by the services that need them; none should appear at import time.
+HEAVY_MODULES = ("openai", "pydantic_ai", "boto3", "botocore", "aioboto3", "PIL", "sqladmin")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _import_once(module: str) -> tuple[float, list[str]]:
+    """Import ``module`` in a fresh interpreter; return its cumulative import time (ms) and heavy modules loaded."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        typer.echo(proc.stderr[-2000:], err=True)
+        raise typer.Exit(code=proc.returncode)
+
+    cumulative_us = 0
+    loaded: set[str] = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        name = match.group(3)
+        loaded.add(name.split(".")[0])
+        if name == module and len(match.group(2)) == 1:
+            cumulative_us = int(match.group(1))
+    return cumulative_us / 1000, sorted(loaded.intersection(HEAVY_MODULES))
+
+
+@app.command()
+def run(
+    runs: Annotated[int, typer.Option(help="Fresh interpreters per target; the median is reported")] = 3,
+    budget_ms: Annotated[
+        float, typer.Option(help="Exit non-zero if any target's median exceeds this many milliseconds (0 disables)")
+    ] = DEFAULT_BUDGET_MS,
+) -> None:
+    """Print median import time and heavy modules loaded for each entry point."""
+    budget = f", budget {budget_ms:,.0f} ms" if budget_ms > 0 else ""
+    typer.echo(f"Import-time benchmark ({runs} runs per target{budget})")
+    typer.echo("Target | Module        | Median ms | Heavy modules")
+    typer.echo("-------|---------------|-----------|--------------")
+    over_budget = False
+    heavy_loaded = False
+    for name, module in TARGETS.items():
+        samples = [_import_once(module) for _ in range(runs)]
+        median_ms = statistics.median(elapsed for elapsed, _ in samples)
+        heavy = samples[-1][1]
+        typer.echo(f"{name:<6} | {module:<13} | {median_ms:>9,.0f} | {', '.join(heavy) or '-'}")
+        over_budget |= 0 < budget_ms < median_ms
+        heavy_loaded |= bool(heavy)
+
+    if over_budget:
+        typer.echo(f"Import time over budget ({budget_ms:,.0f} ms)", err=True)
+    if heavy_loaded:
+        typer.echo("Heavy modules imported at startup", err=True)
+    if over_budget or heavy_loaded:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
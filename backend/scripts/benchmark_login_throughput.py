@@ -0,0 +1,81 @@
+"""Compare a login storm with bcrypt on the event loop vs on the bounded ``password_hasher`` pool.
+
+Each simulated login verifies one password at the configured bcrypt cost. While
+the storm runs, a probe coroutine asks to wake every 10 ms; how late it wakes is
+the stall every other request (SSE, WebSocket, game ticks) would see. bcrypt
+releases the GIL, so the pool also raises login throughput on multi-core hosts.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_login_throughput.py
+    uv run python scripts/benchmark_login_throughput.py --logins 64 --workers 8 --rounds 10
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Annotated
+
+import typer
+from passlib.context import CryptContext
+
+from app.core.security import PasswordHasher
+
+app = typer.Typer(help="Benchmark login throughput and event-loop stalls for inline vs pooled bcrypt.")
+
+PROBE_INTERVAL = 0.01
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def _storm(context: CryptContext, hashed: str, logins: int, hasher: PasswordHasher | None) -> tuple[float, float]:
+    async def login() -> None:
+        if hasher is None:
+            context.verify("correct horse battery staple", hashed)
+        else:
+            await hasher._run(context.verify, "correct horse battery staple", hashed)
+
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return elapsed, max(lags, default=0.0)
+
+
+@app.command()
+def run(
+    logins: Annotated[int, typer.Option(help="Concurrent logins in the storm")] = 32,
+    workers: Annotated[int, typer.Option(help="Threads in the password hashing pool")] = 4,
+    rounds: Annotated[int, typer.Option(help="bcrypt cost")] = 12,
+) -> None:
+    """Print logins per second and worst event-loop stall for each path."""
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    hashed = context.hash("correct horse battery staple")
+    hasher = PasswordHasher(max_workers=workers)
+    try:
+        results = {
+            "inline": asyncio.run(_storm(context, hashed, logins, None)),
+            "pooled": asyncio.run(_storm(context, hashed, logins, hasher)),
+        }
+    finally:
+        hasher.shutdown()
+
+    typer.echo(f"Login storm benchmark ({logins} logins, bcrypt cost {rounds}, {workers} workers)")
+    typer.echo("Path    | Logins / s | Worst loop stall (ms)")
+    typer.echo("--------|------------|----------------------")
+    for name, (elapsed, stall) in results.items():
+        typer.echo(f"{name:<7} | {logins / elapsed:>10,.1f} | {stall * 1000:>20,.1f}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,83 @@
+"""Compare loot roll throughput: per-roll filtering/validation vs the prebuilt loot tables.
+
+The "legacy" path reproduces the previous ``LootCalculator`` behaviour: rebuild
+the rarity weight dict, filter the full item list by rarity and validate a fresh
+Pydantic schema on every roll. The "tables" path is the current calculator, one
+roll at a time and in batches via ``roll_loot``.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_loot_rolls.py
+    uv run python scripts/benchmark_loot_rolls.py --rolls 200000 --luck 8
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Sequence
+from typing import Annotated
+
+import typer
+
+from app.schemas.exploration_event import ItemSchema, JunkSchema, OutfitSchema, WeaponSchema
+from app.services.exploration import data_loader
+from app.services.exploration.loot_calculator import get_loot_tables, loot_calculator
+
+app = typer.Typer(help="Benchmark exploration loot rolls before and after the prebuilt loot tables.")
+
+
+def _legacy_pick(items: Sequence[dict], schema: type[ItemSchema], luck: int) -> ItemSchema:
+    rarity_weights = loot_calculator.get_rarity_weights(luck)
+    rarity = random.choices(list(rarity_weights.keys()), weights=list(rarity_weights.values()), k=1)[0]
+    of_rarity = [item for item in items if item.get("rarity") == rarity] or items
+    return schema(**random.choice(of_rarity))
+
+
+def _legacy_roll(luck: int) -> tuple[ItemSchema, str]:
+    type_weights = loot_calculator.get_loot_type_weights(luck)
+    item_type = random.choices(list(type_weights.keys()), weights=list(type_weights.values()), k=1)[0]
+    if item_type == "weapon":
+        return _legacy_pick(data_loader.load_weapons(), WeaponSchema, luck), "weapon"
+    if item_type == "outfit":
+        return _legacy_pick(data_loader.load_outfits(), OutfitSchema, luck), "outfit"
+    if item_type == "medicine":
+        return ItemSchema(name="Stimpak", value=50, rarity="Common"), "stimpak"
+    return _legacy_pick(data_loader.load_junk_items(), JunkSchema, luck), "junk"
+
+
+def _time(func, rolls: int) -> float:
+    start = time.perf_counter()
+    func()
+    return rolls / (time.perf_counter() - start)
+
+
+@app.command()
+def run(
+    rolls: Annotated[int, typer.Option(help="Loot rolls per path")] = 100_000,
+    luck: Annotated[int, typer.Option(help="Dweller luck (1-10)")] = 5,
+    batch: Annotated[int, typer.Option(help="Batch size for the roll_loot path")] = 100,
+) -> None:
+    """Print loot rolls per second for each path."""
+    random.seed(0)
+    get_loot_tables()  # build outside the timed section, as the app does on first roll
+    results = {
+        "legacy": _time(lambda: [_legacy_roll(luck) for _ in range(rolls)], rolls),
+        "tables": _time(lambda: [loot_calculator.select_random_loot(luck) for _ in range(rolls)], rolls),
+        "tables_batched": _time(
+            lambda: [loot_calculator.roll_loot(luck, batch) for _ in range(rolls // batch)], rolls // batch * batch
+        ),
+    }
+    typer.echo(f"Loot roll benchmark ({rolls} rolls, luck {luck})")
+    typer.echo("Path           | Rolls / s")
+    typer.echo("---------------|-----------")
+    for name, rate in results.items():
+        typer.echo(f"{name:<14} | {rate:>10,.0f}")
+    typer.echo(
+        f"Speed-up: {results['tables'] / results['legacy']:.1f}x single, "
+        f"{results['tables_batched'] / results['legacy']:.1f}x batched"
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,135 @@
+"""Compare a plain and a monthly-partitioned notification table over a year of data.
+
+A synthetic year of notifications (``--rows``, spread evenly over the last 365
+days) is loaded with ``generate_series``. Against the plain table, and again
+after ``convert_to_partitioned``, the script times:
+
+* the monthly usage query (``count(*) ... WHERE created_at >= :month_start``),
+  which on the partitioned table only scans the current month;
+* retention of everything older than nine months: ``DELETE`` on the plain
+  table vs ``DROP TABLE`` of the expired partitions. Both run in a transaction
+  that is rolled back, so the two layouts see the same data.
+
+PostgreSQL only; the database's tables are dropped and recreated.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_partitioning.py --database-url postgresql+asyncpg://...
+    uv run python scripts/benchmark_partitioning.py --database-url postgresql+asyncpg://... --rows 5000000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Annotated
+
+import typer
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.partitioning import add_months, convert_to_partitioned, drop_expired_partitions, month_start
+from app.models.user import User
+from app.schemas.vault import VaultNumber
+from app.services.vault_service import VaultProvisionSpec, VaultService
+
+app = typer.Typer(help="Benchmark monthly partitioning of the notification table.")
+
+_MONTHLY_QUERY = text("SELECT count(*) FROM notification WHERE user_id = :user_id AND created_at >= :since")
+
+
+async def _seed(connection: AsyncConnection, user_id, vault_id, rows: int) -> None:
+    await connection.execute(
+        text(
+            "INSERT INTO notification (id, user_id, vault_id, notification_type, priority, title, message, "
+            "is_read, is_dismissed, created_at) "
+            "SELECT gen_random_uuid(), :user_id, :vault_id, 'LEVEL_UP', 'NORMAL', 'Level up', 'Dweller levelled up', "
+            "false, false, (now() AT TIME ZONE 'utc') - random() * interval '365 days' "
+            "FROM generate_series(1, :rows)"
+        ),
+        {"user_id": user_id, "vault_id": vault_id, "rows": rows},
+    )
+    await connection.execute(text("ANALYZE notification"))
+
+
+async def _time_monthly_query(connection: AsyncConnection, user_id, runs: int) -> float:
+    since = datetime.combine(month_start(datetime.utcnow()), datetime.min.time())
+    await connection.execute(_MONTHLY_QUERY, {"user_id": user_id, "since": since})  # warm the cache
+    start = time.perf_counter()
+    for _ in range(runs):
+        await connection.execute(_MONTHLY_QUERY, {"user_id": user_id, "since": since})
+    return (time.perf_counter() - start) / runs * 1000
+
+
+async def _time_retention(connection: AsyncConnection, cutoff: datetime, *, partitioned: bool) -> tuple[float, int]:
+    transaction = await connection.begin_nested()
+    start = time.perf_counter()
+    if partitioned:
+        removed = await connection.run_sync(drop_expired_partitions, "notification", cutoff)
+    else:
+        result = await connection.execute(
+            text("DELETE FROM notification WHERE created_at < :cutoff"), {"cutoff": cutoff}
+        )
+        removed = result.rowcount
+    seconds = time.perf_counter() - start
+    await transaction.rollback()
+    return seconds, removed
+
+
+async def _run(database_url: str, rows: int, runs: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(username="benchmark", email="benchmark@example.com", hashed_password="!")  # ruff: ignore[hardcoded-password-func-arg]
+        session.add(user)
+        await session.commit()
+        (vault,) = await VaultService().provision_vaults(
+            session, [VaultProvisionSpec(VaultNumber(number=1), user.id, is_boosted=True)]
+        )
+
+    # Retention at a month boundary, so dropping partitions removes exactly what DELETE does
+    cutoff = datetime.combine(add_months(month_start(datetime.utcnow()), -9), datetime.min.time())
+
+    typer.echo(f"Partitioning benchmark: {rows:,} notifications over 365 days, retention cutoff {cutoff:%Y-%m-%d}")
+    typer.echo("Layout      | Monthly query (ms) | Retention (s) | Rows removed")
+    typer.echo("------------|--------------------|---------------|-------------")
+    async with engine.connect() as conn:
+        await _seed(conn, user.id, vault.id, rows)
+        await conn.commit()
+
+        for layout in ("plain", "partitioned"):
+            if layout == "partitioned":
+                start = time.perf_counter()
+                await conn.run_sync(convert_to_partitioned, "notification", 3)
+                await conn.execute(text("ANALYZE notification"))
+                await conn.commit()
+                conversion_seconds = time.perf_counter() - start
+            query_ms = await _time_monthly_query(conn, user.id, runs)
+            retention_s, removed = await _time_retention(conn, cutoff, partitioned=layout == "partitioned")
+            typer.echo(f"{layout:<11} | {query_ms:>18.2f} | {retention_s:>13.3f} | {removed:>12,}")
+
+    typer.echo(f"One-off conversion took {conversion_seconds:.1f} s")
+    await engine.dispose()
+
+
+@app.command()
+def run(
+    database_url: Annotated[str, typer.Option(help="Async PostgreSQL URL; its tables are dropped and recreated")],
+    rows: Annotated[int, typer.Option(help="Notifications spread over the synthetic year")] = 1_000_000,
+    runs: Annotated[int, typer.Option(help="Repetitions of the monthly query")] = 50,
+) -> None:
+    """Print monthly-query and retention timings for the plain and partitioned layouts."""
+    if not database_url.startswith("postgresql"):
+        typer.echo("Error: partitioning needs PostgreSQL; pass a postgresql+asyncpg:// URL.", err=True)
+        raise typer.Exit(code=1)
+    asyncio.run(_run(database_url, rows, runs))
+
+
+if __name__ == "__main__":
+    app()
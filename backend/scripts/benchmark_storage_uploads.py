@@ -0,0 +1,91 @@
+"""Compare photo upload throughput: thread-wrapped sync adapter vs the async storage facade.
+
+Both paths talk to the in-memory ``FakeS3Client`` with an emulated per-request
+latency, so the numbers reflect scheduling (serial ``asyncio.to_thread`` calls on
+the default executor vs concurrent uploads on the dedicated storage executor)
+rather than network noise.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_storage_uploads.py
+    uv run python scripts/benchmark_storage_uploads.py --requests 200 --latency-ms 40
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from typing import Annotated
+
+import typer
+from PIL import Image
+
+from app.services.storage.async_adapter import AsyncRustFSAdapter
+from app.services.storage.fake_s3 import FakeS3Client
+from app.services.storage.rustfs_adapter import RustFSAdapter
+
+app = typer.Typer(help="Benchmark image + thumbnail uploads through both storage paths.")
+
+
+def _sample_png(size: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (size, size), color=(20, 90, 160)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def _thread_wrapped(adapter: RustFSAdapter, image: bytes, index: int) -> None:
+    """The pre-existing call pattern: two sequential ``to_thread`` hops per photo."""
+    await asyncio.to_thread(adapter.upload_file, file_data=image, file_name=f"{index}.png", bucket_name="images")
+    await asyncio.to_thread(
+        adapter.upload_thumbnail, file_data=image, file_name=f"{index}_thumbnail.png", bucket_name="thumbnails"
+    )
+
+
+async def _async_facade(storage: AsyncRustFSAdapter, image: bytes, index: int) -> None:
+    await storage.upload_image_with_thumbnail(
+        file_data=image,
+        file_name=f"{index}.png",
+        thumbnail_name=f"{index}_thumbnail.png",
+        bucket_name="images",
+        thumbnail_bucket_name="thumbnails",
+    )
+
+
+async def _benchmark(requests: int, latency: float, image_size: int) -> dict[str, float]:
+    image = _sample_png(image_size)
+
+    sync_adapter = RustFSAdapter(client=FakeS3Client(latency=latency))
+    start = time.perf_counter()
+    await asyncio.gather(*(_thread_wrapped(sync_adapter, image, i) for i in range(requests)))
+    thread_elapsed = time.perf_counter() - start
+
+    storage = AsyncRustFSAdapter(RustFSAdapter(client=FakeS3Client(latency=latency)))
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(_async_facade(storage, image, i) for i in range(requests)))
+        async_elapsed = time.perf_counter() - start
+    finally:
+        storage.close()
+
+    return {"thread_wrapped": thread_elapsed, "async_facade": async_elapsed}
+
+
+@app.command()
+def run(
+    requests: Annotated[int, typer.Option(help="Concurrent photo generations to upload")] = 100,
+    latency_ms: Annotated[float, typer.Option(help="Emulated object-store latency per request")] = 20.0,
+    image_size: Annotated[int, typer.Option(help="Edge length of the generated PNG in pixels")] = 1024,
+) -> None:
+    """Print wall time and photos/second for each upload path."""
+    results = asyncio.run(_benchmark(requests, latency_ms / 1000, image_size))
+    typer.echo(f"Storage upload benchmark ({requests} photos, {latency_ms:.0f} ms latency)")
+    typer.echo("Path           | Wall time | Photos / s")
+    typer.echo("---------------|-----------|-----------")
+    for name, elapsed in results.items():
+        typer.echo(f"{name:<14} | {elapsed:>8.2f}s | {requests / elapsed:>10.1f}")
+    typer.echo(f"Speed-up: {results['thread_wrapped'] / results['async_facade']:.1f}x")
+
+
+if __name__ == "__main__":
+    app()
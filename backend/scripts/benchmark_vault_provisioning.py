@@ -0,0 +1,104 @@
+"""Compare vault provisioning: one ``initiate_vault`` call per vault vs a single ``provision_vaults`` batch.
+
+Both paths run against a throwaway database (in-memory SQLite by default) and
+build the same boosted vaults; the difference is whether rows are flushed and
+committed per vault or staged once for the whole batch. Statement and commit
+counts are taken from engine events, so they hold on any backend.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_vault_provisioning.py
+    uv run python scripts/benchmark_vault_provisioning.py --vaults 200 --database-url postgresql+asyncpg://...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Annotated
+
+import typer
+from sqlalchemy import JSON, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.user import User
+from app.schemas.vault import VaultNumber
+from app.services.vault_service import VaultProvisionSpec, VaultService
+
+app = typer.Typer(help="Benchmark creating many boosted vaults one at a time vs in one batch.")
+
+
+def _sqlite_compatible_schema() -> None:
+    """Store JSONB columns as plain JSON so the schema can be created on SQLite."""
+    for table in SQLModel.metadata.tables.values():
+        for column in table.columns:
+            if isinstance(column.type, JSONB):
+                column.type = JSON()
+
+
+async def _run_path(database_url: str, vaults: int, *, batched: bool) -> tuple[float, int, int]:
+    if database_url.startswith("sqlite"):
+        _sqlite_compatible_schema()
+    engine = create_async_engine(database_url, poolclass=StaticPool)
+    counts = {"statements": 0, "commits": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_statement(*_args) -> None:
+        counts["statements"] += 1
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def _count_commit(*_args) -> None:
+        counts["commits"] += 1
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    service = VaultService()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(username="benchmark", email="benchmark@example.com", hashed_password="!")  # ruff: ignore[hardcoded-password-func-arg]
+        session.add(user)
+        await session.commit()
+        specs = [VaultProvisionSpec(VaultNumber(number=n), user.id, is_boosted=True) for n in range(1, vaults + 2)]
+        await service.provision_vaults(session, specs[:1])  # warm static data and objective lookups
+        specs = specs[1:]
+
+        counts.update(statements=0, commits=0)
+        start = time.perf_counter()
+        if batched:
+            await service.provision_vaults(session, specs)
+        else:
+            for spec in specs:
+                await service.initiate_vault(session, spec.obj_in, spec.user_id, spec.is_boosted)
+        elapsed = time.perf_counter() - start
+
+    await engine.dispose()
+    return elapsed, counts["statements"], counts["commits"]
+
+
+@app.command()
+def run(
+    vaults: Annotated[int, typer.Option(help="Boosted vaults to create per path")] = 50,
+    database_url: Annotated[
+        str, typer.Option(help="Async database URL; its tables are dropped and recreated")
+    ] = "sqlite+aiosqlite:///:memory:",
+) -> None:
+    """Print wall time, statements and commits for each path."""
+    results = {
+        "per_vault": asyncio.run(_run_path(database_url, vaults, batched=False)),
+        "batched": asyncio.run(_run_path(database_url, vaults, batched=True)),
+    }
+    typer.echo(f"Vault provisioning benchmark ({vaults} boosted vaults)")
+    typer.echo("Path       | Vaults / s | Statements | Commits")
+    typer.echo("-----------|------------|------------|--------")
+    for name, (elapsed, statements, commits) in results.items():
+        typer.echo(f"{name:<10} | {vaults / elapsed:>10,.1f} | {statements:>10,} | {commits:>7,}")
+    typer.echo(f"Speed-up: {results['per_vault'][0] / results['batched'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    app()
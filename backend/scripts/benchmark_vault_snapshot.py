@@ -0,0 +1,149 @@
+"""Time a streaming vault snapshot export and import and check that memory stays flat.
+
+A provisioned vault is padded with extra dwellers, weapons and chat messages
+until it holds roughly ``--rows`` rows, then exported with
+``VaultSnapshotService`` and imported back as a second vault. The run is
+repeated at ten times the size: the peak Python allocation (``tracemalloc``)
+should barely move, because both directions hold one batch at a time.
+
+Usage:
+    cd backend
+    uv run python scripts/benchmark_vault_snapshot.py
+    uv run python scripts/benchmark_vault_snapshot.py --rows 50000 --database-url postgresql+asyncpg://...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+import tracemalloc
+from typing import Annotated
+
+import typer
+from sqlalchemy import JSON, insert
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.chat_message import ChatMessage
+from app.models.dweller import Dweller
+from app.models.user import User
+from app.models.weapon import Weapon
+from app.schemas.common import GenderEnum, RarityEnum, WeaponSubtypeEnum, WeaponTypeEnum
+from app.schemas.vault import VaultNumber
+from app.services.vault_service import VaultProvisionSpec, VaultService
+from app.services.vault_snapshot import VaultSnapshotService
+
+app = typer.Typer(help="Benchmark streaming vault snapshot export and import.")
+
+
+def _sqlite_compatible_schema() -> None:
+    """Store JSONB columns as plain JSON so the schema can be created on SQLite."""
+    for table in SQLModel.metadata.tables.values():
+        for column in table.columns:
+            if isinstance(column.type, JSONB):
+                column.type = JSON()
+
+
+async def _pad_vault(session: AsyncSession, vault_id, user_id, rows: int) -> None:
+    dwellers = [
+        Dweller(
+            vault_id=vault_id,
+            first_name=f"Dweller{n}",
+            gender=GenderEnum.FEMALE,
+            rarity=RarityEnum.COMMON,
+        )
+        for n in range(rows // 3)
+    ]
+    session.add_all(dwellers)
+    await session.flush()
+    await session.execute(
+        insert(Weapon),
+        [
+            {
+                "name": "10mm pistol",
+                "rarity": RarityEnum.COMMON,
+                "value": 10,
+                "weapon_type": WeaponTypeEnum.GUN,
+                "weapon_subtype": WeaponSubtypeEnum.PISTOL,
+                "stat": "A",
+                "damage_min": 2,
+                "damage_max": 3,
+                "dweller_id": dweller.id,
+            }
+            for dweller in dwellers
+        ],
+    )
+    await session.execute(
+        insert(ChatMessage),
+        [
+            {"vault_id": vault_id, "from_user_id": user_id, "to_dweller_id": dweller.id, "message_text": "Hi " * 20}
+            for dweller in dwellers
+        ],
+    )
+    await session.commit()
+
+
+async def _run_size(database_url: str, rows: int) -> tuple[int, float, float, int, int]:
+    if database_url.startswith("sqlite"):
+        _sqlite_compatible_schema()
+    engine = create_async_engine(database_url, poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    service = VaultSnapshotService()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(username="benchmark", email="benchmark@example.com", hashed_password="!")  # ruff: ignore[hardcoded-password-func-arg]
+        session.add(user)
+        await session.commit()
+        (vault,) = await VaultService().provision_vaults(
+            session, [VaultProvisionSpec(VaultNumber(number=1), user.id, is_boosted=True)]
+        )
+        await _pad_vault(session, vault.id, user.id, rows)
+
+        archive = io.BytesIO()
+        tracemalloc.start()
+        start = time.perf_counter()
+        exported = await service.export_vault(session, vault.id, archive)
+        export_seconds = time.perf_counter() - start
+        _, export_peak = tracemalloc.get_traced_memory()
+
+        archive.seek(0)
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        await service.import_vault(session, archive, user_id=user.id)
+        import_seconds = time.perf_counter() - start
+        _, import_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    await engine.dispose()
+    # The archive buffer itself grows with the vault, so it is excluded from the peak
+    size = archive.getbuffer().nbytes
+    return exported.total_rows, export_seconds, import_seconds, export_peak - size, import_peak
+
+
+@app.command()
+def run(
+    rows: Annotated[int, typer.Option(help="Approximate rows in the smaller vault")] = 10_000,
+    database_url: Annotated[
+        str, typer.Option(help="Async database URL; its tables are dropped and recreated")
+    ] = "sqlite+aiosqlite:///:memory:",
+) -> None:
+    """Print export/import time and peak Python memory for two vault sizes."""
+    typer.echo("Vault snapshot benchmark")
+    typer.echo("Rows    | Export (s) | Import (s) | Export peak (KiB) | Import peak (KiB)")
+    typer.echo("--------|------------|------------|-------------------|------------------")
+    for size in (rows, rows * 10):
+        total, export_s, import_s, export_peak, import_peak = asyncio.run(_run_size(database_url, size))
+        typer.echo(
+            f"{total:>7,} | {export_s:>10.3f} | {import_s:>10.3f} | {export_peak / 1024:>17,.0f} | "
+            f"{import_peak / 1024:>17,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    app()